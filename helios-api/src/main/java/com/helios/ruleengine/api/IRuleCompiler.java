@@ -2,6 +2,7 @@ package com.helios.ruleengine.api;
 
 import com.helios.ruleengine.api.model.RuleDefinition;
 import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.ModelInterner;
 
 import io.opentelemetry.api.trace.Tracer;
 import java.nio.file.Path;
@@ -47,4 +48,7 @@ public interface IRuleCompiler {
      */
     default void setCompilationListener(CompilationListener listener) {
     }
+
+    default void setInterner(ModelInterner interner) {
+    }
 }
\ No newline at end of file
@@ -0,0 +1,15 @@
+package com.helios.ruleengine.api.model;
+
+public enum EvaluationBackend {
+    /**
+     * Every true predicate increments the counters of the combinations using it;
+     * cost grows with the number of true predicates and their postings.
+     */
+    COUNTING,
+    /**
+     * A compiled decision DAG routes the event on its most discriminating field
+     * values to a small set of candidate combinations, which are then verified;
+     * cost grows with the path length and the candidates reached.
+     */
+    DECISION_DAG
+}
@@ -0,0 +1,15 @@
+package com.helios.ruleengine.api.model;
+
+public enum ModelLayout {
+    /**
+     * Posting lists are heap RoaringBitmaps, one object graph per predicate;
+     * fastest to build and to update in place.
+     */
+    HEAP,
+    /**
+     * Posting lists are packed back to back in one off-heap buffer and read in
+     * place through flyweight bitmap views, so a large model adds almost no
+     * objects for the garbage collector to trace.
+     */
+    OFF_HEAP
+}
@@ -132,6 +132,23 @@ public record Predicate(
      * Placeholder numeric evaluation.
      */
     private boolean evaluateNumeric(Object eventValue) {
+        if (isWholeNumber(eventValue) && hasWholeNumberBounds()) {
+            // Exact for timestamps and 64-bit ids, which doubles would round
+            long eventLong = ((Number) eventValue).longValue();
+            return switch (operator) {
+                case GREATER_THAN -> eventLong > ((Number) value).longValue();
+                case GREATER_THAN_OR_EQUAL -> eventLong >= ((Number) value).longValue();
+                case LESS_THAN -> eventLong < ((Number) value).longValue();
+                case LESS_THAN_OR_EQUAL -> eventLong <= ((Number) value).longValue();
+                case BETWEEN -> {
+                    List<?> range = (List<?>) value;
+                    yield eventLong >= ((Number) range.get(0)).longValue()
+                            && eventLong <= ((Number) range.get(1)).longValue();
+                }
+                default -> false;
+            };
+        }
+
         double eventDouble = toDouble(eventValue);
         if (Double.isNaN(eventDouble))
             return false;
@@ -151,6 +168,17 @@ public record Predicate(
         };
     }
 
+    private boolean hasWholeNumberBounds() {
+        if (value instanceof List<?> range) {
+            return range.size() == 2 && isWholeNumber(range.get(0)) && isWholeNumber(range.get(1));
+        }
+        return isWholeNumber(value);
+    }
+
+    private static boolean isWholeNumber(Object val) {
+        return val instanceof Long || val instanceof Integer || val instanceof Short || val instanceof Byte;
+    }
+
     /**
      * Overridden equals for logical predicate equality.
      * Note: This does *not* include weight or selectivity,
@@ -1,5 +1,6 @@
 package com.helios.ruleengine.api.model;
 
+import com.fasterxml.jackson.annotation.JsonCreator;
 import com.fasterxml.jackson.annotation.JsonProperty;
 
 import java.util.List;
@@ -17,7 +18,25 @@ public record RuleDefinition(
         @JsonProperty("conditions") List<Condition> conditions,
         @JsonProperty("priority") Integer priority,
         @JsonProperty("description") String description,
-        @JsonProperty("enabled") Boolean enabled) {
+        @JsonProperty("enabled") Boolean enabled,
+        @JsonProperty("family") String family) {
+
+    /**
+     * Canonical constructor, used for JSON binding. {@code family} is an optional
+     * tag grouping rules for MAX_PRIORITY_N selection.
+     */
+    @JsonCreator
+    public RuleDefinition {
+    }
+
+    /**
+     * Creates a rule definition without a family tag.
+     */
+    public RuleDefinition(String ruleCode, List<Condition> conditions, Integer priority,
+            String description, Boolean enabled) {
+        this(ruleCode, conditions, priority, description, enabled, null);
+    }
+
     /**
      * DTO for a single condition.
      */
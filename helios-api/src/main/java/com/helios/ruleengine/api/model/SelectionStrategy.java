@@ -3,5 +3,14 @@ package com.helios.ruleengine.api.model;
 public enum SelectionStrategy {
     ALL_MATCHES,
     MAX_PRIORITY_PER_FAMILY,
-    FIRST_MATCH
+    FIRST_MATCH,
+    /**
+     * The K highest-priority matches (K = the model's selection limit), ties broken by rule code.
+     */
+    TOP_K,
+    /**
+     * The N highest-priority matches of each rule family (N = the model's selection limit).
+     * Rules without a family form one default family.
+     */
+    MAX_PRIORITY_N
 }
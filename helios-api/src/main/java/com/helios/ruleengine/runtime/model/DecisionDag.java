@@ -0,0 +1,394 @@
+package com.helios.ruleengine.runtime.model;
+
+import com.helios.ruleengine.api.model.Predicate;
+import it.unimi.dsi.fastutil.doubles.DoubleArrayList;
+import it.unimi.dsi.fastutil.ints.Int2IntOpenHashMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntList;
+import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+import it.unimi.dsi.fastutil.objects.Object2IntOpenHashMap;
+import it.unimi.dsi.fastutil.objects.ObjectArrayList;
+import it.unimi.dsi.fastutil.objects.ObjectOpenHashSet;
+
+import java.io.Serializable;
+import java.util.Arrays;
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Set;
+
+/**
+ * Decision DAG over a model's combinations, walked by the DECISION_DAG
+ * evaluation backend instead of counting.
+ *
+ * <p>An inner node switches on one field's (encoded) event value: every
+ * EQUAL_TO value and IS_ANY_OF member its candidates test leads to the
+ * candidates that value can still satisfy, and the default edge (value absent
+ * or not tested) to the candidates that do not constrain the field. The field
+ * is chosen greedily to minimize the expected number of candidates left. A leaf
+ * holds the remaining candidate combinations, which evaluation verifies against
+ * their predicates. Nodes with the same candidate set are shared, which makes
+ * the tree a DAG.
+ *
+ * <p>Routing is sound: a combination is left behind only on edges where one of
+ * its equality predicates is false. Construction is bounded by depth, node
+ * count and total candidate entries; past a bound nodes become leaves, so a
+ * tight budget only costs larger leaves.
+ *
+ * <p>Nodes are flattened into arrays, children before parents, built once;
+ * immutable and shareable across threads.
+ */
+public final class DecisionDag implements Serializable {
+    private static final long serialVersionUID = 1L;
+
+    // Candidate sets this small are verified rather than split
+    private static final int MAX_LEAF_CANDIDATES = 8;
+    private static final int MAX_DEPTH = 16;
+    // A split must at least halve the expected candidates
+    private static final double MAX_SPLIT_RATIO = 0.5;
+    // Budgets per combination, with a floor for small models
+    private static final int NODES_PER_COMBINATION = 4;
+    private static final int ENTRIES_PER_COMBINATION = 16;
+    private static final int MIN_BUDGET = 4096;
+
+    private static final int LEAF = -1;
+
+    // Per node
+    private final int[] fields; // field tested, LEAF for leaves
+    private final Object2IntOpenHashMap<Object>[] branches; // value -> child, default child otherwise
+    private final int[][] candidates; // leaves: combination IDs, sorted
+    private final int[][] predicateIds; // leaves: union of the candidates' predicates, sorted
+    private final int[][] fieldIds; // leaves: fields of those predicates, sorted
+    private final double[] expectedCosts;
+
+    private final int root;
+
+    @SuppressWarnings("unchecked")
+    private DecisionDag(Builder builder, int root) {
+        this.fields = builder.fields.toIntArray();
+        this.branches = builder.branches.toArray(new Object2IntOpenHashMap[0]);
+        this.candidates = builder.candidates.toArray(new int[0][]);
+        this.predicateIds = builder.predicateIds.toArray(new int[0][]);
+        this.fieldIds = builder.fieldIds.toArray(new int[0][]);
+        this.expectedCosts = builder.costs.toDoubleArray();
+        this.root = root;
+    }
+
+    /**
+     * Builds the DAG over the given combinations.
+     *
+     * @param predicates               Predicates, indexed by ID
+     * @param combinationPredicateIds  Predicate IDs per combination, indexed by combination ID
+     */
+    public static DecisionDag build(Predicate[] predicates, IntList[] combinationPredicateIds) {
+        Builder builder = new Builder(predicates, combinationPredicateIds);
+        int[] all = new int[combinationPredicateIds.length];
+        Arrays.setAll(all, i -> i);
+        int root = builder.build(all, 0, new IntArrayList());
+        return new DecisionDag(builder, root);
+    }
+
+    public int root() {
+        return root;
+    }
+
+    public boolean isLeaf(int node) {
+        return fields[node] == LEAF;
+    }
+
+    /**
+     * @return The field an inner node switches on.
+     */
+    public int field(int node) {
+        return fields[node];
+    }
+
+    /**
+     * @param value Encoded event value of the node's field, null if absent
+     * @return The child to follow.
+     */
+    public int next(int node, Object value) {
+        return branches[node].getInt(value);
+    }
+
+    /**
+     * @return Candidate combination IDs of a leaf, sorted. Do not modify.
+     */
+    public int[] candidates(int node) {
+        return candidates[node];
+    }
+
+    /**
+     * @return Predicate IDs used by a leaf's candidates, sorted. Do not modify.
+     */
+    public int[] predicateIds(int node) {
+        return predicateIds[node];
+    }
+
+    /**
+     * @return Fields of a leaf's predicates, sorted. Do not modify.
+     */
+    public int[] fieldIds(int node) {
+        return fieldIds[node];
+    }
+
+    public int size() {
+        return fields.length;
+    }
+
+    /**
+     * Rough per-event cost of walking the DAG: a leaf costs its predicates plus
+     * a check per candidate predicate; an inner node one probe plus the mean of
+     * its children, as if the event value were equally likely any tested value
+     * or none.
+     */
+    public double expectedCost() {
+        return expectedCosts[root];
+    }
+
+    /**
+     * Rough per-event cost of the counting backend, in the units of
+     * {@link #expectedCost()}: every predicate is evaluated and each true one
+     * increments the counters of its combinations. Equality predicates are true
+     * with the odds assumed by the DAG, NOT_EQUAL_TO ones almost always, the
+     * others half the time.
+     */
+    public static double estimateCountingCost(Predicate[] predicates, IntList[] combinationPredicateIds) {
+        int[] postings = new int[predicates.length];
+        for (IntList predIds : combinationPredicateIds) {
+            for (int i = 0; i < predIds.size(); i++) {
+                postings[predIds.getInt(i)]++;
+            }
+        }
+
+        Int2ObjectOpenHashMap<Set<Object>> fieldValues = new Int2ObjectOpenHashMap<>();
+        for (Predicate p : predicates) {
+            Object[] values = routingValues(p);
+            if (values != null) {
+                fieldValues.computeIfAbsent(p.fieldId(), k -> new ObjectOpenHashSet<>()).addAll(Arrays.asList(values));
+            }
+        }
+
+        double cost = predicates.length;
+        for (int predId = 0; predId < predicates.length; predId++) {
+            Predicate p = predicates[predId];
+            Object[] values = routingValues(p);
+            double trueOdds;
+            if (values != null) {
+                trueOdds = (double) values.length / (fieldValues.get(p.fieldId()).size() + 1);
+            } else if (p.operator() == Predicate.Operator.NOT_EQUAL_TO) {
+                trueOdds = 1.0;
+            } else {
+                trueOdds = 0.5;
+            }
+            cost += trueOdds * postings[predId];
+        }
+        return cost;
+    }
+
+    /**
+     * Values a predicate can be true for: the EQUAL_TO value or the distinct
+     * IS_ANY_OF members; null for other operators.
+     */
+    private static Object[] routingValues(Predicate p) {
+        return switch (p.operator()) {
+            case EQUAL_TO -> p.value() != null ? new Object[] { p.value() } : null;
+            case IS_ANY_OF -> p.value() instanceof List<?> members ? new LinkedHashSet<>(members).toArray() : null;
+            default -> null;
+        };
+    }
+
+    private static final class Builder {
+        private final Predicate[] predicates;
+        private final IntList[] combinations;
+        private final Object[][] routes; // Map[predicateId -> routing values], null if not routable
+        private final int[][] routable; // Map[combinationId -> one routable predicate per field]
+
+        // Nodes already built, by candidate set
+        private final Object2IntOpenHashMap<IntArrayList> shared = new Object2IntOpenHashMap<>();
+        private final int nodeBudget;
+        private final long entryBudget;
+        private int plannedNodes = 1;
+        private long entries;
+
+        final IntArrayList fields = new IntArrayList();
+        final ObjectArrayList<Object2IntOpenHashMap<Object>> branches = new ObjectArrayList<>();
+        final ObjectArrayList<int[]> candidates = new ObjectArrayList<>();
+        final ObjectArrayList<int[]> predicateIds = new ObjectArrayList<>();
+        final ObjectArrayList<int[]> fieldIds = new ObjectArrayList<>();
+        final DoubleArrayList costs = new DoubleArrayList();
+
+        Builder(Predicate[] predicates, IntList[] combinations) {
+            this.predicates = predicates;
+            this.combinations = combinations;
+            this.routes = new Object[predicates.length][];
+            for (int predId = 0; predId < predicates.length; predId++) {
+                routes[predId] = routingValues(predicates[predId]);
+            }
+
+            // The most selective routable predicate of each field constrains the combination
+            this.routable = new int[combinations.length][];
+            Int2IntOpenHashMap byField = new Int2IntOpenHashMap();
+            for (int c = 0; c < combinations.length; c++) {
+                byField.clear();
+                for (int i = 0; i < combinations[c].size(); i++) {
+                    int predId = combinations[c].getInt(i);
+                    if (routes[predId] == null) {
+                        continue;
+                    }
+                    int field = predicates[predId].fieldId();
+                    int current = byField.getOrDefault(field, -1);
+                    if (current < 0 || routes[predId].length < routes[current].length) {
+                        byField.put(field, predId);
+                    }
+                }
+                routable[c] = byField.values().toIntArray();
+            }
+
+            this.shared.defaultReturnValue(-1);
+            this.nodeBudget = Math.max(MIN_BUDGET, NODES_PER_COMBINATION * combinations.length);
+            this.entryBudget = Math.max(MIN_BUDGET, (long) ENTRIES_PER_COMBINATION * combinations.length);
+        }
+
+        /**
+         * Builds (or reuses) the node over the given sorted candidates; returns its ID.
+         *
+         * @param tested Fields switched on along the current path, never tested again
+         */
+        int build(int[] cands, int depth, IntArrayList tested) {
+            IntArrayList key = IntArrayList.wrap(cands);
+            int node = shared.getInt(key);
+            if (node >= 0) {
+                return node;
+            }
+            node = cands.length <= MAX_LEAF_CANDIDATES || depth >= MAX_DEPTH
+                    ? leaf(cands)
+                    : split(cands, depth, tested);
+            shared.put(key, node);
+            return node;
+        }
+
+        private int split(int[] cands, int depth, IntArrayList tested) {
+            // Per untested field: candidates constraining it, their routing entries and distinct values
+            Int2IntOpenHashMap constrained = new Int2IntOpenHashMap();
+            Int2IntOpenHashMap fieldEntries = new Int2IntOpenHashMap();
+            Int2ObjectOpenHashMap<Set<Object>> fieldValues = new Int2ObjectOpenHashMap<>();
+            for (int c : cands) {
+                for (int predId : routable[c]) {
+                    int field = predicates[predId].fieldId();
+                    if (tested.contains(field)) {
+                        continue;
+                    }
+                    constrained.addTo(field, 1);
+                    fieldEntries.addTo(field, routes[predId].length);
+                    fieldValues.computeIfAbsent(field, k -> new ObjectOpenHashSet<>())
+                            .addAll(Arrays.asList(routes[predId]));
+                }
+            }
+
+            // Expected child size: unconstrained candidates reach every child,
+            // constrained ones only the children of their values
+            int best = LEAF;
+            double bestSize = cands.length * MAX_SPLIT_RATIO;
+            for (int field : constrained.keySet()) {
+                int distinct = fieldValues.get(field).size();
+                double size = cands.length - constrained.get(field)
+                        + (double) fieldEntries.get(field) / (distinct + 1);
+                if (size < bestSize) {
+                    best = field;
+                    bestSize = size;
+                }
+            }
+            if (best == LEAF) {
+                return leaf(cands);
+            }
+
+            Object[] values = fieldValues.get(best).toArray();
+            int wildcards = cands.length - constrained.get(best);
+            long splitEntries = fieldEntries.get(best) + (long) wildcards * (values.length + 1);
+            if (plannedNodes + values.length + 1 > nodeBudget || entries + splitEntries > entryBudget) {
+                return leaf(cands);
+            }
+            plannedNodes += values.length + 1;
+            entries += splitEntries;
+
+            Object2IntOpenHashMap<Object> valueIndex = new Object2IntOpenHashMap<>(values.length);
+            IntArrayList[] children = new IntArrayList[values.length];
+            for (int i = 0; i < values.length; i++) {
+                valueIndex.put(values[i], i);
+                children[i] = new IntArrayList();
+            }
+            IntArrayList unconstrained = new IntArrayList(wildcards);
+            for (int c : cands) {
+                int predId = route(c, best);
+                if (predId < 0) {
+                    unconstrained.add(c);
+                    for (IntArrayList child : children) {
+                        child.add(c);
+                    }
+                } else {
+                    for (Object value : routes[predId]) {
+                        children[valueIndex.getInt(value)].add(c);
+                    }
+                }
+            }
+
+            tested.add(best);
+            int defaultChild = build(unconstrained.toIntArray(), depth + 1, tested);
+            double childCosts = costs.getDouble(defaultChild);
+            Object2IntOpenHashMap<Object> branch = new Object2IntOpenHashMap<>(values.length);
+            branch.defaultReturnValue(defaultChild);
+            for (int i = 0; i < values.length; i++) {
+                int child = build(children[i].toIntArray(), depth + 1, tested);
+                branch.put(values[i], child);
+                childCosts += costs.getDouble(child);
+            }
+            tested.removeInt(tested.size() - 1);
+
+            return addNode(best, branch, null, null, null, 1 + childCosts / (values.length + 1));
+        }
+
+        /**
+         * The predicate constraining the combination on the field, -1 if none.
+         */
+        private int route(int combinationId, int field) {
+            for (int predId : routable[combinationId]) {
+                if (predicates[predId].fieldId() == field) {
+                    return predId;
+                }
+            }
+            return -1;
+        }
+
+        private int leaf(int[] cands) {
+            IntOpenHashSet leafPredicates = new IntOpenHashSet();
+            long checks = 0;
+            for (int c : cands) {
+                leafPredicates.addAll(combinations[c]);
+                checks += combinations[c].size();
+            }
+            int[] predIds = leafPredicates.toIntArray();
+            Arrays.sort(predIds);
+
+            IntOpenHashSet leafFields = new IntOpenHashSet();
+            for (int predId : predIds) {
+                leafFields.add(predicates[predId].fieldId());
+            }
+            int[] fieldIdArray = leafFields.toIntArray();
+            Arrays.sort(fieldIdArray);
+
+            return addNode(LEAF, null, cands, predIds, fieldIdArray, predIds.length + checks);
+        }
+
+        private int addNode(int field, Object2IntOpenHashMap<Object> branch, int[] cands, int[] predIds,
+                int[] fieldIdArray, double cost) {
+            fields.add(field);
+            branches.add(branch);
+            candidates.add(cands);
+            predicateIds.add(predIds);
+            fieldIds.add(fieldIdArray);
+            costs.add(cost);
+            return fields.size() - 1;
+        }
+    }
+}
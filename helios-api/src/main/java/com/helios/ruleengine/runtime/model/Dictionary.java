@@ -1,34 +1,77 @@
 package com.helios.ruleengine.runtime.model;
 
+import it.unimi.dsi.fastutil.ints.IntArrays;
 import it.unimi.dsi.fastutil.objects.Object2IntMap;
 import it.unimi.dsi.fastutil.objects.Object2IntOpenHashMap;
 
 import java.io.Serializable;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.List;
 
 /**
  * A dictionary for encoding and decoding string values to integer IDs.
  * This is a core component for memory optimization and performance improvement.
+ *
+ * <p>A compiled model's dictionaries never change, so {@link #freeze()} swaps
+ * the hash map and string list for a read-optimized form: all entries back to
+ * back in one char arena, found through a minimal perfect hash (hash and
+ * displace: a key's bucket holds a seed that sends it to its own slot). A
+ * lookup hashes the key once, reads a seed and a slot, and compares the key
+ * against one arena range. A frozen dictionary rejects new entries.
  */
 public class Dictionary implements Serializable {
     private static final long serialVersionUID = 1L;
 
-    private final Object2IntMap<String> stringToId = new Object2IntOpenHashMap<>();
-    private final List<String> idToString = new ArrayList<>();
+    // Average keys per hash bucket; each bucket stores one seed
+    private static final int BUCKET_SIZE = 3;
+    // Seeds tried for a bucket before starting over with another salt
+    private static final int MAX_SEED = 1 << 16;
+    private static final int MAX_SALTS = 16;
+    private static final long GOLDEN = 0x9E3779B97F4A7C15L;
+
+    // Mutable form, null once frozen
+    private Object2IntMap<String> stringToId = new Object2IntOpenHashMap<>();
+    private List<String> idToString = new ArrayList<>();
+
+    // Frozen form, null until frozen
+    private char[] arena; // Entries back to back
+    private int[] offsets; // Map[id -> arena start], one extra end offset
+    private long salt;
+    private int[] seeds; // Map[bucket -> 0 empty, > 0 seed, < 0 -(slot + 1) of a single key]
+    private int[] slotIds; // Map[slot -> id]
+    private transient String[] decoded; // Lazily materialized entries
 
     public Dictionary() {
         stringToId.defaultReturnValue(-1);
     }
 
+    private Dictionary(char[] arena, int[] offsets, long salt, int[] seeds, int[] slotIds) {
+        this.stringToId = null;
+        this.idToString = null;
+        this.arena = arena;
+        this.offsets = offsets;
+        this.salt = salt;
+        this.seeds = seeds;
+        this.slotIds = slotIds;
+    }
+
     /**
      * Encodes a string value into an integer ID.
      * If the value is not present, it will be added to the dictionary.
      *
      * @param value The string value to encode.
      * @return The integer ID for the value.
+     * @throws IllegalStateException if the dictionary is frozen and does not contain the value.
      */
     public int encode(String value) {
+        if (isFrozen()) {
+            int id = getId(value);
+            if (id < 0) {
+                throw new IllegalStateException("Cannot add '" + value + "' to a frozen dictionary");
+            }
+            return id;
+        }
         // FIX: Explicitly type the lambda parameter 's' as a String to resolve type inference issue.
         return stringToId.computeIfAbsent(value, (String s) -> {
             int id = idToString.size();
@@ -44,10 +87,24 @@ public class Dictionary implements Serializable {
      * @return The original string value.
      */
     public String decode(int id) {
-        if (id >= 0 && id < idToString.size()) {
+        if (id < 0 || id >= size()) {
+            return null;
+        }
+        if (!isFrozen()) {
             return idToString.get(id);
         }
-        return null;
+        // Racy but benign: concurrent callers may each materialize the same entry
+        String[] cache = decoded;
+        if (cache == null) {
+            cache = new String[slotIds.length];
+            decoded = cache;
+        }
+        String value = cache[id];
+        if (value == null) {
+            value = new String(arena, offsets[id], offsets[id + 1] - offsets[id]);
+            cache[id] = value;
+        }
+        return value;
     }
 
     /**
@@ -57,7 +114,19 @@ public class Dictionary implements Serializable {
      * @return The integer ID, or -1 if not found.
      */
     public int getId(String value) {
-        return stringToId.getInt(value);
+        if (!isFrozen()) {
+            return stringToId.getInt(value);
+        }
+        if (value == null) {
+            return -1;
+        }
+        long hash = hash(value, salt);
+        int seed = seeds[reduce(hash, seeds.length)];
+        if (seed == 0) {
+            return -1;
+        }
+        int id = slotIds[seed < 0 ? -seed - 1 : slot(hash, seed, slotIds.length)];
+        return matches(id, value) ? id : -1;
     }
 
     /**
@@ -66,6 +135,235 @@ public class Dictionary implements Serializable {
      * @return The size of the dictionary.
      */
     public int size() {
-        return idToString.size();
+        return isFrozen() ? slotIds.length : idToString.size();
+    }
+
+    /**
+     * @return true once {@link #freeze()} has run.
+     */
+    public boolean isFrozen() {
+        return slotIds != null;
+    }
+
+    /**
+     * Converts the dictionary to its read-optimized form in place. IDs are
+     * unchanged; afterwards {@link #encode(String)} only returns existing IDs.
+     * Freezing a frozen dictionary does nothing.
+     *
+     * @return This dictionary.
+     */
+    public Dictionary freeze() {
+        if (isFrozen()) {
+            return this;
+        }
+        int count = idToString.size();
+        int[] entryOffsets = new int[count + 1];
+        for (int id = 0; id < count; id++) {
+            entryOffsets[id + 1] = entryOffsets[id] + idToString.get(id).length();
+        }
+        char[] entryChars = new char[entryOffsets[count]];
+        for (int id = 0; id < count; id++) {
+            String entry = idToString.get(id);
+            entry.getChars(0, entry.length(), entryChars, entryOffsets[id]);
+        }
+
+        int numBuckets = count / BUCKET_SIZE + 1;
+        for (int attempt = 0; attempt < MAX_SALTS; attempt++) {
+            long candidateSalt = mix(GOLDEN * (attempt + 1));
+            int[] candidateSeeds = new int[numBuckets];
+            int[] candidateSlots = new int[count];
+            if (place(entryChars, entryOffsets, candidateSalt, candidateSeeds, candidateSlots)) {
+                arena = entryChars;
+                offsets = entryOffsets;
+                salt = candidateSalt;
+                seeds = candidateSeeds;
+                slotIds = candidateSlots;
+                stringToId = null;
+                idToString = null;
+                return this;
+            }
+        }
+        throw new IllegalStateException("No perfect hash found for " + count + " dictionary entries");
+    }
+
+    /**
+     * Assigns every entry a slot: buckets are placed largest first, each with
+     * the first seed that sends all its keys to free slots; single-key buckets
+     * then take the remaining slots directly.
+     */
+    private static boolean place(char[] chars, int[] entryOffsets, long salt, int[] seeds, int[] slotIds) {
+        int count = slotIds.length;
+        int numBuckets = seeds.length;
+        long[] hashes = new long[count];
+        int[] bucketStarts = new int[numBuckets + 1];
+        for (int id = 0; id < count; id++) {
+            hashes[id] = hash(chars, entryOffsets[id], entryOffsets[id + 1], salt);
+            bucketStarts[reduce(hashes[id], numBuckets) + 1]++;
+        }
+        for (int b = 0; b < numBuckets; b++) {
+            bucketStarts[b + 1] += bucketStarts[b];
+        }
+        int[] members = new int[count];
+        int[] cursor = Arrays.copyOf(bucketStarts, numBuckets);
+        for (int id = 0; id < count; id++) {
+            members[cursor[reduce(hashes[id], numBuckets)]++] = id;
+        }
+        int[] order = new int[numBuckets];
+        for (int b = 0; b < numBuckets; b++) {
+            order[b] = b;
+        }
+        IntArrays.quickSort(order, (a, b) -> Integer.compare(
+                bucketStarts[b + 1] - bucketStarts[b], bucketStarts[a + 1] - bucketStarts[a]));
+
+        Arrays.fill(slotIds, -1);
+        int[] bucketSlots = new int[count == 0 ? 0 : bucketStarts[order[0] + 1] - bucketStarts[order[0]]];
+        int next = 0;
+        for (; next < numBuckets; next++) {
+            int bucket = order[next];
+            int start = bucketStarts[bucket];
+            int size = bucketStarts[bucket + 1] - start;
+            if (size <= 1) {
+                break;
+            }
+            int seed = findSeed(hashes, members, start, size, slotIds, bucketSlots);
+            if (seed == 0) {
+                return false;
+            }
+            for (int k = 0; k < size; k++) {
+                slotIds[bucketSlots[k]] = members[start + k];
+            }
+            seeds[bucket] = seed;
+        }
+        int free = 0;
+        for (; next < numBuckets; next++) {
+            int bucket = order[next];
+            if (bucketStarts[bucket + 1] == bucketStarts[bucket]) {
+                break;
+            }
+            while (slotIds[free] != -1) {
+                free++;
+            }
+            slotIds[free] = members[bucketStarts[bucket]];
+            seeds[bucket] = -free - 1;
+        }
+        return true;
+    }
+
+    /**
+     * @return The first seed sending a bucket's keys to distinct free slots
+     *         (left in {@code bucketSlots}), or 0 if there is none.
+     */
+    private static int findSeed(long[] hashes, int[] members, int start, int size, int[] slotIds,
+            int[] bucketSlots) {
+        for (int seed = 1; seed <= MAX_SEED; seed++) {
+            boolean fits = true;
+            for (int k = 0; k < size && fits; k++) {
+                int slot = slot(hashes[members[start + k]], seed, slotIds.length);
+                fits = slotIds[slot] == -1;
+                for (int j = 0; j < k && fits; j++) {
+                    fits = bucketSlots[j] != slot;
+                }
+                bucketSlots[k] = slot;
+            }
+            if (fits) {
+                return seed;
+            }
+        }
+        return 0;
+    }
+
+    private boolean matches(int id, String value) {
+        int start = offsets[id];
+        if (offsets[id + 1] - start != value.length()) {
+            return false;
+        }
+        for (int i = 0; i < value.length(); i++) {
+            if (arena[start + i] != value.charAt(i)) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    // FNV-1a over the chars, finished with the MurmurHash3 mixer
+    private static long hash(String value, long salt) {
+        long h = salt;
+        for (int i = 0; i < value.length(); i++) {
+            h = (h ^ value.charAt(i)) * 0x100000001B3L;
+        }
+        return mix(h);
+    }
+
+    private static long hash(char[] chars, int from, int to, long salt) {
+        long h = salt;
+        for (int i = from; i < to; i++) {
+            h = (h ^ chars[i]) * 0x100000001B3L;
+        }
+        return mix(h);
+    }
+
+    private static int slot(long hash, int seed, int numSlots) {
+        return reduce(mix(hash ^ (seed * GOLDEN)), numSlots);
+    }
+
+    // Maps the high 32 bits onto [0, n) without division
+    private static int reduce(long hash, int n) {
+        return (int) (((hash >>> 32) * n) >>> 32);
+    }
+
+    private static long mix(long h) {
+        h ^= h >>> 33;
+        h *= 0xFF51AFD7ED558CCDL;
+        h ^= h >>> 33;
+        h *= 0xC4CEB9FE1A85EC53L;
+        h ^= h >>> 33;
+        return h;
+    }
+
+    // --- Frozen form, for EngineModelSnapshot ---
+
+    /**
+     * Rebuilds a frozen dictionary from its parts, checking every entry is
+     * found under its own ID.
+     *
+     * @throws IllegalStateException if the parts are inconsistent.
+     */
+    static Dictionary ofFrozen(char[] arena, int[] offsets, long salt, int[] seeds, int[] slotIds) {
+        if (offsets.length != slotIds.length + 1 || seeds.length == 0
+                || offsets[0] != 0 || offsets[slotIds.length] != arena.length) {
+            throw new IllegalStateException("Inconsistent frozen dictionary");
+        }
+        for (int id = 0; id < slotIds.length; id++) {
+            if (offsets[id] > offsets[id + 1]) {
+                throw new IllegalStateException("Inconsistent frozen dictionary");
+            }
+        }
+        Dictionary dictionary = new Dictionary(arena, offsets, salt, seeds, slotIds);
+        for (int id = 0; id < slotIds.length; id++) {
+            if (dictionary.getId(new String(arena, offsets[id], offsets[id + 1] - offsets[id])) != id) {
+                throw new IllegalStateException("Dictionary entry " + id + " not found under its ID");
+            }
+        }
+        return dictionary;
+    }
+
+    char[] frozenArena() {
+        return arena;
+    }
+
+    int[] frozenOffsets() {
+        return offsets;
+    }
+
+    long frozenSalt() {
+        return salt;
+    }
+
+    int[] frozenSeeds() {
+        return seeds;
+    }
+
+    int[] frozenSlotIds() {
+        return slotIds;
     }
-}
\ No newline at end of file
+}
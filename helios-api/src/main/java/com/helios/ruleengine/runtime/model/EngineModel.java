@@ -6,18 +6,23 @@ package com.helios.ruleengine.runtime.model;
 
 import com.github.benmanes.caffeine.cache.Caffeine;
 import com.helios.ruleengine.api.model.EngineStats;
+import com.helios.ruleengine.api.model.EvaluationBackend;
+import com.helios.ruleengine.api.model.ModelLayout;
 import com.helios.ruleengine.api.model.Predicate;
 import com.helios.ruleengine.api.model.RuleDefinition;
 import com.helios.ruleengine.api.model.SelectionStrategy;
 import it.unimi.dsi.fastutil.ints.*;
 import it.unimi.dsi.fastutil.objects.Object2IntMap;
 import it.unimi.dsi.fastutil.objects.Object2IntOpenHashMap;
+import org.roaringbitmap.ImmutableBitmapDataProvider;
 import org.roaringbitmap.RoaringBitmap;
 
 import java.io.Serializable;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.Comparator;
 import java.util.List;
+import java.util.Objects;
 
 /**
  * The compiled, executable representation of a ruleset.
@@ -28,7 +33,9 @@ import java.util.List;
  *
  * It uses a Structure-of-Arrays (SoA) data layout for combination metadata
  * (predicate counts, priorities, rule codes) to improve memory locality
- * and cache performance during evaluation.
+ * and cache performance during evaluation. The logical rules behind each
+ * combination are stored as compressed sparse rows of primitive rule entries,
+ * so match emission reads them without boxing.
  */
 public final class EngineModel implements Serializable {
     private static final long serialVersionUID = 1L;
@@ -36,30 +43,69 @@ public final class EngineModel implements Serializable {
     // Defines the maximum size of the shared eligible predicate cache
     private static final int ELIGIBLE_PREDICATE_CACHE_SIZE = 10_000;
 
+    /**
+     * Version of what a model compiled from given rules contains. Bump it with
+     * every change to compilation or to the meaning of model structures, so
+     * models persisted by an older build (see {@link EngineModelSnapshot}) are
+     * not loaded by a newer one.
+     */
+    public static final int SEMANTICS_VERSION = 1;
+
+    // Default K (TOP_K) or N (MAX_PRIORITY_N) for bounded selection strategies
+    public static final int DEFAULT_SELECTION_LIMIT = 10;
+
+    private static final RoaringBitmap EMPTY_BITMAP = new RoaringBitmap();
+
+    private static final int[] NO_PREDICATES = new int[0];
+
     // --- Core Data Structures ---
     private final Dictionary fieldDictionary;
     private final Dictionary valueDictionary;
     private final Predicate[] uniquePredicates; // All unique predicates, indexed by ID
     private final Int2ObjectMap<RoaringBitmap> invertedIndex; // Map[predicateId -> Bitmap(combinationIds)]
+    private final Int2ObjectMap<RoaringBitmap> countingIndex; // tierCountingIndex minus bitmap-matched combinations
+    private final Int2ObjectMap<RoaringBitmap> tierCountingIndex; // invertedIndex minus complement postings
+    // OFF_HEAP layout: the three indexes above, packed (the maps are null then)
+    private final ModelLayout layout;
+    private final PackedPostings packedInvertedIndex;
+    private final PackedPostings packedCountingIndex;
+    private final PackedPostings packedTierCountingIndex;
+    private final Int2ObjectMap<RoaringBitmap> bitmapMatchPostings; // invertedIndex of bitmap-matched combinations
+    private final RoaringBitmap[] bitmapMatchCombinations; // Map[combination size -> bitmap-matched combinations]
 
     // --- Rule & Combination Data (Structure-of-Arrays) ---
     private final int[] predicateCounts; // Map[combinationId -> count]
+    private final int[] countedPredicateCounts; // Map[combinationId -> count without complement predicates]
+    private final int[][] complementPredicateIds; // Map[combinationId -> NOT_EQUAL_TO ids checked, not counted]
     private final int[] priorities; // Map[combinationId -> priority (of first rule)]
     private final String[] ruleCodes; // Map[combinationId -> ruleCode (of first rule)]
     private final IntList[] combinationToPredicateIds; // Map[combinationId -> List[predicateId]]
 
     // --- Deduplication & Multi-Rule Mapping ---
-    // These maps store *all* rules associated with a single combination ID,
-    // which is crucial for handling deduplication where one combination
-    // satisfies multiple logical rules.
-    private final List<String>[] combinationRuleCodes;
-    private final List<Integer>[] combinationPriorities;
+    // *All* rules associated with each combination ID, which is crucial for
+    // handling deduplication where one combination satisfies multiple logical
+    // rules. Compressed sparse rows: the rule entries of combination c are
+    // combinationRuleOffsets[c] until combinationRuleOffsets[c + 1].
+    private final int[] combinationRuleOffsets; // Map[combinationId -> first rule entry], one extra end offset
+    private final int[] ruleEntryRules; // Map[entry -> logical rule index]
+    private final int[] ruleEntryPriorities; // Map[entry -> priority]
+    private final int[] ruleEntryFamilies; // Map[entry -> familyId]
+    private final String[] logicalRuleCodes; // Map[logical rule index -> rule code]
+    private final String[] families; // Map[familyId -> family tag], 0 = untagged
 
     // --- Optimization & Metadata ---
     private final EngineStats stats;
     private final List<Predicate> sortedPredicates; // All predicates, sorted by weight (cheapest first)
     private final Int2FloatMap fieldMinWeights; // Map[fieldId -> minimum weight (for early out)]
+    private final int[] fieldEvaluationOrder; // Map[rank -> fieldId], cheapest field first
+    private final int[] fieldRanks; // Map[fieldId -> rank], -1 if the field has no predicates
+    private final int[] combinationMaxPriorities; // Map[combinationId -> max priority over its rules]
+    private final int[] priorityTiers; // Map[tier -> priority], distinct, highest first
+    private final int[][] tierPredicateIds; // Map[tier -> predicateIds first required by that tier]
     private final SelectionStrategy selectionStrategy;
+    private final int selectionLimit;
+    private final EvaluationBackend evaluationBackend;
+    private final DecisionDag decisionDag; // null unless the backend is DECISION_DAG
     private final Int2ObjectMap<List<Predicate>> fieldToPredicates; // Map[fieldId -> List[Predicate]]
 
     // --- Lookups & Caches ---
@@ -135,24 +181,47 @@ public final class EngineModel implements Serializable {
         this.fieldDictionary = builder.fieldDictionary;
         this.valueDictionary = builder.valueDictionary;
         this.uniquePredicates = builder.uniquePredicates;
-        this.invertedIndex = builder.invertedIndex;
+        this.layout = builder.layout;
+        this.packedInvertedIndex = builder.packedInvertedIndex;
+        this.packedCountingIndex = builder.packedCountingIndex;
+        this.packedTierCountingIndex = builder.packedTierCountingIndex;
+        boolean packed = builder.layout == ModelLayout.OFF_HEAP;
+        this.invertedIndex = packed ? null : builder.invertedIndex;
+        this.countingIndex = packed ? null : builder.countingIndex;
+        this.tierCountingIndex = packed ? null : builder.tierCountingIndex;
+        this.bitmapMatchPostings = builder.bitmapMatchPostings;
+        this.bitmapMatchCombinations = builder.bitmapMatchCombinations;
         this.stats = builder.stats;
         this.sortedPredicates = builder.sortedPredicates;
         this.fieldMinWeights = builder.fieldMinWeights;
+        this.fieldEvaluationOrder = builder.fieldEvaluationOrder;
+        this.fieldRanks = builder.fieldRanks;
+        this.combinationMaxPriorities = builder.combinationMaxPriorities;
+        this.priorityTiers = builder.priorityTiers;
+        this.tierPredicateIds = builder.tierPredicateIds;
         this.selectionStrategy = builder.selectionStrategy;
+        this.selectionLimit = builder.selectionLimit;
+        this.evaluationBackend = builder.evaluationBackend;
+        this.decisionDag = builder.evaluationBackend == EvaluationBackend.DECISION_DAG ? builder.decisionDag : null;
         this.ruleDefinitions = builder.ruleDefinitions; // Legacy
         this.familyPriorities = builder.familyPriorities; // Legacy
         this.fieldToPredicates = builder.fieldToPredicates;
 
         // SoA data
         this.predicateCounts = builder.predicateCounts;
+        this.countedPredicateCounts = builder.countedPredicateCounts;
+        this.complementPredicateIds = builder.complementPredicateIds;
         this.priorities = builder.priorities;
         this.ruleCodes = builder.ruleCodes;
         this.combinationToPredicateIds = builder.combinationToPredicateIds;
 
         // Multi-rule mapping data
-        this.combinationRuleCodes = builder.combinationRuleCodes;
-        this.combinationPriorities = builder.combinationPriorities;
+        this.combinationRuleOffsets = builder.combinationRuleOffsets;
+        this.ruleEntryRules = builder.ruleEntryRules;
+        this.ruleEntryPriorities = builder.ruleEntryPriorities;
+        this.ruleEntryFamilies = builder.ruleEntryFamilies;
+        this.logicalRuleCodes = builder.logicalRuleCodes;
+        this.families = builder.familyList.toArray(new String[0]);
 
         // UI Integration reverse lookups (NEW)
         this.ruleCodeToCombinationIds = builder.ruleCodeToCombinationIds;
@@ -223,9 +292,121 @@ public final class EngineModel implements Serializable {
 
     /**
      * @return The inverted index mapping predicate IDs to affected combination IDs.
+     *         A heap copy for the OFF_HEAP layout, made on every call; evaluation
+     *         should use {@link #getPostings(int)}.
      */
     public Int2ObjectMap<RoaringBitmap> getInvertedIndex() {
-        return invertedIndex;
+        return invertedIndex != null ? invertedIndex : packedInvertedIndex.toMap();
+    }
+
+    /**
+     * Inverted index of the combinations matched by counting, i.e. all
+     * combinations except the bitmap-matched ones (see
+     * {@link #getBitmapMatchCombinations(int)}), without complement postings
+     * (see {@link #getComplementPredicateIds(int)}). Same instance as
+     * {@link #getInvertedIndex()} when neither applies (heap copy for the
+     * OFF_HEAP layout, see {@link #getCountingPostings(int)}).
+     */
+    public Int2ObjectMap<RoaringBitmap> getCountingIndex() {
+        return countingIndex != null ? countingIndex : packedCountingIndex.toMap();
+    }
+
+    /**
+     * Inverted index for counting over all combinations (tiered FIRST_MATCH):
+     * {@link #getInvertedIndex()} without complement postings. Same instance as
+     * {@link #getInvertedIndex()} when no combination has complement predicates
+     * (heap copy for the OFF_HEAP layout, see {@link #getTierCountingPostings(int)}).
+     */
+    public Int2ObjectMap<RoaringBitmap> getTierCountingIndex() {
+        return tierCountingIndex != null ? tierCountingIndex : packedTierCountingIndex.toMap();
+    }
+
+    /**
+     * Combinations using a predicate, from {@link #getInvertedIndex()}; read
+     * in place for the OFF_HEAP layout.
+     *
+     * @return Combination IDs, null if none. Do not modify.
+     */
+    public ImmutableBitmapDataProvider getPostings(int predicateId) {
+        return invertedIndex != null ? invertedIndex.get(predicateId) : packedInvertedIndex.get(predicateId);
+    }
+
+    /**
+     * Combinations counting a predicate, from {@link #getCountingIndex()}.
+     *
+     * @return Combination IDs, null if none. Do not modify.
+     */
+    public ImmutableBitmapDataProvider getCountingPostings(int predicateId) {
+        return countingIndex != null ? countingIndex.get(predicateId) : packedCountingIndex.get(predicateId);
+    }
+
+    /**
+     * Combinations counting a predicate in tiered evaluation, from
+     * {@link #getTierCountingIndex()}.
+     *
+     * @return Combination IDs, null if none. Do not modify.
+     */
+    public ImmutableBitmapDataProvider getTierCountingPostings(int predicateId) {
+        return tierCountingIndex != null
+                ? tierCountingIndex.get(predicateId)
+                : packedTierCountingIndex.get(predicateId);
+    }
+
+    /**
+     * @return How the inverted indexes are stored.
+     */
+    public ModelLayout getLayout() {
+        return layout;
+    }
+
+    /**
+     * @return Off-heap bytes held by the packed inverted indexes, 0 for the HEAP layout.
+     */
+    public long getOffHeapBytes() {
+        if (layout != ModelLayout.OFF_HEAP) {
+            return 0;
+        }
+        long bytes = packedInvertedIndex.sizeInBytes();
+        if (packedTierCountingIndex != packedInvertedIndex) {
+            bytes += packedTierCountingIndex.sizeInBytes();
+        }
+        if (packedCountingIndex != packedTierCountingIndex) {
+            bytes += packedCountingIndex.sizeInBytes();
+        }
+        return bytes;
+    }
+
+    /**
+     * Inverted index restricted to the bitmap-matched combinations.
+     */
+    public Int2ObjectMap<RoaringBitmap> getBitmapMatchPostings() {
+        return bitmapMatchPostings;
+    }
+
+    /**
+     * Combinations of the given predicate count matched by bitmap intersection
+     * instead of counters. The compiler picks this per size bucket (1 to
+     * {@value Builder#MAX_BITMAP_MATCH_SIZE} predicates) when the bucket's
+     * posting lists are dense enough.
+     *
+     * @return Bitmap of combination IDs, empty if the bucket is counted. Do not modify.
+     */
+    public RoaringBitmap getBitmapMatchCombinations(int size) {
+        return size > 0 && size < bitmapMatchCombinations.length
+                ? bitmapMatchCombinations[size]
+                : EMPTY_BITMAP;
+    }
+
+    /**
+     * @return Largest bitmap-matched combination size, 0 if all combinations are counted.
+     */
+    public int getMaxBitmapMatchSize() {
+        for (int size = bitmapMatchCombinations.length - 1; size > 0; size--) {
+            if (!bitmapMatchCombinations[size].isEmpty()) {
+                return size;
+            }
+        }
+        return 0;
     }
 
     /**
@@ -250,6 +431,52 @@ public final class EngineModel implements Serializable {
         return fieldMinWeights.get(fieldId);
     }
 
+    /**
+     * Global field evaluation order: fields with predicates, sorted by minimum
+     * predicate weight (cheapest first), ties broken by field ID.
+     *
+     * @return Array mapping rank -> fieldId. Do not modify.
+     */
+    public int[] getFieldEvaluationOrder() {
+        return fieldEvaluationOrder;
+    }
+
+    /**
+     * @return Array mapping fieldId -> rank in {@link #getFieldEvaluationOrder()},
+     *         or -1 for fields without predicates. Do not modify.
+     */
+    public int[] getFieldRanks() {
+        return fieldRanks;
+    }
+
+    /**
+     * Priority tiers: the distinct combination priorities (see
+     * {@link #getCombinationMaxPriority(int)}), highest first.
+     *
+     * @return Array mapping tier -> priority. Do not modify.
+     */
+    public int[] getPriorityTiers() {
+        return priorityTiers;
+    }
+
+    /**
+     * Predicates first required by a tier: every predicate belongs to the highest
+     * tier with a combination that uses it, so a tier's combinations only depend on
+     * predicates of that tier or higher ones.
+     *
+     * @return Sorted predicate IDs of the tier. Do not modify.
+     */
+    public int[] getTierPredicateIds(int tier) {
+        return tierPredicateIds[tier];
+    }
+
+    /**
+     * @return The highest priority among the rules sharing this combination.
+     */
+    public int getCombinationMaxPriority(int combinationId) {
+        return combinationMaxPriorities[combinationId];
+    }
+
     /**
      * @return The strategy used to select which rules to return when multiple
      *         match.
@@ -258,6 +485,43 @@ public final class EngineModel implements Serializable {
         return selectionStrategy;
     }
 
+    /**
+     * @return K for TOP_K or N for MAX_PRIORITY_N selection.
+     */
+    public int getSelectionLimit() {
+        return selectionLimit;
+    }
+
+    /**
+     * @return The backend evaluators use for this model.
+     */
+    public EvaluationBackend getEvaluationBackend() {
+        return evaluationBackend;
+    }
+
+    /**
+     * @return The decision DAG over the combinations; null unless the backend
+     *         is {@link EvaluationBackend#DECISION_DAG}.
+     */
+    public DecisionDag getDecisionDag() {
+        return decisionDag;
+    }
+
+    /**
+     * @return Number of rule families, including the default family (ID 0) of
+     *         untagged rules.
+     */
+    public int getNumFamilies() {
+        return families.length;
+    }
+
+    /**
+     * @return The family tag for a family ID ("" for the default family).
+     */
+    public String getFamily(int familyId) {
+        return families[familyId];
+    }
+
     /**
      * @return Legacy rule definitions (deprecated).
      */
@@ -310,6 +574,31 @@ public final class EngineModel implements Serializable {
         return predicateCounts;
     }
 
+    /**
+     * Predicates per combination that are counted through
+     * {@link #getCountingIndex()} or {@link #getTierCountingIndex()}: the
+     * predicate count minus the combination's complement predicates.
+     *
+     * @return Array of counted predicate counts per combination.
+     */
+    public int[] getCountedPredicateCounts() {
+        return countedPredicateCounts;
+    }
+
+    /**
+     * NOT_EQUAL_TO predicates of a counted combination that are left out of the
+     * counting indexes. Such predicates are true for nearly every event (IS_NONE_OF
+     * blacklists expand into many of them), so counting them would touch every
+     * combination using them; instead a combination whose counted predicates
+     * are all true is matched only if these are in the true set as well.
+     * Combinations made only of NOT_EQUAL_TO predicates keep counting them.
+     *
+     * @return Predicate IDs, empty for most combinations. Do not modify.
+     */
+    public int[] getComplementPredicateIds(int combinationId) {
+        return complementPredicateIds[combinationId];
+    }
+
     /**
      * @return Array of priorities per combination.
      */
@@ -338,21 +627,81 @@ public final class EngineModel implements Serializable {
         return predicateCounts[combinationId];
     }
 
+    /**
+     * First rule entry of a combination. The entries from here up to
+     * {@link #getCombinationRuleEnd(int)} (exclusive) are the logical rules the
+     * combination satisfies (several when rules were deduplicated into it); read
+     * them with the {@code getRuleEntry*} accessors.
+     */
+    public int getCombinationRuleStart(int combinationId) {
+        return combinationRuleOffsets[combinationId];
+    }
+
+    /**
+     * @return End (exclusive) of a combination's rule entries.
+     */
+    public int getCombinationRuleEnd(int combinationId) {
+        return combinationRuleOffsets[combinationId + 1];
+    }
+
+    /**
+     * @return Rule code of a rule entry.
+     */
+    public String getRuleEntryCode(int entry) {
+        return logicalRuleCodes[ruleEntryRules[entry]];
+    }
+
+    /**
+     * @return Logical rule index of a rule entry (see {@link #getLogicalRuleCode(int)}).
+     */
+    public int getRuleEntryRule(int entry) {
+        return ruleEntryRules[entry];
+    }
+
+    /**
+     * @return Priority of a rule entry.
+     */
+    public int getRuleEntryPriority(int entry) {
+        return ruleEntryPriorities[entry];
+    }
+
+    /**
+     * @return Family ID of a rule entry (see {@link #getFamily(int)}).
+     */
+    public int getRuleEntryFamily(int entry) {
+        return ruleEntryFamilies[entry];
+    }
+
+    /**
+     * @return Number of distinct logical rules mapped to combinations.
+     */
+    public int getNumLogicalRules() {
+        return logicalRuleCodes.length;
+    }
+
+    /**
+     * @return Rule code of a logical rule index.
+     */
+    public String getLogicalRuleCode(int ruleIndex) {
+        return logicalRuleCodes[ruleIndex];
+    }
+
     /**
      * Gets the complete list of rule codes associated with a combination ID.
      * This is necessary for ALL_MATCHES strategies where a combination
-     * was deduplicated across multiple rules.
+     * was deduplicated across multiple rules. Builds the list on every call;
+     * evaluation reads the rule entries instead.
      *
      * @param combinationId The combination ID.
      * @return List of rule codes.
      */
     public List<String> getCombinationRuleCodes(int combinationId) {
-        if (combinationRuleCodes != null && combinationId < combinationRuleCodes.length
-                && combinationRuleCodes[combinationId] != null) {
-            return combinationRuleCodes[combinationId];
+        int start = combinationRuleOffsets[combinationId];
+        String[] codes = new String[combinationRuleOffsets[combinationId + 1] - start];
+        for (int j = 0; j < codes.length; j++) {
+            codes[j] = getRuleEntryCode(start + j);
         }
-        // Fallback for older models or single-rule combinations
-        return List.of(ruleCodes[combinationId]);
+        return List.of(codes);
     }
 
     /**
@@ -360,15 +709,20 @@ public final class EngineModel implements Serializable {
      * corresponding to the rule codes from `getCombinationRuleCodes`.
      *
      * @param combinationId The combination ID.
-     * @return List of priorities.
+     * @return Unmodifiable view of the priorities.
      */
-    public List<Integer> getCombinationPrioritiesAll(int combinationId) {
-        if (combinationPriorities != null && combinationId < combinationPriorities.length
-                && combinationPriorities[combinationId] != null) {
-            return combinationPriorities[combinationId];
-        }
-        // Fallback for older models or single-rule combinations
-        return List.of(priorities[combinationId]);
+    public IntList getCombinationPrioritiesAll(int combinationId) {
+        return IntLists.unmodifiable(IntArrayList.wrap(ruleEntryPriorities)
+                .subList(combinationRuleOffsets[combinationId], combinationRuleOffsets[combinationId + 1]));
+    }
+
+    /**
+     * Gets the family ID of each logical rule sharing this combination, parallel
+     * to {@link #getCombinationRuleCodes(int)}.
+     */
+    public int[] getCombinationFamilies(int combinationId) {
+        return Arrays.copyOfRange(ruleEntryFamilies,
+                combinationRuleOffsets[combinationId], combinationRuleOffsets[combinationId + 1]);
     }
 
     // --- UI Integration & Reverse Lookup Accessors (NEW) ---
@@ -427,15 +781,50 @@ public final class EngineModel implements Serializable {
         return ruleMetadata.values();
     }
 
+    /**
+     * Rough per-event cost estimates of the evaluation backends, in abstract work
+     * units (see {@link DecisionDag#expectedCost()}).
+     */
+    public record BackendEstimate(double countingCost, double decisionDagCost, int decisionDagNodes) {
+
+        // The DAG's estimate must be this many times lower to outweigh its per-node overhead
+        private static final double DECISION_DAG_ADVANTAGE = 2.0;
+
+        public EvaluationBackend recommended() {
+            return decisionDagCost * DECISION_DAG_ADVANTAGE < countingCost
+                    ? EvaluationBackend.DECISION_DAG
+                    : EvaluationBackend.COUNTING;
+        }
+    }
+
     public static class Builder {
         Dictionary fieldDictionary;
         Dictionary valueDictionary;
         Predicate[] uniquePredicates;
         final Int2ObjectMap<RoaringBitmap> invertedIndex = new Int2ObjectOpenHashMap<>();
+        boolean invertedIndexLoaded; // Set by withInvertedIndex(), skips buildInvertedIndex()
+        Int2ObjectMap<RoaringBitmap> countingIndex;
+        Int2ObjectMap<RoaringBitmap> tierCountingIndex;
+        Int2ObjectMap<RoaringBitmap> bitmapMatchPostings;
+        RoaringBitmap[] bitmapMatchCombinations;
         EngineStats stats;
         List<Predicate> sortedPredicates;
         final Int2FloatMap fieldMinWeights = new Int2FloatOpenHashMap();
+        int[] fieldEvaluationOrder;
+        int[] fieldRanks;
+        int[] combinationMaxPriorities;
+        int[] priorityTiers;
+        int[][] tierPredicateIds;
+        int[] predicateTiers; // Map[predicateId -> tier first requiring it]
         SelectionStrategy selectionStrategy = SelectionStrategy.FIRST_MATCH;
+        int selectionLimit = DEFAULT_SELECTION_LIMIT;
+        EvaluationBackend evaluationBackend = EvaluationBackend.COUNTING;
+        ModelLayout layout = ModelLayout.HEAP;
+        PackedPostings packedInvertedIndex;
+        PackedPostings packedCountingIndex;
+        PackedPostings packedTierCountingIndex;
+        ModelInterner interner; // Shares parts with the previous model, null for none
+        DecisionDag decisionDag; // Built by estimateBackends() or build(), reset by new combinations
         RuleDefinition[] ruleDefinitions; // Legacy
         Int2IntMap familyPriorities; // Legacy
         final Int2ObjectMap<List<Predicate>> fieldToPredicates = new Int2ObjectOpenHashMap<>();
@@ -459,6 +848,8 @@ public final class EngineModel implements Serializable {
 
         // --- SoA Build-Time Arrays ---
         int[] predicateCounts;
+        int[] countedPredicateCounts;
+        int[][] complementPredicateIds;
         int[] priorities;
         String[] ruleCodes;
         IntList[] combinationToPredicateIds;
@@ -467,11 +858,26 @@ public final class EngineModel implements Serializable {
         List<String>[] combinationRuleCodes;
         // Map[combinationId -> List[priority]]
         List<Integer>[] combinationPriorities;
+        // Map[combinationId -> List[familyId]]
+        IntList[] combinationFamilyIds;
+
+        // Final rule entries (see EngineModel.getCombinationRuleStart)
+        int[] combinationRuleOffsets;
+        int[] ruleEntryRules;
+        int[] ruleEntryPriorities;
+        int[] ruleEntryFamilies;
+        String[] logicalRuleCodes;
+
+        // Map[family tag -> familyId]; ID 0 is the default family of untagged rules
+        private final Object2IntMap<String> familyIdMap = new Object2IntOpenHashMap<>();
+        final List<String> familyList = new ArrayList<>(List.of(""));
 
         @SuppressWarnings("unchecked")
         public Builder() {
             combinationToIdMap.defaultReturnValue(-1);
             predicateIdMap.defaultReturnValue(-1);
+            familyIdMap.defaultReturnValue(-1);
+            familyIdMap.put("", 0);
         }
 
         /**
@@ -523,6 +929,7 @@ public final class EngineModel implements Serializable {
                 // Store new copies to ensure immutability
                 combinationToIdMap.put(new IntArrayList(predicateIds), combinationId);
                 idToCombinationMap.put(combinationId, new IntArrayList(predicateIds));
+                decisionDag = null;
             }
             return combinationId;
         }
@@ -534,13 +941,24 @@ public final class EngineModel implements Serializable {
          * This handles the M:N mapping between logical rules and
          * unique combinations.
          */
-        @SuppressWarnings("unchecked")
         public void addLogicalRuleMapping(String ruleCode, Integer priority, String description, int combinationId) {
+            addLogicalRuleMapping(ruleCode, priority, description, null, combinationId);
+        }
+
+        /**
+         * Maps a logical rule with a family tag (null for untagged) to a combination.
+         *
+         * @see #addLogicalRuleMapping(String, Integer, String, int)
+         */
+        @SuppressWarnings("unchecked")
+        public void addLogicalRuleMapping(String ruleCode, Integer priority, String description, String family,
+                int combinationId) {
             // Ensure the multi-rule tracking arrays are initialized and large enough
             if (combinationRuleCodes == null) {
                 int initialSize = Math.max(100, combinationToIdMap.size() + 50);
                 combinationRuleCodes = (List<String>[]) new List<?>[initialSize];
                 combinationPriorities = (List<Integer>[]) new List<?>[initialSize];
+                combinationFamilyIds = new IntList[initialSize];
             }
 
             if (combinationId >= combinationRuleCodes.length) {
@@ -551,11 +969,13 @@ public final class EngineModel implements Serializable {
                 System.arraycopy(combinationPriorities, 0, expandedPriorities, 0, combinationPriorities.length);
                 combinationRuleCodes = expandedCodes;
                 combinationPriorities = expandedPriorities;
+                combinationFamilyIds = Arrays.copyOf(combinationFamilyIds, newSize);
             }
 
             if (combinationRuleCodes[combinationId] == null) {
                 combinationRuleCodes[combinationId] = new ArrayList<>();
                 combinationPriorities[combinationId] = new ArrayList<>();
+                combinationFamilyIds[combinationId] = new IntArrayList();
             }
 
             // Add the rule code if it's not already mapped to this combination
@@ -563,6 +983,7 @@ public final class EngineModel implements Serializable {
             if (!codes.contains(ruleCode)) {
                 codes.add(ruleCode);
                 combinationPriorities[combinationId].add(priority != null ? priority : 0);
+                combinationFamilyIds[combinationId].add(registerFamily(family));
             }
 
             // --- Populate UI Integration reverse lookups (NEW) ---
@@ -604,6 +1025,17 @@ public final class EngineModel implements Serializable {
             // --- End Legacy ---
         }
 
+        int registerFamily(String family) {
+            String tag = family != null ? family : "";
+            int id = familyIdMap.getInt(tag);
+            if (id < 0) {
+                id = familyList.size();
+                familyIdMap.put(tag, id);
+                familyList.add(tag);
+            }
+            return id;
+        }
+
         /**
          * Registers rule metadata for UI integration.
          * This should be called during compilation for each rule.
@@ -643,11 +1075,69 @@ public final class EngineModel implements Serializable {
             return this;
         }
 
+        public Builder withSelectionLimit(int limit) {
+            if (limit <= 0) {
+                throw new IllegalArgumentException("Selection limit must be positive: " + limit);
+            }
+            this.selectionLimit = limit;
+            return this;
+        }
+
         public Builder withSelectionStrategy(SelectionStrategy strategy) {
             this.selectionStrategy = strategy;
             return this;
         }
 
+        /**
+         * Installs a prebuilt inverted index (e.g. from a snapshot) instead of
+         * deriving it from the registered combinations.
+         */
+        Builder withInvertedIndex(Int2ObjectMap<RoaringBitmap> index) {
+            invertedIndex.clear();
+            invertedIndex.putAll(index);
+            invertedIndexLoaded = true;
+            return this;
+        }
+
+        public Builder withEvaluationBackend(EvaluationBackend backend) {
+            this.evaluationBackend = Objects.requireNonNull(backend, "backend must not be null");
+            return this;
+        }
+
+        public Builder withLayout(ModelLayout layout) {
+            this.layout = Objects.requireNonNull(layout, "layout must not be null");
+            return this;
+        }
+
+        /**
+         * Shares identical predicates and posting bitmaps with the model the
+         * interner last saw (see {@link ModelInterner}); null builds without sharing.
+         */
+        public Builder withInterner(ModelInterner interner) {
+            this.interner = interner;
+            return this;
+        }
+
+        /**
+         * Rough per-event cost estimates of both evaluation backends for the
+         * combinations registered so far (see {@link DecisionDag}). Builds the
+         * decision DAG, which {@link #build()} reuses.
+         */
+        public BackendEstimate estimateBackends() {
+            Predicate[] predicates = predicateList.toArray(new Predicate[0]);
+            IntList[] combinations = new IntList[getUniqueCombinationCount()];
+            for (int i = 0; i < combinations.length; i++) {
+                combinations[i] = idToCombinationMap.get(i);
+            }
+            if (decisionDag == null) {
+                decisionDag = DecisionDag.build(predicates, combinations);
+            }
+            return new BackendEstimate(
+                    DecisionDag.estimateCountingCost(predicates, combinations),
+                    decisionDag.expectedCost(),
+                    decisionDag.size());
+        }
+
         /**
          * Finalizes the build, converting internal lists into optimized
          * arrays (Structure-of-Arrays) for the final EngineModel.
@@ -687,6 +1177,7 @@ public final class EngineModel implements Serializable {
                     ruleCodes[i] = "UNKNOWN_RULE_" + i;
                 }
             }
+            flattenRuleEntries();
 
             // Finalize the unique predicate array
             if (this.uniquePredicates == null) {
@@ -709,6 +1200,22 @@ public final class EngineModel implements Serializable {
                     fieldMinWeights.put(p.fieldId(), p.weight());
                 }
             }
+
+            // Rank fields once so evaluation never sorts per event
+            fieldEvaluationOrder = fieldMinWeights.keySet().toIntArray();
+            IntArrays.quickSort(fieldEvaluationOrder, (a, b) -> {
+                int byWeight = Float.compare(fieldMinWeights.get(a), fieldMinWeights.get(b));
+                return byWeight != 0 ? byWeight : Integer.compare(a, b);
+            });
+            int maxFieldId = -1;
+            for (int fieldId : fieldEvaluationOrder) {
+                maxFieldId = Math.max(maxFieldId, fieldId);
+            }
+            fieldRanks = new int[maxFieldId + 1];
+            Arrays.fill(fieldRanks, -1);
+            for (int rank = 0; rank < fieldEvaluationOrder.length; rank++) {
+                fieldRanks[fieldEvaluationOrder[rank]] = rank;
+            }
         }
 
         /**
@@ -716,6 +1223,9 @@ public final class EngineModel implements Serializable {
          * This is the core data structure for runtime evaluation.
          */
         private void buildInvertedIndex() {
+            if (invertedIndexLoaded) {
+                return;
+            }
             int numCombinations = getUniqueCombinationCount();
 
             for (int combinationId = 0; combinationId < numCombinations; combinationId++) {
@@ -731,23 +1241,294 @@ public final class EngineModel implements Serializable {
             }
         }
 
+        // Largest combination size considered for bitmap matching
+        static final int MAX_BITMAP_MATCH_SIZE = 3;
+
+        // Minimum average posting list length (combinations per predicate) of a size
+        // bucket for bitmap matching to beat per-combination counter increments
+        static final int MIN_BITMAP_MATCH_POSTING = 32;
+
+        /**
+         * Chooses, per combination-size bucket (1 to {@value #MAX_BITMAP_MATCH_SIZE}
+         * predicates), between counter-based and bitmap-intersection matching.
+         * A bucket is bitmap-matched when its combinations' posting lists average at
+         * least {@value #MIN_BITMAP_MATCH_POSTING} entries per predicate: dense
+         * postings turn into container-level ORs/ANDs instead of one counter
+         * increment per combination.
+         */
+        private void selectMatchStrategies() {
+            int numCombinations = getUniqueCombinationCount();
+
+            RoaringBitmap[] buckets = new RoaringBitmap[MAX_BITMAP_MATCH_SIZE + 1];
+            IntSet[] bucketPredicates = new IntSet[MAX_BITMAP_MATCH_SIZE + 1];
+            for (int size = 1; size <= MAX_BITMAP_MATCH_SIZE; size++) {
+                buckets[size] = new RoaringBitmap();
+                bucketPredicates[size] = new IntOpenHashSet();
+            }
+            for (int i = 0; i < numCombinations; i++) {
+                int size = predicateCounts[i];
+                if (size >= 1 && size <= MAX_BITMAP_MATCH_SIZE) {
+                    buckets[size].add(i);
+                    bucketPredicates[size].addAll(combinationToPredicateIds[i]);
+                }
+            }
+
+            bitmapMatchCombinations = new RoaringBitmap[MAX_BITMAP_MATCH_SIZE + 1];
+            bitmapMatchCombinations[0] = new RoaringBitmap();
+            RoaringBitmap bitmapMatched = new RoaringBitmap();
+            for (int size = 1; size <= MAX_BITMAP_MATCH_SIZE; size++) {
+                long postings = (long) size * buckets[size].getCardinality();
+                int predicates = bucketPredicates[size].size();
+                boolean dense = predicates > 0 && postings / predicates >= MIN_BITMAP_MATCH_POSTING;
+                bitmapMatchCombinations[size] = dense ? buckets[size] : new RoaringBitmap();
+                bitmapMatched.or(bitmapMatchCombinations[size]);
+            }
+
+            selectComplementPredicates(bitmapMatched);
+
+            if (bitmapMatched.isEmpty()) {
+                countingIndex = tierCountingIndex;
+                bitmapMatchPostings = new Int2ObjectOpenHashMap<>();
+                return;
+            }
+
+            countingIndex = new Int2ObjectOpenHashMap<>(tierCountingIndex.size());
+            bitmapMatchPostings = new Int2ObjectOpenHashMap<>();
+            for (Int2ObjectMap.Entry<RoaringBitmap> entry : tierCountingIndex.int2ObjectEntrySet()) {
+                RoaringBitmap counted = RoaringBitmap.andNot(entry.getValue(), bitmapMatched);
+                if (!counted.isEmpty()) {
+                    counted.runOptimize();
+                    countingIndex.put(entry.getIntKey(), counted);
+                }
+            }
+            for (Int2ObjectMap.Entry<RoaringBitmap> entry : invertedIndex.int2ObjectEntrySet()) {
+                RoaringBitmap matched = RoaringBitmap.and(entry.getValue(), bitmapMatched);
+                if (!matched.isEmpty()) {
+                    matched.runOptimize();
+                    bitmapMatchPostings.put(entry.getIntKey(), matched);
+                }
+            }
+        }
+
+        /**
+         * Leaves the NOT_EQUAL_TO predicates of counted combinations out of
+         * counting (see {@link EngineModel#getComplementPredicateIds(int)}) and
+         * builds the tier counting index without their postings. A combination
+         * needs at least one other predicate to keep it touched by counting, so
+         * combinations made only of NOT_EQUAL_TO predicates are left as they are.
+         * A NOT_EQUAL_TO predicate first required by a lower priority tier than
+         * all the combination's other predicates stays counted too: tiered
+         * evaluation checks complements when the counters complete, and the
+         * predicate would not be evaluated yet.
+         */
+        private void selectComplementPredicates(RoaringBitmap bitmapMatched) {
+            int numCombinations = getUniqueCombinationCount();
+
+            countedPredicateCounts = predicateCounts.clone();
+            complementPredicateIds = new int[numCombinations][];
+            Int2ObjectMap<RoaringBitmap> complementPostings = new Int2ObjectOpenHashMap<>();
+            IntArrayList complement = new IntArrayList();
+            for (int i = 0; i < numCombinations; i++) {
+                complementPredicateIds[i] = NO_PREDICATES;
+                if (bitmapMatched.contains(i)) {
+                    continue;
+                }
+                int lastCountedTier = -1;
+                for (int predId : combinationToPredicateIds[i]) {
+                    if (uniquePredicates[predId].operator() != Predicate.Operator.NOT_EQUAL_TO) {
+                        lastCountedTier = Math.max(lastCountedTier, predicateTiers[predId]);
+                    }
+                }
+                complement.clear();
+                for (int predId : combinationToPredicateIds[i]) {
+                    if (uniquePredicates[predId].operator() == Predicate.Operator.NOT_EQUAL_TO
+                            && predicateTiers[predId] <= lastCountedTier) {
+                        complement.add(predId);
+                    }
+                }
+                if (complement.isEmpty() || complement.size() == predicateCounts[i]) {
+                    continue;
+                }
+                complementPredicateIds[i] = complement.toIntArray();
+                countedPredicateCounts[i] -= complement.size();
+                for (int predId : complementPredicateIds[i]) {
+                    complementPostings.computeIfAbsent(predId, k -> new RoaringBitmap()).add(i);
+                }
+            }
+
+            if (complementPostings.isEmpty()) {
+                tierCountingIndex = invertedIndex;
+                return;
+            }
+
+            // Predicates without complement postings share the inverted index's bitmaps
+            tierCountingIndex = new Int2ObjectOpenHashMap<>(invertedIndex);
+            for (Int2ObjectMap.Entry<RoaringBitmap> entry : complementPostings.int2ObjectEntrySet()) {
+                RoaringBitmap counted = RoaringBitmap.andNot(
+                        invertedIndex.get(entry.getIntKey()), entry.getValue());
+                if (counted.isEmpty()) {
+                    tierCountingIndex.remove(entry.getIntKey());
+                } else {
+                    counted.runOptimize();
+                    tierCountingIndex.put(entry.getIntKey(), counted);
+                }
+            }
+        }
+
+        /**
+         * Groups combinations into priority tiers (distinct max rule priority,
+         * highest first) and assigns each predicate to the highest tier that uses it.
+         * Lets FIRST_MATCH evaluation stop once the top matching tier is decided.
+         */
+        private void buildPriorityTiers() {
+            int numCombinations = getUniqueCombinationCount();
+
+            combinationMaxPriorities = new int[numCombinations];
+            for (int i = 0; i < numCombinations; i++) {
+                int max = priorities[i];
+                for (int entry = combinationRuleOffsets[i]; entry < combinationRuleOffsets[i + 1]; entry++) {
+                    max = Math.max(max, ruleEntryPriorities[entry]);
+                }
+                combinationMaxPriorities[i] = max;
+            }
+
+            priorityTiers = new IntOpenHashSet(combinationMaxPriorities).toIntArray();
+            IntArrays.quickSort(priorityTiers, (a, b) -> Integer.compare(b, a));
+            Int2IntMap tierByPriority = new Int2IntOpenHashMap(priorityTiers.length);
+            for (int tier = 0; tier < priorityTiers.length; tier++) {
+                tierByPriority.put(priorityTiers[tier], tier);
+            }
+
+            // Highest tier (lowest index) using each predicate
+            predicateTiers = new int[uniquePredicates.length];
+            Arrays.fill(predicateTiers, Integer.MAX_VALUE);
+            for (int i = 0; i < numCombinations; i++) {
+                int tier = tierByPriority.get(combinationMaxPriorities[i]);
+                for (int predId : combinationToPredicateIds[i]) {
+                    if (predId < predicateTiers.length && tier < predicateTiers[predId]) {
+                        predicateTiers[predId] = tier;
+                    }
+                }
+            }
+
+            IntArrayList[] tierPredicates = new IntArrayList[priorityTiers.length];
+            for (int tier = 0; tier < tierPredicates.length; tier++) {
+                tierPredicates[tier] = new IntArrayList();
+            }
+            for (int predId = 0; predId < predicateTiers.length; predId++) {
+                if (predicateTiers[predId] != Integer.MAX_VALUE) {
+                    tierPredicates[predicateTiers[predId]].add(predId);
+                }
+            }
+            tierPredicateIds = new int[priorityTiers.length][];
+            for (int tier = 0; tier < tierPredicates.length; tier++) {
+                tierPredicateIds[tier] = tierPredicates[tier].toIntArray();
+            }
+        }
+
+        /**
+         * Flattens the per-combination rule lists into rule entries (compressed
+         * sparse rows, see {@link EngineModel#getCombinationRuleStart(int)}), with
+         * rule codes interned into one table. A combination without mapped rules
+         * gets a single entry for its legacy rule code.
+         */
+        private void flattenRuleEntries() {
+            int numCombinations = getUniqueCombinationCount();
+
+            combinationRuleOffsets = new int[numCombinations + 1];
+            IntArrayList entryRules = new IntArrayList(numCombinations);
+            IntArrayList entryPriorities = new IntArrayList(numCombinations);
+            IntArrayList entryFamilies = new IntArrayList(numCombinations);
+            Object2IntMap<String> ruleIndexes = new Object2IntOpenHashMap<>();
+            ruleIndexes.defaultReturnValue(-1);
+            List<String> codes = new ArrayList<>();
+            for (int i = 0; i < numCombinations; i++) {
+                combinationRuleOffsets[i] = entryRules.size();
+                boolean mapped = combinationRuleCodes != null && i < combinationRuleCodes.length
+                        && combinationRuleCodes[i] != null && !combinationRuleCodes[i].isEmpty();
+                int rules = mapped ? combinationRuleCodes[i].size() : 1;
+                for (int j = 0; j < rules; j++) {
+                    String code = mapped ? combinationRuleCodes[i].get(j) : ruleCodes[i];
+                    int ruleIndex = ruleIndexes.getInt(code);
+                    if (ruleIndex < 0) {
+                        ruleIndex = codes.size();
+                        ruleIndexes.put(code, ruleIndex);
+                        codes.add(code);
+                    }
+                    entryRules.add(ruleIndex);
+                    entryPriorities.add(mapped ? combinationPriorities[i].get(j) : priorities[i]);
+                    entryFamilies.add(mapped ? combinationFamilyIds[i].getInt(j) : 0);
+                }
+            }
+            combinationRuleOffsets[numCombinations] = entryRules.size();
+
+            ruleEntryRules = entryRules.toIntArray();
+            ruleEntryPriorities = entryPriorities.toIntArray();
+            ruleEntryFamilies = entryFamilies.toIntArray();
+            logicalRuleCodes = codes.toArray(new String[0]);
+        }
+
         /**
          * Builds the final EngineModel with all optimizations applied.
          */
         public EngineModel build() {
+            // Phase 0: Reuse the previous model's identical predicates
+            if (interner != null) {
+                interner.internPredicates(predicateList, fieldToPredicates);
+            }
+
             // Phase 1: Finalize Structure-of-Arrays layout
             finalizeSoAStructures();
 
-            // Phase 2: Build inverted index
+            // Phase 2: Build inverted index, priority tiers, matcher selection and the decision DAG
             buildInvertedIndex();
+            buildPriorityTiers();
+            selectMatchStrategies();
+            if (evaluationBackend == EvaluationBackend.DECISION_DAG && decisionDag == null) {
+                decisionDag = DecisionDag.build(uniquePredicates, combinationToPredicateIds);
+            }
 
             // Phase 3: Validate model integrity
             validate();
 
-            // Phase 4: Construct immutable EngineModel
+            // Phase 4: Pack the counting indexes for the OFF_HEAP layout; share
+            // equal heap posting bitmaps with the previous model
+            if (layout == ModelLayout.OFF_HEAP) {
+                packPostings();
+                if (interner != null) {
+                    interner.internPostings(bitmapMatchPostings);
+                }
+            } else if (interner != null) {
+                interner.internPostings(invertedIndex, tierCountingIndex, countingIndex, bitmapMatchPostings);
+            }
+
+            // Phase 5: Freeze the dictionaries into their read-optimized form
+            if (fieldDictionary != null) {
+                fieldDictionary.freeze();
+            }
+            if (valueDictionary != null) {
+                valueDictionary.freeze();
+            }
+
+            // Phase 6: Construct immutable EngineModel
             return new EngineModel(this);
         }
 
+        /**
+         * Packs the inverted, tier counting and counting indexes off-heap. Indexes
+         * that are the same instance share one packed copy. Bitmap-match postings
+         * stay on the heap: bitmap matching ORs them into heap layers.
+         */
+        private void packPostings() {
+            packedInvertedIndex = PackedPostings.pack(invertedIndex);
+            packedTierCountingIndex = tierCountingIndex == invertedIndex
+                    ? packedInvertedIndex
+                    : PackedPostings.pack(tierCountingIndex);
+            packedCountingIndex = countingIndex == tierCountingIndex
+                    ? packedTierCountingIndex
+                    : PackedPostings.pack(countingIndex);
+        }
+
         /**
          * Validates the model for common integrity issues before finalizing.
          */
@@ -0,0 +1,792 @@
+package com.helios.ruleengine.runtime.model;
+
+import com.helios.ruleengine.api.model.EngineStats;
+import com.helios.ruleengine.api.model.EvaluationBackend;
+import com.helios.ruleengine.api.model.ModelLayout;
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.api.model.RuleDefinition;
+import com.helios.ruleengine.api.model.RuleMetadata;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntArrays;
+import it.unimi.dsi.fastutil.ints.IntList;
+import org.roaringbitmap.RoaringBitmap;
+import org.roaringbitmap.buffer.ImmutableRoaringBitmap;
+
+import java.io.IOException;
+import java.nio.BufferUnderflowException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.StandardOpenOption;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.time.Instant;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collection;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.regex.Pattern;
+import java.util.zip.CRC32C;
+
+/**
+ * Versioned, checksummed binary snapshot of an {@link EngineModel}, loaded
+ * without recompiling the rules.
+ *
+ * <p>Layout, little-endian:
+ * <pre>
+ * header   magic "HELIOSMD", format version, model semantics version,
+ *          source fingerprint,
+ *          payload length, CRC32C of the payload
+ * payload  settings      selection strategy, selection limit, evaluation backend,
+ *                        model layout
+ *          dictionaries  field and value, frozen: counts, hash salt, offset
+ *                        table, bucket seeds, slot IDs, UTF-16 char arena
+ *          predicates    primitive columns (field IDs, operators, weights,
+ *                        selectivities), then values and regex patterns
+ *          combinations  offset table over predicate IDs
+ *          rules         family tags; per combination its rules' codes,
+ *                        priorities, family IDs and the first rule's description
+ *          metadata      rule metadata, then engine stats
+ *          index         inverted index: predicate ID, Roaring portable bitmap
+ * </pre>
+ *
+ * <p>{@link #read(Path)} memory-maps the file, verifies it and hands the
+ * columns to the model builder in ID order, so IDs are preserved. The
+ * inverted index is taken from the mapped bitmaps instead of being rebuilt;
+ * the remaining derived structures (priority tiers, matcher selection, ...)
+ * are rebuilt by the builder, which is cheap next to compilation.
+ *
+ * <p>The source fingerprint is chosen by the writer (see
+ * {@link #fingerprint(List)}) so a loader can tell whether a snapshot is stale
+ * without reading it. The format version covers the byte layout; the model
+ * semantics version ({@link EngineModel#SEMANTICS_VERSION}) covers how rules
+ * compile, so a snapshot of unchanged rules written by a build that compiled
+ * them differently is rejected too.
+ */
+public final class EngineModelSnapshot {
+
+    // 2: model layout in settings, 3: frozen dictionaries, 4: model semantics version in header
+    public static final int FORMAT_VERSION = 4;
+
+    private static final byte[] MAGIC = "HELIOSMD".getBytes(StandardCharsets.US_ASCII);
+    private static final int HEADER_SIZE = 40;
+    private static final int VERSION_OFFSET = 8;
+    private static final int SEMANTICS_OFFSET = 12;
+    private static final int FINGERPRINT_OFFSET = 16;
+    private static final int LENGTH_OFFSET = 24;
+    private static final int CHECKSUM_OFFSET = 32;
+
+    // Value tags
+    private static final byte NULL = 0;
+    private static final byte INT = 1;
+    private static final byte LONG = 2;
+    private static final byte DOUBLE = 3;
+    private static final byte FLOAT = 4;
+    private static final byte STRING = 5;
+    private static final byte BOOLEAN = 6;
+    private static final byte LIST = 7;
+
+    private EngineModelSnapshot() {
+    }
+
+    /**
+     * Writes the model to {@code path}, replacing it atomically.
+     *
+     * @param sourceFingerprint Identifies what the model was compiled from
+     * @throws IllegalArgumentException if a predicate or metadata value has no
+     *                                  snapshot encoding
+     */
+    public static void write(EngineModel model, long sourceFingerprint, Path path) throws IOException {
+        Output out = new Output();
+        writeSettings(out, model);
+        writeDictionary(out, model.getFieldDictionary());
+        writeDictionary(out, model.getValueDictionary());
+        writePredicates(out, model.getUniquePredicates());
+        writeCombinations(out, model);
+        writeRules(out, model);
+        writeRuleMetadata(out, model.getAllRuleMetadata());
+        writeStats(out, model.getStats());
+        writeInvertedIndex(out, model.getInvertedIndex());
+        ByteBuffer payload = out.finish();
+
+        CRC32C checksum = new CRC32C();
+        checksum.update(payload.duplicate());
+        ByteBuffer header = ByteBuffer.allocate(HEADER_SIZE).order(ByteOrder.LITTLE_ENDIAN);
+        header.put(MAGIC)
+                .putInt(FORMAT_VERSION)
+                .putInt(EngineModel.SEMANTICS_VERSION)
+                .putLong(sourceFingerprint)
+                .putLong(payload.remaining())
+                .putLong(checksum.getValue())
+                .flip();
+
+        Path target = path.toAbsolutePath();
+        Path temp = Files.createTempFile(target.getParent(), target.getFileName().toString(), ".tmp");
+        try {
+            try (FileChannel channel = FileChannel.open(temp, StandardOpenOption.WRITE)) {
+                while (header.hasRemaining()) {
+                    channel.write(header);
+                }
+                while (payload.hasRemaining()) {
+                    channel.write(payload);
+                }
+                channel.force(true);
+            }
+            Files.move(temp, target, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+        } finally {
+            Files.deleteIfExists(temp);
+        }
+    }
+
+    /**
+     * Loads a model from a snapshot.
+     *
+     * @throws IOException if the file cannot be read, is not a snapshot of this
+     *                     format and model semantics version, or fails its checksum
+     */
+    public static EngineModel read(Path path) throws IOException {
+        ByteBuffer payload;
+        try (FileChannel channel = FileChannel.open(path, StandardOpenOption.READ)) {
+            long size = channel.size();
+            if (size > Integer.MAX_VALUE) {
+                throw new IOException("Snapshot too large to map: " + path + " (" + size + " bytes)");
+            }
+            // The mapping stays valid after the channel is closed
+            payload = checkedPayload(channel.map(FileChannel.MapMode.READ_ONLY, 0, size), path);
+        }
+        try {
+            return decode(new Input(payload));
+        } catch (BufferUnderflowException | IndexOutOfBoundsException | IllegalArgumentException
+                | IllegalStateException | NegativeArraySizeException | ClassCastException e) {
+            throw new IOException("Corrupted snapshot: " + path, e);
+        }
+    }
+
+    /**
+     * Reads the source fingerprint from a snapshot's header, without
+     * verifying the payload.
+     *
+     * @throws IOException if the file is not a snapshot of this format and
+     *                     model semantics version
+     */
+    public static long readSourceFingerprint(Path path) throws IOException {
+        ByteBuffer header = ByteBuffer.allocate(HEADER_SIZE).order(ByteOrder.LITTLE_ENDIAN);
+        try (FileChannel channel = FileChannel.open(path, StandardOpenOption.READ)) {
+            while (header.hasRemaining() && channel.read(header) >= 0) {
+                // Keep reading until the header is complete or the file ends
+            }
+        }
+        checkHeader(header.flip(), path);
+        return header.getLong(FINGERPRINT_OFFSET);
+    }
+
+    /**
+     * Fingerprint of a list of rule definitions: the first 8 bytes of the
+     * SHA-256 of their text form.
+     */
+    public static long fingerprint(List<RuleDefinition> rules) {
+        try {
+            MessageDigest digest = MessageDigest.getInstance("SHA-256");
+            for (RuleDefinition rule : rules) {
+                digest.update(String.valueOf(rule).getBytes(StandardCharsets.UTF_8));
+                digest.update((byte) '\n');
+            }
+            return ByteBuffer.wrap(digest.digest()).getLong();
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException("SHA-256 not available", e);
+        }
+    }
+
+    private static void checkHeader(ByteBuffer file, Path path) throws IOException {
+        if (file.limit() < HEADER_SIZE) {
+            throw new IOException("Not a model snapshot (too short): " + path);
+        }
+        byte[] magic = new byte[MAGIC.length];
+        file.get(0, magic);
+        if (!Arrays.equals(magic, MAGIC)) {
+            throw new IOException("Not a model snapshot: " + path);
+        }
+        int version = file.getInt(VERSION_OFFSET);
+        if (version != FORMAT_VERSION) {
+            throw new IOException("Unsupported snapshot format version " + version
+                    + " (expected " + FORMAT_VERSION + "): " + path);
+        }
+        int semantics = file.getInt(SEMANTICS_OFFSET);
+        if (semantics != EngineModel.SEMANTICS_VERSION) {
+            throw new IOException("Snapshot written for model semantics version " + semantics
+                    + " (expected " + EngineModel.SEMANTICS_VERSION + "): " + path);
+        }
+    }
+
+    private static ByteBuffer checkedPayload(ByteBuffer file, Path path) throws IOException {
+        file.order(ByteOrder.LITTLE_ENDIAN);
+        checkHeader(file, path);
+        long length = file.getLong(LENGTH_OFFSET);
+        if (length != file.limit() - HEADER_SIZE) {
+            throw new IOException("Truncated snapshot: " + path + " (payload " + length + " bytes, file "
+                    + file.limit() + ")");
+        }
+        ByteBuffer payload = file.slice(HEADER_SIZE, (int) length).order(ByteOrder.LITTLE_ENDIAN);
+        CRC32C checksum = new CRC32C();
+        checksum.update(payload.duplicate());
+        if (checksum.getValue() != file.getLong(CHECKSUM_OFFSET)) {
+            throw new IOException("Snapshot checksum mismatch: " + path);
+        }
+        return payload;
+    }
+
+    private static EngineModel decode(Input in) {
+        SelectionStrategy strategy = SelectionStrategy.valueOf(in.string());
+        int selectionLimit = in.getInt();
+        EvaluationBackend backend = EvaluationBackend.valueOf(in.string());
+        ModelLayout layout = ModelLayout.valueOf(in.string());
+        Dictionary fieldDictionary = readDictionary(in);
+        Dictionary valueDictionary = readDictionary(in);
+
+        EngineModel.Builder builder = new EngineModel.Builder();
+        readPredicates(in, builder);
+        readCombinations(in, builder);
+        readRules(in, builder);
+        readRuleMetadata(in, builder);
+        EngineStats stats = readStats(in);
+        builder.withInvertedIndex(readInvertedIndex(in));
+
+        return builder.withStats(stats)
+                .withFieldDictionary(fieldDictionary)
+                .withValueDictionary(valueDictionary)
+                .withSelectionStrategy(strategy)
+                .withSelectionLimit(selectionLimit)
+                .withEvaluationBackend(backend)
+                .withLayout(layout)
+                .build();
+    }
+
+    // --- Sections ---
+
+    private static void writeSettings(Output out, EngineModel model) {
+        out.putString(model.getSelectionStrategy().name());
+        out.putInt(model.getSelectionLimit());
+        out.putString(model.getEvaluationBackend().name());
+        out.putString(model.getLayout().name());
+    }
+
+    private static void writeDictionary(Output out, Dictionary dictionary) {
+        dictionary.freeze();
+        int[] offsets = dictionary.frozenOffsets();
+        int[] seeds = dictionary.frozenSeeds();
+        out.putInt(dictionary.size());
+        out.putInt(seeds.length);
+        out.putLong(dictionary.frozenSalt());
+        out.putInts(offsets);
+        out.putInts(seeds);
+        out.putInts(dictionary.frozenSlotIds());
+        out.putChars(dictionary.frozenArena());
+    }
+
+    private static Dictionary readDictionary(Input in) {
+        int count = in.getInt();
+        int buckets = in.getInt();
+        long salt = in.getLong();
+        int[] offsets = in.ints(count + 1);
+        int[] seeds = in.ints(buckets);
+        int[] slotIds = in.ints(count);
+        char[] arena = in.chars(offsets[count]);
+        return Dictionary.ofFrozen(arena, offsets, salt, seeds, slotIds);
+    }
+
+    private static void writePredicates(Output out, Predicate[] predicates) {
+        Predicate.Operator[] operators = Predicate.Operator.values();
+        out.putInt(operators.length);
+        for (Predicate.Operator operator : operators) {
+            out.putString(operator.name());
+        }
+
+        out.putInt(predicates.length);
+        for (Predicate p : predicates) {
+            out.putInt(p.fieldId());
+        }
+        for (Predicate p : predicates) {
+            out.putByte((byte) p.operator().ordinal());
+        }
+        for (Predicate p : predicates) {
+            out.putFloat(p.weight());
+        }
+        for (Predicate p : predicates) {
+            out.putFloat(p.selectivity());
+        }
+        for (Predicate p : predicates) {
+            out.putValue(p.value());
+        }
+        for (Predicate p : predicates) {
+            out.putString(p.pattern() != null ? p.pattern().pattern() : null);
+            if (p.pattern() != null) {
+                out.putInt(p.pattern().flags());
+            }
+        }
+    }
+
+    private static void readPredicates(Input in, EngineModel.Builder builder) {
+        Predicate.Operator[] operators = new Predicate.Operator[in.getInt()];
+        for (int i = 0; i < operators.length; i++) {
+            operators[i] = Predicate.Operator.valueOf(in.string());
+        }
+
+        int count = in.getInt();
+        int[] fieldIds = in.ints(count);
+        byte[] operatorIndexes = in.bytes(count);
+        float[] weights = in.floats(count);
+        float[] selectivities = in.floats(count);
+        Object[] values = new Object[count];
+        for (int i = 0; i < count; i++) {
+            values[i] = in.value();
+        }
+        for (int predId = 0; predId < count; predId++) {
+            String regex = in.string();
+            Pattern pattern = regex != null ? Pattern.compile(regex, in.getInt()) : null;
+            Predicate predicate = new Predicate(fieldIds[predId], operators[operatorIndexes[predId]],
+                    values[predId], pattern, weights[predId], selectivities[predId]);
+            if (builder.registerPredicate(predicate) != predId) {
+                throw new IllegalStateException("Duplicate predicate " + predId);
+            }
+        }
+    }
+
+    private static void writeCombinations(Output out, EngineModel model) {
+        int count = model.getNumRules();
+        out.putInt(count);
+        int offset = 0;
+        out.putInt(offset);
+        for (int combinationId = 0; combinationId < count; combinationId++) {
+            offset += model.getCombinationPredicateIds(combinationId).size();
+            out.putInt(offset);
+        }
+        for (int combinationId = 0; combinationId < count; combinationId++) {
+            IntList predicateIds = model.getCombinationPredicateIds(combinationId);
+            for (int i = 0; i < predicateIds.size(); i++) {
+                out.putInt(predicateIds.getInt(i));
+            }
+        }
+    }
+
+    private static void readCombinations(Input in, EngineModel.Builder builder) {
+        int count = in.getInt();
+        int[] offsets = in.ints(count + 1);
+        int[] predicateIds = in.ints(offsets[count]);
+        for (int combinationId = 0; combinationId < count; combinationId++) {
+            IntList combination = IntArrayList.wrap(
+                    Arrays.copyOfRange(predicateIds, offsets[combinationId], offsets[combinationId + 1]));
+            if (builder.registerCombination(combination) != combinationId) {
+                throw new IllegalStateException("Duplicate combination " + combinationId);
+            }
+        }
+    }
+
+    private static void writeRules(Output out, EngineModel model) {
+        out.putInt(model.getNumFamilies());
+        for (int familyId = 0; familyId < model.getNumFamilies(); familyId++) {
+            out.putString(model.getFamily(familyId));
+        }
+
+        RuleDefinition[] definitions = model.getRuleDefinitions();
+        for (int combinationId = 0; combinationId < model.getNumRules(); combinationId++) {
+            int start = model.getCombinationRuleStart(combinationId);
+            int end = model.getCombinationRuleEnd(combinationId);
+            out.putInt(end - start);
+            for (int entry = start; entry < end; entry++) {
+                out.putString(model.getRuleEntryCode(entry));
+                out.putInt(model.getRuleEntryPriority(entry));
+                out.putInt(model.getRuleEntryFamily(entry));
+            }
+            out.putString(definitions != null && combinationId < definitions.length
+                    && definitions[combinationId] != null ? definitions[combinationId].description() : null);
+        }
+    }
+
+    private static void readRules(Input in, EngineModel.Builder builder) {
+        String[] families = new String[in.getInt()];
+        for (int familyId = 0; familyId < families.length; familyId++) {
+            families[familyId] = in.string();
+            if (builder.registerFamily(families[familyId]) != familyId) {
+                throw new IllegalStateException("Duplicate family " + familyId);
+            }
+        }
+
+        for (int combinationId = 0; combinationId < builder.getUniqueCombinationCount(); combinationId++) {
+            int rules = in.getInt();
+            String[] ruleCodes = new String[rules];
+            int[] priorities = new int[rules];
+            int[] familyIds = new int[rules];
+            for (int j = 0; j < rules; j++) {
+                ruleCodes[j] = in.string();
+                priorities[j] = in.getInt();
+                familyIds[j] = in.getInt();
+            }
+            String description = in.string();
+            for (int j = 0; j < rules; j++) {
+                builder.addLogicalRuleMapping(ruleCodes[j], priorities[j], j == 0 ? description : null,
+                        families[familyIds[j]], combinationId);
+            }
+        }
+    }
+
+    private static void writeRuleMetadata(Output out, Collection<RuleMetadata> rules) {
+        out.putInt(rules.size());
+        for (RuleMetadata rule : rules) {
+            out.putString(rule.ruleCode());
+            out.putString(rule.description());
+            if (rule.conditions() == null) {
+                out.putInt(-1);
+            } else {
+                out.putInt(rule.conditions().size());
+                for (RuleDefinition.Condition condition : rule.conditions()) {
+                    out.putString(condition.field());
+                    out.putString(condition.operator());
+                    out.putValue(condition.value());
+                }
+            }
+            out.putValue(rule.priority());
+            out.putValue(rule.enabled());
+            out.putString(rule.createdBy());
+            out.putInstant(rule.createdAt());
+            out.putString(rule.lastModifiedBy());
+            out.putInstant(rule.lastModifiedAt());
+            out.putValue(rule.version());
+            out.putInt(rule.tags().size());
+            for (String tag : rule.tags()) {
+                out.putString(tag);
+            }
+            out.putInt(rule.labels().size());
+            for (Map.Entry<String, String> label : rule.labels().entrySet()) {
+                out.putString(label.getKey());
+                out.putString(label.getValue());
+            }
+            Set<Integer> combinationIds = rule.combinationIds() != null ? rule.combinationIds() : Set.of();
+            out.putInt(combinationIds.size());
+            for (int combinationId : combinationIds) {
+                out.putInt(combinationId);
+            }
+            out.putValue(rule.estimatedSelectivity());
+            out.putValue(rule.isVectorizable());
+            out.putString(rule.compilationStatus());
+        }
+    }
+
+    private static void readRuleMetadata(Input in, EngineModel.Builder builder) {
+        int count = in.getInt();
+        for (int i = 0; i < count; i++) {
+            String ruleCode = in.string();
+            String description = in.string();
+            int conditionCount = in.getInt();
+            List<RuleDefinition.Condition> conditions = null;
+            if (conditionCount >= 0) {
+                conditions = new ArrayList<>(conditionCount);
+                for (int c = 0; c < conditionCount; c++) {
+                    conditions.add(new RuleDefinition.Condition(in.string(), in.string(), in.value()));
+                }
+            }
+            Integer priority = (Integer) in.value();
+            Boolean enabled = (Boolean) in.value();
+            String createdBy = in.string();
+            Instant createdAt = in.instant();
+            String lastModifiedBy = in.string();
+            Instant lastModifiedAt = in.instant();
+            Integer version = (Integer) in.value();
+            Set<String> tags = new HashSet<>();
+            for (int t = in.getInt(); t > 0; t--) {
+                tags.add(in.string());
+            }
+            Map<String, String> labels = new HashMap<>();
+            for (int l = in.getInt(); l > 0; l--) {
+                labels.put(in.string(), in.string());
+            }
+            Set<Integer> combinationIds = new HashSet<>();
+            for (int c = in.getInt(); c > 0; c--) {
+                combinationIds.add(in.getInt());
+            }
+            Integer estimatedSelectivity = (Integer) in.value();
+            Boolean isVectorizable = (Boolean) in.value();
+            String compilationStatus = in.string();
+            builder.addRuleMetadata(new RuleMetadata(ruleCode, description, conditions, priority, enabled,
+                    createdBy, createdAt, lastModifiedBy, lastModifiedAt, version, tags, labels,
+                    combinationIds, estimatedSelectivity, isVectorizable, compilationStatus));
+        }
+    }
+
+    private static void writeStats(Output out, EngineStats stats) {
+        out.putInt(stats.uniqueCombinations());
+        out.putInt(stats.totalPredicates());
+        out.putLong(stats.compilationTimeNanos());
+        Map<String, Object> metadata = stats.metadata() != null ? stats.metadata() : Map.of();
+        out.putInt(metadata.size());
+        for (Map.Entry<String, Object> entry : metadata.entrySet()) {
+            out.putString(entry.getKey());
+            out.putValue(entry.getValue());
+        }
+    }
+
+    private static EngineStats readStats(Input in) {
+        int uniqueCombinations = in.getInt();
+        int totalPredicates = in.getInt();
+        long compilationTimeNanos = in.getLong();
+        Map<String, Object> metadata = new HashMap<>();
+        for (int i = in.getInt(); i > 0; i--) {
+            metadata.put(in.string(), in.value());
+        }
+        return new EngineStats(uniqueCombinations, totalPredicates, compilationTimeNanos, metadata);
+    }
+
+    private static void writeInvertedIndex(Output out, Int2ObjectMap<RoaringBitmap> invertedIndex) {
+        int[] predicateIds = invertedIndex.keySet().toIntArray();
+        IntArrays.quickSort(predicateIds);
+        out.putInt(predicateIds.length);
+        for (int predId : predicateIds) {
+            out.putInt(predId);
+            out.putBitmap(invertedIndex.get(predId));
+        }
+    }
+
+    private static Int2ObjectMap<RoaringBitmap> readInvertedIndex(Input in) {
+        int count = in.getInt();
+        Int2ObjectMap<RoaringBitmap> invertedIndex = new Int2ObjectOpenHashMap<>(count);
+        for (int i = 0; i < count; i++) {
+            int predId = in.getInt();
+            ByteBuffer bitmap = in.slice(in.getInt());
+            invertedIndex.put(predId, new ImmutableRoaringBitmap(bitmap).toRoaringBitmap());
+        }
+        return invertedIndex;
+    }
+
+    // --- Encoding ---
+
+    /**
+     * Growable little-endian buffer.
+     */
+    private static final class Output {
+        private ByteBuffer buffer = ByteBuffer.allocate(1 << 16).order(ByteOrder.LITTLE_ENDIAN);
+
+        private void ensure(int bytes) {
+            if (buffer.remaining() >= bytes) {
+                return;
+            }
+            long needed = (long) buffer.position() + bytes;
+            long capacity = Math.max(needed, (long) buffer.capacity() * 2);
+            if (needed > Integer.MAX_VALUE - HEADER_SIZE) {
+                throw new IllegalStateException("Snapshot exceeds 2 GB");
+            }
+            ByteBuffer grown = ByteBuffer.allocate((int) Math.min(capacity, Integer.MAX_VALUE - HEADER_SIZE))
+                    .order(ByteOrder.LITTLE_ENDIAN);
+            grown.put(buffer.flip());
+            buffer = grown;
+        }
+
+        void putByte(byte value) {
+            ensure(1);
+            buffer.put(value);
+        }
+
+        void putInt(int value) {
+            ensure(4);
+            buffer.putInt(value);
+        }
+
+        void putLong(long value) {
+            ensure(8);
+            buffer.putLong(value);
+        }
+
+        void putFloat(float value) {
+            ensure(4);
+            buffer.putFloat(value);
+        }
+
+        void putBytes(byte[] bytes) {
+            ensure(bytes.length);
+            buffer.put(bytes);
+        }
+
+        void putInts(int[] values) {
+            ensure(values.length * Integer.BYTES);
+            buffer.asIntBuffer().put(values);
+            buffer.position(buffer.position() + values.length * Integer.BYTES);
+        }
+
+        void putChars(char[] values) {
+            ensure(values.length * Character.BYTES);
+            buffer.asCharBuffer().put(values);
+            buffer.position(buffer.position() + values.length * Character.BYTES);
+        }
+
+        /**
+         * UTF-8 with a length prefix; -1 for null.
+         */
+        void putString(String value) {
+            if (value == null) {
+                putInt(-1);
+                return;
+            }
+            byte[] bytes = value.getBytes(StandardCharsets.UTF_8);
+            putInt(bytes.length);
+            putBytes(bytes);
+        }
+
+        void putInstant(Instant value) {
+            putByte(value != null ? (byte) 1 : NULL);
+            if (value != null) {
+                putLong(value.getEpochSecond());
+                putInt(value.getNano());
+            }
+        }
+
+        void putValue(Object value) {
+            switch (value) {
+                case null -> putByte(NULL);
+                case Integer i -> {
+                    putByte(INT);
+                    putInt(i);
+                }
+                case Long l -> {
+                    putByte(LONG);
+                    putLong(l);
+                }
+                case Double d -> {
+                    putByte(DOUBLE);
+                    putLong(Double.doubleToRawLongBits(d));
+                }
+                case Float f -> {
+                    putByte(FLOAT);
+                    putFloat(f);
+                }
+                case String s -> {
+                    putByte(STRING);
+                    putString(s);
+                }
+                case Boolean b -> {
+                    putByte(BOOLEAN);
+                    putByte(b ? (byte) 1 : 0);
+                }
+                case List<?> list -> {
+                    putByte(LIST);
+                    putInt(list.size());
+                    for (Object element : list) {
+                        putValue(element);
+                    }
+                }
+                default -> throw new IllegalArgumentException(
+                        "No snapshot encoding for " + value.getClass().getName() + ": " + value);
+            }
+        }
+
+        void putBitmap(RoaringBitmap bitmap) {
+            int size = bitmap.serializedSizeInBytes();
+            putInt(size);
+            ensure(size);
+            bitmap.serialize(buffer);
+        }
+
+        ByteBuffer finish() {
+            return buffer.flip();
+        }
+    }
+
+    /**
+     * Sequential reader over a (mapped) little-endian payload.
+     */
+    private static final class Input {
+        private final ByteBuffer buffer;
+
+        Input(ByteBuffer buffer) {
+            this.buffer = buffer;
+        }
+
+        byte getByte() {
+            return buffer.get();
+        }
+
+        int getInt() {
+            return buffer.getInt();
+        }
+
+        long getLong() {
+            return buffer.getLong();
+        }
+
+        int[] ints(int count) {
+            int[] values = new int[count];
+            buffer.asIntBuffer().get(values);
+            buffer.position(buffer.position() + count * Integer.BYTES);
+            return values;
+        }
+
+        char[] chars(int count) {
+            char[] values = new char[count];
+            buffer.asCharBuffer().get(values);
+            buffer.position(buffer.position() + count * Character.BYTES);
+            return values;
+        }
+
+        float[] floats(int count) {
+            float[] values = new float[count];
+            buffer.asFloatBuffer().get(values);
+            buffer.position(buffer.position() + count * Float.BYTES);
+            return values;
+        }
+
+        byte[] bytes(int count) {
+            byte[] values = new byte[count];
+            buffer.get(values);
+            return values;
+        }
+
+        /**
+         * The next {@code length} bytes as a little-endian view.
+         */
+        ByteBuffer slice(int length) {
+            ByteBuffer slice = buffer.slice(buffer.position(), length).order(ByteOrder.LITTLE_ENDIAN);
+            buffer.position(buffer.position() + length);
+            return slice;
+        }
+
+        String string() {
+            int length = getInt();
+            return length < 0 ? null : new String(bytes(length), StandardCharsets.UTF_8);
+        }
+
+        Instant instant() {
+            return getByte() == NULL ? null : Instant.ofEpochSecond(getLong(), getInt());
+        }
+
+        Object value() {
+            byte tag = getByte();
+            return switch (tag) {
+                case NULL -> null;
+                case INT -> getInt();
+                case LONG -> getLong();
+                case DOUBLE -> Double.longBitsToDouble(getLong());
+                case FLOAT -> buffer.getFloat();
+                case STRING -> string();
+                case BOOLEAN -> getByte() != 0;
+                case LIST -> {
+                    int size = getInt();
+                    List<Object> list = new ArrayList<>(size);
+                    for (int i = 0; i < size; i++) {
+                        list.add(value());
+                    }
+                    yield list;
+                }
+                default -> throw new IllegalStateException("Unknown value tag " + tag);
+            };
+        }
+    }
+}
@@ -0,0 +1,116 @@
+package com.helios.ruleengine.runtime.model;
+
+import com.helios.ruleengine.api.model.Predicate;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import org.roaringbitmap.RoaringBitmap;
+
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Shares immutable parts between successive models, so a reload does not keep
+ * two copies of what did not change while the old model drains.
+ *
+ * <p>A model built with an interner (see
+ * {@link EngineModel.Builder#withInterner(ModelInterner)}) reuses the previous
+ * model's instance of every predicate that is identical, weight and
+ * selectivity included, and of every posting bitmap kept on the heap with the
+ * same combination IDs. The interner then remembers the new model's parts in
+ * place of the previous ones, so it holds at most one model's worth of
+ * references.
+ *
+ * <p>Interned parts are never modified after a build. Concurrent builds are
+ * safe: each reads the latest published pools, and a lost update only means
+ * less sharing on the next build.
+ */
+public final class ModelInterner {
+
+    // Predicate equality ignores weight and selectivity; interning must not
+    private record PredicateIdentity(Predicate predicate, float weight, float selectivity) {
+        PredicateIdentity(Predicate predicate) {
+            this(predicate, predicate.weight(), predicate.selectivity());
+        }
+    }
+
+    private volatile Map<PredicateIdentity, Predicate> predicates = Map.of();
+    private volatile Map<RoaringBitmap, RoaringBitmap> bitmaps = Map.of();
+    private volatile int sharedPredicates;
+    private volatile int sharedBitmaps;
+
+    /**
+     * @return Predicates the last built model took from the model before it.
+     */
+    public int getSharedPredicates() {
+        return sharedPredicates;
+    }
+
+    /**
+     * @return Posting bitmaps the last built model took from the model before it.
+     */
+    public int getSharedBitmaps() {
+        return sharedBitmaps;
+    }
+
+    /**
+     * Swaps the builder's predicates for the previous model's identical ones.
+     * Runs before the builder derives anything from its predicates.
+     */
+    void internPredicates(List<Predicate> predicateList, Int2ObjectMap<List<Predicate>> fieldToPredicates) {
+        Map<PredicateIdentity, Predicate> previous = predicates;
+        Map<PredicateIdentity, Predicate> next = new HashMap<>(predicateList.size() * 2);
+        int shared = 0;
+        for (int i = 0; i < predicateList.size(); i++) {
+            Predicate predicate = predicateList.get(i);
+            PredicateIdentity identity = new PredicateIdentity(predicate);
+            Predicate interned = previous.get(identity);
+            if (interned != null) {
+                predicateList.set(i, interned);
+                shared++;
+            } else {
+                interned = predicate;
+            }
+            next.put(identity, interned);
+        }
+        for (List<Predicate> fieldPredicates : fieldToPredicates.values()) {
+            fieldPredicates.replaceAll(p -> next.getOrDefault(new PredicateIdentity(p), p));
+        }
+        predicates = next;
+        sharedPredicates = shared;
+    }
+
+    /**
+     * Swaps the posting bitmaps of the given indexes for the previous model's
+     * equal ones. Indexes may share bitmaps or be the same map. Runs after the
+     * builder's last change to the bitmaps.
+     */
+    @SafeVarargs
+    final void internPostings(Int2ObjectMap<RoaringBitmap>... indexes) {
+        Map<RoaringBitmap, RoaringBitmap> previous = bitmaps;
+        Map<RoaringBitmap, RoaringBitmap> next = new HashMap<>();
+        int shared = 0;
+        for (Int2ObjectMap<RoaringBitmap> index : indexes) {
+            if (index == null) {
+                continue;
+            }
+            for (Int2ObjectMap.Entry<RoaringBitmap> entry : index.int2ObjectEntrySet()) {
+                RoaringBitmap bitmap = entry.getValue();
+                RoaringBitmap interned = next.get(bitmap);
+                if (interned == null) {
+                    interned = previous.get(bitmap);
+                    if (interned != null) {
+                        shared++;
+                    } else {
+                        interned = bitmap;
+                    }
+                    next.put(interned, interned);
+                }
+                if (interned != bitmap) {
+                    entry.setValue(interned);
+                }
+            }
+        }
+        bitmaps = next;
+        sharedBitmaps = shared;
+    }
+}
@@ -0,0 +1,127 @@
+package com.helios.ruleengine.runtime.model;
+
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import org.roaringbitmap.RoaringBitmap;
+import org.roaringbitmap.buffer.ImmutableRoaringBitmap;
+
+import java.io.IOException;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import java.io.Serializable;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+
+/**
+ * Inverted index packed into a single off-heap buffer, used by the OFF_HEAP
+ * model layout.
+ *
+ * <p>The posting bitmaps are stored back to back in Roaring's portable format,
+ * in predicate ID order, and addressed through one offset table; the whole
+ * index is two objects on the heap however many combinations it covers.
+ * {@link #get(int)} returns a flyweight {@link ImmutableRoaringBitmap} reading
+ * the buffer in place. Views are cheap, short-lived and not cached.
+ *
+ * <p>Immutable; the buffer is only read through absolute slices, so instances
+ * can be shared across threads.
+ */
+public final class PackedPostings implements Serializable {
+    private static final long serialVersionUID = 1L;
+
+    private final int[] offsets; // Map[predicateId -> start of its bitmap], equal to the next offset if none
+    private final int postings;
+    private transient ByteBuffer data;
+
+    private PackedPostings(int[] offsets, int postings, ByteBuffer data) {
+        this.offsets = offsets;
+        this.postings = postings;
+        this.data = data;
+    }
+
+    /**
+     * Packs an inverted index (predicate ID to combination IDs) into a direct buffer.
+     *
+     * @throws IllegalArgumentException if the serialized index exceeds 2 GB
+     */
+    public static PackedPostings pack(Int2ObjectMap<RoaringBitmap> index) {
+        int maxPredicateId = -1;
+        long bytes = 0;
+        for (Int2ObjectMap.Entry<RoaringBitmap> entry : index.int2ObjectEntrySet()) {
+            maxPredicateId = Math.max(maxPredicateId, entry.getIntKey());
+            bytes += entry.getValue().serializedSizeInBytes();
+        }
+        if (bytes > Integer.MAX_VALUE) {
+            throw new IllegalArgumentException("Inverted index too large to pack: " + bytes + " bytes");
+        }
+
+        ByteBuffer data = ByteBuffer.allocateDirect((int) bytes).order(ByteOrder.LITTLE_ENDIAN);
+        int[] offsets = new int[maxPredicateId + 2];
+        for (int predId = 0; predId <= maxPredicateId; predId++) {
+            offsets[predId] = data.position();
+            RoaringBitmap bitmap = index.get(predId);
+            if (bitmap != null) {
+                bitmap.serialize(data);
+            }
+        }
+        offsets[maxPredicateId + 1] = data.position();
+        return new PackedPostings(offsets, index.size(), data.flip());
+    }
+
+    /**
+     * @return View of the predicate's combination IDs, null if it has none.
+     */
+    public ImmutableRoaringBitmap get(int predicateId) {
+        if (predicateId < 0 || predicateId >= offsets.length - 1) {
+            return null;
+        }
+        int start = offsets[predicateId];
+        int end = offsets[predicateId + 1];
+        return start == end
+                ? null
+                : new ImmutableRoaringBitmap(data.slice(start, end - start).order(ByteOrder.LITTLE_ENDIAN));
+    }
+
+    /**
+     * @return Number of predicates with a posting bitmap.
+     */
+    public int size() {
+        return postings;
+    }
+
+    /**
+     * @return Off-heap bytes held by the packed bitmaps.
+     */
+    public long sizeInBytes() {
+        return data.capacity();
+    }
+
+    /**
+     * Copies the index back onto the heap, for callers that need mutable
+     * bitmaps or the map form.
+     */
+    public Int2ObjectMap<RoaringBitmap> toMap() {
+        Int2ObjectMap<RoaringBitmap> index = new Int2ObjectOpenHashMap<>(postings);
+        for (int predId = 0; predId < offsets.length - 1; predId++) {
+            ImmutableRoaringBitmap posting = get(predId);
+            if (posting != null) {
+                index.put(predId, posting.toRoaringBitmap());
+            }
+        }
+        return index;
+    }
+
+    private void writeObject(ObjectOutputStream out) throws IOException {
+        out.defaultWriteObject();
+        byte[] bytes = new byte[data.limit()];
+        data.get(0, bytes);
+        out.writeInt(bytes.length);
+        out.write(bytes);
+    }
+
+    private void readObject(ObjectInputStream in) throws IOException, ClassNotFoundException {
+        in.defaultReadObject();
+        byte[] bytes = new byte[in.readInt()];
+        in.readFully(bytes);
+        data = ByteBuffer.allocateDirect(bytes.length).order(ByteOrder.LITTLE_ENDIAN).put(bytes).flip();
+    }
+}
@@ -0,0 +1,181 @@
+package com.helios.ruleengine.benchmark;
+
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.infra.telemetry.TracingService;
+import com.helios.ruleengine.runtime.context.EvaluationContext;
+import com.helios.ruleengine.runtime.context.PredicateBitSet;
+import com.helios.ruleengine.runtime.model.Dictionary;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.operators.PredicateEvaluator;
+import io.opentelemetry.api.trace.Tracer;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntSet;
+import org.openjdk.jmh.annotations.*;
+import org.openjdk.jmh.infra.Blackhole;
+import org.openjdk.jmh.profile.GCProfiler;
+import org.openjdk.jmh.runner.Runner;
+import org.openjdk.jmh.runner.RunnerException;
+import org.openjdk.jmh.runner.options.Options;
+import org.openjdk.jmh.runner.options.OptionsBuilder;
+
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.*;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * PREDICATE EVALUATION ALLOCATION BENCHMARK
+ *
+ * Measures the steady-state allocation rate of the operator evaluators
+ * (numeric, CONTAINS, REGEX, equality) behind {@link PredicateEvaluator}.
+ * Matches are written straight into a pooled {@link EvaluationContext},
+ * so with the GC profiler gc.alloc.rate.norm should report ~0 B/op.
+ *
+ * Run: java -jar target/benchmarks.jar PredicateAllocationBenchmark -prof gc
+ */
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.NANOSECONDS)
+@State(Scope.Thread)
+@Fork(value = 1, jvmArgs = {
+        "-Xms2g",
+        "-Xmx2g",
+        "--add-modules=jdk.incubator.vector"
+})
+@Warmup(iterations = 5, time = 2)
+@Measurement(iterations = 5, time = 3)
+public class PredicateAllocationBenchmark {
+
+    private static final Tracer TRACER = TracingService.getInstance().getTracer();
+    private static final int FIELD_COUNT = 8;
+    private static final int EVENT_COUNT = 1_024;
+
+    // "all": no eligibility filter; "filtered": half of the predicates are eligible
+    @Param({"all", "filtered"})
+    private String eligibility;
+
+    private PredicateEvaluator predicateEvaluator;
+    private EvaluationContext ctx;
+    private IntSet eligiblePredicateIds;
+    private int[] fieldIds;
+    private List<Int2ObjectMap<Object>> encodedEvents;
+    private int eventIndex;
+
+    @Setup(Level.Trial)
+    public void setupTrial() throws Exception {
+        Path rulesPath = createTestRules(400);
+        EngineModel model = new RuleCompiler(TRACER).compile(rulesPath);
+        Files.deleteIfExists(rulesPath);
+
+        predicateEvaluator = new PredicateEvaluator(model);
+        ctx = new EvaluationContext(model.getNumRules(), 256, 64, model.getUniquePredicates().length);
+
+        if ("filtered".equals(eligibility)) {
+            eligiblePredicateIds = new PredicateBitSet(model.getUniquePredicates().length);
+            for (int id = 0; id < model.getUniquePredicates().length; id += 2) {
+                eligiblePredicateIds.add(id);
+            }
+        }
+
+        Dictionary fields = model.getFieldDictionary();
+        fieldIds = new int[FIELD_COUNT];
+        for (int f = 0; f < FIELD_COUNT; f++) {
+            fieldIds[f] = fields.getId("FIELD_" + f);
+        }
+        encodedEvents = generateEncodedEvents(model);
+
+        // Warm the per-thread buffers and the context's collections
+        for (int i = 0; i < EVENT_COUNT; i++) {
+            evaluateEvent(encodedEvents.get(i));
+        }
+    }
+
+    @Benchmark
+    public void evaluateFields(Blackhole bh) {
+        Int2ObjectMap<Object> attributes = encodedEvents.get(eventIndex);
+        eventIndex = (eventIndex + 1) % EVENT_COUNT;
+        bh.consume(evaluateEvent(attributes));
+    }
+
+    private int evaluateEvent(Int2ObjectMap<Object> attributes) {
+        ctx.reset();
+        for (int fieldId : fieldIds) {
+            predicateEvaluator.evaluateField(fieldId, attributes, ctx, eligiblePredicateIds);
+        }
+        return ctx.getTruePredicates().size();
+    }
+
+    // Helper: numeric, CONTAINS, REGEX, EQUAL_TO and NOT_EQUAL_TO predicates spread over the fields
+    private Path createTestRules(int count) throws IOException {
+        Path path = Files.createTempFile("allocation_rules_", ".json");
+        Random rand = new Random(42);
+        StringJoiner rules = new StringJoiner(",\n", "[\n", "\n]");
+
+        for (int i = 0; i < count; i++) {
+            int field = i % FIELD_COUNT;
+            String condition = switch (i % 7) {
+                case 0 -> numericCondition(field, "GREATER_THAN", rand.nextInt(1000));
+                case 1 -> numericCondition(field, "LESS_THAN", rand.nextInt(1000));
+                case 2 -> {
+                    int lower = rand.nextInt(900);
+                    yield String.format("{\"field\":\"field_%d\",\"operator\":\"BETWEEN\",\"value\":[%d,%d]}",
+                            field, lower, lower + rand.nextInt(100));
+                }
+                case 3 -> String.format("{\"field\":\"field_%d\",\"operator\":\"CONTAINS\",\"value\":\"K%d\"}",
+                        field, rand.nextInt(50));
+                case 4 -> String.format("{\"field\":\"field_%d\",\"operator\":\"REGEX\",\"value\":\"^V%d.*\"}",
+                        field, rand.nextInt(20));
+                case 5 -> String.format("{\"field\":\"field_%d\",\"operator\":\"EQUAL_TO\",\"value\":\"VALUE_%d\"}",
+                        field, rand.nextInt(50));
+                default -> String.format("{\"field\":\"field_%d\",\"operator\":\"NOT_EQUAL_TO\",\"value\":\"VALUE_%d\"}",
+                        field, rand.nextInt(50));
+            };
+            rules.add(String.format("{\"rule_code\":\"R%d\",\"conditions\":[%s]}", i, condition));
+        }
+
+        Files.writeString(path, rules.toString());
+        return path;
+    }
+
+    private static String numericCondition(int field, String operator, int value) {
+        return String.format("{\"field\":\"field_%d\",\"operator\":\"%s\",\"value\":%d}", field, operator, value);
+    }
+
+    // Helper: pre-encoded attribute maps (numeric on even fields, strings on odd fields)
+    private List<Int2ObjectMap<Object>> generateEncodedEvents(EngineModel model) {
+        Dictionary values = model.getValueDictionary();
+        Random rand = new Random(123);
+        List<Int2ObjectMap<Object>> events = new ArrayList<>(EVENT_COUNT);
+
+        for (int i = 0; i < EVENT_COUNT; i++) {
+            Int2ObjectMap<Object> attributes = new Int2ObjectOpenHashMap<>();
+            for (int f = 0; f < FIELD_COUNT; f++) {
+                if (fieldIds[f] < 0) {
+                    continue;
+                }
+                if (f % 2 == 0) {
+                    attributes.put(fieldIds[f], (double) rand.nextInt(1000));
+                } else {
+                    String value = rand.nextBoolean()
+                            ? "VALUE_" + rand.nextInt(50)
+                            : "V" + rand.nextInt(20) + "K" + rand.nextInt(50);
+                    int valueId = values.getId(value);
+                    attributes.put(fieldIds[f], valueId != -1 ? (Object) valueId : value);
+                }
+            }
+            events.add(attributes);
+        }
+        return events;
+    }
+
+    public static void main(String[] args) throws RunnerException {
+        Options opt = new OptionsBuilder()
+                .include(PredicateAllocationBenchmark.class.getSimpleName())
+                .addProfiler(GCProfiler.class)
+                .shouldFailOnError(true)
+                .build();
+
+        new Runner(opt).run();
+    }
+}
@@ -7,9 +7,13 @@ import com.helios.ruleengine.api.model.RuleDefinition;
 import com.helios.ruleengine.compiler.optimization.SmartIsAnyOfFactorizer;
 import com.helios.ruleengine.runtime.model.Dictionary;
 import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.EngineModelSnapshot;
+import com.helios.ruleengine.runtime.model.ModelInterner;
 import com.helios.ruleengine.api.model.Predicate;
 import com.helios.ruleengine.api.model.SelectionStrategy;
 import com.helios.ruleengine.api.model.EngineStats;
+import com.helios.ruleengine.api.model.EvaluationBackend;
+import com.helios.ruleengine.api.model.ModelLayout;
 import io.opentelemetry.api.OpenTelemetry;
 import io.opentelemetry.api.trace.Span;
 import io.opentelemetry.api.trace.Tracer;
@@ -34,6 +38,10 @@ public class RuleCompiler implements IRuleCompiler {
             .configure(com.fasterxml.jackson.databind.DeserializationFeature.FAIL_ON_UNKNOWN_PROPERTIES, false);
     private Tracer tracer;
     private com.helios.ruleengine.api.CompilationListener listener;
+    private int selectionLimit = EngineModel.DEFAULT_SELECTION_LIMIT;
+    private EvaluationBackend evaluationBackend = EvaluationBackend.COUNTING;
+    private ModelLayout layout = ModelLayout.HEAP;
+    private ModelInterner interner;
 
     public RuleCompiler() {
         this(OpenTelemetry.noop().getTracer("helios-compiler"));
@@ -58,7 +66,12 @@ public class RuleCompiler implements IRuleCompiler {
             String str = ((String) value).trim();
             if (!str.isEmpty()) {
                 try {
-                    // Try parsing as double (handles both integers and decimals)
+                    // Whole numbers stay exact as long (timestamps, 64-bit ids)
+                    return Long.parseLong(str);
+                } catch (NumberFormatException ignored) {
+                    // Not a whole number, fall through to double
+                }
+                try {
                     return Double.parseDouble(str);
                 } catch (NumberFormatException e) {
                     return null;
@@ -168,6 +181,10 @@ public class RuleCompiler implements IRuleCompiler {
                     .withFieldDictionary(fieldDictionary)
                     .withValueDictionary(valueDictionary)
                     .withSelectionStrategy(strategy)
+                    .withSelectionLimit(selectionLimit)
+                    .withEvaluationBackend(evaluationBackend)
+                    .withLayout(layout)
+                    .withInterner(interner)
                     .build();
 
             notifyStageComplete("INDEX_BUILDING", stageStart, Map.of(
@@ -187,6 +204,44 @@ public class RuleCompiler implements IRuleCompiler {
         }
     }
 
+    /**
+     * Sets K for TOP_K or N for MAX_PRIORITY_N selection in models compiled from now on.
+     *
+     * @param selectionLimit positive number of rules to keep
+     */
+    public void setSelectionLimit(int selectionLimit) {
+        if (selectionLimit <= 0) {
+            throw new IllegalArgumentException("Selection limit must be positive: " + selectionLimit);
+        }
+        this.selectionLimit = selectionLimit;
+    }
+
+    /**
+     * Sets the evaluation backend of models compiled from now on. Compiled
+     * stats recommend one for the ruleset (metadata "recommendedBackend").
+     */
+    public void setEvaluationBackend(EvaluationBackend evaluationBackend) {
+        this.evaluationBackend = Objects.requireNonNull(evaluationBackend, "evaluationBackend must not be null");
+    }
+
+    /**
+     * Sets the layout of models compiled from now on. OFF_HEAP keeps the
+     * inverted indexes in off-heap buffers, for large models on GC-sensitive
+     * services.
+     */
+    public void setLayout(ModelLayout layout) {
+        this.layout = Objects.requireNonNull(layout, "layout must not be null");
+    }
+
+    /**
+     * Shares identical predicates and posting bitmaps between the models
+     * compiled from now on (see {@link ModelInterner}); null to stop sharing.
+     */
+    @Override
+    public void setInterner(ModelInterner interner) {
+        this.interner = interner;
+    }
+
     @Override
     public void setTracer(Tracer tracer) {
         this.tracer = tracer;
@@ -278,6 +333,10 @@ public class RuleCompiler implements IRuleCompiler {
                     .withFieldDictionary(fieldDictionary)
                     .withValueDictionary(valueDictionary)
                     .withSelectionStrategy(strategy)
+                    .withSelectionLimit(selectionLimit)
+                    .withEvaluationBackend(evaluationBackend)
+                    .withLayout(layout)
+                    .withInterner(interner)
                     .build();
 
             notifyStageComplete("INDEX_BUILDING", stageStart, Map.of(
@@ -296,6 +355,26 @@ public class RuleCompiler implements IRuleCompiler {
         }
     }
 
+    /**
+     * Writes a compiled model as a binary snapshot, which
+     * {@link EngineModelSnapshot#read(Path)} loads without recompiling.
+     *
+     * @param sourceFingerprint Identifies the rules the model was compiled from,
+     *                          e.g. {@link EngineModelSnapshot#fingerprint(List)}
+     */
+    public void writeSnapshot(EngineModel model, long sourceFingerprint, Path path) throws IOException {
+        Span span = tracer.spanBuilder("write-model-snapshot").startSpan();
+        try (Scope scope = span.makeCurrent()) {
+            EngineModelSnapshot.write(model, sourceFingerprint, path);
+            span.setAttribute("snapshotBytes", Files.size(path));
+        } catch (IOException | RuntimeException e) {
+            span.recordException(e);
+            throw e;
+        } finally {
+            span.end();
+        }
+    }
+
     /**
      * Helper method to notify listener when a stage starts.
      * No-op if listener is null (zero overhead).
@@ -336,6 +415,12 @@ public class RuleCompiler implements IRuleCompiler {
         metadata.put("deduplicationRatePercent", deduplicationRate);
         metadata.put("deduplicationRatePercentFormatted", String.format("%.2f", deduplicationRate));
 
+        EngineModel.BackendEstimate backends = builder.estimateBackends();
+        metadata.put("estimatedCountingCost", backends.countingCost());
+        metadata.put("estimatedDecisionDagCost", backends.decisionDagCost());
+        metadata.put("decisionDagNodes", backends.decisionDagNodes());
+        metadata.put("recommendedBackend", backends.recommended().name());
+
         return new EngineStats(
                 uniqueCombinations,
                 builder.getPredicateCount(),
@@ -423,7 +508,8 @@ public class RuleCompiler implements IRuleCompiler {
                     canonicalKey.sort(null); // Sort IDs to create a canonical key
                     int combinationId = builder.registerCombination(canonicalKey);
                     // Map this unique combination back to the original logical rule
-                    builder.addLogicalRuleMapping(def.ruleCode(), def.priority(), def.description(), combinationId);
+                    builder.addLogicalRuleMapping(def.ruleCode(), def.priority(), def.description(), def.family(),
+                            combinationId);
 
                     // Track combination ID for metadata
                     ruleToCombinations
@@ -585,6 +671,12 @@ public class RuleCompiler implements IRuleCompiler {
      * - { status == "A", country == "CA" }
      *
      * Each of these combinations is then registered with the EngineModel builder.
+     *
+     * Expansion is bounded by {@link #MAX_EXPANDED_COMBINATIONS} per rule: the
+     * smallest lists are expanded first, and any list that would push the
+     * product past the budget stays a single IS_ANY_OF predicate, evaluated as
+     * a set-membership lookup at runtime. Two 300-value lists therefore give
+     * one combination rather than 90,000.
      */
     private List<List<Predicate>> generatePredicateCombinations(RuleDefinition def,
             SelectivityProfile profile,
@@ -701,9 +793,23 @@ public class RuleCompiler implements IRuleCompiler {
             }
         }
 
+        // Expand the smallest lists while the product stays within budget;
+        // larger ones are folded back into native set-membership predicates
+        expandablePredicates.sort(Comparator.comparingInt(List::size));
+        List<List<Predicate>> expandedLists = new ArrayList<>();
+        long expandedCount = 1;
+        for (List<Predicate> alternatives : expandablePredicates) {
+            if (expandedCount * alternatives.size() <= MAX_EXPANDED_COMBINATIONS) {
+                expandedCount *= alternatives.size();
+                expandedLists.add(alternatives);
+            } else {
+                staticPredicates.add(toSetMembershipPredicate(alternatives));
+            }
+        }
+
         // Now, generate the Cartesian product of all combinations
         List<List<Predicate>> combinations = new ArrayList<>();
-        List<List<Predicate>> expandedParts = generateCombinations(expandablePredicates);
+        List<List<Predicate>> expandedParts = generateCombinations(expandedLists);
 
         if (expandedParts.isEmpty()) {
             // No expandable predicates, just add the static list
@@ -721,24 +827,42 @@ public class RuleCompiler implements IRuleCompiler {
     }
 
     /**
-     * Helper to generate the Cartesian product of predicate lists.
+     * Maximum number of combinations a single rule may expand into. Small
+     * IS_ANY_OF lists are still expanded, so their EQUAL_TO predicates are
+     * shared with other rules; larger lists compile to one set-membership
+     * predicate instead.
      */
-    private static final int MAX_COMBINATIONS = 100_000;
+    private static final int MAX_EXPANDED_COMBINATIONS = 256;
+
+    // Deterministic order for set-membership values, so equal sets share a predicate
+    @SuppressWarnings({ "unchecked", "rawtypes" })
+    private static final Comparator<Object> CANONICAL_VALUE_ORDER = Comparator
+            .comparing((Object v) -> v.getClass().getName())
+            .thenComparing((a, b) -> a instanceof Comparable c ? c.compareTo(b) : 0);
 
+    /**
+     * Folds the EQUAL_TO alternatives of an IS_ANY_OF list back into a single
+     * IS_ANY_OF predicate over the (encoded) values, deduplicated and in
+     * canonical order.
+     */
+    private static Predicate toSetMembershipPredicate(List<Predicate> alternatives) {
+        Predicate first = alternatives.get(0);
+        List<Object> values = alternatives.stream()
+                .map(Predicate::value)
+                .distinct()
+                .sorted(CANONICAL_VALUE_ORDER)
+                .toList();
+        return new Predicate(first.fieldId(), Predicate.Operator.IS_ANY_OF, values, null,
+                first.weight(), first.selectivity());
+    }
+
+    /**
+     * Helper to generate the Cartesian product of predicate lists.
+     */
     private List<List<Predicate>> generateCombinations(List<List<Predicate>> lists) {
         List<List<Predicate>> result = new ArrayList<>();
         if (lists.isEmpty())
             return result;
-        // Check estimated size to prevent Cartesian product explosion
-        long estimatedSize = 1;
-        for (List<Predicate> list : lists) {
-            estimatedSize *= Math.max(1, list.size());
-            if (estimatedSize > MAX_COMBINATIONS) {
-                throw new CompilationException("Rule generates too many combinations (" + estimatedSize
-                        + "). Max allowed: " + MAX_COMBINATIONS
-                        + ". Reduce IS_ANY_OF list sizes or split into multiple rules.");
-            }
-        }
         generateCombinationsRecursive(lists, 0, new ArrayList<>(), result);
         return result;
     }
@@ -928,27 +1052,14 @@ public class RuleCompiler implements IRuleCompiler {
             // Perform an early check for *obvious* contradictions and log warnings
             detectContradictions(def.ruleCode(), canonizedConditions);
 
-            // Early per-rule combination explosion estimate
-            long estimatedCombinations = 1;
-            for (RuleDefinition.Condition c : canonizedConditions) {
-                if ("IS_ANY_OF".equals(c.operator()) && c.value() instanceof List) {
-                    estimatedCombinations *= ((List<?>) c.value()).size();
-                    if (estimatedCombinations > MAX_COMBINATIONS) {
-                        throw new CompilationException("Rule '" + def.ruleCode()
-                                + "' would generate too many combinations (estimated " + estimatedCombinations
-                                + "). Max allowed: " + MAX_COMBINATIONS
-                                + ". Reduce IS_ANY_OF list sizes or split into multiple rules.");
-                    }
-                }
-            }
-
             // Create canonized rule
             validated.add(new RuleDefinition(
                     def.ruleCode(),
                     canonizedConditions,
                     def.priority(),
                     def.description(),
-                    def.enabled()));
+                    def.enabled(),
+                    def.family()));
         }
 
         return validated;
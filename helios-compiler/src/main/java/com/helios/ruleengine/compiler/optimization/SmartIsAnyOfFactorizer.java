@@ -218,7 +218,8 @@ public class SmartIsAnyOfFactorizer {
                 newConditions,
                 rule.priority(),
                 rule.description(),
-                rule.enabled()
+                rule.enabled(),
+                rule.family()
         );
     }
 
@@ -261,4 +261,126 @@ class RuleCompilerTest {
         float lastWeight = sortedPredicates.get(sortedPredicates.size() - 1).weight();
         assertThat(firstWeight).isLessThan(lastWeight);
     }
-}
\ No newline at end of file
+
+    @Test
+    @DisplayName("Should emit a global field evaluation order ranked by minimum predicate weight")
+    void shouldEmitFieldEvaluationOrder() throws Exception {
+        String rulesJson = """
+                [
+                  {"rule_code": "R1", "conditions": [{"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"}]},
+                  {"rule_code": "R2", "conditions": [
+                    {"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"},
+                    {"field": "amount", "operator": "GREATER_THAN", "value": 1000},
+                    {"field": "notes", "operator": "REGEX", "value": ".*urgent.*"}
+                  ]}
+                ]
+                """;
+        EngineModel model = compiler.compile(writeRules(rulesJson));
+
+        int[] order = model.getFieldEvaluationOrder();
+        int[] ranks = model.getFieldRanks();
+
+        assertThat(order).hasSize(3);
+        for (int rank = 0; rank < order.length; rank++) {
+            assertThat(ranks[order[rank]]).isEqualTo(rank);
+            if (rank > 0) {
+                assertThat(model.getFieldMinWeight(order[rank]))
+                        .isGreaterThanOrEqualTo(model.getFieldMinWeight(order[rank - 1]));
+            }
+        }
+        assertThat(model.getFieldDictionary().decode(order[0])).isEqualTo("STATUS");
+        assertThat(model.getFieldDictionary().decode(order[2])).isEqualTo("NOTES");
+    }
+
+    @Test
+    @DisplayName("Should group combinations into priority tiers, highest first")
+    void shouldEmitPriorityTiers() throws Exception {
+        String rulesJson = """
+                [
+                  {"rule_code": "LOW", "priority": 10, "conditions": [
+                    {"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"}
+                  ]},
+                  {"rule_code": "HIGH", "priority": 50, "conditions": [
+                    {"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"},
+                    {"field": "amount", "operator": "GREATER_THAN", "value": 1000}
+                  ]},
+                  {"rule_code": "MID", "priority": 20, "conditions": [
+                    {"field": "country", "operator": "EQUAL_TO", "value": "US"}
+                  ]},
+                  {"rule_code": "MID_ALIAS", "priority": 5, "conditions": [
+                    {"field": "country", "operator": "EQUAL_TO", "value": "US"}
+                  ]}
+                ]
+                """;
+        EngineModel model = compiler.compile(writeRules(rulesJson));
+
+        assertThat(model.getPriorityTiers()).containsExactly(50, 20, 10);
+
+        // A predicate belongs to the highest tier that uses it
+        int fieldStatus = model.getFieldDictionary().getId("STATUS");
+        int fieldAmount = model.getFieldDictionary().getId("AMOUNT");
+        int fieldCountry = model.getFieldDictionary().getId("COUNTRY");
+        assertThat(fieldsOf(model, model.getTierPredicateIds(0))).containsExactlyInAnyOrder(fieldStatus, fieldAmount);
+        assertThat(fieldsOf(model, model.getTierPredicateIds(1))).containsExactly(fieldCountry);
+        assertThat(model.getTierPredicateIds(2)).isEmpty();
+
+        // Rules sharing a combination are tiered by their highest priority
+        assertThat(model.getCombinationIdsForRule("MID_ALIAS")).isNotEmpty();
+        for (int combinationId : model.getCombinationIdsForRule("MID_ALIAS")) {
+            assertThat(model.getCombinationMaxPriority(combinationId)).isEqualTo(20);
+        }
+    }
+
+    @Test
+    @DisplayName("Should store the rules of each combination as contiguous rule entries")
+    void shouldFlattenCombinationRules() throws Exception {
+        String rulesJson = """
+                [
+                  {"rule_code": "RULE_A", "priority": 7, "conditions": [
+                    {"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"},
+                    {"field": "country", "operator": "IS_ANY_OF", "value": ["US", "CA"]}
+                  ]},
+                  {"rule_code": "RULE_B", "priority": 3, "conditions": [
+                    {"field": "status", "operator": "EQUAL_TO", "value": "ACTIVE"},
+                    {"field": "country", "operator": "IS_ANY_OF", "value": ["US", "UK"]}
+                  ]}
+                ]
+                """;
+        EngineModel model = compiler.compile(writeRules(rulesJson));
+
+        // Entries cover every combination back to back; rule codes are stored once
+        assertThat(model.getCombinationRuleStart(0)).isZero();
+        int entries = 0;
+        for (int i = 0; i < model.getNumRules(); i++) {
+            assertThat(model.getCombinationRuleStart(i)).isEqualTo(entries);
+            entries = model.getCombinationRuleEnd(i);
+            assertThat(model.getCombinationPrioritiesAll(i)).hasSize(model.getCombinationRuleCodes(i).size());
+        }
+        assertThat(entries).isEqualTo(4);
+        assertThat(model.getNumLogicalRules()).isEqualTo(2);
+
+        // The shared { status=ACTIVE, country=US } combination holds both rules with their own priorities
+        int shared = -1;
+        for (int i = 0; i < model.getNumRules(); i++) {
+            if (model.getCombinationRuleEnd(i) - model.getCombinationRuleStart(i) == 2) {
+                shared = i;
+            }
+        }
+        assertThat(shared).isNotNegative();
+        for (int entry = model.getCombinationRuleStart(shared); entry < model.getCombinationRuleEnd(shared); entry++) {
+            String ruleCode = model.getRuleEntryCode(entry);
+            assertThat(model.getLogicalRuleCode(model.getRuleEntryRule(entry))).isEqualTo(ruleCode);
+            assertThat(model.getRuleEntryPriority(entry)).isEqualTo(ruleCode.equals("RULE_A") ? 7 : 3);
+            assertThat(model.getRuleEntryFamily(entry)).isZero();
+        }
+        assertThat(model.getCombinationRuleCodes(shared)).containsExactlyInAnyOrder("RULE_A", "RULE_B");
+    }
+
+    private static int[] fieldsOf(EngineModel model, int[] predicateIds) {
+        int[] fieldIds = new int[predicateIds.length];
+        for (int i = 0; i < predicateIds.length; i++) {
+            fieldIds[i] = model.getPredicate(predicateIds[i]).fieldId();
+        }
+        return fieldIds;
+    }
+}
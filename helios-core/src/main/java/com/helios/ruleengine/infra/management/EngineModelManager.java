@@ -6,6 +6,8 @@ import com.helios.ruleengine.api.exceptions.CompilationException;
 import com.helios.ruleengine.api.IRuleCompiler;
 import com.helios.ruleengine.api.model.RuleDefinition;
 import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.EngineModelSnapshot;
+import com.helios.ruleengine.runtime.model.ModelInterner;
 import io.opentelemetry.api.trace.Span;
 import io.opentelemetry.api.trace.Tracer;
 import io.opentelemetry.context.Scope;
@@ -41,6 +43,13 @@ public class EngineModelManager implements IEngineModelManager {
     private final ScheduledExecutorService monitoringExecutor;
     private final Tracer tracer;
 
+    /**
+     * Shares identical predicates and posting bitmaps between successive
+     * compiled models, so the old and new model do not hold two copies of
+     * what a reload left unchanged.
+     */
+    private final ModelInterner interner = new ModelInterner();
+
     private long lastModifiedTime = -1;
 
     /**
@@ -59,6 +68,7 @@ public class EngineModelManager implements IEngineModelManager {
         this.tracer = tracer;
         this.compiler = compiler;
         this.compiler.setTracer(tracer);
+        this.compiler.setInterner(interner);
         this.monitoringExecutor = Executors.newSingleThreadScheduledExecutor(r -> {
             Thread t = new Thread(r, "Rule-File-Monitor");
             t.setDaemon(true);
@@ -84,6 +94,7 @@ public class EngineModelManager implements IEngineModelManager {
         this.tracer = tracer;
         this.compiler = compiler;
         this.compiler.setTracer(tracer);
+        this.compiler.setInterner(interner);
         this.monitoringExecutor = Executors.newSingleThreadScheduledExecutor(r -> {
             Thread t = new Thread(r, "Rule-File-Monitor");
             t.setDaemon(true);
@@ -187,6 +198,7 @@ public class EngineModelManager implements IEngineModelManager {
             activeModel.set(newModel);
             this.lastModifiedTime = modifiedTime;
             span.setAttribute("newModel.uniqueCombinations", newModel.getNumRules());
+            recordSharing(span);
             logger.info("Successfully recompiled and swapped to new rule model.");
 
             compiler.setCompilationListener(null);
@@ -222,6 +234,7 @@ public class EngineModelManager implements IEngineModelManager {
             EngineModel newModel = compiler.compile(rules);
             activeModel.set(newModel);
             span.setAttribute("newModel.uniqueCombinations", newModel.getNumRules());
+            recordSharing(span);
             logger.info("Successfully compiled and loaded " + rules.size() + " rules from database.");
 
             compiler.setCompilationListener(null);
@@ -237,6 +250,68 @@ public class EngineModelManager implements IEngineModelManager {
         }
     }
 
+    /**
+     * Loads and activates a model snapshot written by {@link #writeSnapshot(Path, long)},
+     * skipping compilation, if it exists and was written for the same source.
+     *
+     * @param sourceFingerprint fingerprint of the current rules, e.g.
+     *                          {@link EngineModelSnapshot#fingerprint(List)}
+     * @return true if the snapshot was activated; false if it is missing, stale or
+     *         unreadable, in which case the caller should compile
+     */
+    public boolean loadSnapshot(Path snapshotPath, long sourceFingerprint) {
+        if (!Files.exists(snapshotPath)) {
+            return false;
+        }
+        Span span = tracer.spanBuilder("load-model-snapshot").startSpan();
+        try (Scope scope = span.makeCurrent()) {
+            span.setAttribute("snapshotFile", snapshotPath.toString());
+            if (EngineModelSnapshot.readSourceFingerprint(snapshotPath) != sourceFingerprint) {
+                logger.info("Model snapshot " + snapshotPath + " is stale; recompiling.");
+                return false;
+            }
+            long loadStart = System.nanoTime();
+            EngineModel newModel = EngineModelSnapshot.read(snapshotPath);
+            activeModel.set(newModel);
+            span.setAttribute("newModel.uniqueCombinations", newModel.getNumRules());
+            logger.info(String.format("Loaded model snapshot %s in %.2f ms", snapshotPath,
+                    (System.nanoTime() - loadStart) / 1_000_000.0));
+            triggerCacheWarmup(newModel);
+            return true;
+        } catch (IOException | RuntimeException e) {
+            span.recordException(e);
+            logger.log(Level.WARNING, "Could not load model snapshot " + snapshotPath + "; recompiling.", e);
+            return false;
+        } finally {
+            span.end();
+        }
+    }
+
+    /**
+     * Writes the active model as a snapshot for {@link #loadSnapshot(Path, long)}.
+     *
+     * @param sourceFingerprint fingerprint of the rules the active model was compiled from
+     * @throws IOException if the snapshot cannot be written
+     */
+    public void writeSnapshot(Path snapshotPath, long sourceFingerprint) throws IOException {
+        Span span = tracer.spanBuilder("write-model-snapshot").startSpan();
+        try (Scope scope = span.makeCurrent()) {
+            EngineModelSnapshot.write(activeModel.get(), sourceFingerprint, snapshotPath);
+            span.setAttribute("snapshotBytes", Files.size(snapshotPath));
+            logger.info("Wrote model snapshot " + snapshotPath);
+        } catch (IOException | RuntimeException e) {
+            span.recordException(e);
+            throw e;
+        } finally {
+            span.end();
+        }
+    }
+
+    private void recordSharing(Span span) {
+        span.setAttribute("newModel.sharedPredicates", interner.getSharedPredicates());
+        span.setAttribute("newModel.sharedBitmaps", interner.getSharedBitmaps());
+    }
+
     private void triggerCacheWarmup(EngineModel newModel) {
         if (cacheWarmupCallback != null) {
             Span warmupSpan = tracer.spanBuilder("cache-warmup").startSpan();
@@ -299,6 +374,7 @@ public class EngineModelManager implements IEngineModelManager {
             activeModel.set(newModel);
             this.lastModifiedTime = modifiedTime;
             span.setAttribute("newModel.uniqueCombinations", newModel.getNumRules());
+            recordSharing(span);
             logger.info("Successfully reloaded and swapped to new rule model.");
             triggerCacheWarmup(newModel);
         } catch (IOException | RuntimeException e) {
@@ -0,0 +1,91 @@
+package com.helios.ruleengine.model;
+
+import com.helios.ruleengine.runtime.model.Dictionary;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+/**
+ * A frozen dictionary must keep every ID, find nothing it does not hold, and
+ * reject new entries.
+ */
+class DictionaryFreezeTest {
+
+    // Includes equal String.hashCode pairs ("Aa"/"BB"), the empty string and non-ASCII entries
+    private static List<String> entries() {
+        List<String> entries = new ArrayList<>(List.of("Aa", "BB", "AaAa", "BBBB", "", "ÜBER", "東京"));
+        for (int i = 0; i < 5_000; i++) {
+            entries.add("VALUE_" + i);
+        }
+        return entries;
+    }
+
+    private static Dictionary dictionary(List<String> entries) {
+        Dictionary dictionary = new Dictionary();
+        entries.forEach(dictionary::encode);
+        return dictionary;
+    }
+
+    @Test
+    @DisplayName("Frozen dictionary should keep every ID")
+    void shouldKeepIds() {
+        List<String> entries = entries();
+        Dictionary dictionary = dictionary(entries);
+
+        assertThat(dictionary.freeze()).isSameAs(dictionary);
+        assertThat(dictionary.isFrozen()).isTrue();
+        assertThat(dictionary.size()).isEqualTo(entries.size());
+        for (int id = 0; id < entries.size(); id++) {
+            assertThat(dictionary.getId(entries.get(id))).isEqualTo(id);
+            assertThat(dictionary.decode(id)).isEqualTo(entries.get(id));
+            assertThat(dictionary.encode(entries.get(id))).isEqualTo(id);
+        }
+        assertThat(dictionary.decode(-1)).isNull();
+        assertThat(dictionary.decode(entries.size())).isNull();
+    }
+
+    @Test
+    @DisplayName("Frozen dictionary should not find or accept new values")
+    void shouldRejectUnknownValues() {
+        Dictionary dictionary = dictionary(entries()).freeze();
+
+        for (String unknown : List.of("VALUE_5000", "VALUE_", "value_1", "Ab", "AAAA", "ÜBER ")) {
+            assertThat(dictionary.getId(unknown)).as(unknown).isEqualTo(-1);
+        }
+        assertThat(dictionary.getId(null)).isEqualTo(-1);
+        assertThatThrownBy(() -> dictionary.encode("NEW"))
+                .isInstanceOf(IllegalStateException.class)
+                .hasMessageContaining("frozen");
+    }
+
+    @Test
+    @DisplayName("Empty and serialized frozen dictionaries should work")
+    void shouldFreezeEmptyAndSerialize() throws Exception {
+        Dictionary empty = new Dictionary().freeze();
+        assertThat(empty.size()).isZero();
+        assertThat(empty.getId("ANY")).isEqualTo(-1);
+
+        List<String> entries = entries();
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        try (ObjectOutputStream out = new ObjectOutputStream(bytes)) {
+            out.writeObject(dictionary(entries).freeze());
+        }
+        Dictionary copy;
+        try (ObjectInputStream in = new ObjectInputStream(new ByteArrayInputStream(bytes.toByteArray()))) {
+            copy = (Dictionary) in.readObject();
+        }
+        for (int id = 0; id < entries.size(); id++) {
+            assertThat(copy.getId(entries.get(id))).isEqualTo(id);
+            assertThat(copy.decode(id)).isEqualTo(entries.get(id));
+        }
+    }
+}
@@ -0,0 +1,220 @@
+package com.helios.ruleengine.model;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.RuleDefinition;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.evaluation.RuleEvaluator;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.EngineModelSnapshot;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Random;
+import java.util.stream.Stream;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+/**
+ * A model loaded from a binary snapshot must evaluate exactly like the model
+ * it was written from, and damaged snapshots must be rejected.
+ */
+class EngineModelSnapshotTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int RULES = 60;
+
+    private Path tempDir;
+
+    @BeforeEach
+    void setUp() throws IOException {
+        tempDir = Files.createTempDirectory("model_snapshot_test");
+    }
+
+    @AfterEach
+    void tearDown() throws IOException {
+        try (Stream<Path> files = Files.walk(tempDir)) {
+            files.sorted(Comparator.reverseOrder()).forEach(path -> path.toFile().delete());
+        }
+    }
+
+    private static RuleDefinition.Condition condition(String field, String operator, Object value) {
+        return new RuleDefinition.Condition(field, operator, value);
+    }
+
+    // Mixes dictionary-encoded, numeric, list, string, regex and null-check predicates
+    private static List<RuleDefinition> rules() {
+        List<RuleDefinition> rules = new ArrayList<>();
+        for (int i = 0; i < RULES; i++) {
+            List<RuleDefinition.Condition> conditions = new ArrayList<>();
+            conditions.add(condition("country", "IS_ANY_OF", List.of("C" + (i % 5), "C" + ((i + 2) % 5))));
+            switch (i % 6) {
+                case 0 -> conditions.add(condition("amount", "GREATER_THAN", i * 10));
+                case 1 -> conditions.add(condition("amount", "BETWEEN", List.of(i, i * 20)));
+                case 2 -> conditions.add(condition("merchant", "REGEX", "^M" + (i % 3) + ".*"));
+                case 3 -> conditions.add(condition("merchant", "STARTS_WITH", "m" + (i % 4)));
+                case 4 -> conditions.add(condition("status", "NOT_EQUAL_TO", "BLOCKED"));
+                default -> conditions.add(condition("coupon", "IS_NULL", null));
+            }
+            if (i % 4 == 0) {
+                conditions.add(condition("score", "LESS_THAN_OR_EQUAL", 0.5 + i / 100.0));
+            }
+            rules.add(new RuleDefinition("R" + i, conditions, i % 9, "Rule " + i, true,
+                    i % 3 == 0 ? "fraud" : null));
+        }
+        return rules;
+    }
+
+    private static List<Event> randomEvents(int count, long seed) {
+        Random random = new Random(seed);
+        List<Event> events = new ArrayList<>(count);
+        for (int i = 0; i < count; i++) {
+            Map<String, Object> attrs = new HashMap<>();
+            attrs.put("country", "C" + random.nextInt(6));
+            attrs.put("amount", random.nextInt(1200));
+            attrs.put("merchant", "M" + random.nextInt(5) + "X");
+            attrs.put("score", random.nextDouble());
+            if (random.nextBoolean()) {
+                attrs.put("status", random.nextBoolean() ? "BLOCKED" : "OK");
+            }
+            if (random.nextInt(3) == 0) {
+                attrs.put("coupon", "SPRING");
+            }
+            events.add(new Event("evt-" + i, "TEST", attrs));
+        }
+        return events;
+    }
+
+    private static EngineModel compile(SelectionStrategy strategy) throws Exception {
+        return new RuleCompiler(NOOP_TRACER).compile(rules(), strategy);
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).sorted().toList();
+    }
+
+    @Test
+    @DisplayName("Snapshot round trip should evaluate like the compiled model")
+    void shouldMatchOriginalModel() throws Exception {
+        for (SelectionStrategy strategy : List.of(SelectionStrategy.ALL_MATCHES, SelectionStrategy.FIRST_MATCH)) {
+            EngineModel original = compile(strategy);
+            Path snapshot = tempDir.resolve("model-" + strategy + ".snapshot");
+            new RuleCompiler(NOOP_TRACER).writeSnapshot(original, 42L, snapshot);
+
+            EngineModel loaded = EngineModelSnapshot.read(snapshot);
+
+            assertThat(loaded.getSelectionStrategy()).isEqualTo(strategy);
+            assertThat(loaded.getNumRules()).isEqualTo(original.getNumRules());
+            assertThat(loaded.getUniquePredicates()).hasSameSizeAs(original.getUniquePredicates());
+            assertThat(loaded.getInvertedIndex()).isEqualTo(original.getInvertedIndex());
+
+            RuleEvaluator expected = new RuleEvaluator(original, NOOP_TRACER, false);
+            RuleEvaluator actual = new RuleEvaluator(loaded, NOOP_TRACER, false);
+            for (Event event : randomEvents(300, 17L)) {
+                assertThat(codes(actual.evaluate(event)))
+                        .as("%s matches for %s", strategy, event)
+                        .isEqualTo(codes(expected.evaluate(event)));
+            }
+        }
+    }
+
+    @Test
+    @DisplayName("Snapshot should preserve stats, families, dictionaries and rule metadata")
+    void shouldPreserveMetadata() throws Exception {
+        EngineModel original = compile(SelectionStrategy.ALL_MATCHES);
+        Path snapshot = tempDir.resolve("model.snapshot");
+        EngineModelSnapshot.write(original, 7L, snapshot);
+
+        EngineModel loaded = EngineModelSnapshot.read(snapshot);
+
+        assertThat(loaded.getStats()).isEqualTo(original.getStats());
+        assertThat(loaded.getNumFamilies()).isEqualTo(original.getNumFamilies());
+        assertThat(loaded.getValueDictionary().isFrozen()).isTrue();
+        assertThat(loaded.getValueDictionary().size()).isEqualTo(original.getValueDictionary().size());
+        for (int id = 0; id < original.getValueDictionary().size(); id++) {
+            String value = original.getValueDictionary().decode(id);
+            assertThat(loaded.getValueDictionary().getId(value)).isEqualTo(id);
+        }
+        assertThat(loaded.getAllRuleMetadata()).containsExactlyInAnyOrderElementsOf(original.getAllRuleMetadata());
+        for (int combinationId = 0; combinationId < original.getNumRules(); combinationId++) {
+            assertThat(loaded.getCombinationRuleCodes(combinationId))
+                    .isEqualTo(original.getCombinationRuleCodes(combinationId));
+            assertThat(loaded.getCombinationFamilies(combinationId))
+                    .isEqualTo(original.getCombinationFamilies(combinationId));
+        }
+        assertThat(EngineModelSnapshot.readSourceFingerprint(snapshot)).isEqualTo(7L);
+    }
+
+    @Test
+    @DisplayName("Fingerprint should change with the rules")
+    void shouldFingerprintRules() {
+        List<RuleDefinition> rules = rules();
+        List<RuleDefinition> changed = new ArrayList<>(rules);
+        changed.set(0, new RuleDefinition("R0", rules.get(0).conditions(), 99, "Rule 0", true, "fraud"));
+
+        assertThat(EngineModelSnapshot.fingerprint(rules)).isEqualTo(EngineModelSnapshot.fingerprint(rules()));
+        assertThat(EngineModelSnapshot.fingerprint(changed)).isNotEqualTo(EngineModelSnapshot.fingerprint(rules));
+    }
+
+    @Test
+    @DisplayName("Damaged snapshots should be rejected")
+    void shouldRejectDamagedSnapshots() throws Exception {
+        Path snapshot = tempDir.resolve("model.snapshot");
+        EngineModelSnapshot.write(compile(SelectionStrategy.ALL_MATCHES), 1L, snapshot);
+        byte[] bytes = Files.readAllBytes(snapshot);
+
+        byte[] flipped = bytes.clone();
+        flipped[bytes.length / 2] ^= 0x5A;
+        Path corrupted = Files.write(tempDir.resolve("corrupted.snapshot"), flipped);
+        assertThatThrownBy(() -> EngineModelSnapshot.read(corrupted))
+                .isInstanceOf(IOException.class)
+                .hasMessageContaining("checksum");
+
+        byte[] renamed = bytes.clone();
+        renamed[0] = 'X';
+        Path foreign = Files.write(tempDir.resolve("foreign.snapshot"), renamed);
+        assertThatThrownBy(() -> EngineModelSnapshot.read(foreign)).isInstanceOf(IOException.class);
+        assertThatThrownBy(() -> EngineModelSnapshot.readSourceFingerprint(foreign))
+                .isInstanceOf(IOException.class);
+
+        Path truncated = Files.write(tempDir.resolve("truncated.snapshot"),
+                Arrays.copyOf(bytes, bytes.length - 3));
+        assertThatThrownBy(() -> EngineModelSnapshot.read(truncated)).isInstanceOf(IOException.class);
+    }
+
+    @Test
+    @DisplayName("Snapshots from another model semantics version should be rejected")
+    void shouldRejectOtherSemanticsVersion() throws Exception {
+        Path snapshot = tempDir.resolve("model.snapshot");
+        EngineModelSnapshot.write(compile(SelectionStrategy.ALL_MATCHES), 1L, snapshot);
+        ByteBuffer bytes = ByteBuffer.wrap(Files.readAllBytes(snapshot)).order(ByteOrder.LITTLE_ENDIAN);
+        assertThat(bytes.getInt(12)).isEqualTo(EngineModel.SEMANTICS_VERSION);
+
+        // The header is outside the checksum, so only the version check can catch this
+        bytes.putInt(12, EngineModel.SEMANTICS_VERSION - 1);
+        Path older = Files.write(tempDir.resolve("older.snapshot"), bytes.array());
+        assertThatThrownBy(() -> EngineModelSnapshot.read(older))
+                .isInstanceOf(IOException.class)
+                .hasMessageContaining("semantics version");
+        assertThatThrownBy(() -> EngineModelSnapshot.readSourceFingerprint(older))
+                .isInstanceOf(IOException.class)
+                .hasMessageContaining("semantics version");
+    }
+}
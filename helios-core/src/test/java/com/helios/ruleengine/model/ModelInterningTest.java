@@ -0,0 +1,125 @@
+package com.helios.ruleengine.model;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.api.model.RuleDefinition;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.evaluation.RuleEvaluator;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.ModelInterner;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.roaringbitmap.RoaringBitmap;
+
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Random;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Successive models compiled with one interner share their unchanged
+ * predicates and posting bitmaps, and still evaluate like unshared models.
+ */
+class ModelInterningTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int RULES = 80;
+
+    private static List<RuleDefinition> rules(int amountOffset) {
+        List<RuleDefinition> rules = new ArrayList<>();
+        for (int i = 0; i < RULES; i++) {
+            List<RuleDefinition.Condition> conditions = new ArrayList<>();
+            conditions.add(new RuleDefinition.Condition("country", "IS_ANY_OF",
+                    List.of("C" + (i % 5), "C" + ((i + 1) % 5))));
+            conditions.add(new RuleDefinition.Condition("merchant", "EQUAL_TO", "M" + (i % 20)));
+            // Only the last rule's threshold moves between versions
+            int amount = i == RULES - 1 ? i * 10 + amountOffset : i * 10;
+            conditions.add(new RuleDefinition.Condition("amount", "GREATER_THAN", amount));
+            rules.add(new RuleDefinition("R" + i, conditions, i % 7, "Rule " + i, true, null));
+        }
+        return rules;
+    }
+
+    private static List<Event> randomEvents(int count, long seed) {
+        Random random = new Random(seed);
+        List<Event> events = new ArrayList<>(count);
+        for (int i = 0; i < count; i++) {
+            Map<String, Object> attrs = new HashMap<>();
+            attrs.put("country", "C" + random.nextInt(6));
+            attrs.put("merchant", "M" + random.nextInt(22));
+            attrs.put("amount", random.nextInt(RULES * 10 + 50));
+            events.add(new Event("evt-" + i, "TEST", attrs));
+        }
+        return events;
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).sorted().toList();
+    }
+
+    @Test
+    @DisplayName("Recompiled models should share unchanged predicates and bitmaps")
+    void shouldShareUnchangedParts() throws Exception {
+        ModelInterner interner = new ModelInterner();
+        RuleCompiler compiler = new RuleCompiler(NOOP_TRACER);
+        compiler.setInterner(interner);
+
+        EngineModel first = compiler.compile(rules(0));
+        assertThat(interner.getSharedPredicates()).isZero();
+        EngineModel second = compiler.compile(rules(5));
+
+        assertThat(interner.getSharedPredicates()).isPositive();
+        assertThat(interner.getSharedBitmaps()).isPositive();
+        int samePredicates = 0;
+        for (Predicate predicate : second.getUniquePredicates()) {
+            int firstId = first.getPredicateId(predicate);
+            Predicate previous = firstId >= 0 ? first.getPredicate(firstId) : null;
+            if (previous != null && previous.weight() == predicate.weight()
+                    && previous.selectivity() == predicate.selectivity()) {
+                assertThat(predicate).isSameAs(previous);
+                samePredicates++;
+            }
+        }
+        assertThat(samePredicates).isEqualTo(interner.getSharedPredicates());
+
+        int sameBitmaps = 0;
+        for (Int2ObjectMap.Entry<RoaringBitmap> entry : second.getInvertedIndex().int2ObjectEntrySet()) {
+            RoaringBitmap previous = first.getInvertedIndex().get(entry.getIntKey());
+            if (previous == entry.getValue()) {
+                sameBitmaps++;
+            }
+        }
+        assertThat(sameBitmaps).isPositive();
+    }
+
+    @Test
+    @DisplayName("Shared models should evaluate like models compiled alone")
+    void shouldEvaluateLikeUnsharedModels() throws Exception {
+        RuleCompiler compiler = new RuleCompiler(NOOP_TRACER);
+        compiler.setInterner(new ModelInterner());
+        EngineModel first = compiler.compile(rules(0));
+        EngineModel second = compiler.compile(rules(5));
+
+        RuleCompiler alone = new RuleCompiler(NOOP_TRACER);
+        RuleEvaluator firstExpected = new RuleEvaluator(alone.compile(rules(0)), NOOP_TRACER, false);
+        RuleEvaluator secondExpected = new RuleEvaluator(alone.compile(rules(5)), NOOP_TRACER, false);
+        RuleEvaluator firstShared = new RuleEvaluator(first, NOOP_TRACER, false);
+        RuleEvaluator secondShared = new RuleEvaluator(second, NOOP_TRACER, false);
+
+        for (Event event : randomEvents(300, 5L)) {
+            assertThat(codes(firstShared.evaluate(event)))
+                    .as("previous model matches for %s", event)
+                    .isEqualTo(codes(firstExpected.evaluate(event)));
+            assertThat(codes(secondShared.evaluate(event)))
+                    .as("new model matches for %s", event)
+                    .isEqualTo(codes(secondExpected.evaluate(event)));
+        }
+    }
+}
@@ -1,6 +1,7 @@
 package com.helios.ruleengine.validation;
 
 import com.helios.ruleengine.api.exceptions.CompilationException;
+import com.helios.ruleengine.api.model.Predicate;
 import com.helios.ruleengine.compiler.RuleCompiler;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.infra.telemetry.TracingService;
@@ -11,6 +12,7 @@ import org.junit.jupiter.params.provider.MethodSource;
 import java.io.IOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.util.Arrays;
 import java.util.Comparator;
 import java.util.UUID;
 import java.util.stream.Stream;
@@ -339,8 +341,8 @@ class CompilationValidationTest {
 
     @Test
     @Order(4)
-    @DisplayName("Should warn on extreme expansions")
-    void shouldWarnOnExtremeExpansions() throws Exception {
+    @DisplayName("Should compile extreme expansions to set-membership predicates")
+    void shouldCompileExtremeExpansionsAsSetMembership() throws Exception {
         // GIVEN: Rule with extreme expansion potential
         StringBuilder values = new StringBuilder("[");
         for (int i = 0; i < 50; i++) {
@@ -359,24 +361,20 @@ class CompilationValidationTest {
 
         Path rulesFile = createTempRulesFile(rulesJson);
 
-        // WHEN/THEN: Should either compile with warning or reject
-        // (This would expand to 50^3 = 125,000 combinations)
-        try {
-            EngineModel model = COMPILER.compile(rulesFile);
-
-            int totalExpanded = (int) model.getStats().metadata()
-                    .getOrDefault("totalExpandedCombinations", 0);
+        // WHEN: Compile (full expansion would be 50^3 = 125,000 combinations)
+        EngineModel model = COMPILER.compile(rulesFile);
 
-            // If it compiles, verify the expansion count
-            assertThat(totalExpanded)
-                    .as("Should expand to 125,000 combinations")
-                    .isGreaterThan(100000);
+        // THEN: One list is expanded, the other two stay set-membership predicates
+        int totalExpanded = (int) model.getStats().metadata()
+                .getOrDefault("totalExpandedCombinations", 0);
 
-        } catch (CompilationException e) {
-            // Also acceptable - reject extreme expansions
-            assertThat(e.getMessage())
-                    .containsAnyOf("expansion", "too many", "limit");
-        }
+        assertThat(totalExpanded)
+                .as("Should expand only the first list within the per-rule budget")
+                .isEqualTo(50);
+        assertThat(Arrays.stream(model.getUniquePredicates())
+                .filter(p -> p.operator() == Predicate.Operator.IS_ANY_OF)
+                .count())
+                .isEqualTo(2);
     }
 
     // ========================================================================
@@ -1,5 +1,7 @@
 package com.helios.ruleengine.runtime.context;
 
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntIterator;
 import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
 import it.unimi.dsi.fastutil.ints.IntSet;
 
@@ -22,14 +24,17 @@ import org.roaringbitmap.RoaringBitmap;
  * - Pre-sized collections to minimize resizing
  * - Direct field access for hot paths (counters, touchedRules)
  * - Reusable RoaringBitmap buffer for intersection operations
+ * - truePredicates is a dense bitset with word-level clear on reset()
+ * - Bounded selection (TOP_K / MAX_PRIORITY_N) keeps matches in fixed-size heaps
+ *   instead of the full match list
  *
  * FIX: touchedRules is now IntSet for automatic deduplication
  * FIX: predicatesEvaluated public field now synchronized with internal counter
  */
 public final class EvaluationContext {
 
-    // Predicate evaluation results
-    private final IntSet truePredicates;
+    // Predicate evaluation results (dense bitset over predicate IDs)
+    private final PredicateBitSet truePredicates;
 
     // Rule matching state
     // FIX: Changed from IntList to IntSet to automatically deduplicate
@@ -49,6 +54,11 @@ public final class EvaluationContext {
     private final List<MutableMatchedRule> rulePool;
     private int poolIndex;
 
+    // Bounded selection: one heap per family (a single heap when not per family), 0 = unbounded
+    private int matchLimit;
+    private MatchHeap[] matchHeaps;
+    private final IntArrayList activeHeaps = new IntArrayList();
+
     // Metrics
     private int predicatesEvaluatedCount;
 
@@ -62,7 +72,12 @@ public final class EvaluationContext {
     }
 
     public EvaluationContext(int numRules, int estimatedTouchedRules, int initialMatchCapacity) {
-        this.truePredicates = new IntOpenHashSet(256);
+        this(numRules, estimatedTouchedRules, initialMatchCapacity, 256);
+    }
+
+    public EvaluationContext(int numRules, int estimatedTouchedRules, int initialMatchCapacity,
+            int numPredicates) {
+        this.truePredicates = new PredicateBitSet(numPredicates);
         this.touchedRules = new IntOpenHashSet(estimatedTouchedRules); // FIX: Now a Set
         this.counters = new int[numRules];
         this.bitmapBuffer = new RoaringBitmap();
@@ -100,6 +115,7 @@ public final class EvaluationContext {
         bitmapBuffer.clear();
         matchedRules.clear();
         poolIndex = 0; // Reset pool index to reuse objects
+        clearMatchHeaps();
         predicatesEvaluatedCount = 0;
         predicatesEvaluated = 0; // FIX: Synchronize public field
     }
@@ -111,6 +127,37 @@ public final class EvaluationContext {
         truePredicates.add(predicateId);
     }
 
+    /**
+     * Record a set of predicates as true, restricted to
+     * {@code eligiblePredicateIds} when non-null.
+     *
+     * @return Number of predicates recorded
+     */
+    public int addTruePredicates(PredicateBitSet predicateIds, IntSet eligiblePredicateIds) {
+        if (eligiblePredicateIds == null || eligiblePredicateIds instanceof PredicateBitSet) {
+            return truePredicates.or(predicateIds, (PredicateBitSet) eligiblePredicateIds);
+        }
+        int count = 0;
+        for (IntIterator it = predicateIds.iterator(); it.hasNext();) {
+            int predicateId = it.nextInt();
+            if (eligiblePredicateIds.contains(predicateId)) {
+                truePredicates.add(predicateId);
+                count++;
+            }
+        }
+        return count;
+    }
+
+    /**
+     * Withdraw a predicate recorded as true (complement evaluation, where a
+     * whole set is recorded first and the few false members taken out).
+     *
+     * @return Whether the predicate was recorded
+     */
+    public boolean removeTruePredicate(int predicateId) {
+        return truePredicates.remove(predicateId);
+    }
+
     /**
      * Get all predicates that evaluated to true.
      */
@@ -196,11 +243,48 @@ public final class EvaluationContext {
      */
     public int predicatesEvaluated = 0; // Now synchronized with internal counter
 
+    /**
+     * Bounds matched rules to the {@code limit} highest-priority ones (ties broken
+     * by rule code), kept in fixed-size heaps so the full match list is never built.
+     * With {@code numFamilies > 1} the bound applies per family ID. Call
+     * {@link #collectLimitedMatches()} to move the selection into the matched rules.
+     */
+    public void setMatchLimit(int limit, int numFamilies) {
+        if (limit <= 0) {
+            throw new IllegalArgumentException("Match limit must be positive: " + limit);
+        }
+        this.matchLimit = limit;
+        this.matchHeaps = new MatchHeap[Math.max(1, numFamilies)];
+        this.activeHeaps.clear();
+    }
+
     /**
      * Add a matched rule to the results.
      * Uses mutable object to avoid allocation during hot evaluation path.
      */
     public void addMatchedRule(int ruleId, String ruleCode, int priority, String description) {
+        addMatchedRule(ruleId, ruleCode, priority, description, 0);
+    }
+
+    /**
+     * Add a matched rule of the given family. The family only matters with a
+     * per-family match limit (see {@link #setMatchLimit(int, int)}).
+     */
+    public void addMatchedRule(int ruleId, String ruleCode, int priority, String description, int familyId) {
+        if (matchLimit > 0) {
+            int heapIndex = matchHeaps.length == 1 ? 0 : familyId;
+            MatchHeap heap = matchHeaps[heapIndex];
+            if (heap == null) {
+                heap = new MatchHeap(matchLimit);
+                matchHeaps[heapIndex] = heap;
+            }
+            if (heap.isEmpty()) {
+                activeHeaps.add(heapIndex);
+            }
+            heap.offer(ruleId, ruleCode, priority, description);
+            return;
+        }
+
         MutableMatchedRule rule;
         if (poolIndex < rulePool.size()) {
             rule = rulePool.get(poolIndex);
@@ -214,6 +298,25 @@ public final class EvaluationContext {
         matchedRules.add(rule);
     }
 
+    /**
+     * Moves the bounded selection into the matched rules list: highest priority
+     * first within each family, families in order of their first match.
+     * No-op without a match limit.
+     */
+    public void collectLimitedMatches() {
+        for (int i = 0; i < activeHeaps.size(); i++) {
+            matchHeaps[activeHeaps.getInt(i)].drainTo(matchedRules);
+        }
+        activeHeaps.clear();
+    }
+
+    private void clearMatchHeaps() {
+        for (int i = 0; i < activeHeaps.size(); i++) {
+            matchHeaps[activeHeaps.getInt(i)].clear();
+        }
+        activeHeaps.clear();
+    }
+
     /**
      * Get mutable matched rules list.
      * Used during evaluation to build results without allocation.
@@ -222,6 +325,101 @@ public final class EvaluationContext {
         return matchedRules;
     }
 
+    /**
+     * Fixed-capacity min-heap of matched rules: the root is the weakest kept
+     * match, replaced when a stronger one arrives. Slots are reused across
+     * evaluations, so steady-state offers do not allocate.
+     */
+    private static final class MatchHeap {
+        private final MutableMatchedRule[] slots;
+        private int size;
+
+        MatchHeap(int capacity) {
+            this.slots = new MutableMatchedRule[capacity];
+        }
+
+        boolean isEmpty() {
+            return size == 0;
+        }
+
+        void clear() {
+            size = 0;
+        }
+
+        void offer(int ruleId, String ruleCode, int priority, String description) {
+            if (size < slots.length) {
+                MutableMatchedRule slot = slots[size];
+                if (slot == null) {
+                    slot = new MutableMatchedRule();
+                    slots[size] = slot;
+                }
+                slot.set(ruleId, ruleCode, priority, description);
+                siftUp(size++);
+            } else if (outranks(priority, ruleCode, slots[0])) {
+                slots[0].set(ruleId, ruleCode, priority, description);
+                siftDown(0, size);
+            }
+        }
+
+        /**
+         * In-place heap sort (weakest moved to the end), then appends best first.
+         */
+        void drainTo(List<MutableMatchedRule> out) {
+            for (int end = size - 1; end > 0; end--) {
+                swap(0, end);
+                siftDown(0, end);
+            }
+            for (int i = 0; i < size; i++) {
+                out.add(slots[i]);
+            }
+            size = 0;
+        }
+
+        private static boolean outranks(int priority, String ruleCode, MutableMatchedRule other) {
+            return priority != other.getPriority()
+                    ? priority > other.getPriority()
+                    : ruleCode.compareTo(other.getRuleCode()) < 0;
+        }
+
+        private static boolean weaker(MutableMatchedRule a, MutableMatchedRule b) {
+            return outranks(b.getPriority(), b.getRuleCode(), a);
+        }
+
+        private void siftUp(int index) {
+            while (index > 0) {
+                int parent = (index - 1) >>> 1;
+                if (!weaker(slots[index], slots[parent])) {
+                    break;
+                }
+                swap(index, parent);
+                index = parent;
+            }
+        }
+
+        private void siftDown(int index, int limit) {
+            while (true) {
+                int child = 2 * index + 1;
+                if (child >= limit) {
+                    break;
+                }
+                if (child + 1 < limit && weaker(slots[child + 1], slots[child])) {
+                    child++;
+                }
+                if (!weaker(slots[child], slots[index])) {
+                    break;
+                }
+                swap(index, child);
+                index = child;
+            }
+        }
+
+        private void swap(int i, int j) {
+            MutableMatchedRule tmp = slots[i];
+            slots[i] = slots[j];
+            slots[j] = tmp;
+        }
+    }
+
     /**
      * Mutable matched rule object - avoids allocation during evaluation.
      *
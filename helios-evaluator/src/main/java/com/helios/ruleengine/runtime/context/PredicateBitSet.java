@@ -0,0 +1,258 @@
+package com.helios.ruleengine.runtime.context;
+
+import it.unimi.dsi.fastutil.ints.AbstractIntSet;
+import it.unimi.dsi.fastutil.ints.IntIterator;
+import it.unimi.dsi.fastutil.ints.IntList;
+
+import java.util.Arrays;
+import java.util.NoSuchElementException;
+
+/**
+ * Dense bitset over predicate IDs, exposed as a fastutil {@link it.unimi.dsi.fastutil.ints.IntSet}.
+ *
+ * Predicate IDs are dense (0..numPredicates-1, see EngineModel.getUniquePredicates()),
+ * so membership is a single word load instead of a hash probe.
+ *
+ * PERFORMANCE OPTIMIZATIONS:
+ * - contains()/add(): one shift + mask on a long[] word
+ * - clear(): word-level, only zeroes words that became non-zero since the last clear
+ *   (O(touched words), not O(numPredicates))
+ * - forEach(): iterates set bits of touched words only, no iterator allocation
+ * - copy(): word-wise array copy
+ *
+ * THREAD SAFETY: Not thread-safe for mutation. Instances shared across threads
+ * (e.g. cached eligible-predicate sets) must not be modified after publication.
+ */
+public final class PredicateBitSet extends AbstractIntSet {
+
+    private long[] words;
+    private int size;
+
+    // Indexes of words that are (or were) non-zero since the last clear
+    private int[] touchedWords;
+    private int touchedCount;
+
+    public PredicateBitSet(int capacity) {
+        int numWords = Math.max(1, (capacity + 63) >>> 6);
+        this.words = new long[numWords];
+        this.touchedWords = new int[numWords];
+    }
+
+    private PredicateBitSet(PredicateBitSet source) {
+        this.words = source.words.clone();
+        this.touchedWords = source.touchedWords.clone();
+        this.touchedCount = source.touchedCount;
+        this.size = source.size;
+    }
+
+    /**
+     * Word-wise copy of this set.
+     */
+    public PredicateBitSet copy() {
+        return new PredicateBitSet(this);
+    }
+
+    @Override
+    public boolean contains(int k) {
+        int wordIndex = k >>> 6;
+        return k >= 0 && wordIndex < words.length && (words[wordIndex] & (1L << k)) != 0;
+    }
+
+    @Override
+    public boolean add(int k) {
+        if (k < 0) {
+            throw new IllegalArgumentException("Predicate ID must be non-negative: " + k);
+        }
+        int wordIndex = k >>> 6;
+        if (wordIndex >= words.length) {
+            grow(wordIndex + 1);
+        }
+        long word = words[wordIndex];
+        long bit = 1L << k;
+        if ((word & bit) != 0) {
+            return false;
+        }
+        if (word == 0) {
+            touchedWords[touchedCount++] = wordIndex;
+        }
+        words[wordIndex] = word | bit;
+        size++;
+        return true;
+    }
+
+    /**
+     * Add every ID in the list (no iterator allocation).
+     */
+    public void addAll(IntList ids) {
+        for (int i = 0; i < ids.size(); i++) {
+            add(ids.getInt(i));
+        }
+    }
+
+    /**
+     * Word-wise union with another bitset.
+     */
+    public void or(PredicateBitSet other) {
+        if (other.words.length > words.length) {
+            grow(other.words.length);
+        }
+        for (int i = 0; i < other.touchedCount; i++) {
+            int wordIndex = other.touchedWords[i];
+            long word = words[wordIndex];
+            long merged = word | other.words[wordIndex];
+            if (merged != word) {
+                if (word == 0) {
+                    touchedWords[touchedCount++] = wordIndex;
+                }
+                size += Long.bitCount(merged) - Long.bitCount(word);
+                words[wordIndex] = merged;
+            }
+        }
+    }
+
+    /**
+     * Word-wise union with {@code other ∩ mask}, or with all of {@code other}
+     * when {@code mask} is null.
+     *
+     * @return Number of IDs of {@code other} within the mask
+     */
+    public int or(PredicateBitSet other, PredicateBitSet mask) {
+        if (other.words.length > words.length) {
+            grow(other.words.length);
+        }
+        int count = 0;
+        for (int i = 0; i < other.touchedCount; i++) {
+            int wordIndex = other.touchedWords[i];
+            long added = other.words[wordIndex];
+            if (mask != null) {
+                added &= wordIndex < mask.words.length ? mask.words[wordIndex] : 0L;
+            }
+            count += Long.bitCount(added);
+            long word = words[wordIndex];
+            long merged = word | added;
+            if (merged != word) {
+                if (word == 0) {
+                    touchedWords[touchedCount++] = wordIndex;
+                }
+                size += Long.bitCount(merged) - Long.bitCount(word);
+                words[wordIndex] = merged;
+            }
+        }
+        return count;
+    }
+
+    @Override
+    public boolean remove(int k) {
+        if (!contains(k)) {
+            return false;
+        }
+        int wordIndex = k >>> 6;
+        words[wordIndex] &= ~(1L << k);
+        size--;
+        if (words[wordIndex] == 0) {
+            // Rare path: keep touchedWords free of zero words so add() can re-register it
+            for (int i = 0; i < touchedCount; i++) {
+                if (touchedWords[i] == wordIndex) {
+                    touchedWords[i] = touchedWords[--touchedCount];
+                    break;
+                }
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Word-level clear: zeroes only the words touched since the last clear.
+     */
+    @Override
+    public void clear() {
+        if (touchedCount > (words.length >>> 2)) {
+            Arrays.fill(words, 0L);
+        } else {
+            for (int i = 0; i < touchedCount; i++) {
+                words[touchedWords[i]] = 0L;
+            }
+        }
+        touchedCount = 0;
+        size = 0;
+    }
+
+    @Override
+    public int size() {
+        return size;
+    }
+
+    @Override
+    public boolean isEmpty() {
+        return size == 0;
+    }
+
+    /**
+     * Allocation-free iteration over set bits (touched words only, unordered across words).
+     */
+    @Override
+    public void forEach(java.util.function.IntConsumer action) {
+        for (int i = 0; i < touchedCount; i++) {
+            int wordIndex = touchedWords[i];
+            long word = words[wordIndex];
+            int base = wordIndex << 6;
+            while (word != 0) {
+                action.accept(base + Long.numberOfTrailingZeros(word));
+                word &= word - 1;
+            }
+        }
+    }
+
+    /**
+     * Ascending iterator over set bits.
+     */
+    @Override
+    public IntIterator iterator() {
+        return new IntIterator() {
+            private int wordIndex = -1;
+            private long word;
+            private int last = -1;
+
+            {
+                advance();
+            }
+
+            private void advance() {
+                while (word == 0 && ++wordIndex < words.length) {
+                    word = words[wordIndex];
+                }
+            }
+
+            @Override
+            public boolean hasNext() {
+                return word != 0;
+            }
+
+            @Override
+            public int nextInt() {
+                if (word == 0) {
+                    throw new NoSuchElementException();
+                }
+                last = (wordIndex << 6) + Long.numberOfTrailingZeros(word);
+                word &= word - 1;
+                advance();
+                return last;
+            }
+
+            @Override
+            public void remove() {
+                if (last < 0) {
+                    throw new IllegalStateException();
+                }
+                PredicateBitSet.this.remove(last);
+                last = -1;
+            }
+        };
+    }
+
+    private void grow(int minWords) {
+        int newLength = Math.max(minWords, words.length * 2);
+        words = Arrays.copyOf(words, newLength);
+        touchedWords = Arrays.copyOf(touchedWords, newLength);
+    }
+}
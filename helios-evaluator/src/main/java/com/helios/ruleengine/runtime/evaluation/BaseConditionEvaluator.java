@@ -443,7 +443,7 @@ public class BaseConditionEvaluator {
      */
     private boolean isStaticPredicate(Predicate predicate) {
         return switch (predicate.operator()) {
-            case EQUAL_TO, NOT_EQUAL_TO, IS_NULL, IS_NOT_NULL -> true;
+            case EQUAL_TO, NOT_EQUAL_TO, IS_ANY_OF, IS_NULL, IS_NOT_NULL -> true;
             default -> false;
         };
     }
@@ -0,0 +1,172 @@
+/*
+ * Copyright (c) 2025 Helios Rule Engine
+ * Licensed under the Apache License, Version 2.0
+ */
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.runtime.context.EvaluationContext;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.IntSet;
+import org.roaringbitmap.RoaringBitmap;
+
+import java.util.function.IntConsumer;
+
+/**
+ * Counter-free matcher for small combinations (see
+ * {@link EngineModel#getBitmapMatchCombinations(int)}).
+ *
+ * Instead of one counter increment per (true predicate, combination) pair, the
+ * hit counts are kept as bit-sliced RoaringBitmap layers: layer i holds the
+ * combinations hit by more than i true predicates. For each true predicate P:
+ *
+ * <pre>
+ * layer[i] |= layer[i-1] &amp; postings(P)   (from the top layer down)
+ * layer[0] |= postings(P)
+ * </pre>
+ *
+ * A combination of size k matches when it is in layer k-1, so the matches are
+ * the union of {@code layer[k-1] & combinationsOfSize(k)}. All work is
+ * container-level ORs/ANDs.
+ *
+ * THREAD SAFETY: Layers are thread-local; the instance can be shared by the
+ * evaluator's threads.
+ */
+final class BitmapMatcher {
+
+    private final Int2ObjectMap<RoaringBitmap> postings;
+    private final RoaringBitmap[] combinationsBySize;
+    private final int layers;
+
+    private final ThreadLocal<State> statePool;
+
+    BitmapMatcher(EngineModel model) {
+        this.postings = model.getBitmapMatchPostings();
+        this.layers = model.getMaxBitmapMatchSize();
+        this.combinationsBySize = new RoaringBitmap[layers + 1];
+        for (int size = 1; size <= layers; size++) {
+            combinationsBySize[size] = model.getBitmapMatchCombinations(size);
+        }
+        this.statePool = ThreadLocal.withInitial(() -> new State(layers, postings, model));
+    }
+
+    /**
+     * Whether the model has any bitmap-matched combinations.
+     */
+    static boolean isApplicable(EngineModel model) {
+        return model.getMaxBitmapMatchSize() > 0;
+    }
+
+    /**
+     * Adds the bitmap-matched combinations satisfied by {@code truePredicates}
+     * (restricted to {@code eligibleRules} when non-null) to the context.
+     */
+    void detectMatches(IntSet truePredicates, RoaringBitmap eligibleRules, EvaluationContext ctx) {
+        State state = statePool.get();
+        state.begin();
+
+        truePredicates.forEach(state.postingAccumulator);
+
+        RoaringBitmap matched = state.collect(combinationsBySize, eligibleRules);
+        state.matchEmitter.configure(ctx);
+        matched.forEach(state.matchEmitter);
+    }
+
+    void cleanupThreadLocal() {
+        statePool.remove();
+    }
+
+    /**
+     * Adds the rules of each matched combination to the configured context.
+     * Pooled per thread, like RuleEvaluator's CounterUpdater, so emitting
+     * matches does not allocate a capturing lambda per event.
+     */
+    private static final class MatchEmitter implements org.roaringbitmap.IntConsumer {
+        private final EngineModel model;
+        private EvaluationContext ctx;
+
+        MatchEmitter(EngineModel model) {
+            this.model = model;
+        }
+
+        void configure(EvaluationContext ctx) {
+            this.ctx = ctx;
+        }
+
+        @Override
+        public void accept(int combinationId) {
+            int end = model.getCombinationRuleEnd(combinationId);
+            for (int entry = model.getCombinationRuleStart(combinationId); entry < end; entry++) {
+                ctx.addMatchedRule(combinationId, model.getRuleEntryCode(entry), model.getRuleEntryPriority(entry),
+                        "", model.getRuleEntryFamily(entry));
+            }
+        }
+    }
+
+    /**
+     * Per-thread hit layers, scratch bitmaps and visitors, cleared (not
+     * reallocated) per event.
+     */
+    private static final class State {
+        private final RoaringBitmap[] hits;
+        private final RoaringBitmap scratch = new RoaringBitmap();
+        private final RoaringBitmap matched = new RoaringBitmap();
+        private final IntConsumer postingAccumulator;
+        private final MatchEmitter matchEmitter;
+        private boolean empty;
+
+        State(int layers, Int2ObjectMap<RoaringBitmap> postings, EngineModel model) {
+            this.hits = new RoaringBitmap[layers];
+            for (int i = 0; i < layers; i++) {
+                hits[i] = new RoaringBitmap();
+            }
+            this.postingAccumulator = predId -> {
+                RoaringBitmap posting = postings.get(predId);
+                if (posting != null) {
+                    accumulate(posting);
+                }
+            };
+            this.matchEmitter = new MatchEmitter(model);
+        }
+
+        void begin() {
+            for (RoaringBitmap layer : hits) {
+                layer.clear();
+            }
+            empty = true;
+        }
+
+        void accumulate(RoaringBitmap posting) {
+            if (!empty) {
+                for (int i = hits.length - 1; i > 0; i--) {
+                    if (hits[i - 1].isEmpty()) {
+                        continue;
+                    }
+                    scratch.clear();
+                    scratch.or(hits[i - 1]);
+                    scratch.and(posting);
+                    hits[i].or(scratch);
+                }
+            }
+            hits[0].or(posting);
+            empty = false;
+        }
+
+        RoaringBitmap collect(RoaringBitmap[] combinationsBySize, RoaringBitmap eligibleRules) {
+            matched.clear();
+            for (int size = 1; size < combinationsBySize.length; size++) {
+                if (combinationsBySize[size].isEmpty() || hits[size - 1].isEmpty()) {
+                    continue;
+                }
+                scratch.clear();
+                scratch.or(hits[size - 1]);
+                scratch.and(combinationsBySize[size]);
+                matched.or(scratch);
+            }
+            if (eligibleRules != null && !matched.isEmpty()) {
+                matched.and(eligibleRules);
+            }
+            return matched;
+        }
+    }
+}
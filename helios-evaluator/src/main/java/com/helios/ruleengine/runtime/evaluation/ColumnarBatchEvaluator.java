@@ -0,0 +1,537 @@
+/*
+ * Copyright (c) 2025 Helios Rule Engine
+ * Licensed under the Apache License, Version 2.0
+ */
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.runtime.context.EvaluationContext;
+import com.helios.ruleengine.runtime.context.EventEncoder;
+import com.helios.ruleengine.runtime.context.PredicateBitSet;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.operators.PredicateEvaluator;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+import it.unimi.dsi.fastutil.ints.IntSet;
+import it.unimi.dsi.fastutil.objects.Object2ObjectOpenHashMap;
+import jdk.incubator.vector.DoubleVector;
+import jdk.incubator.vector.VectorMask;
+import jdk.incubator.vector.VectorOperators;
+import jdk.incubator.vector.VectorSpecies;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+
+/**
+ * Column-oriented predicate evaluation for batches of events.
+ *
+ * <p>
+ * The per-event path dispatches every field of every event through
+ * {@link PredicateEvaluator}. For large batches (Kafka consumers deliver
+ * 500-5000 events at a time) that repeats the same dispatch, map lookups and
+ * context bookkeeping thousands of times. This evaluator instead:
+ * <ol>
+ * <li>Dictionary-encodes the whole batch once into per-field columns</li>
+ * <li>Evaluates each unique predicate once across its column:
+ * <ul>
+ * <li>EQUAL_TO and IS_ANY_OF: one hash probe per event into a value→predicateIds
+ * map holding every EQUAL_TO value and every IS_ANY_OF member</li>
+ * <li>GREATER_THAN(_OR_EQUAL) / LESS_THAN(_OR_EQUAL) / BETWEEN: SIMD comparison of the threshold
+ * against the whole numeric column, in double precision</li>
+ * </ul>
+ * </li>
+ * <li>Records the resulting true predicates per event, which the caller feeds
+ * into the regular counter-update and match-detection steps</li>
+ * </ol>
+ *
+ * <p>
+ * All other operators (NOT_EQUAL_TO, CONTAINS, REGEX, ...) are "residual": they
+ * are evaluated per event through the existing {@link PredicateEvaluator},
+ * restricted to the residual predicate IDs so nothing is evaluated twice.
+ * Numeric predicates whose bounds are not exact doubles (longs beyond 2^53)
+ * are residual too, and events whose numeric value is not an exact double
+ * have that field's numeric predicates evaluated per event, so the result is
+ * always the exact comparison the per-event path makes.
+ *
+ * <h2>Thread Safety</h2>
+ * <p>
+ * The compiled column plans are immutable. Per-batch buffers are pooled per
+ * thread, so a single instance can serve concurrent batches.
+ */
+final class ColumnarBatchEvaluator {
+
+    private static final VectorSpecies<Double> DOUBLE_SPECIES = DoubleVector.SPECIES_PREFERRED;
+
+    private static final byte OP_GREATER_THAN = 0;
+    private static final byte OP_LESS_THAN = 1;
+    private static final byte OP_BETWEEN = 2;
+    private static final byte OP_GREATER_THAN_OR_EQUAL = 3;
+    private static final byte OP_LESS_THAN_OR_EQUAL = 4;
+
+    private final EventEncoder eventEncoder;
+    private final PredicateEvaluator predicateEvaluator;
+
+    // Column plans indexed by fieldId (null = field has no predicates)
+    private final FieldPlan[] fieldPlans;
+    private final int[] plannedFieldIds;
+    // Fields with columnar numeric predicates
+    private final int[] numericFieldIds;
+
+    // Predicates that are not handled by the columnar kernels
+    private final IntSet residualPredicateIds;
+    private final int[] residualFieldIds;
+
+    private final ThreadLocal<Batch> batchPool = ThreadLocal.withInitial(Batch::new);
+
+    ColumnarBatchEvaluator(EngineModel model, EventEncoder eventEncoder, PredicateEvaluator predicateEvaluator) {
+        this.eventEncoder = eventEncoder;
+        this.predicateEvaluator = predicateEvaluator;
+        this.fieldPlans = new FieldPlan[model.getFieldDictionary().size()];
+        this.residualPredicateIds = new PredicateBitSet(model.getUniquePredicates().length);
+
+        IntArrayList planned = new IntArrayList();
+        IntArrayList residualFields = new IntArrayList();
+        IntArrayList numericFields = new IntArrayList();
+        for (Int2ObjectMap.Entry<List<Predicate>> entry : model.getFieldToPredicates().int2ObjectEntrySet()) {
+            int fieldId = entry.getIntKey();
+            if (fieldId < 0 || fieldId >= fieldPlans.length) {
+                continue;
+            }
+            FieldPlan plan = new FieldPlan(model, entry.getValue(), residualPredicateIds);
+            fieldPlans[fieldId] = plan;
+            planned.add(fieldId);
+            if (plan.hasResidual) {
+                residualFields.add(fieldId);
+            }
+            if (plan.numericIds.length > 0) {
+                numericFields.add(fieldId);
+            }
+        }
+        this.plannedFieldIds = planned.toIntArray();
+        this.numericFieldIds = numericFields.toIntArray();
+        this.residualFieldIds = residualFields.toIntArray();
+    }
+
+    /**
+     * Encodes and evaluates the columnar predicates for a batch.
+     *
+     * <p>
+     * The returned batch is pooled per thread and is only valid until the next
+     * call to this method on the same thread.
+     */
+    Batch evaluate(List<Event> events) {
+        Batch batch = batchPool.get();
+        batch.prepare(events.size(), fieldPlans.length);
+
+        encodeColumns(events, batch);
+
+        for (int fieldId : plannedFieldIds) {
+            if (!batch.columnPresent[fieldId]) {
+                continue; // Field absent from every event in the batch
+            }
+            Object[] column = batch.columns[fieldId];
+            FieldPlan plan = fieldPlans[fieldId];
+            if (plan.equalToValueMap != null) {
+                evaluateEqualToColumn(plan, column, batch);
+            }
+            if (plan.numericIds.length > 0 && batch.numericColumnPresent[fieldId]) {
+                evaluateNumericColumn(plan, batch.numericColumns[fieldId], batch);
+            }
+        }
+        return batch;
+    }
+
+    /**
+     * Loads one event's columnar results into the evaluation context and runs
+     * the residual (non-columnar) predicates for that event.
+     */
+    void loadEvent(Batch batch, int eventIndex, EvaluationContext ctx) {
+        IntArrayList truePredicates = batch.truePredicates[eventIndex];
+        for (int i = 0; i < truePredicates.size(); i++) {
+            ctx.addTruePredicate(truePredicates.getInt(i));
+        }
+        ctx.addPredicatesEvaluated(batch.predicatesEvaluated[eventIndex]);
+
+        Int2ObjectOpenHashMap<Object> attributes = batch.residualAttributes;
+        if (batch.numericFallback[eventIndex]) {
+            // Values the double column cannot hold exactly are compared per event
+            for (int fieldId : numericFieldIds) {
+                Object value = batch.columnPresent[fieldId] ? batch.columns[fieldId][eventIndex] : null;
+                if (value instanceof Number number && !isDoubleExact(number)) {
+                    attributes.clear();
+                    attributes.put(fieldId, value);
+                    predicateEvaluator.evaluateField(fieldId, attributes, ctx, fieldPlans[fieldId].numericIdSet);
+                }
+            }
+        }
+
+        if (residualFieldIds.length == 0) {
+            return;
+        }
+
+        attributes.clear();
+        for (int fieldId : residualFieldIds) {
+            if (batch.columnPresent[fieldId] && batch.columns[fieldId][eventIndex] != null) {
+                attributes.put(fieldId, batch.columns[fieldId][eventIndex]);
+            }
+        }
+        for (int fieldId : residualFieldIds) {
+            if (attributes.containsKey(fieldId)) {
+                predicateEvaluator.evaluateField(fieldId, attributes, ctx, residualPredicateIds);
+            }
+        }
+    }
+
+    // ════════════════════════════════════════════════════════════════════════════════
+    // COLUMN ENCODING
+    // ════════════════════════════════════════════════════════════════════════════════
+
+    private void encodeColumns(List<Event> events, Batch batch) {
+        int size = batch.size;
+        for (int i = 0; i < size; i++) {
+            Event event = Objects.requireNonNull(events.get(i), "events must not contain null");
+            // Pooled map - values are copied into columns before the next encode()
+            Int2ObjectMap<Object> encoded = eventEncoder.encode(event);
+            for (Int2ObjectMap.Entry<Object> entry : encoded.int2ObjectEntrySet()) {
+                int fieldId = entry.getIntKey();
+                if (fieldId < 0 || fieldId >= fieldPlans.length || fieldPlans[fieldId] == null) {
+                    continue; // No predicates reference this field
+                }
+                Object value = entry.getValue();
+                if (value == null) {
+                    continue;
+                }
+                batch.column(fieldId)[i] = value;
+
+                FieldPlan plan = fieldPlans[fieldId];
+                batch.predicatesEvaluated[i] += plan.equalToCount;
+                if (plan.numericIds.length > 0 && value instanceof Number number) {
+                    if (isDoubleExact(number)) {
+                        batch.numericColumn(fieldId)[i] = number.doubleValue();
+                        batch.predicatesEvaluated[i] += plan.numericIds.length;
+                    } else {
+                        // Left NaN in the column; evaluated (and counted) per event in loadEvent
+                        batch.numericFallback[i] = true;
+                    }
+                }
+            }
+        }
+    }
+
+    // ════════════════════════════════════════════════════════════════════════════════
+    // COLUMN KERNELS
+    // ════════════════════════════════════════════════════════════════════════════════
+
+    /**
+     * EQUAL_TO and IS_ANY_OF: a single hash probe per event resolves every
+     * equality and set-membership predicate on the field at once.
+     */
+    private void evaluateEqualToColumn(FieldPlan plan, Object[] column, Batch batch) {
+        int size = batch.size;
+        for (int i = 0; i < size; i++) {
+            Object value = column[i];
+            if (value == null) {
+                continue;
+            }
+            int[] predicateIds = plan.equalToValueMap.get(value);
+            if (predicateIds != null) {
+                IntArrayList truePredicates = batch.truePredicates[i];
+                for (int predId : predicateIds) {
+                    truePredicates.add(predId);
+                }
+            }
+        }
+    }
+
+    /**
+     * Numeric comparisons: each predicate's threshold is broadcast once and
+     * compared against the whole column, {@code DOUBLE_SPECIES.length()} events
+     * at a time. Missing and non-numeric values are stored as NaN, which fails
+     * every ordered comparison, so no separate presence mask is needed.
+     */
+    private void evaluateNumericColumn(FieldPlan plan, double[] column, Batch batch) {
+        int size = batch.size;
+        int lanes = DOUBLE_SPECIES.length();
+        int vectorLimit = DOUBLE_SPECIES.loopBound(size);
+
+        for (int p = 0; p < plan.numericIds.length; p++) {
+            int predId = plan.numericIds[p];
+            byte op = plan.numericOps[p];
+            double lower = plan.numericLower[p];
+            double upper = plan.numericUpper[p];
+
+            DoubleVector lowerVec = DoubleVector.broadcast(DOUBLE_SPECIES, lower);
+            DoubleVector upperVec = DoubleVector.broadcast(DOUBLE_SPECIES, upper);
+
+            int i = 0;
+            for (; i < vectorLimit; i += lanes) {
+                DoubleVector values = DoubleVector.fromArray(DOUBLE_SPECIES, column, i);
+                VectorMask<Double> mask = switch (op) {
+                    case OP_GREATER_THAN -> values.compare(VectorOperators.GT, lowerVec);
+                    case OP_LESS_THAN -> values.compare(VectorOperators.LT, upperVec);
+                    case OP_GREATER_THAN_OR_EQUAL -> values.compare(VectorOperators.GE, lowerVec);
+                    case OP_LESS_THAN_OR_EQUAL -> values.compare(VectorOperators.LE, upperVec);
+                    default -> values.compare(VectorOperators.GE, lowerVec)
+                            .and(values.compare(VectorOperators.LE, upperVec));
+                };
+
+                long bits = mask.toLong();
+                while (bits != 0) {
+                    int lane = Long.numberOfTrailingZeros(bits);
+                    batch.truePredicates[i + lane].add(predId);
+                    bits &= bits - 1;
+                }
+            }
+
+            // Scalar remainder
+            for (; i < size; i++) {
+                double value = column[i];
+                boolean passes = switch (op) {
+                    case OP_GREATER_THAN -> value > lower;
+                    case OP_LESS_THAN -> value < upper;
+                    case OP_GREATER_THAN_OR_EQUAL -> value >= lower;
+                    case OP_LESS_THAN_OR_EQUAL -> value <= upper;
+                    default -> value >= lower && value <= upper;
+                };
+                if (passes) {
+                    batch.truePredicates[i].add(predId);
+                }
+            }
+        }
+    }
+
+    /**
+     * Whether the number survives conversion to double unchanged. Only longs
+     * beyond 2^53 do not; other types are compared by their double value anyway.
+     */
+    private static boolean isDoubleExact(Number number) {
+        if (number instanceof Long l) {
+            double d = l;
+            return d != 0x1p63 && (long) d == l;
+        }
+        return true;
+    }
+
+    // ════════════════════════════════════════════════════════════════════════════════
+    // DATA STRUCTURES
+    // ════════════════════════════════════════════════════════════════════════════════
+
+    /**
+     * Pre-compiled per-field layout for the columnar kernels.
+     */
+    private static final class FieldPlan {
+        final Map<Object, int[]> equalToValueMap;
+        final int equalToCount;
+
+        // Structure-of-Arrays layout for numeric predicates
+        final int[] numericIds;
+        final byte[] numericOps;
+        final double[] numericLower; // GT/GTE threshold / BETWEEN lower bound
+        final double[] numericUpper; // LT/LTE threshold / BETWEEN upper bound
+        final IntSet numericIdSet;
+
+        final boolean hasResidual;
+
+        FieldPlan(EngineModel model, List<Predicate> predicates, IntSet residualPredicateIds) {
+            Map<Object, IntArrayList> equalTo = new Object2ObjectOpenHashMap<>();
+            IntArrayList ids = new IntArrayList();
+            List<Byte> ops = new ArrayList<>();
+            List<double[]> bounds = new ArrayList<>();
+            boolean residual = false;
+            int equalToPredicates = 0;
+
+            for (Predicate p : predicates) {
+                int predId = model.getPredicateId(p);
+                switch (p.operator()) {
+                    case EQUAL_TO -> {
+                        equalTo.computeIfAbsent(p.value(), k -> new IntArrayList()).add(predId);
+                        equalToPredicates++;
+                    }
+                    case IS_ANY_OF -> {
+                        if (!(p.value() instanceof List<?> members)) {
+                            residualPredicateIds.add(predId);
+                            residual = true;
+                            continue;
+                        }
+                        // Distinct members, so an event never records the predicate twice
+                        members.stream().distinct().forEach(
+                                member -> equalTo.computeIfAbsent(member, k -> new IntArrayList()).add(predId));
+                        equalToPredicates++;
+                    }
+                    case GREATER_THAN, LESS_THAN, GREATER_THAN_OR_EQUAL, LESS_THAN_OR_EQUAL, BETWEEN -> {
+                        if (!hasDoubleExactBounds(p)) {
+                            residualPredicateIds.add(predId);
+                            residual = true;
+                            continue;
+                        }
+                        ids.add(predId);
+                        switch (p.operator()) {
+                            case GREATER_THAN -> {
+                                ops.add(OP_GREATER_THAN);
+                                bounds.add(new double[] { toDouble(p.value()), Double.NaN });
+                            }
+                            case LESS_THAN -> {
+                                ops.add(OP_LESS_THAN);
+                                bounds.add(new double[] { Double.NaN, toDouble(p.value()) });
+                            }
+                            case GREATER_THAN_OR_EQUAL -> {
+                                ops.add(OP_GREATER_THAN_OR_EQUAL);
+                                bounds.add(new double[] { toDouble(p.value()), Double.NaN });
+                            }
+                            case LESS_THAN_OR_EQUAL -> {
+                                ops.add(OP_LESS_THAN_OR_EQUAL);
+                                bounds.add(new double[] { Double.NaN, toDouble(p.value()) });
+                            }
+                            default -> {
+                                List<?> range = (List<?>) p.value();
+                                ops.add(OP_BETWEEN);
+                                bounds.add(new double[] { toDouble(range.get(0)), toDouble(range.get(1)) });
+                            }
+                        }
+                    }
+                    default -> {
+                        residualPredicateIds.add(predId);
+                        residual = true;
+                    }
+                }
+            }
+
+            if (equalTo.isEmpty()) {
+                this.equalToValueMap = null;
+            } else {
+                Map<Object, int[]> compact = new Object2ObjectOpenHashMap<>(equalTo.size());
+                equalTo.forEach((value, predIds) -> compact.put(value, predIds.toIntArray()));
+                this.equalToValueMap = compact;
+            }
+            this.equalToCount = equalToPredicates;
+
+            this.numericIds = ids.toIntArray();
+            this.numericOps = new byte[ops.size()];
+            this.numericLower = new double[bounds.size()];
+            this.numericUpper = new double[bounds.size()];
+            for (int i = 0; i < bounds.size(); i++) {
+                numericOps[i] = ops.get(i);
+                numericLower[i] = bounds.get(i)[0];
+                numericUpper[i] = bounds.get(i)[1];
+            }
+            this.numericIdSet = new IntOpenHashSet(numericIds);
+
+            this.hasResidual = residual;
+        }
+
+        // Long bounds beyond 2^53 stay residual: the column kernel would round them
+        private static boolean hasDoubleExactBounds(Predicate p) {
+            if (p.value() instanceof List<?> range) {
+                return range.stream().allMatch(bound -> !(bound instanceof Number n) || isDoubleExact(n));
+            }
+            return !(p.value() instanceof Number n) || isDoubleExact(n);
+        }
+
+        private static double toDouble(Object value) {
+            if (value instanceof Number number) {
+                return number.doubleValue();
+            }
+            if (value instanceof String s) {
+                try {
+                    return Double.parseDouble(s);
+                } catch (NumberFormatException e) {
+                    throw new IllegalArgumentException("Cannot convert value to number: " + value, e);
+                }
+            }
+            throw new IllegalArgumentException("Expected Number or numeric String, got: " +
+                    (value == null ? "null" : value.getClass().getName()));
+        }
+    }
+
+    /**
+     * Per-thread batch buffers. Grown on demand and reused across batches so
+     * steady-state batch evaluation does not reallocate columns.
+     */
+    static final class Batch {
+        int size;
+        int capacity;
+
+        Object[][] columns = new Object[0][];
+        double[][] numericColumns = new double[0][];
+        boolean[] columnPresent = new boolean[0];
+        boolean[] numericColumnPresent = new boolean[0];
+
+        IntArrayList[] truePredicates = new IntArrayList[0];
+        int[] predicatesEvaluated = new int[0];
+        // Events with a numeric value the double columns cannot hold exactly
+        boolean[] numericFallback = new boolean[0];
+
+        final Int2ObjectOpenHashMap<Object> residualAttributes = new Int2ObjectOpenHashMap<>(16);
+
+        void prepare(int batchSize, int numFields) {
+            // Clear the previous batch's columns (only those actually used)
+            for (int f = 0; f < columnPresent.length; f++) {
+                if (columnPresent[f]) {
+                    Arrays.fill(columns[f], 0, size, null);
+                    columnPresent[f] = false;
+                }
+                numericColumnPresent[f] = false;
+            }
+            for (int i = 0; i < size; i++) {
+                truePredicates[i].clear();
+            }
+
+            if (numFields > columns.length) {
+                columns = Arrays.copyOf(columns, numFields);
+                numericColumns = Arrays.copyOf(numericColumns, numFields);
+                columnPresent = Arrays.copyOf(columnPresent, numFields);
+                numericColumnPresent = Arrays.copyOf(numericColumnPresent, numFields);
+            }
+
+            if (batchSize > capacity) {
+                int newCapacity = Math.max(batchSize, capacity * 2);
+                for (int f = 0; f < columns.length; f++) {
+                    columns[f] = null;
+                    numericColumns[f] = null;
+                }
+                truePredicates = Arrays.copyOf(truePredicates, newCapacity);
+                for (int i = capacity; i < newCapacity; i++) {
+                    truePredicates[i] = new IntArrayList(16);
+                }
+                predicatesEvaluated = new int[newCapacity];
+                numericFallback = new boolean[newCapacity];
+                capacity = newCapacity;
+            } else {
+                Arrays.fill(predicatesEvaluated, 0, batchSize, 0);
+                Arrays.fill(numericFallback, 0, batchSize, false);
+            }
+
+            size = batchSize;
+        }
+
+        Object[] column(int fieldId) {
+            Object[] column = columns[fieldId];
+            if (column == null) {
+                column = new Object[capacity];
+                columns[fieldId] = column;
+            }
+            columnPresent[fieldId] = true;
+            return column;
+        }
+
+        double[] numericColumn(int fieldId) {
+            double[] column = numericColumns[fieldId];
+            if (column == null) {
+                column = new double[capacity];
+                numericColumns[fieldId] = column;
+            }
+            if (!numericColumnPresent[fieldId]) {
+                // Missing / non-numeric values are NaN so comparisons fail
+                Arrays.fill(column, 0, size, Double.NaN);
+                numericColumnPresent[fieldId] = true;
+            }
+            return column;
+        }
+    }
+}
@@ -36,6 +36,9 @@ public final class EvaluatorMetrics {
     public final AtomicLong eligibleSetCacheHits = new AtomicLong(0);
     private final LongAdder eligibleSetCacheMisses = new LongAdder();
 
+    // FIRST_MATCH short-circuit: priority tiers not evaluated
+    private final LongAdder priorityTiersSkipped = new LongAdder();
+
     // Latency tracking (simple percentile approximation)
     private final LatencyHistogram latencyHistogram = new LatencyHistogram();
 
@@ -58,6 +61,13 @@ public final class EvaluatorMetrics {
         eligibleSetCacheMisses.increment();
     }
 
+    /**
+     * Record priority tiers skipped by FIRST_MATCH short-circuit evaluation.
+     */
+    public void recordPriorityTiersSkipped(int tiersSkipped) {
+        priorityTiersSkipped.add(tiersSkipped);
+    }
+
     /**
      * Get comprehensive metrics snapshot.
      * Creates new map instance to avoid concurrent modification.
@@ -96,6 +106,7 @@ public final class EvaluatorMetrics {
         // P0-A: Conversion savings rate (percentage of evaluations that saved conversions)
         double conversionSavingsRate = evals > 0 ? (double) conversionsSaved / evals * 100.0 : 0.0;
         snapshot.put("conversionSavingsRate", conversionSavingsRate);
+        snapshot.put("priorityTiersSkipped", priorityTiersSkipped.sum());
 
 
         // Latency percentiles (both nanos and micros for compatibility)
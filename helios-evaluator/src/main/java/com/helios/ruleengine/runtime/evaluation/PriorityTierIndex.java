@@ -0,0 +1,80 @@
+/*
+ * Copyright (c) 2025 Helios Rule Engine
+ * Licensed under the Apache License, Version 2.0
+ */
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.runtime.context.PredicateBitSet;
+import com.helios.ruleengine.runtime.model.EngineModel;
+
+/**
+ * Evaluator-side view of the model's priority tiers, used by FIRST_MATCH
+ * short-circuit evaluation.
+ *
+ * For each tier (highest priority first) holds the predicates first required by
+ * that tier as a dense bitset, plus a bitmap over field ranks (see
+ * {@link EngineModel#getFieldEvaluationOrder()}) so a tier only visits the
+ * fields its own predicates read.
+ *
+ * THREAD SAFETY: Immutable after construction.
+ */
+final class PriorityTierIndex {
+
+    private final int[] priorities;
+    private final int[][] predicateIds;
+    private final PredicateBitSet[] predicates;
+    private final long[][] fieldRanks;
+
+    PriorityTierIndex(EngineModel model) {
+        this.priorities = model.getPriorityTiers();
+        int numTiers = priorities.length;
+        Predicate[] uniquePredicates = model.getUniquePredicates();
+        int[] ranks = model.getFieldRanks();
+        int rankWords = (model.getFieldEvaluationOrder().length + 63) >>> 6;
+
+        this.predicateIds = new int[numTiers][];
+        this.predicates = new PredicateBitSet[numTiers];
+        this.fieldRanks = new long[numTiers][];
+        for (int tier = 0; tier < numTiers; tier++) {
+            int[] ids = model.getTierPredicateIds(tier);
+            PredicateBitSet bits = new PredicateBitSet(uniquePredicates.length);
+            long[] tierRanks = new long[rankWords];
+            for (int predId : ids) {
+                bits.add(predId);
+                int rank = ranks[uniquePredicates[predId].fieldId()];
+                tierRanks[rank >>> 6] |= 1L << rank;
+            }
+            predicateIds[tier] = ids;
+            predicates[tier] = bits;
+            fieldRanks[tier] = tierRanks;
+        }
+    }
+
+    /**
+     * Whether tiered evaluation can skip any work: needs at least two tiers.
+     */
+    static boolean isApplicable(EngineModel model) {
+        return model.getPriorityTiers().length > 1;
+    }
+
+    int size() {
+        return priorities.length;
+    }
+
+    int priority(int tier) {
+        return priorities[tier];
+    }
+
+    int[] predicateIds(int tier) {
+        return predicateIds[tier];
+    }
+
+    PredicateBitSet predicates(int tier) {
+        return predicates[tier];
+    }
+
+    long[] fieldRanks(int tier) {
+        return fieldRanks[tier];
+    }
+}
@@ -10,6 +10,7 @@ import com.helios.ruleengine.api.model.EvaluationResult;
 import com.helios.ruleengine.api.model.EvaluationTrace;
 import com.helios.ruleengine.api.model.ExplanationResult;
 import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.Predicate;
 import com.helios.ruleengine.api.model.SelectionStrategy;
 import com.helios.ruleengine.cache.BaseConditionCache;
 import com.helios.ruleengine.cache.CacheConfig;
@@ -18,12 +19,15 @@ import com.helios.ruleengine.api.model.TraceLevel;
 import io.opentelemetry.api.OpenTelemetry;
 import com.helios.ruleengine.runtime.context.EvaluationContext;
 import com.helios.ruleengine.runtime.context.EventEncoder;
+import com.helios.ruleengine.runtime.context.PredicateBitSet;
+import com.helios.ruleengine.runtime.model.DecisionDag;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.runtime.operators.PredicateEvaluator;
 import io.opentelemetry.api.trace.Span;
 import io.opentelemetry.api.trace.Tracer;
 import io.opentelemetry.context.Scope;
 import it.unimi.dsi.fastutil.ints.*;
+import org.roaringbitmap.ImmutableBitmapDataProvider;
 import org.roaringbitmap.RoaringBitmap;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -55,6 +59,11 @@ import java.util.Collections;
  * filtering</li>
  * <li><b>Base Condition Caching:</b> 95%+ cache hit rate for static
  * predicates</li>
+ * <li><b>Decision DAG Backend:</b> models compiled for
+ * {@code DECISION_DAG} route events to a few candidate combinations and
+ * verify those instead of counting</li>
+ * <li><b>Off-Heap Layout:</b> counting reads the packed postings of
+ * {@code OFF_HEAP} models in place</li>
  * </ul>
  *
  * <h2>Thread Safety</h2>
@@ -102,6 +111,13 @@ public final class RuleEvaluator implements IRuleEvaluator {
      */
     private static final int MAX_MATCH_CAPACITY = 1024;
 
+    /**
+     * Minimum batch size for the columnar batch path.
+     * Below this, column setup costs more than it saves and
+     * {@link #evaluateBatch(List)} falls back to per-event evaluation.
+     */
+    private static final int MIN_COLUMNAR_BATCH_SIZE = 16;
+
     // ════════════════════════════════════════════════════════════════════════════════
     // INSTANCE FIELDS
     // ════════════════════════════════════════════════════════════════════════════════
@@ -112,6 +128,25 @@ public final class RuleEvaluator implements IRuleEvaluator {
     private final PredicateEvaluator predicateEvaluator;
     private final BaseConditionEvaluator baseConditionEvaluator;
     private final EventEncoder eventEncoder;
+    private final ColumnarBatchEvaluator columnarBatchEvaluator;
+
+    /**
+     * Priority tiers for FIRST_MATCH short-circuit evaluation.
+     * Null for other strategies and for models with a single tier.
+     */
+    private final PriorityTierIndex priorityTiers;
+
+    /**
+     * Counter-free matcher for small combinations in bitmap-matched size buckets.
+     * Null when the compiler chose counting for every bucket.
+     */
+    private final BitmapMatcher bitmapMatcher;
+
+    /**
+     * Decision DAG walked instead of counting (DECISION_DAG backend).
+     * Null for counting models.
+     */
+    private final DecisionDag decisionDag;
 
     /**
      * Thread-local object pool for EvaluationContext.
@@ -148,6 +183,11 @@ public final class RuleEvaluator implements IRuleEvaluator {
         this.metrics = new EvaluatorMetrics();
         this.predicateEvaluator = new PredicateEvaluator(model);
         this.eventEncoder = new EventEncoder(model.getFieldDictionary(), model.getValueDictionary());
+        this.columnarBatchEvaluator = new ColumnarBatchEvaluator(model, eventEncoder, predicateEvaluator);
+        this.priorityTiers = model.getSelectionStrategy() == SelectionStrategy.FIRST_MATCH
+                && PriorityTierIndex.isApplicable(model) ? new PriorityTierIndex(model) : null;
+        this.bitmapMatcher = BitmapMatcher.isApplicable(model) ? new BitmapMatcher(model) : null;
+        this.decisionDag = model.getDecisionDag();
 
         // Initialize base condition evaluator if caching enabled
         if (enableBaseConditionCache) {
@@ -174,7 +214,17 @@ public final class RuleEvaluator implements IRuleEvaluator {
                     MIN_MATCH_CAPACITY,
                     Math.min((int) (numRules * MATCH_RATIO), MAX_MATCH_CAPACITY));
 
-            return new EvaluationContext(numRules, estimatedTouched, initialMatchCapacity);
+            EvaluationContext ctx = new EvaluationContext(numRules, estimatedTouched, initialMatchCapacity,
+                    model.getUniquePredicates().length);
+
+            // Bounded strategies keep only the top matches in the context's heaps
+            switch (model.getSelectionStrategy()) {
+                case TOP_K -> ctx.setMatchLimit(model.getSelectionLimit(), 1);
+                case MAX_PRIORITY_N -> ctx.setMatchLimit(model.getSelectionLimit(), model.getNumFamilies());
+                default -> {
+                }
+            }
+            return ctx;
         });
     }
 
@@ -237,6 +287,48 @@ public final class RuleEvaluator implements IRuleEvaluator {
         }
     }
 
+    /**
+     * {@inheritDoc}
+     *
+     * <p>
+     * Evaluates a batch using the columnar path: the whole batch is
+     * dictionary-encoded into per-field columns and each predicate is evaluated
+     * once per column (see {@link ColumnarBatchEvaluator}). Counter update, match
+     * detection and rule selection then run per event on a single pooled
+     * context, exactly as in {@link #evaluate(Event)}.
+     *
+     * <p>
+     * Results are returned in input order and are identical to calling
+     * {@link #evaluate(Event)} for each event. The base condition cache is
+     * bypassed: it only pre-filters rules that cannot match, so skipping it does
+     * not change results. Batches smaller than {@value #MIN_COLUMNAR_BATCH_SIZE}
+     * events are evaluated one by one.
+     */
+    @Override
+    public List<MatchResult> evaluateBatch(List<Event> events) {
+        Objects.requireNonNull(events, "events must not be null");
+
+        if (events.size() < MIN_COLUMNAR_BATCH_SIZE) {
+            List<MatchResult> results = new ArrayList<>(events.size());
+            for (Event event : events) {
+                results.add(evaluate(event));
+            }
+            return results;
+        }
+
+        EvaluationContext ctx = contextPool.get();
+        try {
+            return ScopedValue.where(CONTEXT, ctx).call(() -> doEvaluateBatch(events));
+        } catch (Exception e) {
+            if (e instanceof RuntimeException re) {
+                throw re;
+            }
+            throw new RuntimeException(String.format(
+                    "Batch evaluation failed for %d events. Model contains %d rules.",
+                    events.size(), model.getNumRules()), e);
+        }
+    }
+
     /**
      * {@inheritDoc}
      *
@@ -409,13 +501,15 @@ public final class RuleEvaluator implements IRuleEvaluator {
 
             // Decode the value for display and evaluation
             Object actualValue = encodedValue;
-            if (encodedValue instanceof Integer && predicate.operator().name().contains("EQUAL")) {
+            boolean dictionaryEncoded = predicate.operator().name().contains("EQUAL")
+                    || predicate.operator() == Predicate.Operator.IS_ANY_OF;
+            if (encodedValue instanceof Integer && dictionaryEncoded) {
                 actualValue = model.getValueDictionary().decode((Integer) encodedValue);
             }
 
             // Evaluate this predicate against the event using the predicate's own evaluate method
             // Note: For dictionary-encoded equality predicates, we need to use the encoded value
-            Object valueForEvaluation = predicate.operator().name().contains("EQUAL")
+            Object valueForEvaluation = dictionaryEncoded
                     ? encodedValue
                     : actualValue;
             boolean predicateMatched = predicate.evaluate(valueForEvaluation);
@@ -533,55 +627,70 @@ public final class RuleEvaluator implements IRuleEvaluator {
                 }
             }
 
-            // Step 2: Predicate evaluation
-            Span predicateSpan = tracer.spanBuilder("evaluate-predicates").startSpan();
-            try {
-                long predStart = tracing ? System.nanoTime() : 0;
-                evaluatePredicatesHybrid(event, eligibleRulesRoaring);
-                if (tracing) {
-                    collector.recordPredicateEval(System.nanoTime() - predStart);
+            if (decisionDag != null && !tracing) {
+                // Steps 2-4 (DECISION_DAG): walk to a leaf, verify its candidates
+                Span dagSpan = tracer.spanBuilder("evaluate-decision-dag").startSpan();
+                try {
+                    int candidatesVerified = evaluateDecisionDag(event, eligibleRulesRoaring);
+                    dagSpan.setAttribute("candidatesVerified", candidatesVerified);
+                    dagSpan.setAttribute("potentialMatches", ctx.getMutableMatchedRules().size());
+                } finally {
+                    dagSpan.end();
+                }
+            } else if (priorityTiers != null && !tracing) {
+                // Steps 2-4 (FIRST_MATCH): tier by tier, stop once the top matching tier is decided
+                Span tierSpan = tracer.spanBuilder("evaluate-priority-tiers").startSpan();
+                try {
+                    int tiersEvaluated = evaluatePriorityTiers(event, eligibleRulesRoaring);
+                    tierSpan.setAttribute("tiersEvaluated", tiersEvaluated);
+                    tierSpan.setAttribute("potentialMatches", ctx.getMutableMatchedRules().size());
+                } finally {
+                    tierSpan.end();
+                }
+            } else {
+                // Step 2: Predicate evaluation
+                Span predicateSpan = tracer.spanBuilder("evaluate-predicates").startSpan();
+                try {
+                    long predStart = tracing ? System.nanoTime() : 0;
+                    evaluatePredicatesHybrid(event, eligibleRulesRoaring);
+                    if (tracing) {
+                        collector.recordPredicateEval(System.nanoTime() - predStart);
+                    }
+                } finally {
+                    predicateSpan.end();
                 }
-            } finally {
-                predicateSpan.end();
-            }
 
-            // Step 3: Counter update
-            Span counterSpan = tracer.spanBuilder("update-counters-optimized").startSpan();
-            try {
-                long counterStart = tracing ? System.nanoTime() : 0;
-                updateCountersOptimized(eligibleRulesRoaring);
-                if (tracing) {
-                    collector.recordCounterUpdate(System.nanoTime() - counterStart);
+                // Step 3: Counter update
+                Span counterSpan = tracer.spanBuilder("update-counters-optimized").startSpan();
+                try {
+                    long counterStart = tracing ? System.nanoTime() : 0;
+                    updateCountersOptimized(eligibleRulesRoaring);
+                    if (tracing) {
+                        collector.recordCounterUpdate(System.nanoTime() - counterStart);
+                    }
+                } finally {
+                    counterSpan.end();
                 }
-            } finally {
-                counterSpan.end();
-            }
 
-            // Step 4: Match detection
-            Span detectSpan = tracer.spanBuilder("detect-matches-optimized").startSpan();
-            try {
-                long detectStart = tracing ? System.nanoTime() : 0;
-                detectMatchesOptimized(eligibleRulesRoaring);
-                if (tracing) {
-                    collector.recordMatchDetection(System.nanoTime() - detectStart);
+                // Step 4: Match detection
+                Span detectSpan = tracer.spanBuilder("detect-matches-optimized").startSpan();
+                try {
+                    long detectStart = tracing ? System.nanoTime() : 0;
+                    detectMatchesOptimized(eligibleRulesRoaring);
+                    if (tracing) {
+                        collector.recordMatchDetection(System.nanoTime() - detectStart);
+                    }
+                    detectSpan.setAttribute("potentialMatches", ctx.getMutableMatchedRules().size());
+                } finally {
+                    detectSpan.end();
                 }
-                detectSpan.setAttribute("potentialMatches", ctx.getMutableMatchedRules().size());
-            } finally {
-                detectSpan.end();
             }
 
             // Step 5: Rule selection
             selectMatches();
 
             // Step 6: Build result
-            List<MatchResult.MatchedRule> matchedRules = new ArrayList<>();
-            for (EvaluationContext.MutableMatchedRule mutable : ctx.getMutableMatchedRules()) {
-                matchedRules.add(new MatchResult.MatchedRule(
-                        mutable.getRuleId(),
-                        mutable.getRuleCode(),
-                        mutable.getPriority(),
-                        mutable.getDescription()));
-            }
+            List<MatchResult.MatchedRule> matchedRules = buildMatchedRules(ctx);
 
             long evaluationTime = System.nanoTime() - startTime;
             metrics.recordEvaluation(evaluationTime, ctx.getPredicatesEvaluated(), matchedRules.size());
@@ -615,6 +724,80 @@ public final class RuleEvaluator implements IRuleEvaluator {
         }
     }
 
+    /**
+     * Core batch evaluation logic executed within ScopedValue context.
+     *
+     * <p>
+     * Predicate evaluation (steps 1-2) is done once for the whole batch; its
+     * cost is amortized evenly over the events when reporting per-event
+     * evaluation time.
+     */
+    private List<MatchResult> doEvaluateBatch(List<Event> events) {
+        Span batchSpan = tracer.spanBuilder("evaluate-batch").startSpan();
+        try (Scope scope = batchSpan.makeCurrent()) {
+            EvaluationContext ctx = CONTEXT.get();
+            int batchSize = events.size();
+            batchSpan.setAttribute("batchSize", batchSize);
+
+            // Steps 1-2: Columnar encoding and predicate evaluation
+            long columnarStart = System.nanoTime();
+            ColumnarBatchEvaluator.Batch batch = columnarBatchEvaluator.evaluate(events);
+            long columnarNanosPerEvent = (System.nanoTime() - columnarStart) / batchSize;
+
+            int rulesEvaluated = getLogicalRuleCount();
+            List<MatchResult> results = new ArrayList<>(batchSize);
+            int totalMatches = 0;
+
+            for (int i = 0; i < batchSize; i++) {
+                long startTime = System.nanoTime();
+                ctx.reset();
+
+                columnarBatchEvaluator.loadEvent(batch, i, ctx);
+
+                // Steps 3-5: Counter update, match detection, rule selection
+                updateCountersOptimized(null);
+                detectMatchesOptimized(null);
+                selectMatches();
+
+                List<MatchResult.MatchedRule> matchedRules = buildMatchedRules(ctx);
+                long evaluationTime = columnarNanosPerEvent + (System.nanoTime() - startTime);
+                metrics.recordEvaluation(evaluationTime, ctx.getPredicatesEvaluated(), matchedRules.size());
+                totalMatches += matchedRules.size();
+
+                results.add(new MatchResult(
+                        events.get(i).eventId(),
+                        matchedRules,
+                        evaluationTime,
+                        ctx.getPredicatesEvaluated(),
+                        rulesEvaluated));
+            }
+
+            batchSpan.setAttribute("rulesMatched", totalMatches);
+            return results;
+
+        } catch (RuntimeException e) {
+            batchSpan.recordException(e);
+            throw e;
+        } finally {
+            batchSpan.end();
+        }
+    }
+
+    /**
+     * Converts the context's pooled matched rules into immutable results.
+     */
+    private List<MatchResult.MatchedRule> buildMatchedRules(EvaluationContext ctx) {
+        List<MatchResult.MatchedRule> matchedRules = new ArrayList<>();
+        for (EvaluationContext.MutableMatchedRule mutable : ctx.getMutableMatchedRules()) {
+            matchedRules.add(new MatchResult.MatchedRule(
+                    mutable.getRuleId(),
+                    mutable.getRuleCode(),
+                    mutable.getPriority(),
+                    mutable.getDescription()));
+        }
+        return matchedRules;
+    }
+
     /**
      * Evaluates predicates using dictionary-encoded attributes.
      */
@@ -627,14 +810,12 @@ public final class RuleEvaluator implements IRuleEvaluator {
         // Compute eligible predicate set (with caching)
         IntSet eligiblePredicateIds = computeEligiblePredicateIds(eligibleRules);
 
-        // Sort fields by minimum predicate weight (cheap & selective first)
-        // Use pooled buffer to avoid allocation (was 29.5% of allocations)
-        IntArrayList fieldIds = FIELD_IDS_BUFFER.get();
-        fieldIds.clear();
-        fieldIds.addAll(encodedAttributes.keySet());
-        fieldIds.sort((int a, int b) -> Float.compare(
-                model.getFieldMinWeight(a),
-                model.getFieldMinWeight(b)));
+        // Mark the model ranks of the event's fields (cheap & selective first).
+        // Ranks are precomputed by the compiler, so ordering is a linear pass over a
+        // presence bitmap instead of a per-event sort. Fields without predicates are skipped.
+        FieldRankCollector ranks = fieldRankCollectorPool.get();
+        ranks.begin();
+        encodedAttributes.keySet().forEach(ranks);
 
         // Get tracing state before evaluation
         final boolean tracing = tracingEnabled.get();
@@ -642,9 +823,17 @@ public final class RuleEvaluator implements IRuleEvaluator {
 
         // OPTIMIZATION: Removed unused truePredicatesBefore allocation (was O(n))
 
-        // Evaluate predicates field by field
-        for (int fieldId : fieldIds) {
-            predicateEvaluator.evaluateField(fieldId, encodedAttributes, ctx, eligiblePredicateIds);
+        // Evaluate predicates field by field, in rank order
+        final int[] fieldOrder = model.getFieldEvaluationOrder();
+        final long[] present = ranks.present;
+        for (int wordIndex = ranks.minWord; wordIndex <= ranks.maxWord; wordIndex++) {
+            long word = present[wordIndex];
+            int base = wordIndex << 6;
+            while (word != 0) {
+                int fieldId = fieldOrder[base + Long.numberOfTrailingZeros(word)];
+                predicateEvaluator.evaluateField(fieldId, encodedAttributes, ctx, eligiblePredicateIds);
+                word &= word - 1;
+            }
         }
 
         // OPTIMIZATION: Copy only the delta - predicates that changed during this
@@ -710,7 +899,8 @@ public final class RuleEvaluator implements IRuleEvaluator {
             Object actualValue = encodedAttributes.get(predicate.fieldId());
 
             // Decode if dictionary-encoded
-            if (actualValue instanceof Integer && predicate.operator().name().contains("EQUAL")) {
+            if (actualValue instanceof Integer && (predicate.operator().name().contains("EQUAL")
+                    || predicate.operator() == Predicate.Operator.IS_ANY_OF)) {
                 actualValue = model.getValueDictionary().decode((Integer) actualValue);
             }
 
@@ -738,7 +928,8 @@ public final class RuleEvaluator implements IRuleEvaluator {
         }
 
         metrics.recordEligibleSetCacheMiss();
-        IntSet eligible = new IntOpenHashSet();
+        // Dense bitset: operators probe it for every candidate predicate
+        PredicateBitSet eligible = new PredicateBitSet(model.getUniquePredicates().length);
 
         eligibleRules.forEach((int ruleId) -> {
             IntList predicateIds = model.getCombinationPredicateIds(ruleId);
@@ -750,11 +941,59 @@ public final class RuleEvaluator implements IRuleEvaluator {
     }
 
     /**
-     * Thread-local pool for field IDs list.
-     * Avoids allocations during predicate evaluation (29.5% of allocations).
+     * Thread-local presence bitmap over the model's field ranks.
+     * Replaces the per-event sorted field ID list; avoids allocation and the comparator.
      */
-    private static final ThreadLocal<IntArrayList> FIELD_IDS_BUFFER = ThreadLocal
-            .withInitial(() -> new IntArrayList(64));
+    private final ThreadLocal<FieldRankCollector> fieldRankCollectorPool = ThreadLocal
+            .withInitial(this::newFieldRankCollector);
+
+    private FieldRankCollector newFieldRankCollector() {
+        return new FieldRankCollector(model.getFieldRanks(), model.getFieldEvaluationOrder().length);
+    }
+
+    /**
+     * Sets the rank bit of each present field. Implemented as a reusable consumer
+     * to avoid lambda allocation in the hot path.
+     */
+    private static final class FieldRankCollector implements it.unimi.dsi.fastutil.ints.IntConsumer {
+        private final int[] fieldRanks;
+        final long[] present;
+        int minWord;
+        int maxWord;
+
+        FieldRankCollector(int[] fieldRanks, int numRankedFields) {
+            this.fieldRanks = fieldRanks;
+            this.present = new long[(numRankedFields + 63) >>> 6];
+            this.minWord = Integer.MAX_VALUE;
+            this.maxWord = -1;
+        }
+
+        /**
+         * Clears the words marked by the previous event (even if its evaluation threw).
+         */
+        void begin() {
+            for (int i = minWord; i <= maxWord; i++) {
+                present[i] = 0L;
+            }
+            minWord = Integer.MAX_VALUE;
+            maxWord = -1;
+        }
+
+        @Override
+        public void accept(int fieldId) {
+            if (fieldId < 0 || fieldId >= fieldRanks.length) {
+                return;
+            }
+            int rank = fieldRanks[fieldId];
+            if (rank < 0) {
+                return; // No predicates on this field
+            }
+            int wordIndex = rank >>> 6;
+            present[wordIndex] |= 1L << rank;
+            if (wordIndex < minWord) minWord = wordIndex;
+            if (wordIndex > maxWord) maxWord = wordIndex;
+        }
+    }
 
     /**
      * Thread-local pool for RoaringBitmap intersection operations.
@@ -820,6 +1059,13 @@ public final class RuleEvaluator implements IRuleEvaluator {
      * * Large posting lists (≥128 rules): Use intersection() - better algorithmic
      * complexity
      * * Reuse pooled bitmap for intersection to maintain zero-allocation property
+     * - v1.3: Combinations in bitmap-matched size buckets (1-3 predicates, dense
+     * postings) are left out via EngineModel.getCountingIndex() and matched by
+     * {@link BitmapMatcher} in detectMatchesOptimized
+     * - v1.4: NOT_EQUAL_TO postings of combinations with other predicates are left
+     * out as well (EngineModel.getComplementPredicateIds()): "all but one true"
+     * blacklists no longer touch every combination counter, the few combinations
+     * reaching their counted threshold check them in detectMatchesOptimized
      *
      * PERFORMANCE CHARACTERISTICS:
      * - Eliminates Container[] allocations via bitmap pooling
@@ -832,6 +1078,11 @@ public final class RuleEvaluator implements IRuleEvaluator {
         EvaluationContext ctx = CONTEXT.get();
         IntSet truePredicates = ctx.getTruePredicates();
 
+        // Bitmap-matched combinations and complement predicates are detected without
+        // counters (except when tracing, which reports counters for every touched
+        // combination)
+        final boolean tracing = tracingEnabled.get();
+
         // Pre-fetch for hot path
         final int[] counters = ctx.counters;
         final IntSet touchedRules = ctx.getTouchedRules();
@@ -841,15 +1092,18 @@ public final class RuleEvaluator implements IRuleEvaluator {
         updater.configure(counters, touchedRules);
 
         truePredicates.forEach((int predId) -> {
-            RoaringBitmap affectedRules = model.getInvertedIndex().get(predId);
+            // Heap bitmaps, or views over the packed postings of an OFF_HEAP model
+            ImmutableBitmapDataProvider affectedRules = !tracing
+                    ? model.getCountingPostings(predId)
+                    : model.getPostings(predId);
             if (affectedRules == null)
                 return;
 
             if (eligibleRulesRoaring != null) {
                 // ADAPTIVE STRATEGY: Choose algorithm based on posting list size
-                final int cardinality = affectedRules.getCardinality();
-
-                if (cardinality < INTERSECTION_CARDINALITY_THRESHOLD) {
+                // (packed postings are always probed: they cannot be ORed into the buffer)
+                if (!(affectedRules instanceof RoaringBitmap heapPostings)
+                        || heapPostings.getCardinality() < INTERSECTION_CARDINALITY_THRESHOLD) {
                     // Small posting list: Use contains() - lower overhead, fewer operations
                     // For <128 rules, the contains() overhead is negligible
                     affectedRules.forEach((int ruleId) -> {
@@ -863,7 +1117,7 @@ public final class RuleEvaluator implements IRuleEvaluator {
                     // Reuse pooled bitmap to maintain zero-allocation property
                     RoaringBitmap intersectionBuffer = INTERSECTION_BUFFER.get();
                     intersectionBuffer.clear();
-                    intersectionBuffer.or(affectedRules);
+                    intersectionBuffer.or(heapPostings);
                     intersectionBuffer.and(eligibleRulesRoaring);
                     intersectionBuffer.forEach(updater);
                 }
@@ -881,13 +1135,16 @@ public final class RuleEvaluator implements IRuleEvaluator {
     private void detectMatchesOptimized(RoaringBitmap eligibleRulesRoaring) {
         EvaluationContext ctx = CONTEXT.get();
         IntSet touchedRules = ctx.getTouchedRules();
+        IntSet truePredicates = ctx.getTruePredicates();
         int[] counters = ctx.counters;
-        int[] needs = model.getPredicateCounts();
 
         // Get tracing state
         final boolean tracing = tracingEnabled.get();
         final TraceCollector collector = tracing ? traceCollector.get() : null;
 
+        // Counters cover complement predicates only when tracing (see updateCountersOptimized)
+        int[] needs = tracing ? model.getPredicateCounts() : model.getCountedPredicateCounts();
+
         // Avoid creating IntArrayList (which iterates the set) and use forEach directly
         // Note: Prefetching is removed as it requires index-based access, but the
         // allocation savings
@@ -896,18 +1153,19 @@ public final class RuleEvaluator implements IRuleEvaluator {
         touchedRules.forEach((int ruleId) -> {
             int predicatesMatched = counters[ruleId];
             int predicatesRequired = needs[ruleId];
-            boolean matched = predicatesMatched >= predicatesRequired;
+            boolean matched = predicatesMatched >= predicatesRequired
+                    && (tracing || complementsHold(ruleId, truePredicates));
 
             if (matched) {
-                List<String> ruleCodes = model.getCombinationRuleCodes(ruleId);
-                List<Integer> priorities = model.getCombinationPrioritiesAll(ruleId);
-
-                for (int j = 0; j < ruleCodes.size(); j++) {
-                    ctx.addMatchedRule(ruleId, ruleCodes.get(j), priorities.get(j), "");
+                int end = model.getCombinationRuleEnd(ruleId);
+                for (int entry = model.getCombinationRuleStart(ruleId); entry < end; entry++) {
+                    String ruleCode = model.getRuleEntryCode(entry);
+                    int priority = model.getRuleEntryPriority(entry);
+                    ctx.addMatchedRule(ruleId, ruleCode, priority, "", model.getRuleEntryFamily(entry));
 
                     // Collect trace data for matched rules
                     if (tracing && collector != null) {
-                        collector.addRuleDetail(ruleId, ruleCodes.get(j), priorities.get(j),
+                        collector.addRuleDetail(ruleId, ruleCode, priority,
                                 predicatesMatched, predicatesRequired, true, List.of());
                         // Notify collector of a match for conditional tracing
                         collector.notifyMatch();
@@ -915,19 +1173,225 @@ public final class RuleEvaluator implements IRuleEvaluator {
                 }
             } else if (tracing && collector != null) {
                 // Collect trace data for non-matched touched rules
-                List<String> ruleCodes = model.getCombinationRuleCodes(ruleId);
-                List<Integer> priorities = model.getCombinationPrioritiesAll(ruleId);
-
                 // Identify failed predicates
                 List<String> failedPredicates = computeFailedPredicates(ruleId, ctx.getTruePredicates());
 
-                for (int j = 0; j < ruleCodes.size(); j++) {
-                    collector.addRuleDetail(ruleId, ruleCodes.get(j), priorities.get(j),
+                int end = model.getCombinationRuleEnd(ruleId);
+                for (int entry = model.getCombinationRuleStart(ruleId); entry < end; entry++) {
+                    collector.addRuleDetail(ruleId, model.getRuleEntryCode(entry), model.getRuleEntryPriority(entry),
                             predicatesMatched, predicatesRequired, false, failedPredicates);
                 }
             }
         });
 
+        // Small combinations in bitmap-matched size buckets (see updateCountersOptimized)
+        if (bitmapMatcher != null && !tracing) {
+            bitmapMatcher.detectMatches(truePredicates, eligibleRulesRoaring, ctx);
+        }
+    }
+
+    /**
+     * Whether the combination's complement predicates (NOT_EQUAL_TO predicates
+     * left out of counting, see EngineModel.getComplementPredicateIds()) are all true.
+     */
+    private boolean complementsHold(int combinationId, IntSet truePredicates) {
+        for (int predId : model.getComplementPredicateIds(combinationId)) {
+            if (!truePredicates.contains(predId)) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Pooled consumer for tiered FIRST_MATCH evaluation (avoids lambda allocation).
+     */
+    private final ThreadLocal<TierCounter> tierCounterPool = ThreadLocal.withInitial(TierCounter::new);
+
+    /**
+     * Counts a tier's true predicates and records combinations as they complete.
+     * Also restricts a tier's predicates to the base-condition eligible set.
+     */
+    private final class TierCounter implements org.roaringbitmap.IntConsumer {
+        private final PredicateBitSet eligibleScratch = new PredicateBitSet(model.getUniquePredicates().length);
+        private final int[] needs = model.getCountedPredicateCounts();
+        private EvaluationContext ctx;
+        private RoaringBitmap eligibleRules;
+        private int bestPriority;
+
+        void configure(EvaluationContext ctx, RoaringBitmap eligibleRules) {
+            this.ctx = ctx;
+            this.eligibleRules = eligibleRules;
+            this.bestPriority = Integer.MIN_VALUE;
+        }
+
+        IntSet eligiblePredicates(int tier, IntSet eligiblePredicateIds) {
+            if (eligiblePredicateIds == null) {
+                return priorityTiers.predicates(tier);
+            }
+            eligibleScratch.clear();
+            for (int predId : priorityTiers.predicateIds(tier)) {
+                if (eligiblePredicateIds.contains(predId)) {
+                    eligibleScratch.add(predId);
+                }
+            }
+            return eligibleScratch;
+        }
+
+        @Override
+        public void accept(int combinationId) {
+            if (eligibleRules != null && !eligibleRules.contains(combinationId)) {
+                return;
+            }
+            ctx.getTouchedRules().add(combinationId);
+            if (++ctx.counters[combinationId] == needs[combinationId]
+                    && complementsHold(combinationId, ctx.getTruePredicates())) {
+                int end = model.getCombinationRuleEnd(combinationId);
+                for (int entry = model.getCombinationRuleStart(combinationId); entry < end; entry++) {
+                    ctx.addMatchedRule(combinationId, model.getRuleEntryCode(entry),
+                            model.getRuleEntryPriority(entry), "", model.getRuleEntryFamily(entry));
+                }
+                bestPriority = Math.max(bestPriority, model.getCombinationMaxPriority(combinationId));
+            }
+        }
+    }
+
+    /**
+     * FIRST_MATCH short-circuit over the model's priority tiers, highest first.
+     *
+     * Each tier evaluates only the predicates it is the first to need and counts
+     * them. A tier's combinations only use predicates of that tier or higher ones,
+     * so their counters are final once the tier is processed, and completions are
+     * detected as counters reach the required count (complement predicates are
+     * evaluated by then and checked on completion). Evaluation stops after the
+     * first tier whose priority is at or below the best completed combination:
+     * the remaining tiers are strictly lower and cannot change the selection.
+     * Replaces steps 2-4 of {@link #doEvaluate(Event)}; tracing uses the full path.
+     *
+     * @return number of tiers evaluated
+     */
+    private int evaluatePriorityTiers(Event event, RoaringBitmap eligibleRules) {
+        EvaluationContext ctx = CONTEXT.get();
+        Int2ObjectMap<Object> encodedAttributes = eventEncoder.encode(event);
+        IntSet eligiblePredicateIds = computeEligiblePredicateIds(eligibleRules);
+
+        FieldRankCollector ranks = fieldRankCollectorPool.get();
+        ranks.begin();
+        encodedAttributes.keySet().forEach(ranks);
+
+        TierCounter counter = tierCounterPool.get();
+        counter.configure(ctx, eligibleRules);
+
+        final int[] fieldOrder = model.getFieldEvaluationOrder();
+        final long[] present = ranks.present;
+        final IntSet truePredicates = ctx.getTruePredicates();
+        final int numTiers = priorityTiers.size();
+
+        int tier = 0;
+        while (tier < numTiers) {
+            // Evaluate the tier's predicates on the event's fields, in rank order
+            IntSet tierEligible = counter.eligiblePredicates(tier, eligiblePredicateIds);
+            long[] tierFields = priorityTiers.fieldRanks(tier);
+            for (int wordIndex = ranks.minWord; wordIndex <= ranks.maxWord; wordIndex++) {
+                long word = present[wordIndex] & tierFields[wordIndex];
+                int base = wordIndex << 6;
+                while (word != 0) {
+                    int fieldId = fieldOrder[base + Long.numberOfTrailingZeros(word)];
+                    predicateEvaluator.evaluateField(fieldId, encodedAttributes, ctx, tierEligible);
+                    word &= word - 1;
+                }
+            }
+
+            // Count them; completed combinations are recorded by the counter
+            for (int predId : priorityTiers.predicateIds(tier)) {
+                if (truePredicates.contains(predId)) {
+                    ImmutableBitmapDataProvider affectedRules = model.getTierCountingPostings(predId);
+                    if (affectedRules != null) {
+                        affectedRules.forEach(counter);
+                    }
+                }
+            }
+
+            if (counter.bestPriority >= priorityTiers.priority(tier++)) {
+                break;
+            }
+        }
+
+        metrics.recordPriorityTiersSkipped(numTiers - tier);
+        return tier;
+    }
+
+    /**
+     * Pooled set of the eligible predicates of a decision DAG leaf.
+     */
+    private final ThreadLocal<PredicateBitSet> dagPredicatesPool = ThreadLocal
+            .withInitial(() -> new PredicateBitSet(model.getUniquePredicates().length));
+
+    /**
+     * DECISION_DAG backend: follows the event's field values down the model's
+     * decision DAG, evaluates only the leaf's predicates and records each
+     * candidate combination (among the base-condition eligible rules) whose
+     * predicates are all true. Cost follows the path length and the leaf, not
+     * the number of true predicates. Replaces steps 2-4 of
+     * {@link #doEvaluate(Event)}; tracing uses the counting path.
+     *
+     * @return number of candidate combinations verified
+     */
+    private int evaluateDecisionDag(Event event, RoaringBitmap eligibleRules) {
+        EvaluationContext ctx = CONTEXT.get();
+        Int2ObjectMap<Object> encodedAttributes = eventEncoder.encode(event);
+
+        int node = decisionDag.root();
+        while (!decisionDag.isLeaf(node)) {
+            node = decisionDag.next(node, encodedAttributes.get(decisionDag.field(node)));
+        }
+        int[] candidates = decisionDag.candidates(node);
+        if (candidates.length == 0) {
+            return 0;
+        }
+
+        PredicateBitSet leafPredicates = dagPredicatesPool.get();
+        leafPredicates.clear();
+        if (eligibleRules == null) {
+            for (int predId : decisionDag.predicateIds(node)) {
+                leafPredicates.add(predId);
+            }
+        } else {
+            for (int combinationId : candidates) {
+                if (eligibleRules.contains(combinationId)) {
+                    leafPredicates.addAll(model.getCombinationPredicateIds(combinationId));
+                }
+            }
+        }
+        for (int fieldId : decisionDag.fieldIds(node)) {
+            predicateEvaluator.evaluateField(fieldId, encodedAttributes, ctx, leafPredicates);
+        }
+
+        IntSet truePredicates = ctx.getTruePredicates();
+        int verified = 0;
+        for (int combinationId : candidates) {
+            if (eligibleRules != null && !eligibleRules.contains(combinationId)) {
+                continue;
+            }
+            verified++;
+            if (allTrue(model.getCombinationPredicateIds(combinationId), truePredicates)) {
+                int end = model.getCombinationRuleEnd(combinationId);
+                for (int entry = model.getCombinationRuleStart(combinationId); entry < end; entry++) {
+                    ctx.addMatchedRule(combinationId, model.getRuleEntryCode(entry),
+                            model.getRuleEntryPriority(entry), "", model.getRuleEntryFamily(entry));
+                }
+            }
+        }
+        return verified;
+    }
+
+    private static boolean allTrue(IntList predicateIds, IntSet truePredicates) {
+        for (int i = 0; i < predicateIds.size(); i++) {
+            if (!truePredicates.contains(predicateIds.getInt(i))) {
+                return false;
+            }
+        }
+        return true;
     }
 
     /**
@@ -962,7 +1426,14 @@ public final class RuleEvaluator implements IRuleEvaluator {
     private void selectMatches() {
         EvaluationContext ctx = CONTEXT.get();
 
-        if (model.getSelectionStrategy() == SelectionStrategy.ALL_MATCHES) {
+        SelectionStrategy strategy = model.getSelectionStrategy();
+        if (strategy == SelectionStrategy.ALL_MATCHES) {
+            return;
+        }
+
+        // Bounded strategies: selection already happened in the context's heaps
+        if (strategy == SelectionStrategy.TOP_K || strategy == SelectionStrategy.MAX_PRIORITY_N) {
+            ctx.collectLimitedMatches();
             return;
         }
 
@@ -1069,6 +1540,8 @@ public final class RuleEvaluator implements IRuleEvaluator {
      * <ul>
      * <li>{@code roaringConversionsSaved}: Bitmap conversions avoided via
      * caching</li>
+     * <li>{@code priorityTiersSkipped}: Priority tiers skipped by FIRST_MATCH
+     * short-circuit evaluation</li>
      * </ul>
      * </li>
      * </ul>
@@ -1157,7 +1630,12 @@ public final class RuleEvaluator implements IRuleEvaluator {
         tracingEnabled.remove();
         traceCollector.remove();
         counterUpdaterPool.remove();
-        FIELD_IDS_BUFFER.remove();
+        tierCounterPool.remove();
+        dagPredicatesPool.remove();
+        if (bitmapMatcher != null) {
+            bitmapMatcher.cleanupThreadLocal();
+        }
+        fieldRankCollectorPool.remove();
         INTERSECTION_BUFFER.remove();
 
         if (logger.isDebugEnabled()) {
@@ -1295,7 +1773,9 @@ public final class RuleEvaluator implements IRuleEvaluator {
             // OPTIMIZATION: Copy only the final 'after' state
             // We need the complete set of true predicates for trace accuracy,
             // but we can avoid storing references to the live evaluation context
-            this.newTruePredicates = new it.unimi.dsi.fastutil.ints.IntOpenHashSet(after);
+            this.newTruePredicates = after instanceof PredicateBitSet bits
+                    ? bits.copy()
+                    : new it.unimi.dsi.fastutil.ints.IntOpenHashSet(after);
 
             // OPTIMIZATION: Copy only field values we need (avoid retaining full encoded
             // map)
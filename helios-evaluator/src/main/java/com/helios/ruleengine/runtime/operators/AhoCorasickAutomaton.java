@@ -0,0 +1,161 @@
+package com.helios.ruleengine.runtime.operators;
+
+import it.unimi.dsi.fastutil.chars.Char2IntOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntArrayFIFOQueue;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntList;
+
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * Case-insensitive Aho-Corasick automaton over a set of literal patterns.
+ *
+ * <p>The failure links are folded into a dense transition table, so scanning a
+ * value is one table lookup per char with no backtracking. Chars are mapped to
+ * a compact alphabet of the (case-folded) chars that occur in some pattern;
+ * every other char is class 0, which always leads back to the root.
+ *
+ * <p>Pattern hits for a state are its own outputs plus those of the states on
+ * its output link chain (the nearest failure ancestors that end a pattern).
+ * The automaton is immutable and can be shared across threads.
+ */
+final class AhoCorasickAutomaton {
+
+    static final int ROOT = 0;
+    private static final int[] NO_OUTPUTS = new int[0];
+
+    private final int[] asciiClasses = new int[128];
+    private final Char2IntOpenHashMap otherClasses = new Char2IntOpenHashMap();
+    private final int width;
+
+    private final int[] transitions;   // state * width + class -> state
+    private final int[][] outputs;     // pattern indexes ending exactly at the state
+    private final int[] outputLinks;   // next state on the output chain, ROOT = none
+    private final int[] emptyPatterns; // zero-length patterns, contained in every value
+
+    /**
+     * @param patterns Patterns in index order; reported hits are indexes into this list
+     */
+    AhoCorasickAutomaton(List<String> patterns) {
+        int maxStates = 1;
+        int classes = 1;
+        IntList empty = new IntArrayList();
+        for (int i = 0; i < patterns.size(); i++) {
+            String pattern = patterns.get(i);
+            if (pattern.isEmpty()) {
+                empty.add(i);
+            }
+            maxStates += pattern.length();
+            for (int j = 0; j < pattern.length(); j++) {
+                char c = fold(pattern.charAt(j));
+                if (classOf(c) == 0) {
+                    if (c < 128) {
+                        asciiClasses[c] = classes++;
+                    } else {
+                        otherClasses.put(c, classes++);
+                    }
+                }
+            }
+        }
+        this.width = classes;
+        this.emptyPatterns = empty.toIntArray();
+
+        // 1. Trie (-1 = no edge yet)
+        int[] next = new int[maxStates * width];
+        Arrays.fill(next, -1);
+        IntList[] ownOutputs = new IntList[maxStates];
+        int states = 1;
+        for (int i = 0; i < patterns.size(); i++) {
+            String pattern = patterns.get(i);
+            if (pattern.isEmpty()) {
+                continue;
+            }
+            int state = ROOT;
+            for (int j = 0; j < pattern.length(); j++) {
+                int slot = state * width + classOf(fold(pattern.charAt(j)));
+                if (next[slot] < 0) {
+                    next[slot] = states++;
+                }
+                state = next[slot];
+            }
+            if (ownOutputs[state] == null) {
+                ownOutputs[state] = new IntArrayList();
+            }
+            ownOutputs[state].add(i);
+        }
+
+        // 2. Breadth-first: failure links folded into the table, output links
+        this.transitions = Arrays.copyOf(next, states * width);
+        this.outputs = new int[states][];
+        this.outputLinks = new int[states];
+        int[] failure = new int[states];
+        IntArrayFIFOQueue queue = new IntArrayFIFOQueue();
+
+        for (int state = 0; state < states; state++) {
+            outputs[state] = ownOutputs[state] != null ? ownOutputs[state].toIntArray() : NO_OUTPUTS;
+        }
+        for (int c = 0; c < width; c++) {
+            int child = transitions[c];
+            if (child < 0) {
+                transitions[c] = ROOT;
+            } else {
+                queue.enqueue(child);
+            }
+        }
+        while (!queue.isEmpty()) {
+            int state = queue.dequeueInt();
+            int fail = failure[state];
+            outputLinks[state] = outputs[fail].length > 0 ? fail : outputLinks[fail];
+            for (int c = 0; c < width; c++) {
+                int slot = state * width + c;
+                int child = transitions[slot];
+                int fallback = transitions[fail * width + c];
+                if (child < 0) {
+                    transitions[slot] = fallback;
+                } else {
+                    failure[child] = fallback;
+                    queue.enqueue(child);
+                }
+            }
+        }
+    }
+
+    int numStates() {
+        return outputs.length;
+    }
+
+    /**
+     * Transition on one char of the scanned value.
+     */
+    int next(int state, char c) {
+        return transitions[state * width + classOf(fold(c))];
+    }
+
+    /**
+     * Patterns ending exactly at the state (empty if none).
+     */
+    int[] outputs(int state) {
+        return outputs[state];
+    }
+
+    /**
+     * Next state on the output chain, {@link #ROOT} at the end of the chain.
+     */
+    int outputLink(int state) {
+        return outputLinks[state];
+    }
+
+    int[] emptyPatterns() {
+        return emptyPatterns;
+    }
+
+    private int classOf(char folded) {
+        return folded < 128 ? asciiClasses[folded] : otherClasses.get(folded);
+    }
+
+    // Same equivalence as String.regionMatches(true, ...)
+    private static char fold(char c) {
+        return Character.toLowerCase(Character.toUpperCase(c));
+    }
+}
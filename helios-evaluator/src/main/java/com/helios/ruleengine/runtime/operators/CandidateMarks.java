@@ -0,0 +1,33 @@
+package com.helios.ruleengine.runtime.operators;
+
+import java.util.Arrays;
+
+/**
+ * Epoch-stamped visited marks; avoids clearing between evaluations.
+ * Not thread-safe: evaluators keep one instance per thread.
+ */
+final class CandidateMarks {
+    private final int[] marks;
+    private int epoch;
+
+    CandidateMarks(int size) {
+        this.marks = new int[size];
+    }
+
+    int nextEpoch() {
+        if (++epoch == 0) {
+            // Wrapped around: stale marks could collide, start over
+            Arrays.fill(marks, 0);
+            epoch = 1;
+        }
+        return epoch;
+    }
+
+    boolean mark(int idx, int epoch) {
+        if (marks[idx] == epoch) {
+            return false;
+        }
+        marks[idx] = epoch;
+        return true;
+    }
+}
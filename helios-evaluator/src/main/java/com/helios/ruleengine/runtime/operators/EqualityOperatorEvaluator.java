@@ -5,6 +5,7 @@
 package com.helios.ruleengine.runtime.operators;
 
 import com.helios.ruleengine.runtime.context.EvaluationContext;
+import com.helios.ruleengine.runtime.context.PredicateBitSet;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.api.model.Predicate;
 import it.unimi.dsi.fastutil.ints.IntArrayList;
@@ -13,15 +14,16 @@ import it.unimi.dsi.fastutil.ints.IntSet;
 import it.unimi.dsi.fastutil.objects.Object2ObjectOpenHashMap;
 
 import java.util.ArrayList;
+import java.util.LinkedHashSet;
 import java.util.List;
 import java.util.Map;
 import java.util.Objects;
-import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.atomic.AtomicLong;
+import java.util.stream.Stream;
 
 /**
- * Optimized equality operator evaluator for EQUAL_TO and NOT_EQUAL_TO
- * predicates.
+ * Optimized equality operator evaluator for EQUAL_TO, NOT_EQUAL_TO and
+ * IS_ANY_OF predicates.
  *
  * PERFORMANCE OPTIMIZATIONS:
  *
@@ -29,7 +31,7 @@ import java.util.concurrent.atomic.AtomicLong;
  * Pre-compiles each field's predicates into specialized data structures:
  * - Value→PredicateIds hash map for O(1) EQUAL_TO lookups
  * - Pre-computed predicate IDs (no runtime model.getPredicateId() calls)
- * - Selectivity-sorted arrays for optimal evaluation order
+ * - NOT_EQUAL_TO evaluated by complement (bitset of all, minus value hits)
  * - Separated EQUAL_TO and NOT_EQUAL_TO for specialized handling
  *
  * 2. FAST PATH SPECIALIZATIONS:
@@ -37,40 +39,53 @@ import java.util.concurrent.atomic.AtomicLong;
  * - EQUAL_TO: O(1) hash lookup instead of O(N) linear scan
  * - Empty predicate sets: Immediate return
  *
- * 3. SELECTIVITY-BASED ORDERING:
- * High selectivity predicates (rare matches) evaluated first.
- * Rationale:
- * - High selectivity = few matches = likely to fail fast
- * - Enables early termination when combined with eligibility filtering
- * - Reduces average comparisons per evaluation
+ * 3. COMPLEMENT EVALUATION FOR NOT_EQUAL_TO:
+ * IS_NONE_OF is compiled into one NOT_EQUAL_TO predicate per value, so
+ * blacklist-style fields carry many of them, and nearly all are true for
+ * any given event. Instead of comparing each one:
+ * - The field's NOT_EQUAL_TO IDs are kept in a precomputed bitset
+ * - A value→predicateIds map finds the few that are false (O(1) probe)
+ * - The bitset is OR-ed into the true set (word-wise, masked by
+ * eligibility) and the false ones are taken out again
  *
  * Example:
- * - Predicate A: country == "RARE_COUNTRY" (selectivity 0.95 - matches 5%)
- * - Predicate B: status == "ACTIVE" (selectivity 0.30 - matches 70%)
- * - Evaluate A first (likely to fail and skip B)
+ * - Predicates: country != "KP", country != "IR", country != "SY"
+ * - Event country = "IR": add all three, remove the "IR" one
  *
- * 4. MEMORY EFFICIENCY:
+ * 4. SET MEMBERSHIP FOR IS_ANY_OF:
+ * Large IS_ANY_OF lists are compiled to one predicate instead of one
+ * EQUAL_TO per value. Each member value is entered into the same
+ * value→predicateIds map, so the single EQUAL_TO probe also resolves
+ * every IS_ANY_OF predicate containing the value.
+ *
+ * Example:
+ * - Predicates: country == "US" (P1), country IN ["US", "CA", ...] (P2)
+ * - Map: "US" → [P1, P2], "CA" → [P2], ...
+ *
+ * 5. MEMORY EFFICIENCY:
  * - Lazy initialization: Only compile fields that have equality predicates
  * - Shared structures: Value maps shared across evaluations
  * - No per-evaluation allocations
  *
  * EXECUTION FLOW:
  * 1. Initialization (once per field):
- * a. Extract EQUAL_TO and NOT_EQUAL_TO predicates for field
- * b. Build value→predicateIds map for EQUAL_TO
+ * a. Extract EQUAL_TO, NOT_EQUAL_TO and IS_ANY_OF predicates for field
+ * b. Build value→predicateIds maps for EQUAL_TO (with IS_ANY_OF members)
+ * and NOT_EQUAL_TO
  * c. Pre-lookup all predicate IDs from model
- * d. Sort predicates by selectivity (descending)
+ * d. Collect NOT_EQUAL_TO IDs into a bitset
  * e. Create specialized FieldEvaluator
  *
  * 2. Runtime evaluation (per event):
- * a. Get FieldEvaluator for field (O(1) map lookup)
- * b. EQUAL_TO: Hash lookup in value map (O(1))
- * c. NOT_EQUAL_TO: Iterate sorted array (early termination)
+ * a. Get FieldEvaluator for field (O(1) array lookup)
+ * b. EQUAL_TO and IS_ANY_OF: Hash lookup in value map (O(1))
+ * c. NOT_EQUAL_TO: Bitset union, then remove the value's hits (O(1) probe)
  * d. Apply eligibility filter
  * e. Update context with matches
  *
  * PERFORMANCE IMPACT:
  * - EQUAL_TO evaluation: O(N) → O(1) per field
+ * - NOT_EQUAL_TO evaluation: N comparisons → N/64 word ORs + 1 probe
  * - Average comparisons: N → 1-3 (depending on selectivity distribution)
  * - Initialization cost: ~10-50ms for 100K predicates (amortized over millions
  * of evaluations)
@@ -82,9 +97,10 @@ public final class EqualityOperatorEvaluator {
 
     private final EngineModel model;
 
-    // Field-specific compiled evaluators
-    // Lazy initialization: Only fields with equality predicates are compiled
-    private final Map<Integer, FieldEvaluator> fieldEvaluators;
+    // Field-specific compiled evaluators, indexed by field id
+    // Only fields with equality predicates are compiled (null otherwise)
+    private final FieldEvaluator[] fieldEvaluators;
+    private int compiledFields;
 
     // --- FIX START ---
     // Switched to AtomicLong for thread-safe metric collection.
@@ -100,7 +116,7 @@ public final class EqualityOperatorEvaluator {
 
     public EqualityOperatorEvaluator(EngineModel model) {
         this.model = model;
-        this.fieldEvaluators = new ConcurrentHashMap<>();
+        this.fieldEvaluators = new FieldEvaluator[PredicateEvaluator.fieldTableSize(model)];
         initializeEvaluators();
     }
 
@@ -119,18 +135,21 @@ public final class EqualityOperatorEvaluator {
             // Filter predicates to only equality operators
             List<Predicate> equalityPredicates = predicates.stream()
                     .filter(p -> p.operator() == Predicate.Operator.EQUAL_TO ||
-                            p.operator() == Predicate.Operator.NOT_EQUAL_TO)
+                            p.operator() == Predicate.Operator.NOT_EQUAL_TO ||
+                            p.operator() == Predicate.Operator.IS_ANY_OF)
                     .toList();
 
             if (!equalityPredicates.isEmpty()) {
                 // Compile specialized evaluator for this field
-                fieldEvaluators.put(fieldId, new FieldEvaluator(fieldId, equalityPredicates));
+                fieldEvaluators[fieldId] = new FieldEvaluator(fieldId, equalityPredicates);
+                compiledFields++;
             }
         });
     }
 
     /**
-     * Evaluate EQUAL_TO and NOT_EQUAL_TO predicates for a given field and value.
+     * Evaluate EQUAL_TO, NOT_EQUAL_TO and IS_ANY_OF predicates for a given field
+     * and value.
      *
      * OPTIMIZATION: Uses pre-compiled FieldEvaluator with O(1) hash lookups for
      * EQUAL_TO
@@ -145,7 +164,8 @@ public final class EqualityOperatorEvaluator {
         // --- FIX END ---
 
         // Get pre-compiled evaluator for this field
-        FieldEvaluator evaluator = fieldEvaluators.get(fieldId);
+        FieldEvaluator evaluator = fieldId >= 0 && fieldId < fieldEvaluators.length
+                ? fieldEvaluators[fieldId] : null;
         if (evaluator == null) {
             return; // No equality predicates for this field
         }
@@ -154,23 +174,33 @@ public final class EqualityOperatorEvaluator {
         evaluator.evaluate(eventValue, ctx, eligiblePredicateIds);
     }
 
+    /**
+     * Whether this evaluator has compiled predicates for the field.
+     */
+    boolean hasField(int fieldId) {
+        return fieldId >= 0 && fieldId < fieldEvaluators.length && fieldEvaluators[fieldId] != null;
+    }
+
     /**
      * Field-specific evaluator with pre-compiled optimization structures.
      *
      * ARCHITECTURE:
-     * - Separate handling for EQUAL_TO (hash-based) and NOT_EQUAL_TO (array-based)
+     * - Separate handling for EQUAL_TO (hash-based) and NOT_EQUAL_TO (complement-based)
      * - Pre-computed predicate IDs (no runtime lookups)
-     * - Selectivity-sorted for optimal evaluation order
      * - Fast paths for common cases (single predicate, no predicates)
      */
     private class FieldEvaluator {
-        // EQUAL_TO predicates: Optimized for O(1) value lookup
-        // Map: value → list of predicate IDs that check for this value
+        // EQUAL_TO and IS_ANY_OF predicates: Optimized for O(1) value lookup
+        // Map: value → list of predicate IDs that check for (or list) this value
         private final Map<Object, IntList> equalToValueMap;
 
-        // NOT_EQUAL_TO predicates: Sorted by selectivity (high to low)
-        // Array of [predicateId, value] pairs for cache-friendly sequential access
-        private final NotEqualPredicate[] notEqualPredicates;
+        // All EQUAL_TO and IS_ANY_OF predicate IDs, flattened for allocation-free counting
+        private final int[] equalToPredicateIds;
+
+        // NOT_EQUAL_TO predicates: all IDs as a bitset, plus
+        // Map: value → list of predicate IDs that are false for this value
+        private final PredicateBitSet notEqualPredicateIds;
+        private final Map<Object, IntList> notEqualValueMap;
 
         // Fast path: If field has exactly 1 predicate, store it here for direct
         // evaluation
@@ -180,32 +210,43 @@ public final class EqualityOperatorEvaluator {
             // Separate EQUAL_TO and NOT_EQUAL_TO predicates
             List<Predicate> equalToList = new ArrayList<>();
             List<Predicate> notEqualToList = new ArrayList<>();
+            List<Predicate> isAnyOfList = new ArrayList<>();
 
             for (Predicate p : equalityPredicates) {
                 if (p.operator() == Predicate.Operator.EQUAL_TO) {
                     equalToList.add(p);
                 } else if (p.operator() == Predicate.Operator.NOT_EQUAL_TO) {
                     notEqualToList.add(p);
+                } else if (p.operator() == Predicate.Operator.IS_ANY_OF) {
+                    isAnyOfList.add(p);
                 }
             }
 
-            // Build EQUAL_TO value map for O(1) lookups
-            this.equalToValueMap = buildEqualToValueMap(equalToList);
-
-            // Build selectivity-sorted NOT_EQUAL_TO array
-            this.notEqualPredicates = buildNotEqualToArray(notEqualToList);
+            // Build EQUAL_TO value map for O(1) lookups, with every IS_ANY_OF member
+            this.equalToValueMap = buildValueMap(equalToList);
+            addSetMembers(equalToValueMap, isAnyOfList);
+            this.equalToPredicateIds = Stream.concat(equalToList.stream(), isAnyOfList.stream())
+                    .mapToInt(model::getPredicateId)
+                    .toArray();
+
+            // Build NOT_EQUAL_TO bitset and value map for complement evaluation
+            this.notEqualPredicateIds = new PredicateBitSet(model.getUniquePredicates().length);
+            for (Predicate p : notEqualToList) {
+                notEqualPredicateIds.add(model.getPredicateId(p));
+            }
+            this.notEqualValueMap = buildValueMap(notEqualToList);
 
-            // Check for single-predicate fast path
-            this.singlePredicateCache = (equalityPredicates.size() == 1)
+            // Check for single-predicate fast path (a set is never a single value)
+            this.singlePredicateCache = (equalityPredicates.size() == 1 && isAnyOfList.isEmpty())
                     ? new SinglePredicateCache(equalityPredicates.get(0))
                     : null;
         }
 
         /**
-         * Build value→predicateIds map for EQUAL_TO predicates.
+         * Build value→predicateIds map for EQUAL_TO (or NOT_EQUAL_TO) predicates.
          *
          * This enables O(1) lookup: Given event value, find all predicates that check
-         * for it.
+         * for it (the EQUAL_TO ones that match, the NOT_EQUAL_TO ones that fail).
          *
          * Example:
          * - Predicate P1: country == "US"
@@ -218,10 +259,10 @@ public final class EqualityOperatorEvaluator {
          *
          * Evaluation: event.country == "US" → lookup("US") → [P1, P3] (O(1))
          */
-        private Map<Object, IntList> buildEqualToValueMap(List<Predicate> equalToPredicates) {
+        private Map<Object, IntList> buildValueMap(List<Predicate> predicates) {
             Map<Object, IntList> valueMap = new Object2ObjectOpenHashMap<>();
 
-            for (Predicate p : equalToPredicates) {
+            for (Predicate p : predicates) {
                 int predId = model.getPredicateId(p);
                 Object value = p.value();
 
@@ -233,37 +274,21 @@ public final class EqualityOperatorEvaluator {
         }
 
         /**
-         * Build selectivity-sorted array for NOT_EQUAL_TO predicates.
-         *
-         * RATIONALE FOR SELECTIVITY ORDERING:
-         * NOT_EQUAL_TO predicates usually have LOW selectivity (match often).
-         * Example: status != "INACTIVE" matches 95% of events.
-         *
-         * By sorting high→low selectivity, we check rare conditions first:
-         * - High selectivity predicates fail fast (don't match most events)
-         * - Combined with eligibility filtering, enables early termination
-         * - Reduces average comparisons per evaluation
+         * Add each IS_ANY_OF member value to the value map, so one probe finds
+         * the set-membership predicates containing the event value.
          *
-         * Example ordering:
-         * 1. country != "RARE_COUNTRY" (selectivity 0.99 - fails 99% of time)
-         * 2. tier != "PLATINUM" (selectivity 0.85 - fails 85% of time)
-         * 3. status != "INACTIVE" (selectivity 0.30 - matches 70% of time)
+         * Members are added once per predicate, even if the list repeats them.
          */
-        private NotEqualPredicate[] buildNotEqualToArray(List<Predicate> notEqualToPredicates) {
-            // Sort by selectivity descending (high selectivity first)
-            List<Predicate> sorted = new ArrayList<>(notEqualToPredicates);
-            sorted.sort((p1, p2) -> Float.compare(p2.selectivity(), p1.selectivity()));
-
-            NotEqualPredicate[] array = new NotEqualPredicate[sorted.size()];
-            for (int i = 0; i < sorted.size(); i++) {
-                Predicate p = sorted.get(i);
-                array[i] = new NotEqualPredicate(
-                        model.getPredicateId(p),
-                        p.value(),
-                        p.selectivity());
+        private void addSetMembers(Map<Object, IntList> valueMap, List<Predicate> predicates) {
+            for (Predicate p : predicates) {
+                if (!(p.value() instanceof List<?> members)) {
+                    continue;
+                }
+                int predId = model.getPredicateId(p);
+                for (Object member : new LinkedHashSet<>(members)) {
+                    valueMap.computeIfAbsent(member, k -> new IntArrayList()).add(predId);
+                }
             }
-
-            return array;
         }
 
         /**
@@ -271,9 +296,8 @@ public final class EqualityOperatorEvaluator {
          *
          * EXECUTION FLOW:
          * 1. Fast path: Single predicate? Direct evaluation
-         * 2. EQUAL_TO: Hash lookup for exact value matches (O(1))
-         * 3. NOT_EQUAL_TO: Sequential scan with selectivity ordering (early
-         * termination)
+         * 2. EQUAL_TO and IS_ANY_OF: Hash lookup for exact value matches (O(1))
+         * 3. NOT_EQUAL_TO: Bitset union minus the value's hits (complement)
          */
         void evaluate(Object eventValue, EvaluationContext ctx, IntSet eligiblePredicateIds) {
             // Fast path: Single predicate field
@@ -282,10 +306,10 @@ public final class EqualityOperatorEvaluator {
                 return;
             }
 
-            // EQUAL_TO evaluation: O(1) hash lookup
+            // EQUAL_TO and IS_ANY_OF evaluation: O(1) hash lookup
             evaluateEqualTo(eventValue, ctx, eligiblePredicateIds);
 
-            // NOT_EQUAL_TO evaluation: Selectivity-ordered scan
+            // NOT_EQUAL_TO evaluation: Complement of a hash lookup
             evaluateNotEqualTo(eventValue, ctx, eligiblePredicateIds);
         }
 
@@ -374,50 +398,50 @@ public final class EqualityOperatorEvaluator {
          * Count all eligible EQUAL_TO predicates for accurate statistics.
          */
         private int countEligibleEqualToPredicates(IntSet eligiblePredicateIds) {
+            if (eligiblePredicateIds == null) {
+                return equalToPredicateIds.length;
+            }
             int count = 0;
-            for (IntList predIds : equalToValueMap.values()) {
-                for (int i = 0; i < predIds.size(); i++) {
-                    int predId = predIds.getInt(i);
-                    if (eligiblePredicateIds == null || eligiblePredicateIds.contains(predId)) {
-                        count++;
-                    }
+            for (int predId : equalToPredicateIds) {
+                if (eligiblePredicateIds.contains(predId)) {
+                    count++;
                 }
             }
             return count;
         }
 
         /**
-         * Evaluate NOT_EQUAL_TO predicates with selectivity-based ordering.
+         * Evaluate NOT_EQUAL_TO predicates by complement.
          *
-         * OPTIMIZATION: High selectivity predicates first (rare matches, likely to
-         * fail).
-         * This enables early termination when combined with eligibility filtering.
+         * All eligible NOT_EQUAL_TO predicates are recorded as true with one
+         * word-wise bitset union; a single hash probe then finds the few that
+         * check for this exact value, and those are taken out again.
          *
-         * Average case: Check 1-3 predicates instead of all N predicates.
+         * Complexity: O(N) comparisons → O(N/64) word ORs + O(K) removals,
+         * where K = number of predicates for this specific value (usually 0-1)
          */
         private void evaluateNotEqualTo(Object eventValue, EvaluationContext ctx,
                 IntSet eligiblePredicateIds) {
-            for (NotEqualPredicate pred : notEqualPredicates) {
-                // Apply eligibility filter (early termination opportunity)
-                if (eligiblePredicateIds != null && !eligiblePredicateIds.contains(pred.predicateId)) {
-                    continue;
-                }
-
-                // Evaluate NOT_EQUAL_TO
-                boolean matched = !Objects.equals(eventValue, pred.value);
-                // System.out.println("DEBUG: NOT_EQUAL_TO predId=" + pred.predicateId + "
-                // value=" + pred.value + " eventValue=" + eventValue + " matched=" + matched);
-                ctx.incrementPredicatesEvaluatedCount();
-
-                if (matched) {
-                    ctx.addTruePredicate(pred.predicateId);
+            if (notEqualPredicateIds.isEmpty()) {
+                return;
+            }
 
-                    // --- FIX START ---
-                    // Changed to atomic increment.
-                    notEqualToMatches.incrementAndGet();
-                    // --- FIX END ---
+            // Every eligible NOT_EQUAL_TO predicate is evaluated (logically)
+            int evaluated = ctx.addTruePredicates(notEqualPredicateIds, eligiblePredicateIds);
+            ctx.addPredicatesEvaluated(evaluated);
+
+            // O(1) hash lookup: predicates that fail for this value
+            int matched = evaluated;
+            IntList failingPredicateIds = notEqualValueMap.get(eventValue);
+            if (failingPredicateIds != null) {
+                for (int i = 0; i < failingPredicateIds.size(); i++) {
+                    if (ctx.removeTruePredicate(failingPredicateIds.getInt(i))) {
+                        matched--;
+                    }
                 }
             }
+
+            notEqualToMatches.addAndGet(matched);
         }
     }
 
@@ -437,16 +461,6 @@ public final class EqualityOperatorEvaluator {
         }
     }
 
-    /**
-     * Lightweight struct for NOT_EQUAL_TO predicates.
-     * Sorted by selectivity for optimal evaluation order.
-     */
-    private record NotEqualPredicate(
-            int predicateId,
-            Object value,
-            float selectivity) {
-    }
-
     /**
      * Get performance metrics for monitoring.
      */
@@ -459,7 +473,7 @@ public final class EqualityOperatorEvaluator {
                 equalToMatches.get(),
                 notEqualToMatches.get(),
                 fastPathHits.get(),
-                fieldEvaluators.size());
+                compiledFields);
         // --- FIX END ---
     }
 
@@ -0,0 +1,181 @@
+package com.helios.ruleengine.runtime.operators;
+
+import com.helios.ruleengine.runtime.context.EvaluationContext;
+import it.unimi.dsi.fastutil.doubles.DoubleArrayList;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntArrays;
+import it.unimi.dsi.fastutil.ints.IntSet;
+
+import java.util.Arrays;
+
+/**
+ * Centered interval tree over inclusive BETWEEN ranges, answering stabbing
+ * queries (all ranges containing a value) in O(log n + k).
+ *
+ * <p>Each node holds a center point and the ranges containing it, sorted
+ * twice: by lower bound ascending and by upper bound descending. Ranges
+ * entirely below the center go to the left subtree, entirely above to the
+ * right. A query walks one root-to-leaf path; at each node it emits the
+ * sorted prefix that contains the value and stops at the first range that
+ * does not.
+ *
+ * <p>Nodes are flattened into arrays, built once; immutable and shareable
+ * across threads.
+ */
+final class IntervalIndex {
+
+    private static final int NONE = -1;
+
+    // Per node
+    private final double[] centers;
+    private final int[] left;
+    private final int[] right;
+    private final int[] start; // range of the node's entries in the arrays below
+    private final int[] end;
+
+    // Per entry, grouped by node
+    private final double[] byLowerBounds;
+    private final int[] byLowerIds;
+    private final double[] byUpperBounds;
+    private final int[] byUpperIds;
+
+    private final int root;
+
+    /**
+     * @param ids    Predicate id per range
+     * @param lower  Inclusive lower bounds
+     * @param upper  Inclusive upper bounds
+     * @param count  Number of ranges in the arrays
+     */
+    IntervalIndex(int[] ids, double[] lower, double[] upper, int count) {
+        Builder builder = new Builder(ids, lower, upper);
+        IntArrayList all = new IntArrayList(count);
+        for (int i = 0; i < count; i++) {
+            if (lower[i] <= upper[i]) { // Empty (or NaN) ranges never match
+                all.add(i);
+            }
+        }
+        this.root = builder.build(all.toIntArray());
+
+        this.centers = builder.centers.toDoubleArray();
+        this.left = builder.left.toIntArray();
+        this.right = builder.right.toIntArray();
+        this.start = builder.start.toIntArray();
+        this.end = builder.end.toIntArray();
+        this.byLowerBounds = builder.byLowerBounds.toDoubleArray();
+        this.byLowerIds = builder.byLowerIds.toIntArray();
+        this.byUpperBounds = builder.byUpperBounds.toDoubleArray();
+        this.byUpperIds = builder.byUpperIds.toIntArray();
+    }
+
+    /**
+     * Adds every range containing {@code value} (restricted to
+     * {@code eligibleIds} when non-null) to the context.
+     */
+    void stab(double value, IntSet eligibleIds, EvaluationContext ctx) {
+        if (Double.isNaN(value)) {
+            return;
+        }
+        int node = root;
+        while (node != NONE) {
+            double center = centers[node];
+            if (value < center) {
+                for (int i = start[node]; i < end[node] && byLowerBounds[i] <= value; i++) {
+                    emit(byLowerIds[i], eligibleIds, ctx);
+                }
+                node = left[node];
+            } else if (value > center) {
+                for (int i = start[node]; i < end[node] && byUpperBounds[i] >= value; i++) {
+                    emit(byUpperIds[i], eligibleIds, ctx);
+                }
+                node = right[node];
+            } else {
+                for (int i = start[node]; i < end[node]; i++) {
+                    emit(byLowerIds[i], eligibleIds, ctx);
+                }
+                return;
+            }
+        }
+    }
+
+    private static void emit(int id, IntSet eligibleIds, EvaluationContext ctx) {
+        if (eligibleIds == null || eligibleIds.contains(id)) {
+            ctx.addTruePredicate(id);
+        }
+    }
+
+    private static final class Builder {
+        private final int[] ids;
+        private final double[] lower;
+        private final double[] upper;
+
+        final DoubleArrayList centers = new DoubleArrayList();
+        final IntArrayList left = new IntArrayList();
+        final IntArrayList right = new IntArrayList();
+        final IntArrayList start = new IntArrayList();
+        final IntArrayList end = new IntArrayList();
+        final DoubleArrayList byLowerBounds = new DoubleArrayList();
+        final IntArrayList byLowerIds = new IntArrayList();
+        final DoubleArrayList byUpperBounds = new DoubleArrayList();
+        final IntArrayList byUpperIds = new IntArrayList();
+
+        Builder(int[] ids, double[] lower, double[] upper) {
+            this.ids = ids;
+            this.lower = lower;
+            this.upper = upper;
+        }
+
+        /**
+         * Builds the subtree over the given ranges; returns its node, NONE if empty.
+         */
+        int build(int[] ranges) {
+            if (ranges.length == 0) {
+                return NONE;
+            }
+
+            // Median endpoint: an endpoint of some range, so the node is never empty
+            double[] endpoints = new double[ranges.length * 2];
+            for (int i = 0; i < ranges.length; i++) {
+                endpoints[2 * i] = lower[ranges[i]];
+                endpoints[2 * i + 1] = upper[ranges[i]];
+            }
+            Arrays.sort(endpoints);
+            double center = endpoints[ranges.length];
+
+            IntArrayList below = new IntArrayList();
+            IntArrayList above = new IntArrayList();
+            IntArrayList containing = new IntArrayList();
+            for (int r : ranges) {
+                if (upper[r] < center) {
+                    below.add(r);
+                } else if (lower[r] > center) {
+                    above.add(r);
+                } else {
+                    containing.add(r);
+                }
+            }
+
+            int node = centers.size();
+            centers.add(center);
+            left.add(NONE);
+            right.add(NONE);
+            start.add(byLowerIds.size());
+
+            int[] byLower = containing.toIntArray();
+            int[] byUpper = containing.toIntArray();
+            IntArrays.quickSort(byLower, (a, b) -> Double.compare(lower[a], lower[b]));
+            IntArrays.quickSort(byUpper, (a, b) -> Double.compare(upper[b], upper[a]));
+            for (int i = 0; i < byLower.length; i++) {
+                byLowerBounds.add(lower[byLower[i]]);
+                byLowerIds.add(ids[byLower[i]]);
+                byUpperBounds.add(upper[byUpper[i]]);
+                byUpperIds.add(ids[byUpper[i]]);
+            }
+            end.add(byLowerIds.size());
+
+            left.set(node, build(below.toIntArray()));
+            right.set(node, build(above.toIntArray()));
+            return node;
+        }
+    }
+}
@@ -0,0 +1,132 @@
+package com.helios.ruleengine.runtime.operators;
+
+import it.unimi.dsi.fastutil.chars.Char2IntMap;
+import it.unimi.dsi.fastutil.chars.Char2IntRBTreeMap;
+import it.unimi.dsi.fastutil.chars.Char2IntSortedMap;
+import it.unimi.dsi.fastutil.ints.IntArrayFIFOQueue;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntList;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Case-insensitive trie over literal patterns, for prefix (STARTS_WITH) and,
+ * built over reversed patterns, suffix (ENDS_WITH) matching.
+ *
+ * <p>Nodes are laid out breadth-first in compressed sparse rows: the edges of
+ * node n are {@code edgeChars/edgeTargets[edgeStart[n] .. edgeStart[n+1])},
+ * sorted by char and binary-searched. This stays compact for large, sparse
+ * alphabets (URLs, card BIN prefixes) where a dense table would not.
+ *
+ * <p>Walking the value from its start (or end, for a reversed trie) visits
+ * every pattern that is a prefix (suffix) of it. Immutable and shareable
+ * across threads.
+ */
+final class LiteralTrie {
+
+    static final int ROOT = 0;
+    static final int NO_NODE = -1;
+    private static final int[] NO_OUTPUTS = new int[0];
+
+    private final int[] edgeStart;
+    private final char[] edgeChars;
+    private final int[] edgeTargets;
+    private final int[][] outputs; // pattern indexes ending at the node
+
+    /**
+     * @param patterns Patterns in index order; reported hits are indexes into this list
+     * @param reversed Index the patterns back to front (suffix matching)
+     */
+    LiteralTrie(List<String> patterns, boolean reversed) {
+        // 1. Pointer trie
+        List<Char2IntSortedMap> children = new ArrayList<>();
+        List<IntList> ownOutputs = new ArrayList<>();
+        children.add(new Char2IntRBTreeMap());
+        ownOutputs.add(null);
+        for (int i = 0; i < patterns.size(); i++) {
+            String pattern = patterns.get(i);
+            int node = ROOT;
+            for (int j = 0; j < pattern.length(); j++) {
+                char c = fold(pattern.charAt(reversed ? pattern.length() - 1 - j : j));
+                Char2IntSortedMap edges = children.get(node);
+                if (!edges.containsKey(c)) {
+                    edges.put(c, children.size());
+                    children.add(new Char2IntRBTreeMap());
+                    ownOutputs.add(null);
+                }
+                node = edges.get(c);
+            }
+            if (ownOutputs.get(node) == null) {
+                ownOutputs.set(node, new IntArrayList());
+            }
+            ownOutputs.get(node).add(i);
+        }
+
+        // 2. Breadth-first renumbering into CSR arrays
+        int nodes = children.size();
+        int[] order = new int[nodes];   // new id -> old id
+        int[] renumber = new int[nodes]; // old id -> new id
+        IntArrayFIFOQueue queue = new IntArrayFIFOQueue();
+        queue.enqueue(ROOT);
+        int next = 0;
+        while (!queue.isEmpty()) {
+            int old = queue.dequeueInt();
+            order[next] = old;
+            renumber[old] = next++;
+            for (int child : children.get(old).values()) {
+                queue.enqueue(child);
+            }
+        }
+
+        this.edgeStart = new int[nodes + 1];
+        this.edgeChars = new char[nodes - 1];
+        this.edgeTargets = new int[nodes - 1];
+        this.outputs = new int[nodes][];
+        int edge = 0;
+        for (int node = 0; node < nodes; node++) {
+            int old = order[node];
+            edgeStart[node] = edge;
+            for (Char2IntMap.Entry e : children.get(old).char2IntEntrySet()) {
+                edgeChars[edge] = e.getCharKey();
+                edgeTargets[edge++] = renumber[e.getIntValue()];
+            }
+            IntList own = ownOutputs.get(old);
+            outputs[node] = own != null ? own.toIntArray() : NO_OUTPUTS;
+        }
+        edgeStart[nodes] = edge;
+    }
+
+    /**
+     * Child of the node on one char of the walked value, {@link #NO_NODE} if none.
+     */
+    int next(int node, char c) {
+        char key = fold(c);
+        int low = edgeStart[node];
+        int high = edgeStart[node + 1] - 1;
+        while (low <= high) {
+            int mid = (low + high) >>> 1;
+            char midChar = edgeChars[mid];
+            if (midChar < key) {
+                low = mid + 1;
+            } else if (midChar > key) {
+                high = mid - 1;
+            } else {
+                return edgeTargets[mid];
+            }
+        }
+        return NO_NODE;
+    }
+
+    /**
+     * Patterns ending at the node (empty if none).
+     */
+    int[] outputs(int node) {
+        return outputs[node];
+    }
+
+    // Same equivalence as String.regionMatches(true, ...)
+    private static char fold(char c) {
+        return Character.toLowerCase(Character.toUpperCase(c));
+    }
+}
@@ -3,31 +3,42 @@ package com.helios.ruleengine.runtime.operators;
 import com.helios.ruleengine.runtime.context.EvaluationContext;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.api.model.Predicate;
-import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
 import it.unimi.dsi.fastutil.ints.IntSet;
+import jdk.incubator.vector.DoubleVector;
 import jdk.incubator.vector.FloatVector;
+import jdk.incubator.vector.LongVector;
 import jdk.incubator.vector.VectorMask;
 import jdk.incubator.vector.VectorOperators;
 import jdk.incubator.vector.VectorSpecies;
 
 import java.util.*;
-import java.util.concurrent.ConcurrentHashMap;
 
 /**
  * L5-LEVEL NUMERIC OPERATOR EVALUATOR
  *
- * Handles: BETWEEN, GREATER_THAN, LESS_THAN with SIMD vectorization
+ * Handles: BETWEEN, GREATER_THAN(_OR_EQUAL), LESS_THAN(_OR_EQUAL) with SIMD vectorization
  *
  * OPTIMIZATION STRATEGY:
- * - Batch predicates by operator type
+ * - Batch predicates by operator type and lane type: groups whose bounds are all
+ *   whole numbers in the long range are LONG, the rest DOUBLE
+ * - Exact comparisons: LONG groups compare in 64-bit integers (LongVector), DOUBLE
+ *   groups in double precision (DoubleVector); epoch-millisecond timestamps and
+ *   64-bit ids are never rounded
+ * - Float fast path: when every bound of a group and the event value are exactly
+ *   representable as float (small ints, amounts like 99.5), the group is compared
+ *   in FloatVector lanes, twice as wide, with the same result
  * - Use Vector API for 8-16 parallel comparisons
  * - Structure-of-Arrays layout for cache efficiency
+ * - Large GT/GTE/LT/LTE groups: thresholds sorted at build time, one binary search
+ *   finds the cut point and the matching prefix/suffix is emitted directly
+ * - Large BETWEEN groups: centered interval tree, O(log n + k) stabbing query
  * - Eligibility filtering to skip irrelevant predicates
+ * - Zero allocation per evaluation: matches stream into the EvaluationContext
  *
  * PERFORMANCE CHARACTERISTICS:
  * - Vectorized: 2-8× speedup vs scalar
  * - Latency: ~2µs P99 for 100 predicates
- * - Memory: ~16 bytes per predicate
+ * - Memory: ~40 bytes per predicate
  * - Cache: 90%+ L1 hit rate
  *
  * @author Google L5 Engineering Standards
@@ -35,17 +46,36 @@ import java.util.concurrent.ConcurrentHashMap;
 public final class NumericOperatorEvaluator {
 
     private final EngineModel model;
-    private final Map<Integer, FieldEvaluator> fieldEvaluators;
+    // Dense dispatch table indexed by field id (null = no numeric predicates)
+    private final FieldEvaluator[] fieldEvaluators;
+    // Per-thread event value, prepared once per evaluation for every lane type
+    private final ThreadLocal<NumericValue> values = ThreadLocal.withInitial(NumericValue::new);
 
     private static final VectorSpecies<Float> FLOAT_SPECIES = FloatVector.SPECIES_PREFERRED;
+    private static final VectorSpecies<Double> DOUBLE_SPECIES = DoubleVector.SPECIES_PREFERRED;
+    private static final VectorSpecies<Long> LONG_SPECIES = LongVector.SPECIES_PREFERRED;
+
+    // Threshold (GT/GTE/LT/LTE) groups at least this large use sorted thresholds instead of SIMD scans
+    static final int SORTED_SEARCH_MIN_GROUP = 64;
+    // BETWEEN groups at least this large use an interval tree instead of SIMD scans
+    static final int INTERVAL_INDEX_MIN_GROUP = 64;
+
+    // Integral BETWEEN bounds below this magnitude are exact in the (double) interval tree
+    private static final double EXACT_DOUBLE_INTEGER_LIMIT = 0x1p53;
+    private static final double LONG_RANGE_LIMIT = 0x1p63;
 
     // Performance tracking
     private long vectorizedOps = 0;
     private long scalarOps = 0;
+    private long sortedSearches = 0;
+    private long intervalQueries = 0;
+    private long floatLaneOps = 0;
+    private long longLaneOps = 0;
+    private long doubleLaneOps = 0;
 
     public NumericOperatorEvaluator(EngineModel model) {
         this.model = model;
-        this.fieldEvaluators = new ConcurrentHashMap<>();
+        this.fieldEvaluators = new FieldEvaluator[PredicateEvaluator.fieldTableSize(model)];
         initializeEvaluators();
     }
 
@@ -57,427 +87,702 @@ public final class NumericOperatorEvaluator {
                     .toList();
 
             if (!numericPredicates.isEmpty()) {
-                fieldEvaluators.put(fieldId, new FieldEvaluator(numericPredicates));
+                fieldEvaluators[fieldId] = new FieldEvaluator(numericPredicates);
             }
         });
     }
 
     /**
      * Evaluate numeric predicates for a field.
+     *
+     * <p>Integral values (Long, Integer, Short, Byte) are compared exactly against
+     * integral bounds; other numbers by their double value.
      */
-    public void evaluateNumeric(int fieldId, double value,
+    public void evaluateNumeric(int fieldId, Number value,
             EvaluationContext ctx, IntSet eligiblePredicateIds) {
-        FieldEvaluator evaluator = fieldEvaluators.get(fieldId);
+        FieldEvaluator evaluator = fieldId >= 0 && fieldId < fieldEvaluators.length
+                ? fieldEvaluators[fieldId] : null;
         if (evaluator == null)
             return;
 
-        // Count all predicates that will be evaluated (not just matches)
-        int predicatesEvaluatedCount = evaluator.countEligiblePredicates(eligiblePredicateIds);
+        NumericValue probe = values.get();
+        probe.set(value);
+
+        // Matches go straight into the context; count all evaluated predicates (not just matches)
+        int predicatesEvaluatedCount = evaluator.evaluate(probe, eligiblePredicateIds, ctx);
         ctx.addPredicatesEvaluated(predicatesEvaluatedCount);
+    }
 
-        IntSet matches = evaluator.evaluate((float) value, eligiblePredicateIds);
-        matches.forEach((int predId) -> {
-            ctx.addTruePredicate(predId);
-        });
+    /**
+     * Whether this evaluator has compiled predicates for the field.
+     */
+    boolean hasField(int fieldId) {
+        return fieldId >= 0 && fieldId < fieldEvaluators.length && fieldEvaluators[fieldId] != null;
     }
 
     /**
      * Field-level evaluator with batched predicates.
+     *
+     * <p>Allocation-free: matches are written straight into the {@link EvaluationContext}
+     * and eligibility filtering densifies into per-thread lanes sized at construction.
      */
     private class FieldEvaluator {
         private final PredicateGroup[] groups;
-        private final float[] thresholdCache;
-
-        // ✅ FIX: Add ThreadLocal buffer to pool dense predicate lists
-        // This avoids allocating a new list for every evaluation.
-        private final ThreadLocal<List<NumericPredicate>> densePredicateBuffer = ThreadLocal
-                .withInitial(ArrayList::new);
+        private final int predicateCount;
 
-        // ✅ OPTIMIZATION: Pool for dense array to eliminate toArray() allocation
-        private final ThreadLocal<NumericPredicate[]> denseArrayPool;
+        // Per-thread densification buffer, sized for the largest group
+        private final ThreadLocal<Lanes> denseLanes;
 
         FieldEvaluator(List<NumericPredicate> predicates) {
             this.groups = organizeIntoGroups(predicates);
-            int maxSize = Arrays.stream(groups).mapToInt(g -> g.predicates.length).max().orElse(0);
-            this.thresholdCache = new float[Math.max(maxSize, FLOAT_SPECIES.length())];
-
-            // Initialize pool with max possible size
-            final int poolSize = maxSize;
-            this.denseArrayPool = ThreadLocal.withInitial(() -> new NumericPredicate[poolSize]);
+            this.predicateCount = predicates.size();
+            final int maxSize = Arrays.stream(groups)
+                    .filter(g -> !g.indexed())
+                    .mapToInt(g -> g.lanes.count)
+                    .max()
+                    .orElse(0);
+            this.denseLanes = ThreadLocal.withInitial(() -> new Lanes(maxSize));
         }
 
         /**
-         * ✅ FIX: This method is updated to "densify" predicates *before*
-         * calling the vector logic.
+         * Evaluate all eligible predicates, adding matches to the context.
+         *
+         * @return number of predicates evaluated (for statistics)
          */
-        IntSet evaluate(float value, IntSet eligiblePredicateIds) {
-            IntSet matches = new IntOpenHashSet();
-
-            // Get the reusable, thread-local buffers
-            List<NumericPredicate> denseBuffer = densePredicateBuffer.get();
-            NumericPredicate[] pooledArray = denseArrayPool.get();
-
-            for (PredicateGroup group : groups) {
-                // Reset the buffer for this group
-                denseBuffer.clear();
-
-                // --- DENSIFICATION STEP ---
-                // Pre-filter predicates into a dense list.
-                // This ensures the vector unit only processes relevant data.
-                if (eligiblePredicateIds != null) {
-                    for (NumericPredicate pred : group.predicates) {
-                        if (eligiblePredicateIds.contains(pred.id)) {
-                            denseBuffer.add(pred);
-                        }
+        int evaluate(NumericValue value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            if (eligiblePredicateIds == null) {
+                // No filter (e.g., base cache disabled): evaluate compiled lanes in place
+                for (PredicateGroup group : groups) {
+                    if (group.sorted != null) {
+                        evaluateSorted(group, value, null, ctx);
+                    } else if (group.intervals != null) {
+                        intervalQueries++;
+                        group.intervals.stab(value.exact, null, ctx);
+                    } else {
+                        evaluateLanes(group, group.lanes, value, ctx);
                     }
-                } else {
-                    // No filter, add all (e.g., base cache disabled)
-                    Collections.addAll(denseBuffer, group.predicates);
                 }
+                return predicateCount;
+            }
 
-                if (denseBuffer.isEmpty()) {
-                    continue; // Skip this group, no eligible predicates
-                }
-                // --- END DENSIFICATION ---
-
-                // ✅ OPTIMIZATION: Copy into pooled array instead of allocating
-                // BEFORE: NumericPredicate[] denseArray = denseBuffer.toArray(new
-                // NumericPredicate[0]);
-                int denseSize = denseBuffer.size();
-                for (int i = 0; i < denseSize; i++) {
-                    pooledArray[i] = denseBuffer.get(i);
+            Lanes dense = denseLanes.get();
+            int evaluated = 0;
+            for (PredicateGroup group : groups) {
+                if (group.sorted != null) {
+                    // One search decides the whole group; eligibility only filters the emitted range
+                    evaluateSorted(group, value, eligiblePredicateIds, ctx);
+                    evaluated += group.lanes.count;
+                    continue;
                 }
-
-                // CRITICAL: Null out remaining slots to prevent stale data in subsequent
-                // evaluations
-                // This is necessary because the pool is reused across evaluations with
-                // different counts
-                for (int i = denseSize; i < pooledArray.length; i++) {
-                    pooledArray[i] = null;
+                if (group.intervals != null) {
+                    intervalQueries++;
+                    group.intervals.stab(value.exact, eligiblePredicateIds, ctx);
+                    evaluated += group.lanes.count;
+                    continue;
                 }
-
-                // Create a temporary, dense group using the pooled array slice
-                // Note: We pass the full array but only use denseSize elements
-                PredicateGroup eligibleGroup = new PredicateGroup(group.operator, pooledArray, denseSize);
-
-                // ✅ CHANGED: Call evaluate methods with the *dense* group
-                // and pass 'null' for eligibility. The underlying methods
-                // are already optimized to skip checks when eligibility is null.
-                switch (eligibleGroup.operator) {
-                    case GREATER_THAN -> evaluateGT(value, eligibleGroup, matches, null);
-                    case LESS_THAN -> evaluateLT(value, eligibleGroup, matches, null);
-                    case BETWEEN -> evaluateBetween(value, eligibleGroup, matches, null);
+                // Densify so the vector unit only processes relevant predicates
+                dense.gather(group.lanes, eligiblePredicateIds);
+                if (dense.count == 0) {
+                    continue; // Skip this group, no eligible predicates
                 }
+                evaluateLanes(group, dense, value, ctx);
+                evaluated += dense.count;
             }
+            return evaluated;
+        }
 
-            return matches;
+        /**
+         * Compare the value against the group's lanes in the narrowest exact lane type.
+         */
+        private void evaluateLanes(PredicateGroup group, Lanes lanes, NumericValue value, EvaluationContext ctx) {
+            if (group.floatExact && value.floatExact) {
+                floatLaneOps++;
+                evaluateFloatLanes(group.operator, value, lanes, ctx);
+            } else if (group.integral) {
+                longLaneOps++;
+                evaluateLongLanes(group.operator, value, lanes, ctx);
+            } else {
+                doubleLaneOps++;
+                evaluateDoubleLanes(group.operator, value, lanes, ctx);
+            }
         }
 
         /**
-         * Vectorized GREATER_THAN evaluation.
-         * (No changes needed, already handles null eligiblePredicateIds)
+         * Vectorized comparison over float lanes, scalar remainder. Only used when
+         * the bounds and the value are all exactly representable as float.
          */
-        private void evaluateGT(float value, PredicateGroup group,
-                IntSet matches, IntSet eligiblePredicateIds) {
-            int count = group.count; // Use actual count for pooled arrays
+        private void evaluateFloatLanes(Operator operator, NumericValue value, Lanes lanes, EvaluationContext ctx) {
+            int count = lanes.count;
+            int i = 0;
 
             if (count >= FLOAT_SPECIES.length()) {
-                // Vectorized path
                 vectorizedOps++;
-                long[] eligibilityMask = buildEligibilityMask(group, count, eligiblePredicateIds);
-                FloatVector eventVec = FloatVector.broadcast(FLOAT_SPECIES, value);
-
-                int vectorCount = count / FLOAT_SPECIES.length();
-                for (int i = 0; i < vectorCount; i++) {
-                    int offset = i * FLOAT_SPECIES.length();
-                    loadThresholds(group, offset, FLOAT_SPECIES.length());
-
-                    FloatVector thresholdVec = FloatVector.fromArray(FLOAT_SPECIES, thresholdCache, 0);
-                    VectorMask<Float> mask = eventVec.compare(VectorOperators.GT, thresholdVec);
-
-                    processMaskedResults(offset, mask, eligibilityMask, group.predicates, count, matches);
+                FloatVector eventVec = FloatVector.broadcast(FLOAT_SPECIES, value.narrow);
+                int loopBound = FLOAT_SPECIES.loopBound(count);
+                if (operator == Operator.BETWEEN) {
+                    for (; i < loopBound; i += FLOAT_SPECIES.length()) {
+                        FloatVector lowerVec = FloatVector.fromArray(FLOAT_SPECIES, lanes.lower, i);
+                        FloatVector upperVec = FloatVector.fromArray(FLOAT_SPECIES, lanes.upper, i);
+                        // Inclusive: value >= lower AND value <= upper
+                        VectorMask<Float> mask = eventVec.compare(VectorOperators.GE, lowerVec)
+                                .and(eventVec.compare(VectorOperators.LE, upperVec));
+                        addMatches(mask, i, lanes.ids, ctx);
+                    }
+                } else {
+                    VectorOperators.Comparison comparison = comparison(operator);
+                    for (; i < loopBound; i += FLOAT_SPECIES.length()) {
+                        FloatVector thresholdVec = FloatVector.fromArray(FLOAT_SPECIES, lanes.lower, i);
+                        addMatches(eventVec.compare(comparison, thresholdVec), i, lanes.ids, ctx);
+                    }
                 }
+            }
 
-                // Scalar remainder
-                int remainder = count % FLOAT_SPECIES.length();
-                if (remainder > 0) {
-                    scalarOps += remainder;
-                    processScalarRemainder(vectorCount * FLOAT_SPECIES.length(), count,
-                            value, group, eligibilityMask, matches, true);
+            // Scalar remainder (or scalar fallback for small groups); float bounds are exact here
+            scalarOps += count - i;
+            for (; i < count; i++) {
+                if (matches(operator, value.exact, lanes.exactLower[i], lanes.exactUpper[i])) {
+                    ctx.addTruePredicate(lanes.ids[i]);
                 }
-            } else {
-                // Scalar fallback for small batches
-                scalarOps += count;
-                evaluateScalarGT(value, group, matches, eligiblePredicateIds);
             }
         }
 
         /**
-         * Vectorized LESS_THAN evaluation.
-         * (No changes needed, already handles null eligiblePredicateIds)
+         * Vectorized comparison over double lanes, scalar remainder.
          */
-        private void evaluateLT(float value, PredicateGroup group,
-                IntSet matches, IntSet eligiblePredicateIds) {
-            int count = group.count; // Use actual count for pooled arrays
+        private void evaluateDoubleLanes(Operator operator, NumericValue value, Lanes lanes, EvaluationContext ctx) {
+            int count = lanes.count;
+            int i = 0;
 
-            if (count >= FLOAT_SPECIES.length()) {
+            if (count >= DOUBLE_SPECIES.length()) {
                 vectorizedOps++;
-                long[] eligibilityMask = buildEligibilityMask(group, count, eligiblePredicateIds);
-                FloatVector eventVec = FloatVector.broadcast(FLOAT_SPECIES, value);
-
-                int vectorCount = count / FLOAT_SPECIES.length();
-                for (int i = 0; i < vectorCount; i++) {
-                    int offset = i * FLOAT_SPECIES.length();
-                    loadThresholds(group, offset, FLOAT_SPECIES.length());
-
-                    FloatVector thresholdVec = FloatVector.fromArray(FLOAT_SPECIES, thresholdCache, 0);
-                    VectorMask<Float> mask = eventVec.compare(VectorOperators.LT, thresholdVec);
-
-                    processMaskedResults(offset, mask, eligibilityMask, group.predicates, count, matches);
+                DoubleVector eventVec = DoubleVector.broadcast(DOUBLE_SPECIES, value.exact);
+                int loopBound = DOUBLE_SPECIES.loopBound(count);
+                if (operator == Operator.BETWEEN) {
+                    for (; i < loopBound; i += DOUBLE_SPECIES.length()) {
+                        DoubleVector lowerVec = DoubleVector.fromArray(DOUBLE_SPECIES, lanes.exactLower, i);
+                        DoubleVector upperVec = DoubleVector.fromArray(DOUBLE_SPECIES, lanes.exactUpper, i);
+                        VectorMask<Double> mask = eventVec.compare(VectorOperators.GE, lowerVec)
+                                .and(eventVec.compare(VectorOperators.LE, upperVec));
+                        addMatches(mask, i, lanes.ids, ctx);
+                    }
+                } else {
+                    VectorOperators.Comparison comparison = comparison(operator);
+                    for (; i < loopBound; i += DOUBLE_SPECIES.length()) {
+                        DoubleVector thresholdVec = DoubleVector.fromArray(DOUBLE_SPECIES, lanes.exactLower, i);
+                        addMatches(eventVec.compare(comparison, thresholdVec), i, lanes.ids, ctx);
+                    }
                 }
+            }
 
-                int remainder = count % FLOAT_SPECIES.length();
-                if (remainder > 0) {
-                    scalarOps += remainder;
-                    processScalarRemainder(vectorCount * FLOAT_SPECIES.length(), count,
-                            value, group, eligibilityMask, matches, false);
+            scalarOps += count - i;
+            for (; i < count; i++) {
+                if (matches(operator, value.exact, lanes.exactLower[i], lanes.exactUpper[i])) {
+                    ctx.addTruePredicate(lanes.ids[i]);
                 }
-            } else {
-                scalarOps += count;
-                evaluateScalarLT(value, group, matches, eligiblePredicateIds);
             }
         }
 
         /**
-         * Vectorized BETWEEN evaluation (inclusive range).
-         * (No changes needed, already handles null eligiblePredicateIds)
+         * Vectorized comparison over long lanes, scalar remainder.
+         *
+         * Against whole-number bounds a fractional value compares like its floor
+         * or ceiling (see {@link NumericValue#probe}), so every comparison is exact.
          */
-        private void evaluateBetween(float value, PredicateGroup group,
-                IntSet matches, IntSet eligiblePredicateIds) {
-            int count = group.count; // Use actual count for pooled arrays
+        private void evaluateLongLanes(Operator operator, NumericValue value, Lanes lanes, EvaluationContext ctx) {
+            int count = lanes.count;
+            if (value.nan) {
+                return; // No comparison with NaN holds
+            }
+            if (value.overflow != 0) {
+                // Beyond the long range: above (or below) every bound
+                scalarOps += count;
+                if (overflowMatches(operator, value.overflow)) {
+                    for (int i = 0; i < count; i++) {
+                        ctx.addTruePredicate(lanes.ids[i]);
+                    }
+                }
+                return;
+            }
 
-            if (count >= FLOAT_SPECIES.length()) {
+            int i = 0;
+            if (count >= LONG_SPECIES.length()) {
                 vectorizedOps++;
-                long[] eligibilityMask = buildEligibilityMask(group, count, eligiblePredicateIds);
-                FloatVector eventVec = FloatVector.broadcast(FLOAT_SPECIES, value);
-
-                float[] lowerBounds = new float[FLOAT_SPECIES.length()];
-                float[] upperBounds = new float[FLOAT_SPECIES.length()];
-
-                int vectorCount = count / FLOAT_SPECIES.length();
-                for (int i = 0; i < vectorCount; i++) {
-                    int offset = i * FLOAT_SPECIES.length();
-
-                    // Load range bounds
-                    for (int j = 0; j < FLOAT_SPECIES.length(); j++) {
-                        lowerBounds[j] = (float) group.predicates[offset + j].lowerBound;
-                        upperBounds[j] = (float) group.predicates[offset + j].upperBound;
+                int loopBound = LONG_SPECIES.loopBound(count);
+                if (operator == Operator.BETWEEN) {
+                    LongVector floorVec = LongVector.broadcast(LONG_SPECIES, value.floor);
+                    LongVector ceilVec = LongVector.broadcast(LONG_SPECIES, value.ceil);
+                    for (; i < loopBound; i += LONG_SPECIES.length()) {
+                        LongVector lowerVec = LongVector.fromArray(LONG_SPECIES, lanes.longLower, i);
+                        LongVector upperVec = LongVector.fromArray(LONG_SPECIES, lanes.longUpper, i);
+                        VectorMask<Long> mask = floorVec.compare(VectorOperators.GE, lowerVec)
+                                .and(ceilVec.compare(VectorOperators.LE, upperVec));
+                        addMatches(mask, i, lanes.ids, ctx);
                     }
+                } else {
+                    VectorOperators.Comparison comparison = comparison(operator);
+                    LongVector eventVec = LongVector.broadcast(LONG_SPECIES, value.probe(operator));
+                    for (; i < loopBound; i += LONG_SPECIES.length()) {
+                        LongVector thresholdVec = LongVector.fromArray(LONG_SPECIES, lanes.longLower, i);
+                        addMatches(eventVec.compare(comparison, thresholdVec), i, lanes.ids, ctx);
+                    }
+                }
+            }
 
-                    FloatVector lowerVec = FloatVector.fromArray(FLOAT_SPECIES, lowerBounds, 0);
-                    FloatVector upperVec = FloatVector.fromArray(FLOAT_SPECIES, upperBounds, 0);
-
-                    // Inclusive: value >= lower AND value <= upper
-                    VectorMask<Float> lowerMask = eventVec.compare(VectorOperators.GE, lowerVec);
-                    VectorMask<Float> upperMask = eventVec.compare(VectorOperators.LE, upperVec);
-                    VectorMask<Float> combinedMask = lowerMask.and(upperMask);
-
-                    processMaskedResults(offset, combinedMask, eligibilityMask, group.predicates, count, matches);
+            scalarOps += count - i;
+            for (; i < count; i++) {
+                if (matches(operator, value.floor, value.ceil, lanes.longLower[i], lanes.longUpper[i])) {
+                    ctx.addTruePredicate(lanes.ids[i]);
                 }
+            }
+        }
 
-                // Scalar remainder
-                int remainder = count % FLOAT_SPECIES.length();
-                if (remainder > 0) {
-                    scalarOps += remainder;
-                    int start = vectorCount * FLOAT_SPECIES.length();
-                    for (int i = start; i < count; i++) {
-                        boolean eligible = eligibilityMask == null ||
-                                ((eligibilityMask[i / 64] & (1L << (i % 64))) != 0);
-                        if (eligible && value >= group.predicates[i].lowerBound &&
-                                value <= group.predicates[i].upperBound) {
-                            matches.add(group.predicates[i].id);
-                        }
-                    }
+        /**
+         * Binary search for the cut point: GT/GTE match the thresholds below
+         * (or at) the value, a prefix; LT/LTE those above (or at) it, a suffix.
+         */
+        private void evaluateSorted(PredicateGroup group, NumericValue value,
+                                    IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            sortedSearches++;
+            if (value.nan) {
+                return; // No comparison with NaN holds
+            }
+            SortedThresholds sorted = group.sorted;
+            Operator operator = group.operator;
+            int from = 0;
+            int to = sorted.ids.length;
+            if (group.integral && value.overflow != 0) {
+                if (!overflowMatches(operator, value.overflow)) {
+                    return;
+                }
+            } else if (group.integral) {
+                switch (operator) {
+                    case GREATER_THAN -> to = sorted.firstAtLeast(value.ceil);
+                    case GREATER_THAN_OR_EQUAL -> to = sorted.firstAbove(value.floor);
+                    case LESS_THAN -> from = sorted.firstAbove(value.floor);
+                    case LESS_THAN_OR_EQUAL -> from = sorted.firstAtLeast(value.ceil);
+                    default -> throw new IllegalStateException("Not a threshold operator: " + operator);
                 }
             } else {
-                scalarOps += count;
-                evaluateScalarBetween(value, group, matches, eligiblePredicateIds);
+                switch (operator) {
+                    case GREATER_THAN -> to = sorted.firstAtLeast(value.exact);
+                    case GREATER_THAN_OR_EQUAL -> to = sorted.firstAbove(value.exact);
+                    case LESS_THAN -> from = sorted.firstAbove(value.exact);
+                    case LESS_THAN_OR_EQUAL -> from = sorted.firstAtLeast(value.exact);
+                    default -> throw new IllegalStateException("Not a threshold operator: " + operator);
+                }
+            }
+            int[] ids = sorted.ids;
+            if (eligiblePredicateIds == null) {
+                for (int i = from; i < to; i++) {
+                    ctx.addTruePredicate(ids[i]);
+                }
+            } else {
+                for (int i = from; i < to; i++) {
+                    if (eligiblePredicateIds.contains(ids[i])) {
+                        ctx.addTruePredicate(ids[i]);
+                    }
+                }
             }
         }
 
-        // Helper methods
-        private void loadThresholds(PredicateGroup group, int offset, int length) {
-            // CRITICAL: Use group.count for pooled arrays, not group.predicates.length
-            for (int i = 0; i < length && (offset + i) < group.count; i++) {
-                thresholdCache[i] = (float) group.predicates[offset + i].threshold;
+        private void addMatches(VectorMask<?> mask, int offset, int[] ids, EvaluationContext ctx) {
+            long bits = mask.toLong();
+            while (bits != 0) {
+                ctx.addTruePredicate(ids[offset + Long.numberOfTrailingZeros(bits)]);
+                bits &= bits - 1;
             }
         }
 
-        private long[] buildEligibilityMask(PredicateGroup group, int count, IntSet eligibleIds) {
-            if (eligibleIds == null)
-                return null;
-            long[] mask = new long[(count + 63) / 64];
-            for (int i = 0; i < count; i++) {
-                if (eligibleIds.contains(group.predicates[i].id)) {
-                    mask[i / 64] |= (1L << (i % 64));
-                }
+        private PredicateGroup[] organizeIntoGroups(List<NumericPredicate> predicates) {
+            Map<Operator, List<NumericPredicate>> integral = new EnumMap<>(Operator.class);
+            Map<Operator, List<NumericPredicate>> fractional = new EnumMap<>(Operator.class);
+            predicates.forEach(p -> (p.integral ? integral : fractional)
+                    .computeIfAbsent(p.operator, k -> new ArrayList<>()).add(p));
+
+            List<PredicateGroup> groups = new ArrayList<>();
+            integral.forEach((operator, group) -> groups.add(createGroup(operator, true, group)));
+            fractional.forEach((operator, group) -> groups.add(createGroup(operator, false, group)));
+            return groups.toArray(PredicateGroup[]::new);
+        }
+
+        private PredicateGroup createGroup(Operator operator, boolean integral, List<NumericPredicate> predicates) {
+            Lanes lanes = Lanes.of(predicates);
+            boolean floatExact = lanes.isFloatExact(integral);
+            if (operator == Operator.BETWEEN) {
+                IntervalIndex intervals = lanes.count >= INTERVAL_INDEX_MIN_GROUP
+                        && (!integral || lanes.isDoubleExact())
+                        ? new IntervalIndex(lanes.ids, lanes.exactLower, lanes.exactUpper, lanes.count)
+                        : null;
+                return new PredicateGroup(operator, integral, floatExact, lanes, null, intervals);
             }
-            return mask;
+            SortedThresholds sorted = lanes.count >= SORTED_SEARCH_MIN_GROUP
+                    ? SortedThresholds.of(lanes, integral)
+                    : null;
+            return new PredicateGroup(operator, integral, floatExact, lanes, sorted, null);
         }
+    }
 
-        private void processMaskedResults(int offset, VectorMask<Float> compareMask,
-                long[] eligibilityMask, NumericPredicate[] predicates, int count,
-                IntSet matches) {
-            // CRITICAL: Use count for pooled arrays, not predicates.length
-            for (int j = 0; j < FLOAT_SPECIES.length() && (offset + j) < count; j++) {
-                // This logic is correct: if eligibilityMask is null, eligible is true.
-                // This is the "fast path" we want when passing a dense list.
-                boolean eligible = eligibilityMask == null ||
-                        ((eligibilityMask[(offset + j) / 64] & (1L << ((offset + j) % 64))) != 0);
-                if (eligible && compareMask.laneIsSet(j)) {
-                    matches.add(predicates[offset + j].id);
+    // Data structures
+
+    /**
+     * Predicates of one operator and lane type on a field. {@code integral} groups
+     * compare in longs, the others in doubles; {@code floatExact} groups may use
+     * float lanes. Large groups are evaluated through an index instead of lanes:
+     * {@code sorted} for threshold operators, {@code intervals} for BETWEEN (null
+     * when the group uses lanes).
+     */
+    private record PredicateGroup(Operator operator, boolean integral, boolean floatExact, Lanes lanes,
+                                  SortedThresholds sorted, IntervalIndex intervals) {
+        boolean indexed() {
+            return sorted != null || intervals != null;
+        }
+    }
+
+    /**
+     * An event value in every form the lanes compare against, prepared once per evaluation.
+     */
+    private static final class NumericValue {
+        double exact;       // As double (rounded only for longs beyond 2^53)
+        float narrow;       // As float, valid when floatExact
+        boolean floatExact;
+        boolean nan;
+        long floor;         // Largest long <= value
+        long ceil;          // Smallest long >= value
+        int overflow;       // 1 above, -1 below the long range, 0 within
+
+        void set(Number value) {
+            if (isIntegralType(value)) {
+                long v = value.longValue();
+                exact = v;
+                floor = v;
+                ceil = v;
+                nan = false;
+                overflow = 0;
+                floatExact = isFloatExact(v);
+            } else {
+                double d = value.doubleValue();
+                exact = d;
+                nan = Double.isNaN(d);
+                overflow = d >= LONG_RANGE_LIMIT ? 1 : d < -LONG_RANGE_LIMIT ? -1 : 0;
+                floor = (long) Math.floor(d);
+                ceil = (long) Math.ceil(d);
+                floatExact = (float) d == d;
+            }
+            narrow = (float) exact;
+        }
+
+        /**
+         * The long a threshold operator compares in place of the value: against a
+         * whole-number threshold t, {@code v > t} iff {@code ceil(v) > t},
+         * {@code v >= t} iff {@code floor(v) >= t}, and symmetrically for LT/LTE.
+         */
+        long probe(Operator operator) {
+            return operator == Operator.GREATER_THAN || operator == Operator.LESS_THAN_OR_EQUAL ? ceil : floor;
+        }
+    }
+
+    /**
+     * Threshold operator (GT/GTE/LT/LTE) bounds, exact, in ascending order, with their predicate ids.
+     * Integral groups also keep the thresholds as longs, searched with the value's floor or ceiling.
+     */
+    private static final class SortedThresholds {
+        final double[] thresholds;
+        final long[] longThresholds; // null unless the group is integral
+        final int[] ids;
+
+        private SortedThresholds(double[] thresholds, long[] longThresholds, int[] ids) {
+            this.thresholds = thresholds;
+            this.longThresholds = longThresholds;
+            this.ids = ids;
+        }
+
+        static SortedThresholds of(Lanes lanes, boolean integral) {
+            Integer[] order = new Integer[lanes.count];
+            for (int i = 0; i < order.length; i++) {
+                order[i] = i;
+            }
+            Comparator<Integer> byThreshold = integral
+                    ? Comparator.comparingLong(i -> lanes.longLower[i])
+                    : Comparator.comparingDouble(i -> lanes.exactLower[i]);
+            Arrays.sort(order, byThreshold);
+            double[] thresholds = new double[order.length];
+            long[] longThresholds = integral ? new long[order.length] : null;
+            int[] ids = new int[order.length];
+            for (int i = 0; i < order.length; i++) {
+                thresholds[i] = lanes.exactLower[order[i]];
+                if (integral) {
+                    longThresholds[i] = lanes.longLower[order[i]];
                 }
+                ids[i] = lanes.ids[order[i]];
             }
+            return new SortedThresholds(thresholds, longThresholds, ids);
         }
 
-        private void processScalarRemainder(int start, int end, float value, PredicateGroup group,
-                long[] eligibilityMask, IntSet matches, boolean isGT) {
-            for (int i = start; i < end; i++) {
-                // This logic is also correct and handles the null mask "fast path"
-                boolean eligible = eligibilityMask == null ||
-                        ((eligibilityMask[i / 64] & (1L << (i % 64))) != 0);
-                if (eligible) {
-                    boolean passes = isGT ? value > group.predicates[i].threshold
-                            : value < group.predicates[i].threshold;
-                    if (passes)
-                        matches.add(group.predicates[i].id);
+        // Index of the first threshold >= value (length if none)
+        int firstAtLeast(double value) {
+            int low = 0;
+            int high = thresholds.length;
+            while (low < high) {
+                int mid = (low + high) >>> 1;
+                if (thresholds[mid] < value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
                 }
             }
+            return low;
         }
 
-        private void evaluateScalarGT(float value, PredicateGroup group, IntSet matches, IntSet eligibleIds) {
-            // CRITICAL: Use indexed loop with group.count to avoid null slots in pooled
-            // array
-            for (int i = 0; i < group.count; i++) {
-                NumericPredicate pred = group.predicates[i];
-                if (eligibleIds == null || eligibleIds.contains(pred.id)) {
-                    if (value > pred.threshold)
-                        matches.add(pred.id);
+        // Index of the first threshold > value (length if none)
+        int firstAbove(double value) {
+            int low = 0;
+            int high = thresholds.length;
+            while (low < high) {
+                int mid = (low + high) >>> 1;
+                if (thresholds[mid] <= value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
                 }
             }
+            return low;
         }
 
-        private void evaluateScalarLT(float value, PredicateGroup group, IntSet matches, IntSet eligibleIds) {
-            // CRITICAL: Use indexed loop with group.count to avoid null slots in pooled
-            // array
-            for (int i = 0; i < group.count; i++) {
-                NumericPredicate pred = group.predicates[i];
-                if (eligibleIds == null || eligibleIds.contains(pred.id)) {
-                    if (value < pred.threshold)
-                        matches.add(pred.id);
+        // Index of the first long threshold >= value (length if none)
+        int firstAtLeast(long value) {
+            int low = 0;
+            int high = longThresholds.length;
+            while (low < high) {
+                int mid = (low + high) >>> 1;
+                if (longThresholds[mid] < value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
                 }
             }
+            return low;
         }
 
-        private void evaluateScalarBetween(float value, PredicateGroup group, IntSet matches, IntSet eligibleIds) {
-            // CRITICAL: Use indexed loop with group.count to avoid null slots in pooled
-            // array
-            for (int i = 0; i < group.count; i++) {
-                NumericPredicate pred = group.predicates[i];
-                if (eligibleIds == null || eligibleIds.contains(pred.id)) {
-                    if (value >= pred.lowerBound && value <= pred.upperBound) {
-                        matches.add(pred.id);
-                    }
+        // Index of the first long threshold > value (length if none)
+        int firstAbove(long value) {
+            int low = 0;
+            int high = longThresholds.length;
+            while (low < high) {
+                int mid = (low + high) >>> 1;
+                if (longThresholds[mid] <= value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
                 }
             }
+            return low;
+        }
+    }
+
+    /**
+     * Structure-of-Arrays predicate lanes, one array per lane type.
+     * Threshold operators (GT/GTE/LT/LTE) store their threshold in the lower bound arrays.
+     * The long arrays are only meaningful for integral groups.
+     */
+    private static final class Lanes {
+        final int[] ids;
+        final float[] lower;
+        final float[] upper;
+        final double[] exactLower;
+        final double[] exactUpper;
+        final long[] longLower;
+        final long[] longUpper;
+        int count;
+
+        Lanes(int capacity) {
+            this.ids = new int[capacity];
+            this.lower = new float[capacity];
+            this.upper = new float[capacity];
+            this.exactLower = new double[capacity];
+            this.exactUpper = new double[capacity];
+            this.longLower = new long[capacity];
+            this.longUpper = new long[capacity];
         }
 
-        private PredicateGroup[] organizeIntoGroups(List<NumericPredicate> predicates) {
-            Map<Operator, List<NumericPredicate>> byOperator = new EnumMap<>(Operator.class);
-            predicates.forEach(p -> byOperator.computeIfAbsent(p.operator, k -> new ArrayList<>()).add(p));
+        static Lanes of(List<NumericPredicate> predicates) {
+            Lanes lanes = new Lanes(predicates.size());
+            for (NumericPredicate p : predicates) {
+                lanes.append(p.id, p.lower, p.upper != null ? p.upper : 0L, p.integral);
+            }
+            return lanes;
+        }
 
-            return byOperator.entrySet().stream()
-                    .map(e -> new PredicateGroup(e.getKey(), e.getValue().toArray(new NumericPredicate[0])))
-                    .toArray(PredicateGroup[]::new);
+        private void append(int id, Number lowerBound, Number upperBound, boolean integral) {
+            ids[count] = id;
+            exactLower[count] = lowerBound.doubleValue();
+            exactUpper[count] = upperBound.doubleValue();
+            lower[count] = (float) exactLower[count];
+            upper[count] = (float) exactUpper[count];
+            if (integral) {
+                longLower[count] = toLong(lowerBound);
+                longUpper[count] = toLong(upperBound);
+            }
+            count++;
         }
 
         /**
-         * Count the number of predicates that will be evaluated for this field.
-         * Used for accurate statistics tracking.
+         * Whether every bound is exactly representable as float. Integral bounds
+         * are checked as longs: their double form may already be rounded.
          */
-        int countEligiblePredicates(IntSet eligiblePredicateIds) {
-            int count = 0;
-            for (PredicateGroup group : groups) {
-                if (eligiblePredicateIds != null) {
-                    for (int i = 0; i < group.count; i++) {
-                        if (eligiblePredicateIds.contains(group.predicates[i].id)) {
-                            count++;
-                        }
-                    }
-                } else {
-                    count += group.count;
+        boolean isFloatExact(boolean integral) {
+            for (int i = 0; i < count; i++) {
+                boolean exact = integral
+                        ? isFloatExact(longLower[i]) && isFloatExact(longUpper[i])
+                        : lower[i] == exactLower[i] && upper[i] == exactUpper[i];
+                if (!exact) {
+                    return false;
                 }
             }
-            return count;
+            return true;
         }
-    }
 
-    // Data structures
-    private static class PredicateGroup {
-        final Operator operator;
-        final NumericPredicate[] predicates;
-        final int count; // Actual number of predicates to use (for pooled arrays)
-
-        PredicateGroup(Operator op, NumericPredicate[] preds) {
-            this(op, preds, preds.length);
+        /**
+         * Whether every (integral) bound is strictly inside ±2^53, so double comparisons
+         * against any long value give the same result as long comparisons.
+         */
+        boolean isDoubleExact() {
+            for (int i = 0; i < count; i++) {
+                if (Math.abs(exactLower[i]) >= EXACT_DOUBLE_INTEGER_LIMIT
+                        || Math.abs(exactUpper[i]) >= EXACT_DOUBLE_INTEGER_LIMIT) {
+                    return false;
+                }
+            }
+            return true;
         }
 
-        PredicateGroup(Operator op, NumericPredicate[] preds, int count) {
-            this.operator = op;
-            this.predicates = preds;
-            this.count = count;
+        /**
+         * Refill these lanes with the eligible entries of {@code source}.
+         */
+        void gather(Lanes source, IntSet eligibleIds) {
+            count = 0;
+            for (int i = 0; i < source.count; i++) {
+                int id = source.ids[i];
+                if (eligibleIds.contains(id)) {
+                    ids[count] = id;
+                    lower[count] = source.lower[i];
+                    upper[count] = source.upper[i];
+                    exactLower[count] = source.exactLower[i];
+                    exactUpper[count] = source.exactUpper[i];
+                    longLower[count] = source.longLower[i];
+                    longUpper[count] = source.longUpper[i];
+                    count++;
+                }
+            }
         }
     }
 
     private static class NumericPredicate {
         final int id;
         final Operator operator;
-        final double threshold; // For GT/LT
-        final double lowerBound; // For BETWEEN
-        final double upperBound; // For BETWEEN
-
-        NumericPredicate(int id, Operator op, double threshold) {
-            this(id, op, threshold, 0, 0);
-        }
+        final Number lower; // Threshold for GT/GTE/LT/LTE, lower bound for BETWEEN
+        final Number upper; // For BETWEEN
+        final boolean integral; // All bounds are whole numbers in the long range
 
-        NumericPredicate(int id, Operator op, double lower, double upper) {
-            this(id, op, 0, lower, upper);
+        NumericPredicate(int id, Operator op, Number threshold) {
+            this(id, op, threshold, null);
         }
 
-        private NumericPredicate(int id, Operator op, double threshold, double lower, double upper) {
+        NumericPredicate(int id, Operator op, Number lower, Number upper) {
             this.id = id;
             this.operator = op;
-            this.threshold = threshold;
-            this.lowerBound = lower;
-            this.upperBound = upper;
+            this.lower = lower;
+            this.upper = upper;
+            this.integral = isIntegral(lower) && (upper == null || isIntegral(upper));
         }
     }
 
     private enum Operator {
-        GREATER_THAN, LESS_THAN, BETWEEN
+        GREATER_THAN, LESS_THAN, GREATER_THAN_OR_EQUAL, LESS_THAN_OR_EQUAL, BETWEEN
+    }
+
+    private static VectorOperators.Comparison comparison(Operator operator) {
+        return switch (operator) {
+            case GREATER_THAN -> VectorOperators.GT;
+            case LESS_THAN -> VectorOperators.LT;
+            case GREATER_THAN_OR_EQUAL -> VectorOperators.GE;
+            case LESS_THAN_OR_EQUAL -> VectorOperators.LE;
+            case BETWEEN -> throw new IllegalStateException("Not a threshold operator: " + operator);
+        };
+    }
+
+    private static boolean matches(Operator operator, double value, double lower, double upper) {
+        return switch (operator) {
+            case GREATER_THAN -> value > lower;
+            case LESS_THAN -> value < lower;
+            case GREATER_THAN_OR_EQUAL -> value >= lower;
+            case LESS_THAN_OR_EQUAL -> value <= lower;
+            case BETWEEN -> value >= lower && value <= upper;
+        };
+    }
+
+    // Long comparison of a value with the given floor and ceiling (equal for whole numbers)
+    private static boolean matches(Operator operator, long floor, long ceil, long lower, long upper) {
+        return switch (operator) {
+            case GREATER_THAN -> ceil > lower;
+            case LESS_THAN -> floor < lower;
+            case GREATER_THAN_OR_EQUAL -> floor >= lower;
+            case LESS_THAN_OR_EQUAL -> ceil <= lower;
+            case BETWEEN -> floor >= lower && ceil <= upper;
+        };
+    }
+
+    // Whether a value beyond the long range (sign = overflow) satisfies every long bound
+    private static boolean overflowMatches(Operator operator, int overflow) {
+        return switch (operator) {
+            case GREATER_THAN, GREATER_THAN_OR_EQUAL -> overflow > 0;
+            case LESS_THAN, LESS_THAN_OR_EQUAL -> overflow < 0;
+            case BETWEEN -> false;
+        };
+    }
+
+    private static boolean isIntegralType(Number value) {
+        return value instanceof Long || value instanceof Integer
+                || value instanceof Short || value instanceof Byte;
+    }
+
+    /**
+     * Whether the number is a whole number in the long range (compared as long).
+     */
+    private static boolean isIntegral(Number value) {
+        if (isIntegralType(value)) {
+            return true;
+        }
+        double d = value.doubleValue();
+        return d == Math.rint(d) && d >= -LONG_RANGE_LIMIT && d < LONG_RANGE_LIMIT;
+    }
+
+    private static long toLong(Number value) {
+        return isIntegralType(value) ? value.longValue() : (long) value.doubleValue();
+    }
+
+    private static boolean isFloatExact(long value) {
+        float f = value;
+        return f != 0x1p63f && (long) f == value;
     }
 
     /**
-     * Convert a value to double, handling both Number and String representations.
+     * Convert a value to a Number, handling both Number and String representations.
      * This is necessary because JSON deserialization may produce String values for numeric fields.
+     * Whole-number strings parse as long so they keep full precision.
      */
-    private static double toDouble(Object value) {
+    private static Number toNumber(Object value) {
         if (value instanceof Number) {
-            return ((Number) value).doubleValue();
+            return (Number) value;
         }
         if (value instanceof String) {
+            String str = ((String) value).trim();
+            try {
+                return Long.parseLong(str);
+            } catch (NumberFormatException ignored) {
+                // Not a whole number, try decimal
+            }
             try {
-                return Double.parseDouble((String) value);
+                return Double.parseDouble(str);
             } catch (NumberFormatException e) {
                 throw new IllegalArgumentException("Cannot convert value to number: " + value, e);
             }
@@ -491,25 +796,37 @@ public final class NumericOperatorEvaluator {
             case BETWEEN -> {
                 List<?> range = (List<?>) p.value();
                 yield new NumericPredicate(id, Operator.BETWEEN,
-                        toDouble(range.get(0)),
-                        toDouble(range.get(1)));
+                        toNumber(range.get(0)),
+                        toNumber(range.get(1)));
             }
             case GREATER_THAN -> new NumericPredicate(id, Operator.GREATER_THAN,
-                    toDouble(p.value()));
+                    toNumber(p.value()));
             case LESS_THAN -> new NumericPredicate(id, Operator.LESS_THAN,
-                    toDouble(p.value()));
+                    toNumber(p.value()));
+            case GREATER_THAN_OR_EQUAL -> new NumericPredicate(id, Operator.GREATER_THAN_OR_EQUAL,
+                    toNumber(p.value()));
+            case LESS_THAN_OR_EQUAL -> new NumericPredicate(id, Operator.LESS_THAN_OR_EQUAL,
+                    toNumber(p.value()));
             default -> throw new IllegalArgumentException("Unsupported operator: " + p.operator());
         };
     }
 
     public Metrics getMetrics() {
-        return new Metrics(vectorizedOps, scalarOps);
+        return new Metrics(vectorizedOps, scalarOps, sortedSearches, intervalQueries,
+                floatLaneOps, longLaneOps, doubleLaneOps);
     }
 
-    public record Metrics(long vectorizedOperations, long scalarOperations) {
+    /**
+     * @param floatLaneEvaluations  Lane group evaluations on the float fast path
+     * @param longLaneEvaluations   Lane group evaluations in exact long precision
+     * @param doubleLaneEvaluations Lane group evaluations in double precision
+     */
+    public record Metrics(long vectorizedOperations, long scalarOperations, long sortedSearches,
+                          long intervalQueries, long floatLaneEvaluations, long longLaneEvaluations,
+                          long doubleLaneEvaluations) {
         public double vectorizationRate() {
             long total = vectorizedOperations + scalarOperations;
             return total > 0 ? (double) vectorizedOperations / total : 0.0;
         }
     }
-}
\ No newline at end of file
+}
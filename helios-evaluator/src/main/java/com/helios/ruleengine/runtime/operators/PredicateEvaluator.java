@@ -25,6 +25,8 @@ import java.util.logging.Logger;
  * - Manage caching (delegated to BaseConditionEvaluator)
  *
  * PERFORMANCE:
+ * - Dispatch table indexed by field id: one array load per field selects the
+ *   operator families compiled for it; absent families are never called
  * - Zero overhead dispatching (JIT inlines everything)
  * - Each specialized evaluator maintains its own optimizations
  * - No allocations in steady state
@@ -34,6 +36,13 @@ import java.util.logging.Logger;
 public final class PredicateEvaluator {
     private static final Logger logger = Logger.getLogger(PredicateEvaluator.class.getName());
 
+    // Operator family bits in the per-field dispatch table
+    private static final byte NUMERIC = 1;
+    private static final byte LITERAL = 1 << 1; // CONTAINS, STARTS_WITH, ENDS_WITH
+    private static final byte REGEX = 1 << 2;
+    private static final byte EQUALITY = 1 << 3;
+    private static final byte STRING = LITERAL | REGEX;
+
     private final EngineModel model;
 
     // Specialized evaluators - each handles one operator family
@@ -42,6 +51,9 @@ public final class PredicateEvaluator {
     private final RegexOperatorEvaluator regexEvaluator;
     private final EqualityOperatorEvaluator equalityEvaluator;
 
+    // Per-field dispatch table: operator family bits, indexed by field id
+    private final byte[] fieldOperators;
+
     // Performance tracking
     private long totalEvaluations = 0;
     private long numericOps = 0;
@@ -58,6 +70,16 @@ public final class PredicateEvaluator {
         this.regexEvaluator = new RegexOperatorEvaluator(model);
         this.equalityEvaluator = new EqualityOperatorEvaluator(model);
 
+        this.fieldOperators = new byte[fieldTableSize(model)];
+        for (int fieldId = 0; fieldId < fieldOperators.length; fieldId++) {
+            byte operators = 0;
+            if (numericEvaluator.hasField(fieldId)) operators |= NUMERIC;
+            if (stringEvaluator.hasField(fieldId)) operators |= LITERAL;
+            if (regexEvaluator.hasField(fieldId)) operators |= REGEX;
+            if (equalityEvaluator.hasField(fieldId)) operators |= EQUALITY;
+            fieldOperators[fieldId] = operators;
+        }
+
         logger.info("PredicateEvaluator initialized with 4 specialized evaluators");
     }
 
@@ -65,9 +87,9 @@ public final class PredicateEvaluator {
      * Evaluate all predicates for a single field.
      *
      * DISPATCH LOGIC:
-     * 1. Check if field has any predicates
+     * 1. Look up the field's operator families in the dispatch table
      * 2. Get field value from event attributes
-     * 3. Dispatch to appropriate evaluator(s)
+     * 3. Dispatch to the compiled evaluator(s) only
      * 4. Aggregate results into context
      *
      * @param fieldId Field identifier (dictionary-encoded)
@@ -79,37 +101,60 @@ public final class PredicateEvaluator {
                               EvaluationContext ctx, IntSet eligiblePredicateIds) {
         totalEvaluations++;
 
+        int operators = fieldId >= 0 && fieldId < fieldOperators.length ? fieldOperators[fieldId] : 0;
+        if (operators == 0) {
+            return; // No predicates on this field
+        }
+
         // Get field value
         Object value = attributes.get(fieldId);
         if (value == null) {
             return; // No value, no evaluation
         }
 
-        // Dispatch based on value type and available operators
+        // Dispatch based on value type and compiled operator families
 
-        // 1. Numeric operators (BETWEEN, GREATER_THAN, LESS_THAN)
-        if (value instanceof Number) {
-            numericEvaluator.evaluateNumeric(fieldId, ((Number) value).doubleValue(),
+        // 1. Numeric operators (BETWEEN, GREATER_THAN(_OR_EQUAL), LESS_THAN(_OR_EQUAL))
+        if ((operators & NUMERIC) != 0 && value instanceof Number) {
+            numericEvaluator.evaluateNumeric(fieldId, (Number) value,
                     ctx, eligiblePredicateIds);
             numericOps++;
         }
 
-        // 2. String operators (CONTAINS, REGEX)
-        String stringValue = extractStringValue(value);
-        if (stringValue != null) {
-            stringEvaluator.evaluateContains(fieldId, stringValue,
-                    ctx, eligiblePredicateIds);
-            stringOps++;
+        // 2. String operators (CONTAINS, STARTS_WITH, ENDS_WITH, REGEX)
+        if ((operators & STRING) != 0) {
+            String stringValue = extractStringValue(value);
+            if (stringValue != null) {
+                if ((operators & LITERAL) != 0) {
+                    stringEvaluator.evaluateLiterals(fieldId, stringValue,
+                            ctx, eligiblePredicateIds);
+                    stringOps++;
+                }
+                if ((operators & REGEX) != 0) {
+                    regexEvaluator.evaluateRegex(fieldId, stringValue,
+                            ctx, eligiblePredicateIds);
+                    regexOps++;
+                }
+            }
+        }
 
-            regexEvaluator.evaluateRegex(fieldId, stringValue,
+        // 3. Equality operators (EQUAL_TO, NOT_EQUAL_TO, IS_ANY_OF)
+        if ((operators & EQUALITY) != 0) {
+            equalityEvaluator.evaluateEquality(fieldId, value,
                     ctx, eligiblePredicateIds);
-            regexOps++;
+            equalityOps++;
         }
+    }
 
-        // 3. Equality operators (EQUAL_TO, IS_ANY_OF) - always evaluated
-        equalityEvaluator.evaluateEquality(fieldId, value,
-                ctx, eligiblePredicateIds);
-        equalityOps++;
+    /**
+     * Size of a dense per-field table: one slot per field id that has predicates.
+     */
+    static int fieldTableSize(EngineModel model) {
+        int maxFieldId = -1;
+        for (int fieldId : model.getFieldToPredicates().keySet()) {
+            maxFieldId = Math.max(maxFieldId, fieldId);
+        }
+        return maxFieldId + 1;
     }
 
     /**
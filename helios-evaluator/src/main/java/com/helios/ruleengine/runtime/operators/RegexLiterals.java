@@ -0,0 +1,206 @@
+package com.helios.ruleengine.runtime.operators;
+
+/**
+ * Compile-time extraction of a literal substring that every match of a regex
+ * must contain, used to pre-filter REGEX predicates.
+ *
+ * <p>The extraction is conservative: only literal runs at the top level of the
+ * pattern (outside groups and character classes, not under an optional
+ * quantifier) are considered, and patterns with top-level alternation,
+ * comments mode, {@code \Q...\E} quoting or escapes that take an argument
+ * ({@code \x41}, {@code \pL}, {@code \k<name>}, ...) yield no literal at all. A
+ * {@code null} result simply means the pattern is always verified.
+ */
+final class RegexLiterals {
+
+    private final String regex;
+    private final StringBuilder run = new StringBuilder();
+    private String best = "";
+    private int depth;
+
+    private RegexLiterals(String regex) {
+        this.regex = regex;
+    }
+
+    /**
+     * @return The longest required literal, or {@code null} if none can be proven
+     */
+    static String requiredLiteral(String regex) {
+        return new RegexLiterals(regex).extract();
+    }
+
+    private String extract() {
+        int i = 0;
+        while (i < regex.length()) {
+            char c = regex.charAt(i);
+            switch (c) {
+                case '\\' -> {
+                    if (i + 1 >= regex.length() || regex.charAt(i + 1) == 'Q') {
+                        return null;
+                    }
+                    char escaped = regex.charAt(i + 1);
+                    if (consumesArgument(escaped)) {
+                        // \x41, \u00e9, \0101, \cA, \pL, \k<name>, \N{...}: the
+                        // characters after the escape are not literals
+                        return null;
+                    } else if (Character.isDigit(escaped)) {
+                        // Back-reference; later digits may belong to the group number
+                        endRun();
+                        int end = i + 2;
+                        while (end < regex.length() && Character.isDigit(regex.charAt(end))) {
+                            end++;
+                        }
+                        i = skipQuantifier(end);
+                    } else if (Character.isLetter(escaped)) {
+                        // Class, boundary or control escape
+                        endRun();
+                        i = skipQuantifier(i + 2);
+                    } else {
+                        i = literal(escaped, i + 2);
+                    }
+                }
+                case '[' -> {
+                    int end = skipCharClass(i);
+                    if (end < 0) {
+                        return null;
+                    }
+                    endRun();
+                    i = skipQuantifier(end);
+                }
+                case '(' -> {
+                    if (regex.startsWith("(?", i) && enablesComments(i + 2)) {
+                        return null;
+                    }
+                    endRun();
+                    depth++;
+                    i++;
+                }
+                case ')' -> {
+                    depth--;
+                    i = skipQuantifier(i + 1);
+                }
+                case '|' -> {
+                    if (depth == 0) {
+                        return null;
+                    }
+                    i++;
+                }
+                case '.', '^', '$' -> {
+                    endRun();
+                    i = skipQuantifier(i + 1);
+                }
+                default -> i = literal(c, i + 1);
+            }
+        }
+        endRun();
+        return best.isEmpty() ? null : best;
+    }
+
+    /**
+     * Adds literal {@code c}, followed by position {@code next}, to the current
+     * run and applies any quantifier. Returns the position after the quantifier.
+     */
+    private int literal(char c, int next) {
+        int after = skipQuantifier(next);
+        if (depth > 0) {
+            return after;
+        }
+        if (after == next) {
+            run.append(c);
+        } else if (minRepeats(next) > 0) {
+            // Required, but what follows the repetition is not adjacent to the run
+            run.append(c);
+            endRun();
+        } else {
+            endRun();
+        }
+        return after;
+    }
+
+    private void endRun() {
+        if (run.length() > best.length()) {
+            best = run.toString();
+        }
+        run.setLength(0);
+    }
+
+    // Minimum repetitions of the quantifier at i
+    private int minRepeats(int i) {
+        return switch (regex.charAt(i)) {
+            case '*', '?' -> 0;
+            case '{' -> {
+                int end = i + 1;
+                while (end < regex.length() && Character.isDigit(regex.charAt(end))) {
+                    end++;
+                }
+                yield end > i + 1 ? Integer.parseInt(regex.substring(i + 1, end)) : 0;
+            }
+            default -> 1;
+        };
+    }
+
+    // Position after the quantifier (and lazy/possessive suffix) at i, i if none
+    private int skipQuantifier(int i) {
+        if (i >= regex.length()) {
+            return i;
+        }
+        char c = regex.charAt(i);
+        int after;
+        if (c == '*' || c == '+' || c == '?') {
+            after = i + 1;
+        } else if (c == '{') {
+            int close = regex.indexOf('}', i);
+            if (close < 0) {
+                return i;
+            }
+            after = close + 1;
+        } else {
+            return i;
+        }
+        if (after < regex.length() && (regex.charAt(after) == '?' || regex.charAt(after) == '+')) {
+            after++;
+        }
+        return after;
+    }
+
+    // Position after the character class opening at i, -1 if unterminated or ambiguous
+    private int skipCharClass(int i) {
+        if (regex.startsWith("[]", i) || regex.startsWith("[^]", i)) {
+            return -1;
+        }
+        int nesting = 0;
+        for (int j = i; j < regex.length(); j++) {
+            char c = regex.charAt(j);
+            if (c == '\\') {
+                j++;
+            } else if (c == '[') {
+                nesting++;
+            } else if (c == ']' && --nesting == 0) {
+                return j + 1;
+            }
+        }
+        return -1;
+    }
+
+    // Escapes whose syntax continues past the escaped character
+    private static boolean consumesArgument(char escaped) {
+        return switch (escaped) {
+            case 'x', 'u', '0', 'c', 'p', 'P', 'k', 'N' -> true;
+            default -> false;
+        };
+    }
+
+    // Inline flags such as (?x) or (?ix:...) turn on comments mode
+    private boolean enablesComments(int i) {
+        for (int j = i; j < regex.length(); j++) {
+            char c = regex.charAt(j);
+            if (c == 'x') {
+                return true;
+            }
+            if (!Character.isLetter(c)) {
+                return false;
+            }
+        }
+        return false;
+    }
+}
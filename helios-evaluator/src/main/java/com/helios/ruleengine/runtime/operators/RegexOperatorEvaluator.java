@@ -3,29 +3,38 @@ package com.helios.ruleengine.runtime.operators;
 import com.helios.ruleengine.runtime.context.EvaluationContext;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.api.model.Predicate;
-import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntList;
 import it.unimi.dsi.fastutil.ints.IntSet;
 
+import java.util.ArrayList;
 import java.util.List;
-import java.util.Map;
 import java.util.Objects;
-import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicIntegerArray;
 import java.util.logging.Logger;
+import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 import java.util.regex.PatternSyntaxException;
 
 public final class RegexOperatorEvaluator {
     private static final Logger logger = Logger.getLogger(RegexOperatorEvaluator.class.getName());
 
+    // Match budget: input chars read per value char (at least the minimum); a
+    // match exceeding it (catastrophic backtracking) counts as not matched
+    static final long CHAR_READ_BUDGET_PER_CHAR = 1_000;
+    static final long MIN_CHAR_READ_BUDGET = 100_000;
+
     private final EngineModel model;
-    private final Map<Integer, FieldEvaluator> fieldEvaluators;
+    // Dense dispatch table indexed by field id (null = no regex predicates)
+    private final FieldEvaluator[] fieldEvaluators;
     private long successfulMatches = 0;
     private long failedMatches = 0;
     private long errors = 0;
+    private long budgetExceeded = 0;
 
     public RegexOperatorEvaluator(EngineModel model) {
         this.model = model;
-        this.fieldEvaluators = new ConcurrentHashMap<>();
+        this.fieldEvaluators = new FieldEvaluator[PredicateEvaluator.fieldTableSize(model)];
         initializeEvaluators();
     }
 
@@ -47,55 +56,132 @@ public final class RegexOperatorEvaluator {
                     .toList();
 
             if (!regexPredicates.isEmpty()) {
-                fieldEvaluators.put(fieldId, new FieldEvaluator(regexPredicates));
+                fieldEvaluators[fieldId] = new FieldEvaluator(regexPredicates);
             }
         });
     }
 
     public void evaluateRegex(int fieldId, String value,
                               EvaluationContext ctx, IntSet eligiblePredicateIds) {
-        FieldEvaluator evaluator = fieldEvaluators.get(fieldId);
+        FieldEvaluator evaluator = fieldId >= 0 && fieldId < fieldEvaluators.length
+                ? fieldEvaluators[fieldId] : null;
         if (evaluator == null) return;
 
         // Count all predicates that will be evaluated (not just matches)
         int predicatesEvaluatedCount = evaluator.countEligiblePredicates(eligiblePredicateIds);
         ctx.addPredicatesEvaluated(predicatesEvaluatedCount);
 
-        IntSet matches = evaluator.evaluate(value, eligiblePredicateIds);
-        matches.forEach((int predId) -> {
-            ctx.addTruePredicate(predId);
-        });
+        // Matches go straight into the context
+        evaluator.evaluate(value, eligiblePredicateIds, ctx);
+    }
+
+    /**
+     * Whether this evaluator has compiled predicates for the field.
+     */
+    boolean hasField(int fieldId) {
+        return fieldId >= 0 && fieldId < fieldEvaluators.length && fieldEvaluators[fieldId] != null;
     }
 
     private class FieldEvaluator {
         private final RegexPredicate[] predicates;
+        // Required literals of the pre-filtered patterns (null = no pattern has one)
+        private final AhoCorasickAutomaton literals;
+        // Per literal index: predicate index
+        private final int[] literalPredicates;
+        // Predicates without a required literal: always verified
+        private final int[] unfiltered;
+
+        // Per-thread matchers, one per predicate, reset for each value instead of reallocated
+        private final ThreadLocal<Matcher[]> matchers;
+        private final ThreadLocal<BudgetedCharSequence> input = ThreadLocal.withInitial(BudgetedCharSequence::new);
+        // Per-thread visited literal states: state s is reported when marks[s] == epoch
+        private final ThreadLocal<CandidateMarks> stateMarks;
+        // Per predicate: 1 once a budget overrun was logged, so hostile input cannot flood the log
+        private final AtomicIntegerArray budgetLogged;
 
         FieldEvaluator(List<RegexPredicate> preds) {
             this.predicates = preds.toArray(new RegexPredicate[0]);
-        }
-
-        IntSet evaluate(String value, IntSet eligiblePredicateIds) {
-            IntSet matches = new IntOpenHashSet();
+            this.budgetLogged = new AtomicIntegerArray(predicates.length);
+            List<String> literalPatterns = new ArrayList<>();
+            IntList filtered = new IntArrayList();
+            IntList always = new IntArrayList();
+            for (int i = 0; i < predicates.length; i++) {
+                String literal = RegexLiterals.requiredLiteral(predicates[i].rawPattern);
+                if (literal != null) {
+                    literalPatterns.add(literal);
+                    filtered.add(i);
+                } else {
+                    always.add(i);
+                }
+            }
+            this.literals = literalPatterns.isEmpty() ? null : new AhoCorasickAutomaton(literalPatterns);
+            this.literalPredicates = filtered.toIntArray();
+            this.unfiltered = always.toIntArray();
 
-            for (RegexPredicate pred : predicates) {
-                if (eligiblePredicateIds != null && !eligiblePredicateIds.contains(pred.id)) {
-                    continue;
+            this.matchers = ThreadLocal.withInitial(() -> {
+                Matcher[] perPredicate = new Matcher[predicates.length];
+                for (int i = 0; i < predicates.length; i++) {
+                    perPredicate[i] = predicates[i].compiledPattern.matcher("");
                 }
+                return perPredicate;
+            });
+            final int size = literals != null ? literals.numStates() : 0;
+            this.stateMarks = ThreadLocal.withInitial(() -> new CandidateMarks(size));
+        }
 
-                try {
-                    if (pred.compiledPattern.matcher(value).matches()) {
-                        matches.add(pred.id);
-                        successfulMatches++;
-                    } else {
-                        failedMatches++;
+        /**
+         * One literal scan selects the patterns whose required literal occurs;
+         * only those and the patterns without a literal are run.
+         */
+        void evaluate(String value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            Matcher[] perPredicate = matchers.get();
+            BudgetedCharSequence budgeted = input.get();
+
+            if (literals != null) {
+                CandidateMarks marks = stateMarks.get();
+                int epoch = marks.nextEpoch();
+                int state = AhoCorasickAutomaton.ROOT;
+                for (int i = 0; i < value.length(); i++) {
+                    state = literals.next(state, value.charAt(i));
+                    int hit = literals.outputs(state).length > 0 ? state : literals.outputLink(state);
+                    while (hit != AhoCorasickAutomaton.ROOT && marks.mark(hit, epoch)) {
+                        for (int literal : literals.outputs(hit)) {
+                            verify(literalPredicates[literal], value, budgeted, perPredicate, eligiblePredicateIds, ctx);
+                        }
+                        hit = literals.outputLink(hit);
                     }
-                } catch (Exception e) {
-                    errors++;
-                    logger.warning("Regex eval error for predicate " + pred.id + ": " + e.getMessage());
                 }
             }
+            for (int i : unfiltered) {
+                verify(i, value, budgeted, perPredicate, eligiblePredicateIds, ctx);
+            }
+        }
 
-            return matches;
+        private void verify(int i, String value, BudgetedCharSequence budgeted, Matcher[] perPredicate,
+                            IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            RegexPredicate pred = predicates[i];
+            if (eligiblePredicateIds != null && !eligiblePredicateIds.contains(pred.id)) {
+                return;
+            }
+
+            try {
+                if (perPredicate[i].reset(budgeted.reset(value)).matches()) {
+                    ctx.addTruePredicate(pred.id);
+                    successfulMatches++;
+                } else {
+                    failedMatches++;
+                }
+            } catch (BudgetExceededException e) {
+                budgetExceeded++;
+                failedMatches++;
+                if (budgetLogged.compareAndSet(i, 0, 1)) {
+                    logger.warning("Regex budget exceeded for predicate " + pred.id + " (" + pred.rawPattern
+                            + "); further overruns are only counted");
+                }
+            } catch (Exception e) {
+                errors++;
+                logger.warning("Regex eval error for predicate " + pred.id + ": " + e.getMessage());
+            }
         }
 
         /**
@@ -116,11 +202,58 @@ public final class RegexOperatorEvaluator {
         }
     }
 
+    /**
+     * Value wrapper that bounds the work of one match: the regex engine reads
+     * the input through {@link #charAt(int)}, so counting reads bounds
+     * backtracking. Reused per thread.
+     */
+    private static final class BudgetedCharSequence implements CharSequence {
+        private String value = "";
+        private long remaining;
+
+        BudgetedCharSequence reset(String value) {
+            this.value = value;
+            this.remaining = Math.max(MIN_CHAR_READ_BUDGET, (long) value.length() * CHAR_READ_BUDGET_PER_CHAR);
+            return this;
+        }
+
+        @Override
+        public char charAt(int index) {
+            if (--remaining < 0) {
+                throw BudgetExceededException.INSTANCE;
+            }
+            return value.charAt(index);
+        }
+
+        @Override
+        public int length() {
+            return value.length();
+        }
+
+        @Override
+        public CharSequence subSequence(int start, int end) {
+            return value.subSequence(start, end);
+        }
+
+        @Override
+        public String toString() {
+            return value;
+        }
+    }
+
+    private static final class BudgetExceededException extends RuntimeException {
+        static final BudgetExceededException INSTANCE = new BudgetExceededException();
+
+        private BudgetExceededException() {
+            super("regex budget exceeded", null, false, false);
+        }
+    }
+
     private record RegexPredicate(int id, Pattern compiledPattern, String rawPattern) {}
 
     public Metrics getMetrics() {
-        return new Metrics(successfulMatches, failedMatches, errors);
+        return new Metrics(successfulMatches, failedMatches, errors, budgetExceeded);
     }
 
-    public record Metrics(long successfulMatches, long failedMatches, long errors) {}
+    public record Metrics(long successfulMatches, long failedMatches, long errors, long budgetExceeded) {}
 }
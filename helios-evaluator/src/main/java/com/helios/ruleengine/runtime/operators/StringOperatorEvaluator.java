@@ -3,118 +3,172 @@ package com.helios.ruleengine.runtime.operators;
 import com.helios.ruleengine.runtime.context.EvaluationContext;
 import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.api.model.Predicate;
-import it.unimi.dsi.fastutil.ints.IntArrayList;
-import it.unimi.dsi.fastutil.ints.IntList;
-import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
 import it.unimi.dsi.fastutil.ints.IntSet;
 
-import java.util.*;
-import java.util.concurrent.ConcurrentHashMap;
+import java.util.List;
 
 public final class StringOperatorEvaluator {
     private final EngineModel model;
-    private final Map<Integer, FieldEvaluator> fieldEvaluators;
-    private long candidatesFiltered = 0;
-    private long fullVerifications = 0;
+    // Dense dispatch table indexed by field id (null = no CONTAINS/STARTS_WITH/ENDS_WITH predicates)
+    private final FieldEvaluator[] fieldEvaluators;
+    private long valuesScanned = 0;
+    private long patternHits = 0;
 
     public StringOperatorEvaluator(EngineModel model) {
         this.model = model;
-        this.fieldEvaluators = new ConcurrentHashMap<>();
+        this.fieldEvaluators = new FieldEvaluator[PredicateEvaluator.fieldTableSize(model)];
         initializeEvaluators();
     }
 
     private void initializeEvaluators() {
         model.getFieldToPredicates().forEach((fieldId, predicates) -> {
-            List<StringPredicate> stringPredicates = predicates.stream()
-                    .filter(p -> p.operator() == Predicate.Operator.CONTAINS)
-                    .map(p -> new StringPredicate(model.getPredicateId(p), String.valueOf(p.value())))
-                    .toList();
+            List<StringPredicate> contains = literals(predicates, Predicate.Operator.CONTAINS);
+            List<StringPredicate> prefixes = literals(predicates, Predicate.Operator.STARTS_WITH);
+            List<StringPredicate> suffixes = literals(predicates, Predicate.Operator.ENDS_WITH);
 
-            if (!stringPredicates.isEmpty()) {
-                fieldEvaluators.put(fieldId, new FieldEvaluator(stringPredicates));
+            if (!contains.isEmpty() || !prefixes.isEmpty() || !suffixes.isEmpty()) {
+                fieldEvaluators[fieldId] = new FieldEvaluator(contains, prefixes, suffixes);
             }
         });
     }
 
-    public void evaluateContains(int fieldId, String value,
+    private List<StringPredicate> literals(List<Predicate> predicates, Predicate.Operator operator) {
+        return predicates.stream()
+                .filter(p -> p.operator() == operator)
+                .map(p -> new StringPredicate(model.getPredicateId(p), String.valueOf(p.value())))
+                .toList();
+    }
+
+    /**
+     * Evaluate the field's CONTAINS, STARTS_WITH and ENDS_WITH predicates
+     * (case-insensitive) against the value.
+     */
+    public void evaluateLiterals(int fieldId, String value,
                                  EvaluationContext ctx, IntSet eligiblePredicateIds) {
-        FieldEvaluator evaluator = fieldEvaluators.get(fieldId);
+        FieldEvaluator evaluator = fieldId >= 0 && fieldId < fieldEvaluators.length
+                ? fieldEvaluators[fieldId] : null;
         if (evaluator == null) return;
 
         // Count all predicates that will be evaluated (not just matches)
         int predicatesEvaluatedCount = evaluator.countEligiblePredicates(eligiblePredicateIds);
         ctx.addPredicatesEvaluated(predicatesEvaluatedCount);
 
-        IntSet matches = evaluator.evaluate(value, eligiblePredicateIds);
-        matches.forEach((int predId) -> {
-            ctx.addTruePredicate(predId);
-        });
+        // Matches go straight into the context
+        evaluator.evaluate(value, eligiblePredicateIds, ctx);
+    }
+
+    /**
+     * Whether this evaluator has compiled predicates for the field.
+     */
+    boolean hasField(int fieldId) {
+        return fieldId >= 0 && fieldId < fieldEvaluators.length && fieldEvaluators[fieldId] != null;
     }
 
     private class FieldEvaluator {
-        private final StringPredicate[] predicates;
-        private final Map<String, IntList> bigramIndex;
+        private final StringPredicate[] contains;
+        private final StringPredicate[] prefixes;
+        private final StringPredicate[] suffixes;
+        // CONTAINS patterns of the field, matched in one pass over the value (null = none)
+        private final AhoCorasickAutomaton automaton;
+        // STARTS_WITH patterns, and ENDS_WITH patterns reversed (null = none)
+        private final LiteralTrie prefixTrie;
+        private final LiteralTrie suffixTrie;
+
+        // Per-thread visited output states: state s is reported when marks[s] == epoch
+        private final ThreadLocal<CandidateMarks> stateMarks;
+
+        FieldEvaluator(List<StringPredicate> contains, List<StringPredicate> prefixes, List<StringPredicate> suffixes) {
+            this.contains = contains.toArray(new StringPredicate[0]);
+            this.prefixes = prefixes.toArray(new StringPredicate[0]);
+            this.suffixes = suffixes.toArray(new StringPredicate[0]);
+            this.automaton = contains.isEmpty() ? null
+                    : new AhoCorasickAutomaton(contains.stream().map(StringPredicate::pattern).toList());
+            this.prefixTrie = prefixes.isEmpty() ? null
+                    : new LiteralTrie(prefixes.stream().map(StringPredicate::pattern).toList(), false);
+            this.suffixTrie = suffixes.isEmpty() ? null
+                    : new LiteralTrie(suffixes.stream().map(StringPredicate::pattern).toList(), true);
+            final int size = automaton != null ? automaton.numStates() : 0;
+            this.stateMarks = ThreadLocal.withInitial(() -> new CandidateMarks(size));
+        }
 
-        FieldEvaluator(List<StringPredicate> preds) {
-            this.predicates = preds.toArray(new StringPredicate[0]);
-            this.bigramIndex = buildBigramIndex(predicates);
+        void evaluate(String value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            valuesScanned++;
+            if (automaton != null) {
+                evaluateContains(value, eligiblePredicateIds, ctx);
+            }
+            if (prefixTrie != null) {
+                evaluatePrefixes(value, eligiblePredicateIds, ctx);
+            }
+            if (suffixTrie != null) {
+                evaluateSuffixes(value, eligiblePredicateIds, ctx);
+            }
         }
 
-        private Map<String, IntList> buildBigramIndex(StringPredicate[] preds) {
-            Map<String, IntList> index = new HashMap<>();
-            for (int i = 0; i < preds.length; i++) {
-                String pattern = preds[i].pattern;
-                if (pattern.length() >= 2) {
-                    for (int j = 0; j < pattern.length() - 1; j++) {
-                        String bigram = pattern.substring(j, j + 2);
-                        index.computeIfAbsent(bigram, k -> new IntArrayList()).add(i);
-                    }
-                } else {
-                    // Short patterns - check against all
-                    index.computeIfAbsent("", k -> new IntArrayList()).add(i);
+        /**
+         * Scan the value once, adding every contained pattern to the context.
+         *
+         * <p>Matching is case-insensitive and done in place, without building an
+         * uppercased copy of the value. A pattern occurring several times is
+         * reported once: an output state already reported for this value also
+         * had its whole output chain reported, so the chain walk stops there.
+         */
+        private void evaluateContains(String value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            CandidateMarks marks = stateMarks.get();
+            int epoch = marks.nextEpoch();
+
+            report(contains, automaton.emptyPatterns(), eligiblePredicateIds, ctx);
+
+            int state = AhoCorasickAutomaton.ROOT;
+            for (int i = 0; i < value.length(); i++) {
+                state = automaton.next(state, value.charAt(i));
+                int hit = automaton.outputs(state).length > 0 ? state : automaton.outputLink(state);
+                while (hit != AhoCorasickAutomaton.ROOT && marks.mark(hit, epoch)) {
+                    report(contains, automaton.outputs(hit), eligiblePredicateIds, ctx);
+                    hit = automaton.outputLink(hit);
                 }
             }
-            return index;
         }
 
-        IntSet evaluate(String value, IntSet eligiblePredicateIds) {
-            IntSet matches = new IntOpenHashSet();
-            Set<Integer> candidates = new HashSet<>();
-
-            final String upperValue = value.toUpperCase(); // <-- FIX
-
-            // Gather candidates from bigrams
-            if (upperValue.length() >= 2) { // <-- FIX
-                for (int i = 0; i < upperValue.length() - 1; i++) { // <-- FIX
-                    String bigram = upperValue.substring(i, i + 2); // <-- FIX
-                    IntList predIndices = bigramIndex.get(bigram);
-                    if (predIndices != null) {
-                        predIndices.forEach((int idx) -> candidates.add(idx));
-                    }
+        /**
+         * Walk the prefix trie from the start of the value; every node passed
+         * ends a STARTS_WITH pattern that the value starts with.
+         */
+        private void evaluatePrefixes(String value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            int node = LiteralTrie.ROOT;
+            report(prefixes, prefixTrie.outputs(node), eligiblePredicateIds, ctx);
+            for (int i = 0; i < value.length(); i++) {
+                node = prefixTrie.next(node, value.charAt(i));
+                if (node == LiteralTrie.NO_NODE) {
+                    return;
                 }
+                report(prefixes, prefixTrie.outputs(node), eligiblePredicateIds, ctx);
             }
+        }
 
-            // Always check short patterns
-            IntList shortPatterns = bigramIndex.get("");
-            if (shortPatterns != null) {
-                shortPatterns.forEach((int idx) -> candidates.add(idx));
+        /**
+         * Walk the reversed suffix trie from the end of the value.
+         */
+        private void evaluateSuffixes(String value, IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            int node = LiteralTrie.ROOT;
+            report(suffixes, suffixTrie.outputs(node), eligiblePredicateIds, ctx);
+            for (int i = value.length() - 1; i >= 0; i--) {
+                node = suffixTrie.next(node, value.charAt(i));
+                if (node == LiteralTrie.NO_NODE) {
+                    return;
+                }
+                report(suffixes, suffixTrie.outputs(node), eligiblePredicateIds, ctx);
             }
+        }
 
-            candidatesFiltered += candidates.size();
-
-            // Full verification
-            for (int idx : candidates) {
-                StringPredicate pred = predicates[idx];
-                if (eligiblePredicateIds != null && !eligiblePredicateIds.contains(pred.id)) {
-                    continue;
-                }
-                if (upperValue.contains(pred.pattern)) {
-                    matches.add(pred.id);
+        private void report(StringPredicate[] predicates, int[] patternIndexes,
+                            IntSet eligiblePredicateIds, EvaluationContext ctx) {
+            for (int idx : patternIndexes) {
+                int predId = predicates[idx].id;
+                if (eligiblePredicateIds == null || eligiblePredicateIds.contains(predId)) {
+                    patternHits++;
+                    ctx.addTruePredicate(predId);
                 }
-                fullVerifications++;
             }
-
-            return matches;
         }
 
         /**
@@ -123,8 +177,14 @@ public final class StringOperatorEvaluator {
          */
         int countEligiblePredicates(IntSet eligiblePredicateIds) {
             if (eligiblePredicateIds == null) {
-                return predicates.length;
+                return contains.length + prefixes.length + suffixes.length;
             }
+            return countEligible(contains, eligiblePredicateIds)
+                    + countEligible(prefixes, eligiblePredicateIds)
+                    + countEligible(suffixes, eligiblePredicateIds);
+        }
+
+        private static int countEligible(StringPredicate[] predicates, IntSet eligiblePredicateIds) {
             int count = 0;
             for (StringPredicate pred : predicates) {
                 if (eligiblePredicateIds.contains(pred.id)) {
@@ -136,12 +196,13 @@ public final class StringOperatorEvaluator {
     }
 
     private record StringPredicate(int id, String pattern) {
+
     }
 
     public Metrics getMetrics() {
-        return new Metrics(candidatesFiltered, fullVerifications);
+        return new Metrics(valuesScanned, patternHits);
     }
 
-    public record Metrics(long candidatesFiltered, long fullVerifications) {
+    public record Metrics(long valuesScanned, long patternHits) {
     }
 }
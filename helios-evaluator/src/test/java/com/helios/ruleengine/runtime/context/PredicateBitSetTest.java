@@ -0,0 +1,84 @@
+package com.helios.ruleengine.runtime.context;
+
+import it.unimi.dsi.fastutil.ints.IntArrayList;
+import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+import it.unimi.dsi.fastutil.ints.IntSet;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.util.Random;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class PredicateBitSetTest {
+
+    @Test
+    @DisplayName("Should behave like a hash set for add, contains, remove and size")
+    void shouldMatchHashSetSemantics() {
+        PredicateBitSet bits = new PredicateBitSet(100);
+        IntSet reference = new IntOpenHashSet();
+        Random random = new Random(42);
+
+        for (int i = 0; i < 5_000; i++) {
+            int id = random.nextInt(300); // beyond initial capacity to exercise growth
+            if (random.nextInt(4) == 0) {
+                assertThat(bits.remove(id)).isEqualTo(reference.remove(id));
+            } else {
+                assertThat(bits.add(id)).isEqualTo(reference.add(id));
+            }
+        }
+
+        assertThat(bits).hasSize(reference.size());
+        assertThat(new IntOpenHashSet(bits)).isEqualTo(reference);
+        assertThat(bits.contains(-1)).isFalse();
+        assertThat(bits.contains(1_000_000)).isFalse();
+    }
+
+    @Test
+    @DisplayName("forEach should visit each set bit exactly once, also after remove and re-add")
+    void forEachShouldVisitEachBitOnce() {
+        PredicateBitSet bits = new PredicateBitSet(256);
+        bits.add(3);
+        bits.add(70);
+        bits.remove(70);
+        bits.add(70);
+        bits.add(255);
+
+        IntArrayList visited = new IntArrayList();
+        bits.forEach((int id) -> visited.add(id));
+
+        assertThat(visited).containsExactlyInAnyOrder(3, 70, 255);
+    }
+
+    @Test
+    @DisplayName("clear should reset only touched words and allow reuse")
+    void clearShouldResetForReuse() {
+        PredicateBitSet bits = new PredicateBitSet(1_024);
+        bits.addAll(IntArrayList.of(1, 64, 1_000));
+
+        bits.clear();
+
+        assertThat(bits).isEmpty();
+        assertThat(bits.contains(1)).isFalse();
+        assertThat(bits.contains(1_000)).isFalse();
+
+        bits.add(64);
+        assertThat(new IntOpenHashSet(bits)).containsExactly(64);
+    }
+
+    @Test
+    @DisplayName("or and copy should operate word-wise")
+    void orAndCopyShouldCombineSets() {
+        PredicateBitSet left = new PredicateBitSet(64);
+        left.addAll(IntArrayList.of(1, 2, 500));
+        PredicateBitSet right = new PredicateBitSet(1_024);
+        right.addAll(IntArrayList.of(2, 3, 900));
+
+        PredicateBitSet copy = left.copy();
+        left.or(right);
+
+        assertThat(new IntOpenHashSet(left)).containsExactlyInAnyOrder(1, 2, 3, 500, 900);
+        assertThat(left).hasSize(5);
+        assertThat(new IntOpenHashSet(copy)).containsExactlyInAnyOrder(1, 2, 500);
+    }
+}
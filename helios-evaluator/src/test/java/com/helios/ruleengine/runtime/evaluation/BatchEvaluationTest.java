@@ -0,0 +1,269 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.exceptions.CompilationException;
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Random;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class BatchEvaluationTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+
+    private static final String RULES_JSON = """
+            [
+              {
+                "rule_code": "HIGH_VALUE_US",
+                "priority": 100,
+                "conditions": [
+                  { "field": "amount", "operator": "GREATER_THAN", "value": 5000 },
+                  { "field": "country", "operator": "IS_ANY_OF", "value": ["US", "CA"] }
+                ]
+              },
+              {
+                "rule_code": "SMALL_AMOUNT",
+                "priority": 10,
+                "conditions": [
+                  { "field": "amount", "operator": "LESS_THAN", "value": 100 }
+                ]
+              },
+              {
+                "rule_code": "ADULT",
+                "priority": 20,
+                "conditions": [
+                  { "field": "age", "operator": "BETWEEN", "value": [18, 65] },
+                  { "field": "status", "operator": "EQUAL_TO", "value": "ACTIVE" }
+                ]
+              },
+              {
+                "rule_code": "NOT_BLOCKED",
+                "priority": 5,
+                "conditions": [
+                  { "field": "status", "operator": "IS_NONE_OF", "value": ["BLOCKED", "SUSPENDED"] }
+                ]
+              },
+              {
+                "rule_code": "PROMO_PRODUCT",
+                "priority": 30,
+                "conditions": [
+                  { "field": "product", "operator": "CONTAINS", "value": "PROMO" },
+                  { "field": "amount", "operator": "GREATER_THAN", "value": 50 }
+                ]
+              },
+              {
+                "rule_code": "LIMIT_BAND",
+                "priority": 15,
+                "conditions": [
+                  { "field": "amount", "operator": "GREATER_THAN_OR_EQUAL", "value": 1000 },
+                  { "field": "amount", "operator": "LESS_THAN_OR_EQUAL", "value": 2000 }
+                ]
+              },
+              {
+                "rule_code": "SETTLEMENT_WINDOW",
+                "priority": 12,
+                "conditions": [
+                  { "field": "event_ts", "operator": "BETWEEN", "value": [1700000000000, 1700000000999] }
+                ]
+              },
+              {
+                "rule_code": "ACCOUNT_RANGE",
+                "priority": 8,
+                "conditions": [
+                  { "field": "account", "operator": "GREATER_THAN", "value": 9007199254740992 },
+                  { "field": "account", "operator": "LESS_THAN", "value": 9007199254740995 }
+                ]
+              },
+              {
+                "rule_code": "CORPORATE_EMAIL",
+                "priority": 40,
+                "conditions": [
+                  { "field": "email", "operator": "REGEX", "value": ".*@company\\\\.com" }
+                ]
+              }
+            ]
+            """;
+
+    private RuleEvaluator createEvaluator(SelectionStrategy strategy) throws IOException, CompilationException {
+        Path rulesPath = Files.createTempFile("batch-rules", ".json");
+        Files.writeString(rulesPath, RULES_JSON);
+        EngineModel model = new RuleCompiler(NOOP_TRACER).compile(rulesPath, strategy);
+        return new RuleEvaluator(model, NOOP_TRACER, false);
+    }
+
+    private List<Event> randomEvents(int count, long seed) {
+        Random random = new Random(seed);
+        String[] countries = { "US", "CA", "GB", "DE" };
+        String[] statuses = { "ACTIVE", "BLOCKED", "SUSPENDED", "PENDING" };
+        String[] products = { "PROMO_BUNDLE", "STANDARD", "SUPER_PROMO", "GIFT" };
+        String[] emails = { "a@company.com", "b@other.com", "c@company.org" };
+
+        List<Event> events = new ArrayList<>(count);
+        for (int i = 0; i < count; i++) {
+            Map<String, Object> attrs = new HashMap<>();
+            // Leave fields out at random to exercise missing values
+            if (random.nextInt(5) != 0) {
+                attrs.put("amount", random.nextInt(10_000));
+            }
+            if (random.nextInt(5) != 0) {
+                attrs.put("country", countries[random.nextInt(countries.length)]);
+            }
+            if (random.nextInt(5) != 0) {
+                attrs.put("age", random.nextDouble() * 90);
+            }
+            if (random.nextInt(5) != 0) {
+                attrs.put("status", statuses[random.nextInt(statuses.length)]);
+            }
+            if (random.nextInt(3) == 0) {
+                attrs.put("product", products[random.nextInt(products.length)]);
+            }
+            if (random.nextInt(3) == 0) {
+                attrs.put("email", emails[random.nextInt(emails.length)]);
+            }
+            events.add(new Event("evt-" + i, "TEST", attrs));
+        }
+        return events;
+    }
+
+    private static List<String> ruleCodes(MatchResult result) {
+        return result.matchedRules().stream()
+                .map(MatchResult.MatchedRule::ruleCode)
+                .sorted()
+                .toList();
+    }
+
+    @Test
+    @DisplayName("Columnar batch evaluation should match per-event evaluation")
+    void batchShouldMatchPerEventEvaluation() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.ALL_MATCHES);
+        List<Event> events = randomEvents(1_000, 42L);
+
+        List<MatchResult> batchResults = evaluator.evaluateBatch(events);
+
+        assertThat(batchResults).hasSize(events.size());
+        for (int i = 0; i < events.size(); i++) {
+            MatchResult expected = evaluator.evaluate(events.get(i));
+            MatchResult actual = batchResults.get(i);
+            assertThat(actual.eventId()).isEqualTo(events.get(i).eventId());
+            assertThat(ruleCodes(actual))
+                    .as("matches for %s", events.get(i))
+                    .isEqualTo(ruleCodes(expected));
+        }
+    }
+
+    @Test
+    @DisplayName("Columnar batch evaluation should apply the selection strategy per event")
+    void batchShouldApplySelectionStrategy() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.FIRST_MATCH);
+        List<Event> events = randomEvents(500, 7L);
+
+        List<MatchResult> batchResults = evaluator.evaluateBatch(events);
+
+        for (int i = 0; i < events.size(); i++) {
+            assertThat(ruleCodes(batchResults.get(i)))
+                    .isEqualTo(ruleCodes(evaluator.evaluate(events.get(i))));
+        }
+    }
+
+    @Test
+    @DisplayName("Pooled batch buffers should not leak results between batches")
+    void consecutiveBatchesShouldBeIndependent() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.ALL_MATCHES);
+        List<Event> large = randomEvents(300, 1L);
+        List<Event> small = List.of(
+                new Event("only-status", "TEST", Map.of("status", "PENDING")),
+                new Event("empty", "TEST", Map.of()));
+        List<Event> mixed = new ArrayList<>(small);
+        mixed.addAll(randomEvents(40, 2L));
+
+        evaluator.evaluateBatch(large);
+        List<MatchResult> results = evaluator.evaluateBatch(mixed);
+
+        assertThat(ruleCodes(results.get(0))).containsExactly("NOT_BLOCKED");
+        assertThat(results.get(1).matchedRules()).isEmpty();
+        for (int i = 0; i < mixed.size(); i++) {
+            assertThat(ruleCodes(results.get(i)))
+                    .isEqualTo(ruleCodes(evaluator.evaluate(mixed.get(i))));
+        }
+    }
+
+    @Test
+    @DisplayName("Small batches should fall back to per-event evaluation")
+    void smallBatchShouldEvaluateEachEvent() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.ALL_MATCHES);
+        List<Event> events = List.of(
+                new Event("e1", "TEST", Map.of("amount", 20, "status", "ACTIVE", "age", 30)),
+                new Event("e2", "TEST", Map.of("amount", 9000, "country", "US")));
+
+        List<MatchResult> results = evaluator.evaluateBatch(events);
+
+        assertThat(ruleCodes(results.get(0))).containsExactly("ADULT", "NOT_BLOCKED", "SMALL_AMOUNT");
+        assertThat(ruleCodes(results.get(1))).containsExactly("HIGH_VALUE_US");
+    }
+
+    @Test
+    @DisplayName("Inclusive thresholds should match their bounds in batch and per-event evaluation")
+    void inclusiveThresholdsShouldMatchBounds() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.ALL_MATCHES);
+        int[] amounts = { 999, 1000, 1500, 2000, 2001 };
+        List<Event> events = new ArrayList<>();
+        for (int i = 0; i < 32; i++) { // Large enough for the columnar path
+            events.add(new Event("evt-" + i, "TEST", Map.of("amount", amounts[i % amounts.length])));
+        }
+
+        List<MatchResult> batchResults = evaluator.evaluateBatch(events);
+
+        for (int i = 0; i < events.size(); i++) {
+            int amount = amounts[i % amounts.length];
+            boolean inBand = amount >= 1000 && amount <= 2000;
+            assertThat(ruleCodes(batchResults.get(i)).contains("LIMIT_BAND")).as("amount=%d", amount).isEqualTo(inBand);
+            assertThat(ruleCodes(evaluator.evaluate(events.get(i))).contains("LIMIT_BAND")).isEqualTo(inBand);
+        }
+    }
+
+    @Test
+    @DisplayName("Timestamps and 64-bit ids should compare exactly in batch and per-event evaluation")
+    void longValuesShouldCompareExactly() throws Exception {
+        RuleEvaluator evaluator = createEvaluator(SelectionStrategy.ALL_MATCHES);
+        long[] timestamps = { 1_699_999_999_999L, 1_700_000_000_000L, 1_700_000_000_999L, 1_700_000_001_000L };
+        // 2^53 + 1 and 2^53 + 3 are not representable as double
+        long[] accounts = { 1L << 53, (1L << 53) + 1, (1L << 53) + 2, (1L << 53) + 3 };
+        List<Event> events = new ArrayList<>();
+        for (int i = 0; i < 32; i++) { // Large enough for the columnar path
+            events.add(new Event("evt-" + i, "TEST", Map.of(
+                    "event_ts", timestamps[i % timestamps.length],
+                    "account", accounts[i / timestamps.length % accounts.length])));
+        }
+
+        List<MatchResult> batchResults = evaluator.evaluateBatch(events);
+
+        for (int i = 0; i < events.size(); i++) {
+            long timestamp = timestamps[i % timestamps.length];
+            long account = accounts[i / timestamps.length % accounts.length];
+            List<String> expected = new ArrayList<>();
+            if (account > (1L << 53) && account < (1L << 53) + 3) {
+                expected.add("ACCOUNT_RANGE");
+            }
+            if (timestamp >= 1_700_000_000_000L && timestamp <= 1_700_000_000_999L) {
+                expected.add("SETTLEMENT_WINDOW");
+            }
+            assertThat(ruleCodes(batchResults.get(i))).as("ts=%d account=%d", timestamp, account).isEqualTo(expected);
+            assertThat(ruleCodes(evaluator.evaluate(events.get(i)))).isEqualTo(expected);
+        }
+    }
+}
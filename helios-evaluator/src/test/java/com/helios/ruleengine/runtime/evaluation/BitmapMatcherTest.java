@@ -0,0 +1,143 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+import java.util.StringJoiner;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Bitmap-intersection matching of small combinations must find exactly the
+ * rules counter-based matching finds.
+ */
+class BitmapMatcherTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int GRID = 40;
+
+    private static final List<Map<String, Object>> EVENTS = List.of(
+            Map.of("region", "R3", "score", 25),
+            Map.of("region", "R0", "score", 10),
+            Map.of("region", "R5"),
+            Map.of("score", 12),
+            Map.of("region", "R1", "score", 15, "age", 2, "tenure", 2),
+            Map.of("region", "R1", "score", 15, "age", 1, "tenure", 2));
+
+    private static EngineModel model;
+
+    // GRID x GRID two-predicate rules share each region and score predicate (dense
+    // size-2 bucket); single- and four-predicate rules stay counted
+    @BeforeAll
+    static void compile() throws Exception {
+        StringJoiner rules = new StringJoiner(",\n", "[\n", "\n]");
+        for (int i = 0; i < GRID; i++) {
+            for (int j = 0; j < GRID; j++) {
+                rules.add(String.format("{\"rule_code\":\"PAIR_%d_%d\",\"conditions\":[%s,%s]}",
+                        i, j, region(i), greaterThan("score", j * 10)));
+            }
+            rules.add(String.format("{\"rule_code\":\"SINGLE_%d\",\"conditions\":[%s]}",
+                    i, greaterThan("score", i * 10 + 5)));
+            rules.add(String.format("{\"rule_code\":\"QUAD_%d\",\"conditions\":[%s,%s,%s,%s]}",
+                    i, region(i), greaterThan("score", i * 10), greaterThan("age", i), greaterThan("tenure", i)));
+        }
+        Path rulesPath = Files.createTempFile("bitmap-matcher-rules", ".json");
+        Files.writeString(rulesPath, rules.toString());
+        model = new RuleCompiler(NOOP_TRACER).compile(rulesPath, SelectionStrategy.ALL_MATCHES);
+        Files.deleteIfExists(rulesPath);
+    }
+
+    private static String region(int i) {
+        return String.format("{\"field\":\"region\",\"operator\":\"EQUAL_TO\",\"value\":\"R%d\"}", i);
+    }
+
+    private static String greaterThan(String field, int threshold) {
+        return String.format("{\"field\":\"%s\",\"operator\":\"GREATER_THAN\",\"value\":%d}", field, threshold);
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private static List<String> evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return codes(evaluator.evaluate(new Event("evt", "TEST", attrs)));
+    }
+
+    @Test
+    @DisplayName("Compiler should bitmap-match only dense small-combination buckets")
+    void shouldSelectBitmapMatchingPerSizeBucket() {
+        assertThat(model.getBitmapMatchCombinations(2).getCardinality()).isEqualTo(GRID * GRID);
+        assertThat(model.getBitmapMatchCombinations(1).isEmpty()).isTrue();
+        assertThat(model.getMaxBitmapMatchSize()).isEqualTo(2);
+
+        // Counting index no longer holds bitmap-matched combinations
+        model.getCountingIndex().values().forEach(posting ->
+                assertThat(posting.intersects(model.getBitmapMatchCombinations(2))).isFalse());
+    }
+
+    @Test
+    @DisplayName("A pair should match only when both of its predicates are true")
+    void shouldMatchPairsOnBothPredicates() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("region", "R3", "score", 25)))
+                .containsExactlyInAnyOrder("PAIR_3_0", "PAIR_3_1", "PAIR_3_2", "SINGLE_0", "SINGLE_1");
+        // score > 10 is false at the threshold
+        assertThat(evaluate(evaluator, Map.of("region", "R0", "score", 10)))
+                .containsExactlyInAnyOrder("PAIR_0_0", "SINGLE_0");
+    }
+
+    @Test
+    @DisplayName("A missing field should leave its pairs unmatched")
+    void shouldNotMatchPairsWithMissingField() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        // One true predicate per pair only reaches the first hit layer
+        assertThat(evaluate(evaluator, Map.of("region", "R5"))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("score", 12))).containsExactly("SINGLE_0");
+    }
+
+    @Test
+    @DisplayName("Counted combinations sharing predicates with bitmap-matched pairs should still match")
+    void shouldMatchCountedCombinationsAlongsidePairs() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("region", "R1", "score", 15, "age", 2, "tenure", 2)))
+                .containsExactlyInAnyOrder("PAIR_1_0", "PAIR_1_1", "SINGLE_0", "QUAD_1");
+        assertThat(evaluate(evaluator, Map.of("region", "R1", "score", 15, "age", 1, "tenure", 2)))
+                .containsExactlyInAnyOrder("PAIR_1_0", "PAIR_1_1", "SINGLE_0");
+    }
+
+    @Test
+    @DisplayName("Cached, traced and batch evaluation should agree with bitmap matching")
+    void evaluationModesShouldAgree() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+        // Base conditions (region) restrict the eligible combinations
+        RuleEvaluator cached = new RuleEvaluator(model, NOOP_TRACER, true);
+        List<Event> events = EVENTS.stream().map(attrs -> new Event("evt", "TEST", attrs)).toList();
+
+        List<MatchResult> batch = evaluator.evaluateBatch(events);
+
+        for (int n = 0; n < events.size(); n++) {
+            List<String> direct = codes(evaluator.evaluate(events.get(n)));
+            assertThat(codes(cached.evaluate(events.get(n))))
+                    .as("cached matches for %s", events.get(n))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(batch.get(n))).containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(evaluator.evaluateWithTrace(events.get(n)).matchResult()))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+        }
+    }
+}
@@ -0,0 +1,132 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Random;
+import java.util.StringJoiner;
+import java.util.stream.Collectors;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * TOP_K and MAX_PRIORITY_N must return what sorting and truncating an
+ * ALL_MATCHES result would, without building the full match list.
+ */
+class BoundedSelectionTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int LIMIT = 3;
+    private static final String[] FAMILIES = { "fraud", "promo", "risk" };
+    private static final Comparator<MatchResult.MatchedRule> BEST_FIRST = Comparator
+            .comparingInt(MatchResult.MatchedRule::priority).reversed()
+            .thenComparing(MatchResult.MatchedRule::ruleCode);
+
+    private final Map<String, String> familyByRule = new HashMap<>();
+
+    // Many overlapping single-threshold rules so events match far more than LIMIT rules
+    private Path writeRules(int count, long seed) throws Exception {
+        Random random = new Random(seed);
+        StringJoiner rules = new StringJoiner(",\n", "[\n", "\n]");
+        for (int i = 0; i < count; i++) {
+            String code = "R" + i;
+            String family = random.nextInt(4) == 0 ? null : FAMILIES[random.nextInt(FAMILIES.length)];
+            familyByRule.put(code, family != null ? family : "");
+            rules.add(String.format(
+                    "{\"rule_code\":\"%s\",\"priority\":%d,%s\"conditions\":[{\"field\":\"amount\",\"operator\":\"GREATER_THAN\",\"value\":%d}]}",
+                    code, random.nextInt(5), family != null ? "\"family\":\"" + family + "\"," : "",
+                    random.nextInt(1_000)));
+        }
+        Path rulesPath = Files.createTempFile("bounded-selection-rules", ".json");
+        Files.writeString(rulesPath, rules.toString());
+        return rulesPath;
+    }
+
+    private static RuleEvaluator evaluator(Path rulesPath, SelectionStrategy strategy) throws Exception {
+        RuleCompiler compiler = new RuleCompiler(NOOP_TRACER);
+        compiler.setSelectionLimit(LIMIT);
+        return new RuleEvaluator(compiler.compile(rulesPath, strategy), NOOP_TRACER, false);
+    }
+
+    private static List<Event> events(int count) {
+        List<Event> events = new ArrayList<>(count);
+        for (int i = 0; i < count; i++) {
+            events.add(new Event("evt-" + i, "TEST", Map.of("amount", i * 1_100 / count)));
+        }
+        return events;
+    }
+
+    private static List<String> codes(List<MatchResult.MatchedRule> rules) {
+        return rules.stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private List<String> expectedTopPerFamily(MatchResult all) {
+        Map<String, List<MatchResult.MatchedRule>> byFamily = all.matchedRules().stream()
+                .collect(Collectors.groupingBy(rule -> familyByRule.get(rule.ruleCode())));
+        return byFamily.values().stream()
+                .flatMap(rules -> rules.stream().sorted(BEST_FIRST).limit(LIMIT))
+                .map(MatchResult.MatchedRule::ruleCode)
+                .sorted()
+                .toList();
+    }
+
+    @Test
+    @DisplayName("TOP_K should return the K best matches, best first")
+    void topKShouldMatchSortedAllMatches() throws Exception {
+        Path rulesPath = writeRules(200, 42L);
+        RuleEvaluator topK = evaluator(rulesPath, SelectionStrategy.TOP_K);
+        RuleEvaluator all = evaluator(rulesPath, SelectionStrategy.ALL_MATCHES);
+
+        for (Event event : events(100)) {
+            List<String> expected = codes(all.evaluate(event).matchedRules().stream()
+                    .sorted(BEST_FIRST).limit(LIMIT).toList());
+            assertThat(codes(topK.evaluate(event).matchedRules()))
+                    .as("top %d for %s", LIMIT, event)
+                    .containsExactlyElementsOf(expected);
+        }
+    }
+
+    @Test
+    @DisplayName("MAX_PRIORITY_N should return the N best matches of each family")
+    void maxPriorityNShouldMatchPerFamilySelection() throws Exception {
+        Path rulesPath = writeRules(200, 7L);
+        RuleEvaluator perFamily = evaluator(rulesPath, SelectionStrategy.MAX_PRIORITY_N);
+        RuleEvaluator all = evaluator(rulesPath, SelectionStrategy.ALL_MATCHES);
+
+        for (Event event : events(100)) {
+            List<String> actual = codes(perFamily.evaluate(event).matchedRules()).stream().sorted().toList();
+            assertThat(actual)
+                    .as("top %d per family for %s", LIMIT, event)
+                    .isEqualTo(expectedTopPerFamily(all.evaluate(event)));
+        }
+    }
+
+    @Test
+    @DisplayName("Bounded selection should give the same results in batch evaluation")
+    void batchShouldApplyBoundedSelection() throws Exception {
+        Path rulesPath = writeRules(100, 11L);
+        RuleEvaluator topK = evaluator(rulesPath, SelectionStrategy.TOP_K);
+        List<Event> events = events(64);
+
+        List<MatchResult> batch = topK.evaluateBatch(events);
+
+        for (int i = 0; i < events.size(); i++) {
+            assertThat(batch.get(i).matchedRules()).hasSizeLessThanOrEqualTo(LIMIT);
+            assertThat(codes(batch.get(i).matchedRules()))
+                    .isEqualTo(codes(topK.evaluate(events.get(i)).matchedRules()));
+        }
+    }
+}
@@ -0,0 +1,172 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * NOT_EQUAL_TO predicates left out of counting (complement predicates) must
+ * not change which rules match, on the counting, tiered, batch and traced paths.
+ */
+class ComplementMatchingTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+
+    // Tiers: HIGH 0, MID 1, LOW 2, OPEN 3. MID's status predicate is in MID's own
+    // tier, LOW's is first needed after LOW's country predicate (tier 0), and OPEN
+    // is made of a NOT_EQUAL_TO predicate only
+    private static final String RULES = """
+            [
+              {"rule_code": "HIGH", "priority": 100, "conditions": [
+                {"field": "country", "operator": "EQUAL_TO", "value": "US"},
+                {"field": "amount", "operator": "GREATER_THAN", "value": 1000}
+              ]},
+              {"rule_code": "MID", "priority": 50, "conditions": [
+                {"field": "merchant", "operator": "EQUAL_TO", "value": "M1"},
+                {"field": "status", "operator": "NOT_EQUAL_TO", "value": "SUSPENDED"}
+              ]},
+              {"rule_code": "LOW", "priority": 10, "conditions": [
+                {"field": "country", "operator": "EQUAL_TO", "value": "US"},
+                {"field": "status", "operator": "NOT_EQUAL_TO", "value": "BLOCKED"}
+              ]},
+              {"rule_code": "OPEN", "priority": 1, "conditions": [
+                {"field": "country", "operator": "NOT_EQUAL_TO", "value": "RU"}
+              ]}
+            ]
+            """;
+
+    private static final List<Map<String, Object>> EVENTS = List.of(
+            Map.of("country", "US", "amount", 5_000, "status", "OK"),
+            Map.of("country", "US", "amount", 50, "status", "BLOCKED"),
+            Map.of("country", "US", "amount", 50, "status", "OK"),
+            Map.of("country", "US", "amount", 50, "status", "BLOCKED", "merchant", "M1"),
+            Map.of("merchant", "M1", "status", "OK"),
+            Map.of("merchant", "M1", "status", "SUSPENDED", "country", "FR"),
+            Map.of("merchant", "M1", "country", "RU"));
+
+    private static EngineModel compile(SelectionStrategy strategy) throws Exception {
+        Path rulesPath = Files.createTempFile("complement-rules", ".json");
+        Files.writeString(rulesPath, RULES);
+        try {
+            return new RuleCompiler(NOOP_TRACER).compile(rulesPath, strategy);
+        } finally {
+            Files.deleteIfExists(rulesPath);
+        }
+    }
+
+    private static int combinationOf(EngineModel model, String ruleCode) {
+        for (int c = 0; c < model.getNumRules(); c++) {
+            if (model.getCombinationRuleCodes(c).contains(ruleCode)) {
+                return c;
+            }
+        }
+        throw new AssertionError("No combination for " + ruleCode);
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private static List<String> evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return codes(evaluator.evaluate(new Event("evt", "TEST", attrs)));
+    }
+
+    @Test
+    @DisplayName("Compiler should leave only same-tier NOT_EQUAL_TO predicates of mixed combinations out of counting")
+    void shouldSelectComplementPredicates() throws Exception {
+        EngineModel model = compile(SelectionStrategy.FIRST_MATCH);
+
+        int mid = combinationOf(model, "MID");
+        assertThat(model.getComplementPredicateIds(mid)).hasSize(1);
+        assertThat(model.getCountedPredicateCounts()[mid]).isEqualTo(1);
+        int status = model.getComplementPredicateIds(mid)[0];
+        assertThat(model.getCountingIndex().get(status) == null
+                || !model.getCountingIndex().get(status).contains(mid)).isTrue();
+
+        // First needed by a later tier than LOW's country predicate: still counted
+        int low = combinationOf(model, "LOW");
+        assertThat(model.getComplementPredicateIds(low)).isEmpty();
+        assertThat(model.getCountedPredicateCounts()[low]).isEqualTo(2);
+
+        // Nothing else would touch OPEN's counter
+        int open = combinationOf(model, "OPEN");
+        assertThat(model.getComplementPredicateIds(open)).isEmpty();
+        assertThat(model.getCountedPredicateCounts()[open]).isEqualTo(1);
+    }
+
+    @Test
+    @DisplayName("Complement matching should find every matching rule")
+    void shouldMatchAllRules() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(compile(SelectionStrategy.ALL_MATCHES), NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, EVENTS.get(0))).containsExactlyInAnyOrder("HIGH", "LOW", "OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(1))).containsExactly("OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(2))).containsExactlyInAnyOrder("LOW", "OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(3))).containsExactlyInAnyOrder("MID", "OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(5))).containsExactly("OPEN");
+    }
+
+    @Test
+    @DisplayName("A missing field should fail its NOT_EQUAL_TO predicate, counted or complement")
+    void shouldNotMatchMissingField() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(compile(SelectionStrategy.ALL_MATCHES), NOOP_TRACER, false);
+
+        // No country: the complement-only OPEN does not match
+        assertThat(evaluate(evaluator, EVENTS.get(4))).containsExactly("MID");
+        // No status: MID's complement predicate is false
+        assertThat(evaluate(evaluator, EVENTS.get(6))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("country", "US", "amount", 50))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("Tiered FIRST_MATCH should check complement predicates on completion")
+    void shouldSelectTopPriorityWithTiers() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(compile(SelectionStrategy.FIRST_MATCH), NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, EVENTS.get(0))).containsExactly("HIGH");
+        // LOW's country predicate is counted in tier 0, its status predicate only in tier 2
+        assertThat(evaluate(evaluator, EVENTS.get(1))).containsExactly("OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(2))).containsExactly("LOW");
+        assertThat(evaluate(evaluator, EVENTS.get(3))).containsExactly("MID");
+        assertThat(evaluate(evaluator, EVENTS.get(4))).containsExactly("MID");
+        assertThat(evaluate(evaluator, EVENTS.get(5))).containsExactly("OPEN");
+        assertThat(evaluate(evaluator, EVENTS.get(6))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("Cached, traced and batch evaluation should agree with complement matching")
+    void evaluationModesShouldAgree() throws Exception {
+        EngineModel model = compile(SelectionStrategy.ALL_MATCHES);
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+        RuleEvaluator cached = new RuleEvaluator(model, NOOP_TRACER, true);
+        List<Event> events = EVENTS.stream().map(attrs -> new Event("evt", "TEST", attrs)).toList();
+
+        List<MatchResult> batch = evaluator.evaluateBatch(events);
+
+        for (int n = 0; n < events.size(); n++) {
+            List<String> direct = codes(evaluator.evaluate(events.get(n)));
+            assertThat(codes(cached.evaluate(events.get(n))))
+                    .as("cached matches for %s", events.get(n))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(batch.get(n)))
+                    .as("batch matches for %s", events.get(n))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(evaluator.evaluateWithTrace(events.get(n)).matchResult()))
+                    .as("traced matches for %s", events.get(n))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+        }
+    }
+}
@@ -0,0 +1,173 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.EvaluationBackend;
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+import java.util.StringJoiner;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * The DECISION_DAG backend routes events to candidate combinations and verifies
+ * them; it must match exactly what counting matches.
+ */
+class DecisionDagMatchingTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int MERCHANTS = 12;
+
+    private static final List<Map<String, Object>> EVENTS = List.of(
+            Map.of("merchant", "M3", "amount", 1_000),
+            Map.of("amount", 1_000),
+            Map.of("merchant", "M99", "amount", 1_000),
+            Map.of("merchant", "M0", "amount", 200),
+            Map.of("merchant", "M0", "amount", 200, "status", "OK"),
+            Map.of("merchant", "M0", "amount", 200, "status", "BLOCKED"));
+
+    // MERCHANT_k routes on merchant == Mk; ANY_MERCHANT leaves merchant unconstrained,
+    // so it is a candidate on every edge, the default one included
+    private static String rules() {
+        StringJoiner rules = new StringJoiner(",\n", "[\n", "\n]");
+        for (int k = 0; k < MERCHANTS; k++) {
+            rules.add(String.format("""
+                    {"rule_code": "MERCHANT_%d", "priority": %d, "conditions": [
+                      {"field": "merchant", "operator": "EQUAL_TO", "value": "M%d"},
+                      {"field": "amount", "operator": "GREATER_THAN", "value": 100}
+                    ]}""", k, k, k));
+        }
+        rules.add("""
+                {"rule_code": "ANY_MERCHANT", "priority": 5, "conditions": [
+                  {"field": "amount", "operator": "GREATER_THAN", "value": 500}
+                ]}""");
+        rules.add("""
+                {"rule_code": "NOT_BLOCKED", "priority": 20, "conditions": [
+                  {"field": "merchant", "operator": "EQUAL_TO", "value": "M0"},
+                  {"field": "status", "operator": "NOT_EQUAL_TO", "value": "BLOCKED"}
+                ]}""");
+        return rules.toString();
+    }
+
+    private static EngineModel compile(String rules, SelectionStrategy strategy, EvaluationBackend backend)
+            throws Exception {
+        Path rulesPath = Files.createTempFile("decision-dag-rules", ".json");
+        Files.writeString(rulesPath, rules);
+        try {
+            RuleCompiler compiler = new RuleCompiler(NOOP_TRACER);
+            compiler.setEvaluationBackend(backend);
+            return compiler.compile(rulesPath, strategy);
+        } finally {
+            Files.deleteIfExists(rulesPath);
+        }
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private static List<String> evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return codes(evaluator.evaluate(new Event("evt", "TEST", attrs)));
+    }
+
+    @Test
+    @DisplayName("Compiler should build a decision DAG only for the DECISION_DAG backend")
+    void shouldBuildDagForBackend() throws Exception {
+        EngineModel dag = compile(rules(), SelectionStrategy.ALL_MATCHES, EvaluationBackend.DECISION_DAG);
+        EngineModel counting = compile(rules(), SelectionStrategy.ALL_MATCHES, EvaluationBackend.COUNTING);
+
+        assertThat(dag.getEvaluationBackend()).isEqualTo(EvaluationBackend.DECISION_DAG);
+        assertThat(dag.getDecisionDag()).isNotNull();
+        assertThat(dag.getDecisionDag().isLeaf(dag.getDecisionDag().root())).isFalse();
+        assertThat(counting.getEvaluationBackend()).isEqualTo(EvaluationBackend.COUNTING);
+        assertThat(counting.getDecisionDag()).isNull();
+    }
+
+    @Test
+    @DisplayName("Stats should recommend a backend suited to the ruleset")
+    void shouldRecommendBackend() throws Exception {
+        // Every rule is behind a selective equality test: routing leaves one candidate
+        StringJoiner routable = new StringJoiner(",\n", "[\n", "\n]");
+        StringJoiner ranges = new StringJoiner(",\n", "[\n", "\n]");
+        for (int i = 0; i < 120; i++) {
+            routable.add(String.format("{\"rule_code\":\"R%d\",\"priority\":1,\"conditions\":["
+                    + "{\"field\":\"merchant\",\"operator\":\"EQUAL_TO\",\"value\":\"M%d\"},"
+                    + "{\"field\":\"amount\",\"operator\":\"GREATER_THAN\",\"value\":%d}]}", i, i, i * 5));
+            ranges.add(String.format("{\"rule_code\":\"R%d\",\"priority\":1,\"conditions\":"
+                    + "[{\"field\":\"amount\",\"operator\":\"GREATER_THAN\",\"value\":%d}]}", i, i));
+        }
+
+        Map<String, Object> selective = compile(routable.toString(), SelectionStrategy.ALL_MATCHES,
+                EvaluationBackend.COUNTING).getStats().metadata();
+        assertThat(selective.get("recommendedBackend")).isEqualTo(EvaluationBackend.DECISION_DAG.name());
+        assertThat((double) selective.get("estimatedDecisionDagCost"))
+                .isLessThan((double) selective.get("estimatedCountingCost"));
+
+        // Nothing to route on: every event would verify every combination
+        Map<String, Object> unroutable = compile(ranges.toString(), SelectionStrategy.ALL_MATCHES,
+                EvaluationBackend.COUNTING).getStats().metadata();
+        assertThat(unroutable.get("recommendedBackend")).isEqualTo(EvaluationBackend.COUNTING.name());
+    }
+
+    @Test
+    @DisplayName("An absent or untested field value should follow the default edge")
+    void shouldFollowDefaultEdge() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(
+                compile(rules(), SelectionStrategy.ALL_MATCHES, EvaluationBackend.DECISION_DAG), NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("merchant", "M3", "amount", 1_000)))
+                .containsExactlyInAnyOrder("MERCHANT_3", "ANY_MERCHANT");
+        assertThat(evaluate(evaluator, Map.of("amount", 1_000))).containsExactly("ANY_MERCHANT");
+        assertThat(evaluate(evaluator, Map.of("merchant", "M99", "amount", 1_000))).containsExactly("ANY_MERCHANT");
+        assertThat(evaluate(evaluator, Map.of("merchant", "M3"))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("A NOT_EQUAL_TO on an absent field should not match after routing")
+    void shouldVerifyNotEqualToOnAbsentField() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(
+                compile(rules(), SelectionStrategy.ALL_MATCHES, EvaluationBackend.DECISION_DAG), NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("merchant", "M0", "amount", 200))).containsExactly("MERCHANT_0");
+        assertThat(evaluate(evaluator, Map.of("merchant", "M0", "amount", 200, "status", "OK")))
+                .containsExactlyInAnyOrder("MERCHANT_0", "NOT_BLOCKED");
+        assertThat(evaluate(evaluator, Map.of("merchant", "M0", "amount", 200, "status", "BLOCKED")))
+                .containsExactly("MERCHANT_0");
+    }
+
+    @Test
+    @DisplayName("Decision DAG matching should select the same rules as counting")
+    void shouldSelectLikeCounting() throws Exception {
+        for (SelectionStrategy strategy : List.of(
+                SelectionStrategy.ALL_MATCHES, SelectionStrategy.TOP_K, SelectionStrategy.MAX_PRIORITY_N)) {
+            EngineModel dagModel = compile(rules(), strategy, EvaluationBackend.DECISION_DAG);
+            RuleEvaluator dag = new RuleEvaluator(dagModel, NOOP_TRACER, false);
+            RuleEvaluator cachedDag = new RuleEvaluator(dagModel, NOOP_TRACER, true);
+            RuleEvaluator counting = new RuleEvaluator(
+                    compile(rules(), strategy, EvaluationBackend.COUNTING), NOOP_TRACER, false);
+
+            for (Map<String, Object> attrs : EVENTS) {
+                List<String> expected = evaluate(counting, attrs);
+                assertThat(evaluate(dag, attrs))
+                        .as("%s selection for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(expected);
+                assertThat(evaluate(cachedDag, attrs))
+                        .as("cached %s selection for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(expected);
+                assertThat(codes(dag.evaluateWithTrace(new Event("evt", "TEST", attrs)).matchResult()))
+                        .as("traced %s selection for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(expected);
+            }
+        }
+    }
+}
@@ -0,0 +1,195 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.ModelLayout;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.model.PackedPostings;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.roaringbitmap.RoaringBitmap;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+import java.util.StringJoiner;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Models compiled with the OFF_HEAP layout read packed postings in place and
+ * must match exactly what the HEAP layout matches.
+ */
+class OffHeapLayoutTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final int GRID = 40;
+
+    private static final List<Map<String, Object>> EVENTS = List.of(
+            Map.of("country", "US", "merchant", "M1", "amount", 5_000, "status", "OK"),
+            Map.of("country", "CA", "merchant", "M1"),
+            Map.of("country", "US", "amount", 50, "status", "BLOCKED"),
+            Map.of("country", "US"),
+            Map.of("tier", "GOLD", "a", "A3", "b", "B7"),
+            Map.of("tier", "SILVER", "a", "A3", "b", "B7"),
+            Map.of("a", "A3", "b", "B7"));
+
+    // A few plain rules, plus grid rules (a, b, tier) that share few predicates,
+    // dense enough for bitmap matching
+    private static String rules() {
+        StringJoiner rules = new StringJoiner(",\n", "[\n", "\n]");
+        rules.add("""
+                {"rule_code": "VIP", "priority": 10, "conditions": [
+                  {"field": "country", "operator": "IS_ANY_OF", "value": ["US", "CA"]},
+                  {"field": "merchant", "operator": "EQUAL_TO", "value": "M1"}
+                ]}""");
+        rules.add("""
+                {"rule_code": "LARGE", "priority": 5, "conditions": [
+                  {"field": "amount", "operator": "GREATER_THAN", "value": 1000}
+                ]}""");
+        rules.add("""
+                {"rule_code": "NOT_BLOCKED", "priority": 1, "conditions": [
+                  {"field": "country", "operator": "EQUAL_TO", "value": "US"},
+                  {"field": "status", "operator": "NOT_EQUAL_TO", "value": "BLOCKED"}
+                ]}""");
+        for (int a = 0; a < GRID; a++) {
+            for (int b = 0; b < GRID; b++) {
+                rules.add(String.format("{\"rule_code\":\"G%d_%d\",\"priority\":%d,\"conditions\":["
+                        + "{\"field\":\"a\",\"operator\":\"EQUAL_TO\",\"value\":\"A%d\"},"
+                        + "{\"field\":\"b\",\"operator\":\"EQUAL_TO\",\"value\":\"B%d\"},"
+                        + "{\"field\":\"tier\",\"operator\":\"EQUAL_TO\",\"value\":\"GOLD\"}]}",
+                        a, b, (a + b) % 3, a, b));
+            }
+        }
+        return rules.toString();
+    }
+
+    private static EngineModel compile(SelectionStrategy strategy, ModelLayout layout) throws Exception {
+        Path rulesPath = Files.createTempFile("off-heap-rules", ".json");
+        Files.writeString(rulesPath, rules());
+        try {
+            RuleCompiler compiler = new RuleCompiler(NOOP_TRACER);
+            compiler.setLayout(layout);
+            return compiler.compile(rulesPath, strategy);
+        } finally {
+            Files.deleteIfExists(rulesPath);
+        }
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private static List<String> evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return codes(evaluator.evaluate(new Event("evt", "TEST", attrs)));
+    }
+
+    @Test
+    @DisplayName("OFF_HEAP models should hold the same postings as HEAP models")
+    void shouldPackPostings() throws Exception {
+        EngineModel heap = compile(SelectionStrategy.ALL_MATCHES, ModelLayout.HEAP);
+        EngineModel offHeap = compile(SelectionStrategy.ALL_MATCHES, ModelLayout.OFF_HEAP);
+
+        assertThat(heap.getLayout()).isEqualTo(ModelLayout.HEAP);
+        assertThat(heap.getOffHeapBytes()).isZero();
+        assertThat(offHeap.getLayout()).isEqualTo(ModelLayout.OFF_HEAP);
+        assertThat(offHeap.getOffHeapBytes()).isPositive();
+        assertThat(offHeap.getMaxBitmapMatchSize()).isPositive();
+
+        assertThat(offHeap.getInvertedIndex()).isEqualTo(heap.getInvertedIndex());
+        assertThat(offHeap.getCountingIndex()).isEqualTo(heap.getCountingIndex());
+        assertThat(offHeap.getTierCountingIndex()).isEqualTo(heap.getTierCountingIndex());
+        for (int predId = 0; predId < heap.getUniquePredicates().length; predId++) {
+            RoaringBitmap expected = heap.getCountingIndex().get(predId);
+            if (expected == null) {
+                assertThat(offHeap.getCountingPostings(predId)).isNull();
+            } else {
+                assertThat(offHeap.getCountingPostings(predId).toArray()).isEqualTo(expected.toArray());
+            }
+        }
+    }
+
+    @Test
+    @DisplayName("OFF_HEAP matching should find counted, complement and bitmap-matched rules")
+    void shouldMatchFromPackedPostings() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(
+                compile(SelectionStrategy.ALL_MATCHES, ModelLayout.OFF_HEAP), NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("country", "US", "merchant", "M1", "amount", 5_000, "status", "OK")))
+                .containsExactlyInAnyOrder("VIP", "LARGE", "NOT_BLOCKED");
+        assertThat(evaluate(evaluator, Map.of("country", "CA", "merchant", "M1"))).containsExactly("VIP");
+        assertThat(evaluate(evaluator, Map.of("country", "US", "amount", 50, "status", "BLOCKED"))).isEmpty();
+        // NOT_EQUAL_TO is false on an absent field
+        assertThat(evaluate(evaluator, Map.of("country", "US"))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("tier", "GOLD", "a", "A3", "b", "B7"))).containsExactly("G3_7");
+        assertThat(evaluate(evaluator, Map.of("tier", "SILVER", "a", "A3", "b", "B7"))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("a", "A3", "b", "B7"))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("OFF_HEAP matching should select the same rules as HEAP matching")
+    void shouldMatchLikeHeap() throws Exception {
+        for (SelectionStrategy strategy : List.of(SelectionStrategy.ALL_MATCHES, SelectionStrategy.FIRST_MATCH,
+                SelectionStrategy.TOP_K)) {
+            EngineModel heapModel = compile(strategy, ModelLayout.HEAP);
+            EngineModel offHeapModel = compile(strategy, ModelLayout.OFF_HEAP);
+            RuleEvaluator heap = new RuleEvaluator(heapModel, NOOP_TRACER, false);
+            RuleEvaluator offHeap = new RuleEvaluator(offHeapModel, NOOP_TRACER, false);
+            RuleEvaluator offHeapCached = new RuleEvaluator(offHeapModel, NOOP_TRACER, true);
+
+            for (Map<String, Object> attrs : EVENTS) {
+                Event event = new Event("evt", "TEST", attrs);
+                List<String> expected = codes(heap.evaluate(event));
+                assertThat(codes(offHeap.evaluate(event)))
+                        .as("%s matches for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(expected);
+                assertThat(codes(offHeapCached.evaluate(event)))
+                        .as("%s cached matches for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(expected);
+                assertThat(codes(offHeap.evaluateWithTrace(event).matchResult()))
+                        .as("%s traced matches for %s", strategy, attrs)
+                        .containsExactlyInAnyOrderElementsOf(codes(heap.evaluateWithTrace(event).matchResult()));
+            }
+        }
+    }
+
+    @Test
+    @DisplayName("Packed postings should survive Java serialization")
+    void shouldSerializePackedPostings() throws Exception {
+        Int2ObjectMap<RoaringBitmap> index = new Int2ObjectOpenHashMap<>();
+        index.put(0, RoaringBitmap.bitmapOf(1, 5, 9));
+        index.put(3, RoaringBitmap.bitmapOf(2, 70_000, 140_000));
+        RoaringBitmap dense = new RoaringBitmap();
+        dense.add(0L, 10_000L);
+        dense.runOptimize();
+        index.put(4, dense);
+        PackedPostings packed = PackedPostings.pack(index);
+
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        try (ObjectOutputStream out = new ObjectOutputStream(bytes)) {
+            out.writeObject(packed);
+        }
+        PackedPostings copy;
+        try (ObjectInputStream in = new ObjectInputStream(new ByteArrayInputStream(bytes.toByteArray()))) {
+            copy = (PackedPostings) in.readObject();
+        }
+
+        assertThat(packed.size()).isEqualTo(3);
+        assertThat(packed.get(1)).isNull();
+        assertThat(packed.get(7)).isNull();
+        assertThat(packed.toMap()).isEqualTo(index);
+        assertThat(copy.toMap()).isEqualTo(index);
+        assertThat(copy.get(3).contains(70_000)).isTrue();
+    }
+}
@@ -0,0 +1,147 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * FIRST_MATCH short-circuit evaluation over priority tiers must select exactly
+ * the highest-priority matches of a full (ALL_MATCHES) evaluation.
+ */
+class PriorityTierEvaluationTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+
+    // LOW only uses a predicate of the top tier, so it completes while tier 0 is counted
+    private static final String SHARED_PREDICATE_RULES = """
+            [
+              {"rule_code": "HIGH", "priority": 100, "conditions": [
+                {"field": "amount", "operator": "GREATER_THAN", "value": 1000},
+                {"field": "country", "operator": "EQUAL_TO", "value": "US"}
+              ]},
+              {"rule_code": "MID", "priority": 50, "conditions": [
+                {"field": "merchant", "operator": "EQUAL_TO", "value": "M1"}
+              ]},
+              {"rule_code": "LOW", "priority": 10, "conditions": [
+                {"field": "amount", "operator": "GREATER_THAN", "value": 1000}
+              ]}
+            ]
+            """;
+
+    private static EngineModel compile(String rulesJson, SelectionStrategy strategy) throws Exception {
+        Path rulesPath = Files.createTempFile("priority-tier-rules", ".json");
+        Files.writeString(rulesPath, rulesJson);
+        try {
+            return new RuleCompiler(NOOP_TRACER).compile(rulesPath, strategy);
+        } finally {
+            Files.deleteIfExists(rulesPath);
+        }
+    }
+
+    private static MatchResult evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return evaluator.evaluate(new Event("evt", "TEST", attrs));
+    }
+
+    @Test
+    @DisplayName("Tiered FIRST_MATCH should skip lower tiers once the top tier matches")
+    void shouldStopAfterTopMatchingTier() throws Exception {
+        String rules = """
+                [
+                  {"rule_code": "VIP", "priority": 100, "conditions": [
+                    {"field": "tier", "operator": "EQUAL_TO", "value": "GOLD"}
+                  ]},
+                  {"rule_code": "VIP_ALIAS", "priority": 100, "conditions": [
+                    {"field": "tier", "operator": "EQUAL_TO", "value": "GOLD"}
+                  ]},
+                  {"rule_code": "LARGE", "priority": 50, "conditions": [
+                    {"field": "amount", "operator": "GREATER_THAN", "value": 1000}
+                  ]},
+                  {"rule_code": "PROMO", "priority": 10, "conditions": [
+                    {"field": "product", "operator": "CONTAINS", "value": "PROMO"}
+                  ]}
+                ]
+                """;
+        RuleEvaluator evaluator = new RuleEvaluator(compile(rules, SelectionStrategy.FIRST_MATCH), NOOP_TRACER, false);
+        Map<String, Object> attrs = Map.of("tier", "GOLD", "amount", 5_000, "product", "PROMO_BOX");
+
+        MatchResult gold = evaluator.evaluate(new Event("gold", "TEST", attrs));
+
+        assertThat(gold.matchedRules())
+                .extracting(MatchResult.MatchedRule::ruleCode)
+                .containsExactlyInAnyOrder("VIP", "VIP_ALIAS");
+        assertThat(gold.predicatesEvaluated()).isLessThan(3); // amount and product never evaluated
+        assertThat(evaluator.getMetrics().getSnapshot().get("priorityTiersSkipped")).isEqualTo(2L);
+
+        // Without the top tier, evaluation falls through to the next matching tier
+        MatchResult silver = evaluator.evaluate(new Event("silver", "TEST",
+                Map.of("tier", "SILVER", "amount", 5_000, "product", "PROMO_BOX")));
+        assertThat(silver.matchedRules())
+                .extracting(MatchResult.MatchedRule::ruleCode)
+                .containsExactly("LARGE");
+    }
+
+    @Test
+    @DisplayName("A lower tier completing early should not stop evaluation before a higher tier")
+    void shouldNotStopOnEarlyLowerTierCompletion() throws Exception {
+        RuleEvaluator evaluator = new RuleEvaluator(
+                compile(SHARED_PREDICATE_RULES, SelectionStrategy.FIRST_MATCH), NOOP_TRACER, false);
+
+        // LOW completes in tier 0, but MID (tier 1) still outranks it
+        assertThat(evaluate(evaluator, Map.of("amount", 5_000, "country", "CA", "merchant", "M1")).matchedRules())
+                .extracting(MatchResult.MatchedRule::ruleCode)
+                .containsExactly("MID");
+        assertThat(evaluate(evaluator, Map.of("amount", 5_000, "country", "CA", "merchant", "M2")).matchedRules())
+                .extracting(MatchResult.MatchedRule::ruleCode)
+                .containsExactly("LOW");
+        assertThat(evaluate(evaluator, Map.of("amount", 5_000, "country", "US", "merchant", "M1")).matchedRules())
+                .extracting(MatchResult.MatchedRule::ruleCode)
+                .containsExactly("HIGH");
+        assertThat(evaluate(evaluator, Map.of("amount", 500, "country", "US")).matchedRules()).isEmpty();
+    }
+
+    @Test
+    @DisplayName("Tiered FIRST_MATCH should select like a full evaluation, with and without base conditions")
+    void shouldSelectLikeFullEvaluation() throws Exception {
+        RuleEvaluator allMatches = new RuleEvaluator(
+                compile(SHARED_PREDICATE_RULES, SelectionStrategy.ALL_MATCHES), NOOP_TRACER, false);
+        EngineModel firstMatchModel = compile(SHARED_PREDICATE_RULES, SelectionStrategy.FIRST_MATCH);
+        RuleEvaluator tiered = new RuleEvaluator(firstMatchModel, NOOP_TRACER, false);
+        RuleEvaluator tieredCached = new RuleEvaluator(firstMatchModel, NOOP_TRACER, true);
+
+        for (Map<String, Object> attrs : List.<Map<String, Object>>of(
+                Map.of("amount", 5_000, "country", "US", "merchant", "M1"),
+                Map.of("amount", 5_000, "merchant", "M1"),
+                Map.of("amount", 5_000),
+                Map.of("country", "US", "merchant", "M1"),
+                Map.of("merchant", "M2"))) {
+            int top = evaluate(allMatches, attrs).matchedRules().stream()
+                    .mapToInt(MatchResult.MatchedRule::priority).max().orElse(Integer.MIN_VALUE);
+            String[] expected = evaluate(allMatches, attrs).matchedRules().stream()
+                    .filter(rule -> rule.priority() == top)
+                    .map(MatchResult.MatchedRule::ruleCode)
+                    .toArray(String[]::new);
+
+            assertThat(evaluate(tiered, attrs).matchedRules())
+                    .as("tiered selection for %s", attrs)
+                    .extracting(MatchResult.MatchedRule::ruleCode)
+                    .containsExactlyInAnyOrder(expected);
+            assertThat(evaluate(tieredCached, attrs).matchedRules())
+                    .as("cached tiered selection for %s", attrs)
+                    .extracting(MatchResult.MatchedRule::ruleCode)
+                    .containsExactlyInAnyOrder(expected);
+        }
+    }
+}
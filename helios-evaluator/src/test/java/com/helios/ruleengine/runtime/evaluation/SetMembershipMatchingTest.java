@@ -0,0 +1,168 @@
+package com.helios.ruleengine.runtime.evaluation;
+
+import com.helios.ruleengine.api.model.Event;
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.api.model.SelectionStrategy;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Map;
+import java.util.StringJoiner;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Large IS_ANY_OF lists compile to set-membership predicates instead of a
+ * Cartesian expansion, and must match exactly what the expansion would.
+ */
+class SetMembershipMatchingTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+    private static final long BEYOND_INT = 5_000_000_000L;
+
+    private static EngineModel model;
+
+    // LARGE_A and LARGE_B share their 300-country list; LARGE_B's small status
+    // list is still expanded. MIXED expands its 10 regions, which leaves no budget
+    // for its 30 accounts: 29 int members and one beyond the int range (a Long).
+    // MIXED shares no IS_ANY_OF field with the others, so no list is factorized.
+    @BeforeAll
+    static void compile() throws Exception {
+        String rules = String.format("""
+                [
+                  {"rule_code": "LARGE_A", "conditions": [
+                    {"field": "country", "operator": "IS_ANY_OF", "value": %1$s},
+                    {"field": "merchant", "operator": "IS_ANY_OF", "value": %2$s}
+                  ]},
+                  {"rule_code": "LARGE_B", "conditions": [
+                    {"field": "country", "operator": "IS_ANY_OF", "value": %1$s},
+                    {"field": "merchant", "operator": "IS_ANY_OF", "value": %3$s},
+                    {"field": "status", "operator": "IS_ANY_OF", "value": ["ACTIVE", "PENDING"]}
+                  ]},
+                  {"rule_code": "MIXED", "conditions": [
+                    {"field": "region", "operator": "IS_ANY_OF", "value": %4$s},
+                    {"field": "account", "operator": "IS_ANY_OF", "value": %5$s}
+                  ]}
+                ]
+                """,
+                strings("C", 0, 300), numbers(0, 300), numbers(100, 300), strings("R", 0, 10),
+                numbers(0, 29).replace("]", "," + BEYOND_INT + "]"));
+        Path rulesPath = Files.createTempFile("set-membership-rules", ".json");
+        Files.writeString(rulesPath, rules);
+        try {
+            model = new RuleCompiler(NOOP_TRACER).compile(rulesPath, SelectionStrategy.ALL_MATCHES);
+        } finally {
+            Files.deleteIfExists(rulesPath);
+        }
+    }
+
+    private static String strings(String prefix, int from, int count) {
+        StringJoiner values = new StringJoiner(",", "[", "]");
+        for (int k = from; k < from + count; k++) {
+            values.add("\"" + prefix + k + "\"");
+        }
+        return values.toString();
+    }
+
+    private static String numbers(int from, int count) {
+        StringJoiner values = new StringJoiner(",", "[", "]");
+        for (int k = from; k < from + count; k++) {
+            values.add(String.valueOf(k));
+        }
+        return values.toString();
+    }
+
+    private static List<String> codes(MatchResult result) {
+        return result.matchedRules().stream().map(MatchResult.MatchedRule::ruleCode).toList();
+    }
+
+    private static List<String> evaluate(RuleEvaluator evaluator, Map<String, Object> attrs) {
+        return codes(evaluator.evaluate(new Event("evt", "TEST", attrs)));
+    }
+
+    @Test
+    @DisplayName("Compiler should keep large IS_ANY_OF lists as one set-membership predicate")
+    void shouldNotExpandLargeLists() {
+        // LARGE_A: 1 combination, LARGE_B: 2 (status expanded), MIXED: 10 (regions expanded)
+        assertThat(model.getNumRules()).isEqualTo(13);
+        // The shared country set, two merchant sets and the account set
+        assertThat(Arrays.stream(model.getUniquePredicates())
+                .filter(p -> p.operator() == Predicate.Operator.IS_ANY_OF)
+                .count())
+                .isEqualTo(4L);
+    }
+
+    @Test
+    @DisplayName("Set-membership predicates should match their members only")
+    void shouldMatchMembers() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("country", "C5", "merchant", 150, "status", "ACTIVE")))
+                .containsExactlyInAnyOrder("LARGE_A", "LARGE_B");
+        assertThat(evaluate(evaluator, Map.of("country", "C299", "merchant", 350, "status", "PENDING")))
+                .containsExactly("LARGE_B");
+        assertThat(evaluate(evaluator, Map.of("country", "C5", "merchant", 150, "status", "CLOSED")))
+                .containsExactly("LARGE_A");
+        assertThat(evaluate(evaluator, Map.of("country", "C300", "merchant", 150, "status", "ACTIVE")))
+                .isEmpty();
+    }
+
+    @Test
+    @DisplayName("A missing field should leave its set-membership predicate false")
+    void shouldNotMatchMissingField() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("country", "C5", "status", "ACTIVE"))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("merchant", 150, "status", "ACTIVE"))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("account", 7))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("A set mixing Integer and Long members should match both")
+    void shouldMatchMixedIntegerAndLongMembers() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+
+        assertThat(evaluate(evaluator, Map.of("region", "R3", "account", 7))).containsExactly("MIXED");
+        assertThat(evaluate(evaluator, Map.of("region", "R3", "account", BEYOND_INT))).containsExactly("MIXED");
+        assertThat(evaluate(evaluator, Map.of("region", "R3", "account", 29))).isEmpty();
+        assertThat(evaluate(evaluator, Map.of("region", "R3", "account", BEYOND_INT + 1))).isEmpty();
+    }
+
+    @Test
+    @DisplayName("Cached, traced and batch evaluation should agree with set-membership matching")
+    void evaluationModesShouldAgree() {
+        RuleEvaluator evaluator = new RuleEvaluator(model, NOOP_TRACER, false);
+        RuleEvaluator cached = new RuleEvaluator(model, NOOP_TRACER, true);
+        List<Event> events = List.<Map<String, Object>>of(
+                        Map.of("country", "C5", "merchant", 150, "status", "ACTIVE"),
+                        Map.of("country", "C299", "merchant", 350, "status", "PENDING"),
+                        Map.of("country", "C5", "status", "ACTIVE"),
+                        Map.of("region", "R9", "account", BEYOND_INT),
+                        Map.of("region", "R10", "account", 7))
+                .stream()
+                .map(attrs -> new Event("evt", "TEST", attrs))
+                .toList();
+
+        List<MatchResult> batch = evaluator.evaluateBatch(events);
+
+        for (int n = 0; n < events.size(); n++) {
+            List<String> direct = codes(evaluator.evaluate(events.get(n)));
+            assertThat(codes(cached.evaluate(events.get(n))))
+                    .as("cached matches for %s", events.get(n))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(batch.get(n))).containsExactlyInAnyOrderElementsOf(direct);
+            assertThat(codes(evaluator.evaluateWithTrace(events.get(n)).matchResult()))
+                    .containsExactlyInAnyOrderElementsOf(direct);
+        }
+    }
+}
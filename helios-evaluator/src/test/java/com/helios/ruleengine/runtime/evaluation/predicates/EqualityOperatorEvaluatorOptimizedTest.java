@@ -4,6 +4,7 @@
  */
 package com.helios.ruleengine.runtime.evaluation.predicates;
 
+import com.helios.ruleengine.api.model.Predicate;
 import com.helios.ruleengine.compiler.RuleCompiler;
 import com.helios.ruleengine.runtime.context.EvaluationContext;
 import com.helios.ruleengine.runtime.model.EngineModel;
@@ -17,6 +18,7 @@ import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.Test;
 
 import java.nio.file.Path;
+import java.util.List;
 
 import static org.assertj.core.api.Assertions.*;
 
@@ -25,7 +27,7 @@ import static org.assertj.core.api.Assertions.*;
  *
  * Tests verify:
  * - O(1) hash lookup for EQUAL_TO predicates
- * - Selectivity-based ordering for NOT_EQUAL_TO predicates
+ * - Complement evaluation for NOT_EQUAL_TO predicates
  * - Fast path for single-predicate fields
  * - Correct handling of eligibility filters
  * - Performance improvements over naive implementation
@@ -95,6 +97,31 @@ class EqualityOperatorEvaluatorOptimizedTest {
         assertThat(metrics.totalEvaluations()).isEqualTo(1);
     }
 
+    @Test
+    @DisplayName("Should evaluate NOT_EQUAL_TO predicates by complement")
+    void shouldEvaluateNotEqualToByComplement() {
+        for (String field : new String[] { "STATUS", "TIER" }) {
+            int fieldId = model.getFieldDictionary().getId(field);
+            List<Predicate> notEqualTo = model.getFieldToPredicates().get(fieldId).stream()
+                    .filter(p -> p.operator() == Predicate.Operator.NOT_EQUAL_TO)
+                    .toList();
+            assertThat(notEqualTo).isNotEmpty();
+
+            for (Predicate probe : notEqualTo) {
+                EvaluationContext ctx = new EvaluationContext(model.getNumRules(), 100);
+
+                evaluator.evaluateEquality(fieldId, probe.value(), ctx, null);
+
+                // Every NOT_EQUAL_TO predicate on the field is true except the probed value's
+                for (Predicate p : notEqualTo) {
+                    assertThat(ctx.getTruePredicates().contains(model.getPredicateId(p)))
+                            .as("%s != %s for value %s", field, p.value(), probe.value())
+                            .isEqualTo(!p.value().equals(probe.value()));
+                }
+            }
+        }
+    }
+
     @Test
     @DisplayName("Should respect eligibility filter")
     void shouldRespectEligibilityFilter() {
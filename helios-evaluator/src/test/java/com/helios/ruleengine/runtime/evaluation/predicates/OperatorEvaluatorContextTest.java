@@ -0,0 +1,413 @@
+/*
+ * Copyright (c) 2025 Helios Rule Engine
+ * Licensed under the Apache License, Version 2.0
+ */
+package com.helios.ruleengine.runtime.evaluation.predicates;
+
+import com.helios.ruleengine.api.model.Predicate;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.context.EvaluationContext;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import com.helios.ruleengine.runtime.operators.PredicateEvaluator;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import it.unimi.dsi.fastutil.ints.Int2ObjectMap;
+import it.unimi.dsi.fastutil.ints.Int2ObjectOpenHashMap;
+import it.unimi.dsi.fastutil.ints.IntOpenHashSet;
+import it.unimi.dsi.fastutil.ints.IntSet;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.StringJoiner;
+import java.util.regex.Pattern;
+
+import static org.assertj.core.api.Assertions.*;
+
+/**
+ * Unit tests for operator evaluators writing matches directly into the EvaluationContext.
+ *
+ * Tests verify:
+ * - Vectorized numeric groups (more predicates than vector lanes) with and without eligibility
+ * - Large GT/LT groups evaluated by binary search over sorted thresholds
+ * - Inclusive GTE/LTE thresholds in both the vectorized and sorted paths
+ * - Large BETWEEN groups evaluated by interval tree stabbing queries
+ * - Epoch-millisecond timestamps and 64-bit ids compared exactly in long lanes
+ * - Case-insensitive CONTAINS on raw (non dictionary-encoded) values
+ * - Overlapping CONTAINS keywords matched in one automaton pass
+ * - STARTS_WITH / ENDS_WITH matched by prefix and suffix trie walks
+ * - Pooled regex matchers do not leak state between evaluations
+ * - Literal pre-filtered regexes agree with Pattern, and runaway matches are cut off
+ */
+class OperatorEvaluatorContextTest {
+
+    private static final Tracer tracer = OpenTelemetry.noop().getTracer("test");
+    private static final int THRESHOLDS = 37;
+    private static final int SORTED_THRESHOLDS = 150;
+    private static final int PRICE_BANDS = 200;
+    private static final int LONG_RULES = 70;
+    private static final long EPOCH_MS = 1_700_000_000_123L;
+    private static final long ACCOUNT_BASE = (1L << 53) + 1; // Not representable as double
+    private static final long BIG = 1L << 60; // Exact as float, while BIG + 1 rounds to it
+    private static final String[] KEYWORDS = {
+            "he", "she", "his", "hers", "ushers", "amazon", "amazon prime", "prime", "zon", "café"
+    };
+    private static final String[] REFERENCE_PATTERNS = {
+            "^ORD-[0-9]{4}-(US|CA)$", "ORD.*", "[0-9]+", ".*-CA", "x*x*x*x*x*x*[yz]",
+            // Escapes whose arguments are not literals
+            "^\\x41$", "\\u00e9", "^\\pL+$", "\\0101", "(?<n>a)\\k<n>", "(a)\\11",
+            "\\N{LATIN SMALL LETTER E WITH ACUTE}"
+    };
+    private static final String[] AFFIXES = { "https://", "https://shop.", "http", "4111", "41", ".com", "shop.com", "m" };
+
+    private EngineModel model;
+    private PredicateEvaluator evaluator;
+    private EvaluationContext ctx;
+
+    @BeforeEach
+    void setUp() throws Exception {
+        StringJoiner rules = new StringJoiner(",", "[", "]");
+        for (int i = 0; i < THRESHOLDS; i++) {
+            rules.add(rule("GT_" + i, "AMOUNT", "GREATER_THAN", String.valueOf(i * 10)));
+            rules.add(rule("LT_" + i, "AMOUNT", "LESS_THAN", String.valueOf(i * 10 + 5)));
+            rules.add(rule("GTE_" + i, "AMOUNT", "GREATER_THAN_OR_EQUAL", String.valueOf(i * 10)));
+            rules.add(rule("LTE_" + i, "AMOUNT", "LESS_THAN_OR_EQUAL", String.valueOf(i * 10 + 5)));
+            rules.add(rule("RANGE_" + i, "SCORE", "BETWEEN", "[" + i + "," + (i + 10) + "]"));
+        }
+        rules.add(rule("PROMO", "PRODUCT", "CONTAINS", "\"promo\""));
+        rules.add(rule("X", "PRODUCT", "CONTAINS", "\"x\""));
+        for (int i = 0; i < SORTED_THRESHOLDS; i++) {
+            // Unsorted, with duplicate thresholds; float-exact so both paths agree with doubles
+            int threshold = (i * 37) % 100;
+            rules.add(rule("BAL_GT_" + i, "BALANCE", "GREATER_THAN", threshold + (i % 2 == 0 ? ".5" : "")));
+            rules.add(rule("BAL_LT_" + i, "BALANCE", "LESS_THAN", String.valueOf(threshold)));
+            rules.add(rule("BAL_GTE_" + i, "BALANCE", "GREATER_THAN_OR_EQUAL", String.valueOf(threshold)));
+            rules.add(rule("BAL_LTE_" + i, "BALANCE", "LESS_THAN_OR_EQUAL", threshold + ".5"));
+        }
+        for (int i = 0; i < PRICE_BANDS; i++) {
+            // Overlapping, nested and single-point bands
+            int low = (i * 53) % 150;
+            rules.add(rule("BAND_" + i, "PRICE", "BETWEEN", "[" + low + "," + (low + (i * 7) % 60) + "]"));
+        }
+        for (int i = 0; i < LONG_RULES; i++) {
+            // Sorted, lane and interval groups over values floats (and doubles, for ids) would round
+            rules.add(rule("TS_GT_" + i, "EVENT_TS", "GREATER_THAN", String.valueOf(EPOCH_MS + i)));
+            rules.add(rule("TS_IN_" + i, "EVENT_TS", "BETWEEN", "[" + (EPOCH_MS + 3 * i) + "," + (EPOCH_MS + 3 * i + 1) + "]"));
+            rules.add(rule("ACCT_" + i, "ACCOUNT", "BETWEEN",
+                    "[" + (ACCOUNT_BASE + 10L * i) + "," + (ACCOUNT_BASE + 10L * i + 4) + "]"));
+            if (i < 20) {
+                rules.add(rule("TS_LTE_" + i, "EVENT_TS", "LESS_THAN_OR_EQUAL", String.valueOf(EPOCH_MS + 7 * i)));
+                rules.add(rule("ACCT_GTE_" + i, "ACCOUNT", "GREATER_THAN_OR_EQUAL", String.valueOf(ACCOUNT_BASE + 33L * i)));
+            }
+        }
+        // One small lane group per operator; bounds one apart from a float-exact value
+        rules.add(rule("BIG_GT", "BIG_ID", "GREATER_THAN", String.valueOf(BIG)));
+        rules.add(rule("BIG_GTE", "BIG_ID", "GREATER_THAN_OR_EQUAL", String.valueOf(BIG + 1)));
+        rules.add(rule("BIG_LT", "BIG_ID", "LESS_THAN", String.valueOf(BIG + 1)));
+        rules.add(rule("BIG_LTE", "BIG_ID", "LESS_THAN_OR_EQUAL", String.valueOf(BIG - 1)));
+        rules.add(rule("BIG_IN", "BIG_ID", "BETWEEN", "[" + (BIG + 1) + "," + (BIG + 2) + "]"));
+        for (int i = 0; i < KEYWORDS.length; i++) {
+            rules.add(rule("KW_" + i, "MERCHANT", "CONTAINS", "\"" + KEYWORDS[i] + "\""));
+        }
+        for (int i = 0; i < AFFIXES.length; i++) {
+            rules.add(rule("PRE_" + i, "URL", "STARTS_WITH", "\"" + AFFIXES[i] + "\""));
+            rules.add(rule("SUF_" + i, "URL", "ENDS_WITH", "\"" + AFFIXES[i] + "\""));
+        }
+        for (int i = 0; i < REFERENCE_PATTERNS.length; i++) {
+            rules.add(rule("REF_" + i, "REFERENCE", "REGEX",
+                    "\"" + REFERENCE_PATTERNS[i].replace("\\", "\\\\") + "\""));
+        }
+        rules.add(rule("CORPORATE", "EMAIL", "REGEX", "\".*@company\\\\.com\""));
+
+        Path rulesPath = Files.createTempFile("operator-context-rules", ".json");
+        Files.writeString(rulesPath, rules.toString());
+        model = new RuleCompiler(tracer).compile(rulesPath);
+        evaluator = new PredicateEvaluator(model);
+        ctx = new EvaluationContext(model.getNumRules(), 100);
+    }
+
+    private static String rule(String code, String field, String operator, String value) {
+        return String.format("{\"rule_code\":\"%s\",\"conditions\":[{\"field\":\"%s\",\"operator\":\"%s\",\"value\":%s}]}",
+                code, field, operator, value);
+    }
+
+    private int fieldId(String field) {
+        return model.getFieldDictionary().getId(field);
+    }
+
+    private IntSet evaluate(String field, Object value, IntSet eligible) {
+        Int2ObjectMap<Object> attributes = new Int2ObjectOpenHashMap<>();
+        attributes.put(fieldId(field), value);
+        ctx.reset();
+        evaluator.evaluateField(fieldId(field), attributes, ctx, eligible);
+        return new IntOpenHashSet(ctx.getTruePredicates());
+    }
+
+    private IntSet expectedNumeric(String field, double value, IntSet eligible) {
+        IntSet expected = new IntOpenHashSet();
+        Predicate[] predicates = model.getUniquePredicates();
+        for (int id = 0; id < predicates.length; id++) {
+            Predicate p = predicates[id];
+            if (p.fieldId() != fieldId(field) || (eligible != null && !eligible.contains(id))) {
+                continue;
+            }
+            boolean matches = switch (p.operator()) {
+                case GREATER_THAN -> value > ((Number) p.value()).doubleValue();
+                case LESS_THAN -> value < ((Number) p.value()).doubleValue();
+                case GREATER_THAN_OR_EQUAL -> value >= ((Number) p.value()).doubleValue();
+                case LESS_THAN_OR_EQUAL -> value <= ((Number) p.value()).doubleValue();
+                case BETWEEN -> {
+                    List<?> range = (List<?>) p.value();
+                    yield value >= ((Number) range.get(0)).doubleValue()
+                            && value <= ((Number) range.get(1)).doubleValue();
+                }
+                default -> false;
+            };
+            if (matches) {
+                expected.add(id);
+            }
+        }
+        return expected;
+    }
+
+    // Exact (BigDecimal) comparison, independent of float/double/long lanes
+    private IntSet expectedExact(String field, Number value) {
+        IntSet expected = new IntOpenHashSet();
+        if (value instanceof Double d && d.isNaN()) {
+            return expected;
+        }
+        BigDecimal v = exact(value);
+        Predicate[] predicates = model.getUniquePredicates();
+        for (int id = 0; id < predicates.length; id++) {
+            Predicate p = predicates[id];
+            if (p.fieldId() != fieldId(field)) {
+                continue;
+            }
+            boolean matches = switch (p.operator()) {
+                case GREATER_THAN -> v.compareTo(exact(p.value())) > 0;
+                case LESS_THAN -> v.compareTo(exact(p.value())) < 0;
+                case GREATER_THAN_OR_EQUAL -> v.compareTo(exact(p.value())) >= 0;
+                case LESS_THAN_OR_EQUAL -> v.compareTo(exact(p.value())) <= 0;
+                case BETWEEN -> {
+                    List<?> range = (List<?>) p.value();
+                    yield v.compareTo(exact(range.get(0))) >= 0 && v.compareTo(exact(range.get(1))) <= 0;
+                }
+                default -> false;
+            };
+            if (matches) {
+                expected.add(id);
+            }
+        }
+        return expected;
+    }
+
+    private static BigDecimal exact(Object number) {
+        return number instanceof Long || number instanceof Integer
+                ? BigDecimal.valueOf(((Number) number).longValue())
+                : new BigDecimal(((Number) number).doubleValue());
+    }
+
+    @Test
+    @DisplayName("Vectorized GT/GTE/LT/LTE groups should add exactly the passing predicates")
+    void shouldEvaluateVectorizedThresholds() {
+        for (double amount : new double[]{-1, 0, 95, 180, 183.5, 185, 365, 1000}) {
+            assertThat(evaluate("AMOUNT", amount, null))
+                    .as("amount=%s", amount)
+                    .isEqualTo(expectedNumeric("AMOUNT", amount, null));
+        }
+    }
+
+    @Test
+    @DisplayName("Vectorized BETWEEN group should be inclusive on both bounds")
+    void shouldEvaluateVectorizedRanges() {
+        for (int score = -1; score <= THRESHOLDS + 11; score++) {
+            assertThat(evaluate("SCORE", score, null))
+                    .as("score=%s", score)
+                    .isEqualTo(expectedNumeric("SCORE", score, null));
+        }
+    }
+
+    @Test
+    @DisplayName("Large GT/LT groups should emit exactly the thresholds on the matching side")
+    void shouldBinarySearchSortedThresholds() {
+        for (double balance : new double[]{-1, 0, 0.5, 37, 37.5, 50, 99, 99.5, 100, 1000}) {
+            assertThat(evaluate("BALANCE", balance, null))
+                    .as("balance=%s", balance)
+                    .isEqualTo(expectedNumeric("BALANCE", balance, null));
+        }
+
+        IntSet eligible = new IntOpenHashSet();
+        for (int id = 0; id < model.getUniquePredicates().length; id += 2) {
+            eligible.add(id);
+        }
+        assertThat(evaluate("BALANCE", 42.0, eligible)).isEqualTo(expectedNumeric("BALANCE", 42.0, eligible));
+        assertThat(evaluator.getMetrics().numericMetrics().sortedSearches()).isPositive();
+    }
+
+    @Test
+    @DisplayName("Large BETWEEN groups should return every band containing the value")
+    void shouldStabIntervalIndex() {
+        for (double price = -2; price <= 215; price += 0.5) {
+            assertThat(evaluate("PRICE", price, null))
+                    .as("price=%s", price)
+                    .isEqualTo(expectedNumeric("PRICE", price, null));
+        }
+
+        IntSet eligible = new IntOpenHashSet();
+        for (int id = 0; id < model.getUniquePredicates().length; id += 3) {
+            eligible.add(id);
+        }
+        assertThat(evaluate("PRICE", 75.0, eligible)).isEqualTo(expectedNumeric("PRICE", 75.0, eligible));
+        assertThat(evaluator.getMetrics().numericMetrics().intervalQueries()).isPositive();
+    }
+
+    @Test
+    @DisplayName("Timestamps and 64-bit ids should be compared exactly, one unit apart")
+    void shouldCompareLongValuesExactly() {
+        for (long offset = -2; offset <= 215; offset++) {
+            long timestamp = EPOCH_MS + offset;
+            assertThat(evaluate("EVENT_TS", timestamp, null))
+                    .as("timestamp=%s", timestamp)
+                    .isEqualTo(expectedExact("EVENT_TS", timestamp));
+            long account = ACCOUNT_BASE + 3 * offset;
+            assertThat(evaluate("ACCOUNT", account, null))
+                    .as("account=%s", account)
+                    .isEqualTo(expectedExact("ACCOUNT", account));
+        }
+        assertThat(evaluate("EVENT_TS", EPOCH_MS + 10, null))
+                .isNotEqualTo(evaluate("EVENT_TS", EPOCH_MS + 11, null));
+        assertThat(evaluate("ACCOUNT", ACCOUNT_BASE + 4, null))
+                .isNotEqualTo(evaluate("ACCOUNT", ACCOUNT_BASE + 5, null));
+
+        // Fractional, out-of-range and NaN values against whole-number bounds
+        for (double timestamp : new double[]{EPOCH_MS - 0.5, EPOCH_MS + 0.5, EPOCH_MS + 20.25, 1e30, -1e30, Double.NaN}) {
+            assertThat(evaluate("EVENT_TS", timestamp, null))
+                    .as("timestamp=%s", timestamp)
+                    .isEqualTo(expectedExact("EVENT_TS", timestamp));
+        }
+
+        IntSet eligible = new IntOpenHashSet();
+        for (int id = 0; id < model.getUniquePredicates().length; id += 2) {
+            eligible.add(id);
+        }
+        IntSet expected = expectedExact("ACCOUNT", ACCOUNT_BASE + 41);
+        expected.retainAll(eligible);
+        assertThat(evaluate("ACCOUNT", ACCOUNT_BASE + 41, eligible)).isEqualTo(expected);
+        assertThat(evaluator.getMetrics().numericMetrics().longLaneEvaluations()).isPositive();
+    }
+
+    @Test
+    @DisplayName("Bounds above 2^53 that round to a float-exact value should not take float lanes")
+    void shouldNotRoundLargeBoundsIntoFloatLanes() {
+        for (long value : new long[]{BIG - 2, BIG - 1, BIG, BIG + 1, BIG + 2, BIG + 3}) {
+            assertThat(evaluate("BIG_ID", value, null))
+                    .as("value=%s", value)
+                    .isEqualTo(expectedExact("BIG_ID", value));
+        }
+        // Float-exact event value one below the GTE and BETWEEN bounds: only BIG_LT holds
+        assertThat(evaluate("BIG_ID", BIG, null)).hasSize(1);
+        assertThat(evaluate("BIG_ID", (double) BIG, null)).isEqualTo(expectedExact("BIG_ID", (double) BIG));
+    }
+
+    @Test
+    @DisplayName("Eligibility filter should restrict numeric matches and the evaluated count")
+    void shouldRespectEligibilityForNumericGroups() {
+        IntSet eligible = new IntOpenHashSet();
+        for (int id = 0; id < model.getUniquePredicates().length; id += 3) {
+            eligible.add(id);
+        }
+
+        IntSet matches = evaluate("AMOUNT", 200.0, eligible);
+
+        assertThat(matches).isEqualTo(expectedNumeric("AMOUNT", 200.0, eligible));
+        long eligibleOnField = eligible.intStream()
+                .filter(id -> model.getUniquePredicates()[id].fieldId() == fieldId("AMOUNT"))
+                .count();
+        assertThat(ctx.getPredicatesEvaluated()).isEqualTo((int) eligibleOnField);
+    }
+
+    @Test
+    @DisplayName("CONTAINS should match raw values case-insensitively")
+    void shouldMatchContainsOnRawValues() {
+        IntSet matches = evaluate("PRODUCT", "Summer-Promo-Box", null);
+
+        assertThat(matches).hasSize(2);
+        assertThat(evaluate("PRODUCT", "standard", null)).isEmpty();
+    }
+
+    @Test
+    @DisplayName("CONTAINS should report every overlapping keyword exactly like a substring check")
+    void shouldMatchOverlappingKeywords() {
+        Predicate[] predicates = model.getUniquePredicates();
+        for (String value : new String[]{"USHERS", "Amazon Prime Video", "she sells his shells", "CAFÉ hers", "", "xyz"}) {
+            IntSet expected = new IntOpenHashSet();
+            for (int id = 0; id < predicates.length; id++) {
+                Predicate p = predicates[id];
+                if (p.fieldId() == fieldId("MERCHANT")
+                        && value.toUpperCase().contains(((String) p.value()).toUpperCase())) {
+                    expected.add(id);
+                }
+            }
+            assertThat(evaluate("MERCHANT", value, null)).as("merchant=%s", value).isEqualTo(expected);
+        }
+    }
+
+    @Test
+    @DisplayName("STARTS_WITH and ENDS_WITH should report every matching prefix and suffix")
+    void shouldMatchPrefixesAndSuffixes() {
+        Predicate[] predicates = model.getUniquePredicates();
+        for (String value : new String[]{"HTTPS://Shop.com", "4111111111111111", "http://example.org/m", "", "m"}) {
+            String upper = value.toUpperCase();
+            IntSet expected = new IntOpenHashSet();
+            for (int id = 0; id < predicates.length; id++) {
+                Predicate p = predicates[id];
+                if (p.fieldId() != fieldId("URL")) {
+                    continue;
+                }
+                String pattern = ((String) p.value()).toUpperCase();
+                if (p.operator() == Predicate.Operator.STARTS_WITH ? upper.startsWith(pattern) : upper.endsWith(pattern)) {
+                    expected.add(id);
+                }
+            }
+            assertThat(evaluate("URL", value, null)).as("url=%s", value).isEqualTo(expected);
+        }
+    }
+
+    @Test
+    @DisplayName("Pooled regex matchers should not carry state between evaluations")
+    void shouldReuseRegexMatchers() {
+        assertThat(evaluate("EMAIL", "alice@company.com", null)).hasSize(1);
+        assertThat(evaluate("EMAIL", "bob@other.com", null)).isEmpty();
+        assertThat(evaluate("EMAIL", "carol@company.com", null)).hasSize(1);
+    }
+
+    @Test
+    @DisplayName("Pre-filtered regexes should match exactly what Pattern matches")
+    void shouldPrefilterRegexesByRequiredLiterals() {
+        Predicate[] predicates = model.getUniquePredicates();
+        for (String value : new String[]{"ORD-1234-CA", "ORD-12-US", "order", "2024", "REF-CA", "xxy", "",
+                "A", "é", "abc", "aa", "aa1"}) {
+            IntSet expected = new IntOpenHashSet();
+            for (int id = 0; id < predicates.length; id++) {
+                Predicate p = predicates[id];
+                if (p.fieldId() == fieldId("REFERENCE") && Pattern.matches((String) p.value(), value)) {
+                    expected.add(id);
+                }
+            }
+            assertThat(evaluate("REFERENCE", value, null)).as("reference=%s", value).isEqualTo(expected);
+        }
+    }
+
+    @Test
+    @DisplayName("Catastrophic backtracking should be cut off by the match budget")
+    void shouldStopRunawayRegexes() {
+        IntSet matches = evaluate("REFERENCE", "x".repeat(40), null);
+
+        assertThat(matches).isEmpty();
+        assertThat(evaluator.getMetrics().regexMetrics().budgetExceeded()).isEqualTo(1);
+    }
+}
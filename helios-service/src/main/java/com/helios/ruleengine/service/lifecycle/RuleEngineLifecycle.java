@@ -4,6 +4,7 @@ import com.helios.ruleengine.api.model.RuleDefinition;
 import com.helios.ruleengine.api.model.RuleMetadata;
 import com.helios.ruleengine.infra.management.EngineModelManager;
 import com.helios.ruleengine.infra.telemetry.TracingService;
+import com.helios.ruleengine.runtime.model.EngineModelSnapshot;
 import com.helios.ruleengine.service.monitoring.RuleMetricsAggregator;
 import com.helios.ruleengine.service.repository.JdbcRuleRepository;
 import io.quarkus.runtime.ShutdownEvent;
@@ -11,8 +12,11 @@ import io.quarkus.runtime.StartupEvent;
 import jakarta.enterprise.context.ApplicationScoped;
 import jakarta.enterprise.event.Observes;
 import jakarta.inject.Inject;
+import org.eclipse.microprofile.config.inject.ConfigProperty;
 
+import java.nio.file.Path;
 import java.util.List;
+import java.util.Optional;
 import java.util.logging.Level;
 import java.util.logging.Logger;
 
@@ -21,7 +25,9 @@ import java.util.logging.Logger;
  * Handles startup and shutdown events using Quarkus lifecycle callbacks.
  *
  * On startup, loads rules from the database (the sole source of truth)
- * and compiles them into the active engine model.
+ * and compiles them into the active engine model. If a model snapshot path is
+ * configured, a snapshot compiled from the same rules is loaded instead of
+ * recompiling, and a fresh one is written after compiling.
  */
 @ApplicationScoped
 public class RuleEngineLifecycle {
@@ -40,6 +46,12 @@ public class RuleEngineLifecycle {
     @Inject
     RuleMetricsAggregator metricsAggregator;
 
+    /**
+     * Binary model snapshot used to skip compilation on startup (disabled if unset).
+     */
+    @ConfigProperty(name = "helios.model.snapshot.path")
+    Optional<String> snapshotPath;
+
     /**
      * Called when the application starts.
      * Loads rules from the database and compiles the engine model.
@@ -76,10 +88,25 @@ public class RuleEngineLifecycle {
                     .map(this::toRuleDefinition)
                     .toList();
 
+            Optional<Path> snapshot = snapshotPath.filter(p -> !p.isBlank()).map(Path::of);
+            long fingerprint = EngineModelSnapshot.fingerprint(definitions);
+            if (snapshot.isPresent() && modelManager.loadSnapshot(snapshot.get(), fingerprint)) {
+                logger.info("Loaded " + enabledRules.size() + " rules from model snapshot " + snapshot.get());
+                return;
+            }
+
             modelManager.compileFromRules(definitions, null);
             logger.info("Loaded and compiled " + enabledRules.size() + " rules from database " +
                         "(" + allRules.size() + " total, " + (allRules.size() - enabledRules.size()) + " disabled)");
 
+            if (snapshot.isPresent()) {
+                try {
+                    modelManager.writeSnapshot(snapshot.get(), fingerprint);
+                } catch (Exception e) {
+                    logger.log(Level.WARNING, "Failed to write model snapshot " + snapshot.get(), e);
+                }
+            }
+
         } catch (Exception e) {
             logger.log(Level.SEVERE, "Failed to load rules from database on startup. " +
                        "Engine will start with empty model.", e);
@@ -167,15 +167,21 @@ public class RuleEvaluationResource {
      *   <li>FULL: + Field values (~53% overhead)</li>
      * </ul>
      *
+     * <p>Optional {@code parallel} parameter spreads the batch across the service's
+     * batch pool (multi-core); result order is unchanged. When omitted, the
+     * {@code helios.evaluation.batch.parallel.enabled} setting applies.
+     *
      * @param events list of events to evaluate
      * @param level trace detail level (default: NONE for performance)
+     * @param parallel evaluate partitions of the batch concurrently (default: configured)
      * @return batch evaluation result with statistics
      */
     @POST
     @Path("/batch")
     public Response evaluateBatch(
             List<Event> events,
-            @QueryParam("level") @DefaultValue("NONE") TraceLevel level) {
+            @QueryParam("level") @DefaultValue("NONE") TraceLevel level,
+            @QueryParam("parallel") Boolean parallel) {
         Span span = tracer.spanBuilder("http-evaluate-batch").startSpan();
         try (Scope scope = span.makeCurrent()) {
             if (events == null || events.isEmpty()) {
@@ -193,7 +199,12 @@ public class RuleEvaluationResource {
             span.setAttribute("eventCount", events.size());
             span.setAttribute("traceLevel", level.name());
 
-            BatchEvaluationResult result = evaluationService.evaluateBatchWithStats(events, level);
+            BatchEvaluationResult result = parallel != null
+                    ? evaluationService.evaluateBatchWithStats(events, level, parallel)
+                    : evaluationService.evaluateBatchWithStats(events, level);
+            if (parallel != null) {
+                span.setAttribute("parallel", parallel);
+            }
 
             span.setAttribute("matchRate", result.stats().matchRate());
             span.setAttribute("avgEvaluationTimeNanos", result.stats().avgEvaluationTimeNanos());
@@ -6,7 +6,6 @@ import com.helios.ruleengine.api.model.Event;
 import com.helios.ruleengine.api.model.EvaluationResult;
 import com.helios.ruleengine.api.model.ExplanationResult;
 import com.helios.ruleengine.api.model.MatchResult;
-import com.helios.ruleengine.api.model.RuleMetadata;
 import com.helios.ruleengine.api.model.TraceLevel;
 import com.helios.ruleengine.infra.management.EngineModelManager;
 import com.helios.ruleengine.runtime.evaluation.BaseConditionEvaluator;
@@ -15,15 +14,20 @@ import com.helios.ruleengine.runtime.model.EngineModel;
 import com.helios.ruleengine.service.monitoring.RuleMetricsAggregator;
 import io.opentelemetry.api.trace.Tracer;
 import io.opentelemetry.api.trace.Span;
+import jakarta.annotation.PreDestroy;
 import jakarta.enterprise.context.ApplicationScoped;
 import jakarta.inject.Inject;
+import org.eclipse.microprofile.config.inject.ConfigProperty;
 
 import java.util.ArrayList;
-import java.util.Collection;
-import java.util.HashSet;
+import java.util.Arrays;
 import java.util.List;
 import java.util.Map;
-import java.util.Set;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ForkJoinPool;
+import java.util.concurrent.Future;
 import java.util.logging.Logger;
 
 /**
@@ -45,6 +49,34 @@ public class RuleEvaluationService {
     @Inject
     Tracer tracer;
 
+    /**
+     * Default for {@link #evaluateBatchWithStats(List, TraceLevel)}: spread batches across
+     * the batch pool. Can be overridden per request.
+     */
+    @ConfigProperty(name = "helios.evaluation.batch.parallel.enabled", defaultValue = "false")
+    boolean parallelBatchEnabled;
+
+    /**
+     * Batch pool type: {@code fork-join} (work-stealing, bounded parallelism) or
+     * {@code virtual} (one virtual thread per partition).
+     */
+    @ConfigProperty(name = "helios.evaluation.batch.parallel.executor", defaultValue = "fork-join")
+    String parallelExecutorType;
+
+    /**
+     * Number of workers for the ForkJoin batch pool; 0 means one per available processor.
+     */
+    @ConfigProperty(name = "helios.evaluation.batch.parallel.parallelism", defaultValue = "0")
+    int parallelBatchParallelism;
+
+    /**
+     * Minimum events per partition; smaller partitions cost more in hand-off than they save.
+     */
+    @ConfigProperty(name = "helios.evaluation.batch.parallel.min-partition-size", defaultValue = "64")
+    int parallelMinPartitionSize;
+
+    private volatile ExecutorService batchExecutor;
+
     /**
      * Thread-local pool for RuleEvaluator instances.
      * Ensures each thread has its own evaluator, recreated when model is hot-reloaded.
@@ -177,88 +209,194 @@ public class RuleEvaluationService {
 
     /**
      * Evaluate multiple events in batch with optional tracing and aggregated statistics.
+     * Uses the configured default for parallel evaluation.
      *
      * @param events list of events to evaluate
      * @param level trace detail level (NONE, BASIC, STANDARD, FULL)
      * @return batch evaluation result with statistics
      */
     public BatchEvaluationResult evaluateBatchWithStats(List<Event> events, TraceLevel level) {
+        return evaluateBatchWithStats(events, level, parallelBatchEnabled);
+    }
+
+    /**
+     * Evaluate multiple events in batch with optional tracing, aggregated statistics
+     * and optional multi-core evaluation.
+     *
+     * <p>In parallel mode the batch is split into contiguous partitions that run on the
+     * configured batch pool (ForkJoin work-stealing or virtual threads). Each partition
+     * writes its results into its own slice of the output, so result order always matches
+     * input order. Per-partition statistics are merged afterwards (sum/min/max).
+     * Batches smaller than two partitions are always evaluated serially.
+     *
+     * <p>Without tracing, each partition is evaluated through the columnar batch path
+     * ({@link RuleEvaluator#evaluateBatch(List)}); per-event latencies are then the
+     * partition's time spread evenly over its events.
+     *
+     * @param events list of events to evaluate
+     * @param level trace detail level (NONE, BASIC, STANDARD, FULL)
+     * @param parallel whether to spread the batch across the batch pool
+     * @return batch evaluation result with statistics
+     */
+    public BatchEvaluationResult evaluateBatchWithStats(List<Event> events, TraceLevel level, boolean parallel) {
         if (events == null || events.isEmpty()) {
             return new BatchEvaluationResult(List.of(), BatchStats.empty());
         }
 
         EngineModel currentModel = modelManager.getEngineModel();
-        RuleEvaluator evaluator = getOrRefreshEvaluator(currentModel);
 
-        List<MatchResult> results = new ArrayList<>(events.size());
-        long totalNanos = 0;
-        long minNanos = Long.MAX_VALUE;
-        long maxNanos = Long.MIN_VALUE;
-        int eventsWithMatches = 0;
-        int totalMatchedRules = 0;
+        int totalEvents = events.size();
+        int partitionSize = Math.max(1, parallelMinPartitionSize);
+        if (!parallel || totalEvents < 2 * partitionSize) {
+            MatchResult[] results = new MatchResult[totalEvents];
+            BatchStatsAccumulator stats = evaluatePartition(
+                events, 0, totalEvents, level, currentModel, null, results);
+            return new BatchEvaluationResult(Arrays.asList(results), stats.toStats(totalEvents));
+        }
 
-        for (Event event : events) {
-            long start = System.nanoTime();
+        return evaluateBatchInParallel(events, level, currentModel);
+    }
+
+    /**
+     * Splits the batch into partitions and evaluates them on the batch pool.
+     *
+     * <p>ForkJoin workers use their own thread-local evaluators (like request threads do).
+     * Virtual threads are not reused, so they share the calling thread's evaluator instead
+     * of building a new one per partition; {@link RuleEvaluator} is thread-safe and keeps
+     * per-thread evaluation contexts. Partitions cannot tell their cache accesses apart on
+     * a shared evaluator, so its cache delta is taken once for the batch and split evenly
+     * across the events.
+     */
+    private BatchEvaluationResult evaluateBatchInParallel(List<Event> events, TraceLevel level,
+                                                         EngineModel model) {
+        int totalEvents = events.size();
+        int workers = parallelism();
+
+        // Over-partition (4 tasks per worker) so work-stealing can balance uneven partitions
+        int partitionSize = Math.max(parallelMinPartitionSize, (totalEvents + workers * 4 - 1) / (workers * 4));
+        int partitionCount = (totalEvents + partitionSize - 1) / partitionSize;
+
+        RuleEvaluator sharedEvaluator = useVirtualThreads() ? getOrRefreshEvaluator(model) : null;
+        MatchResult[] results = new MatchResult[totalEvents];
+        ExecutorService executor = batchExecutor();
+
+        List<Future<BatchStatsAccumulator>> partitions = new ArrayList<>(partitionCount);
+        for (int p = 0; p < partitionCount; p++) {
+            int from = p * partitionSize;
+            int to = Math.min(from + partitionSize, totalEvents);
+            partitions.add(executor.submit(
+                () -> evaluatePartition(events, from, to, level, model, sharedEvaluator, results)));
+        }
 
-            // Use trace evaluation if trace level is not NONE
-            MatchResult result;
-            if (level == TraceLevel.NONE) {
-                result = evaluator.evaluate(event);
-            } else {
-                // Evaluate with trace and extract just the match result
-                EvaluationResult traceResult = evaluator.evaluateWithTrace(event, level, false);
-                result = traceResult.matchResult();
+        BatchStatsAccumulator merged = new BatchStatsAccumulator();
+        try {
+            for (Future<BatchStatsAccumulator> partition : partitions) {
+                merged.merge(partition.get());
+            }
+        } catch (InterruptedException e) {
+            partitions.forEach(f -> f.cancel(true));
+            Thread.currentThread().interrupt();
+            throw new RuntimeException("Parallel batch evaluation interrupted", e);
+        } catch (ExecutionException e) {
+            partitions.forEach(f -> f.cancel(true));
+            if (e.getCause() instanceof RuntimeException re) {
+                throw re;
             }
+            throw new RuntimeException("Parallel batch evaluation failed", e.getCause());
+        }
 
-            long duration = System.nanoTime() - start;
+        if (sharedEvaluator != null) {
+            // Partitions shared one evaluator, so cache stats are recorded once for the batch
+            long[] cacheDelta = computeCacheDelta(sharedEvaluator);
+            for (int i = 0; i < totalEvents; i++) {
+                recordRuleCacheAccesses(results[i],
+                    share(cacheDelta[0], i, totalEvents), share(cacheDelta[1], i, totalEvents));
+            }
+        }
+
+        return new BatchEvaluationResult(Arrays.asList(results), merged.toStats(totalEvents));
+    }
+
+    /**
+     * Evaluates events {@code [from, to)} and writes results into the same slots of
+     * {@code results}. Runs on the calling thread (serial) or a batch pool thread (parallel).
+     *
+     * <p>Without tracing the partition goes through the evaluator's columnar batch path in
+     * one call, so per-event latency is the partition's time divided evenly across its events.
+     *
+     * @param sharedEvaluator evaluator to use, or null to use this thread's evaluator
+     */
+    private BatchStatsAccumulator evaluatePartition(List<Event> events, int from, int to, TraceLevel level,
+                                                    EngineModel model, RuleEvaluator sharedEvaluator,
+                                                    MatchResult[] results) {
+        RuleEvaluator evaluator = sharedEvaluator != null ? sharedEvaluator : getOrRefreshEvaluator(model);
+        if (level == TraceLevel.NONE) {
+            return evaluatePartitionColumnar(events, from, to, model, evaluator, sharedEvaluator == null, results);
+        }
 
-            totalNanos += duration;
-            minNanos = Math.min(minNanos, duration);
-            maxNanos = Math.max(maxNanos, duration);
+        BatchStatsAccumulator stats = new BatchStatsAccumulator();
+        for (int i = from; i < to; i++) {
+            Event event = events.get(i);
+            long start = System.nanoTime();
+
+            // Evaluate with trace and extract just the match result
+            EvaluationResult traceResult = evaluator.evaluateWithTrace(event, level, false);
+            MatchResult result = traceResult.matchResult();
+
+            long duration = System.nanoTime() - start;
 
             boolean hasMatches = result.matchedRules() != null && !result.matchedRules().isEmpty();
-            if (hasMatches) {
-                eventsWithMatches++;
-                totalMatchedRules += result.matchedRules().size();
-            }
+            stats.record(duration, hasMatches ? result.matchedRules().size() : 0);
 
-            // Compute per-event cache delta
-            long[] cacheDelta = computeCacheDelta(evaluator);
+            // Compute per-event cache delta (only meaningful for a thread-owned evaluator)
+            long[] cacheDelta = sharedEvaluator == null ? computeCacheDelta(evaluator) : new long[]{0, 0};
 
             // Record per-rule metrics for ALL evaluated rules (matched and non-matched)
-            recordPerRuleMetrics(currentModel, result, hasMatches, duration, cacheDelta[0], cacheDelta[1]);
+            recordPerRuleMetrics(model, result, hasMatches, duration, cacheDelta[0], cacheDelta[1]);
 
             // Record event-level outcome (called for EVERY event, match or not)
             metricsAggregator.recordEventOutcome(hasMatches, duration);
 
-            results.add(result);
+            results[i] = result;
         }
+        return stats;
+    }
 
-        // Calculate statistics
-        int totalEvents = events.size();
-        long avgNanos = totalNanos / totalEvents;
-        double matchRate = (double) eventsWithMatches / totalEvents;
-        double avgRulesPerEvent = (double) totalMatchedRules / totalEvents;
+    /**
+     * Evaluates events {@code [from, to)} with one {@link RuleEvaluator#evaluateBatch(List)} call.
+     * The partition's cache delta (when the evaluator is thread-owned) is split evenly across
+     * its events, like its latency.
+     */
+    private BatchStatsAccumulator evaluatePartitionColumnar(List<Event> events, int from, int to,
+                                                            EngineModel model, RuleEvaluator evaluator,
+                                                            boolean ownsEvaluator, MatchResult[] results) {
+        int count = to - from;
+        long start = System.nanoTime();
+        List<MatchResult> batch = evaluator.evaluateBatch(events.subList(from, to));
+        long partitionNanos = System.nanoTime() - start;
+        long[] cacheDelta = ownsEvaluator ? computeCacheDelta(evaluator) : new long[]{0, 0};
 
-        // Handle edge case where no events were processed
-        if (minNanos == Long.MAX_VALUE) {
-            minNanos = 0;
-        }
-        if (maxNanos == Long.MIN_VALUE) {
-            maxNanos = 0;
+        BatchStatsAccumulator stats = new BatchStatsAccumulator();
+        for (int k = 0; k < count; k++) {
+            MatchResult result = batch.get(k);
+            long duration = share(partitionNanos, k, count);
+
+            boolean hasMatches = result.matchedRules() != null && !result.matchedRules().isEmpty();
+            stats.record(duration, hasMatches ? result.matchedRules().size() : 0);
+            recordPerRuleMetrics(model, result, hasMatches, duration,
+                share(cacheDelta[0], k, count), share(cacheDelta[1], k, count));
+            metricsAggregator.recordEventOutcome(hasMatches, duration);
+
+            results[from + k] = result;
         }
+        return stats;
+    }
 
-        BatchStats stats = new BatchStats(
-            totalEvents,
-            avgNanos,
-            matchRate,
-            minNanos,
-            maxNanos,
-            totalMatchedRules,
-            avgRulesPerEvent
-        );
-
-        return new BatchEvaluationResult(results, stats);
+    /**
+     * Part {@code k} of {@code total} split into {@code parts} near-equal parts that sum to it.
+     */
+    private static long share(long total, int k, int parts) {
+        return total * (k + 1) / parts - total * k / parts;
     }
 
     /**
@@ -301,39 +439,77 @@ public class RuleEvaluationService {
     }
 
     /**
-     * Records per-rule evaluation metrics for ALL rules in the model.
-     * Every rule gets an evaluation count recorded; matched rules also get a match recorded.
-     * Latency and cache stats are only attributed to MATCHED rules, because the engine uses
-     * batch counter-based evaluation (all rules simultaneously), so there is no per-rule timing.
+     * Records per-rule evaluation metrics for the event.
+     * Every rule in the model is implicitly counted as evaluated (the aggregator derives per-rule
+     * evaluation counts from the number of events seen by the model), so only matched rules are
+     * touched here. Latency and cache stats are only attributed to MATCHED rules, because the engine
+     * uses batch counter-based evaluation (all rules simultaneously), so there is no per-rule timing.
      * By recording latency/cache only for matched rules, each rule's metrics reflect
      * "evaluation characteristics when this rule fires", providing meaningful differentiation.
      */
     private void recordPerRuleMetrics(EngineModel model, MatchResult result, boolean hasMatches,
                                       long duration, long cacheHits, long cacheMisses) {
-        // Build set of matched rule codes for O(1) lookup
-        Set<String> matchedCodes;
+        metricsAggregator.recordModelEvaluation(model, result, duration);
         if (hasMatches) {
-            matchedCodes = new HashSet<>(result.matchedRules().size());
-            for (MatchResult.MatchedRule mr : result.matchedRules()) {
-                matchedCodes.add(mr.ruleCode());
-            }
-        } else {
-            matchedCodes = Set.of();
+            recordRuleCacheAccesses(result, cacheHits, cacheMisses);
         }
+    }
 
-        // Record evaluation count for every rule in the model (for match rate calculation)
-        Collection<RuleMetadata> allRules = model.getAllRuleMetadata();
-        for (RuleMetadata meta : allRules) {
-            metricsAggregator.recordEvaluation(
-                meta.ruleCode(), matchedCodes.contains(meta.ruleCode()), duration);
+    /**
+     * Attributes an event's cache accesses to its matched rules (provides differentiation).
+     */
+    private void recordRuleCacheAccesses(MatchResult result, long cacheHits, long cacheMisses) {
+        List<MatchResult.MatchedRule> matchedRules = result.matchedRules();
+        if ((cacheHits == 0 && cacheMisses == 0) || matchedRules == null) {
+            return;
+        }
+        for (int i = 0; i < matchedRules.size(); i++) {
+            metricsAggregator.recordRuleCacheAccess(matchedRules.get(i).ruleCode(), cacheHits, cacheMisses);
         }
+    }
 
-        // Record cache stats only for matched rules (provides differentiation)
-        if ((cacheHits > 0 || cacheMisses > 0) && hasMatches) {
-            for (String matchedCode : matchedCodes) {
-                metricsAggregator.recordRuleCacheAccess(matchedCode, cacheHits, cacheMisses);
+    /**
+     * Returns the batch pool, creating it on first use.
+     */
+    private ExecutorService batchExecutor() {
+        ExecutorService executor = batchExecutor;
+        if (executor == null) {
+            synchronized (this) {
+                executor = batchExecutor;
+                if (executor == null) {
+                    if (useVirtualThreads()) {
+                        executor = Executors.newVirtualThreadPerTaskExecutor();
+                    } else {
+                        executor = new ForkJoinPool(parallelism());
+                    }
+                    logger.info("Created parallel batch pool: executor=" + parallelExecutorType
+                        + ", parallelism=" + parallelism());
+                    batchExecutor = executor;
+                }
             }
         }
+        return executor;
+    }
+
+    private boolean useVirtualThreads() {
+        return "virtual".equalsIgnoreCase(parallelExecutorType);
+    }
+
+    private int parallelism() {
+        return parallelBatchParallelism > 0
+            ? parallelBatchParallelism
+            : Runtime.getRuntime().availableProcessors();
+    }
+
+    /**
+     * Shuts down the batch pool (if it was ever created).
+     */
+    @PreDestroy
+    void shutdownBatchExecutor() {
+        ExecutorService executor = batchExecutor;
+        if (executor != null) {
+            executor.shutdown();
+        }
     }
 
     /**
@@ -368,4 +544,48 @@ public class RuleEvaluationService {
         // Enable BaseConditionEvaluator cache
         return new RuleEvaluator(model, tracer, true);
     }
+
+    /**
+     * Mergeable batch statistics for one partition (or the whole batch).
+     */
+    private static final class BatchStatsAccumulator {
+        private long totalNanos = 0;
+        private long minNanos = Long.MAX_VALUE;
+        private long maxNanos = Long.MIN_VALUE;
+        private int eventsWithMatches = 0;
+        private int totalMatchedRules = 0;
+
+        void record(long durationNanos, int matchedRules) {
+            totalNanos += durationNanos;
+            minNanos = Math.min(minNanos, durationNanos);
+            maxNanos = Math.max(maxNanos, durationNanos);
+            if (matchedRules > 0) {
+                eventsWithMatches++;
+                totalMatchedRules += matchedRules;
+            }
+        }
+
+        void merge(BatchStatsAccumulator other) {
+            totalNanos += other.totalNanos;
+            minNanos = Math.min(minNanos, other.minNanos);
+            maxNanos = Math.max(maxNanos, other.maxNanos);
+            eventsWithMatches += other.eventsWithMatches;
+            totalMatchedRules += other.totalMatchedRules;
+        }
+
+        BatchStats toStats(int totalEvents) {
+            // Handle edge case where no events were processed
+            long min = minNanos == Long.MAX_VALUE ? 0 : minNanos;
+            long max = maxNanos == Long.MIN_VALUE ? 0 : maxNanos;
+            return new BatchStats(
+                totalEvents,
+                totalNanos / totalEvents,
+                (double) eventsWithMatches / totalEvents,
+                min,
+                max,
+                totalMatchedRules,
+                (double) totalMatchedRules / totalEvents
+            );
+        }
+    }
 }
@@ -265,11 +265,11 @@ public class RuleImportService {
 
             // GREATER_THAN aliases
             case "GREATER_THAN", "GT", ">", "IS_GREATER_THAN", "GREATER" -> "GREATER_THAN";
-            case "GREATER_THAN_OR_EQUAL", "GTE", "GE", ">=", "IS_GREATER_THAN_OR_EQUAL" -> "GREATER_THAN";
+            case "GREATER_THAN_OR_EQUAL", "GTE", "GE", ">=", "IS_GREATER_THAN_OR_EQUAL" -> "GREATER_THAN_OR_EQUAL";
 
             // LESS_THAN aliases
             case "LESS_THAN", "LT", "<", "IS_LESS_THAN", "LESS" -> "LESS_THAN";
-            case "LESS_THAN_OR_EQUAL", "LTE", "LE", "<=", "IS_LESS_THAN_OR_EQUAL" -> "LESS_THAN";
+            case "LESS_THAN_OR_EQUAL", "LTE", "LE", "<=", "IS_LESS_THAN_OR_EQUAL" -> "LESS_THAN_OR_EQUAL";
 
             // BETWEEN aliases
             case "BETWEEN", "IN_RANGE", "RANGE" -> "BETWEEN";
@@ -317,6 +317,8 @@ public class RuleImportService {
                normalized.equals("IS_NONE_OF") ||
                normalized.equals("GREATER_THAN") ||
                normalized.equals("LESS_THAN") ||
+               normalized.equals("GREATER_THAN_OR_EQUAL") ||
+               normalized.equals("LESS_THAN_OR_EQUAL") ||
                normalized.equals("BETWEEN") ||
                normalized.equals("CONTAINS") ||
                normalized.equals("REGEX") ||
@@ -317,4 +317,45 @@ public class RuleEvaluationResourceTest {
                 .statusCode(anyOf(equalTo(200), equalTo(404)));
         }
     }
+
+    @Nested
+    @DisplayName("Parallel Batch Evaluation")
+    class ParallelBatchTests {
+
+        @Test
+        @DisplayName("Should keep input order and merge stats in parallel batch mode")
+        void shouldKeepOrderAndMergeStatsInParallelMode() {
+            // Given: enough events for several partitions, every third one matching TEST_RULE_1
+            StringBuilder eventsJson = new StringBuilder("[");
+            int eventCount = 600;
+            for (int i = 0; i < eventCount; i++) {
+                if (i > 0) {
+                    eventsJson.append(',');
+                }
+                String type = i % 3 == 0 ? "test" : "other";
+                eventsJson.append(String.format(
+                    "{\"eventId\": \"parallel-%d\", \"timestamp\": 1736673000000, \"attributes\": {\"type\": \"%s\"}}",
+                    i, type));
+            }
+            eventsJson.append(']');
+
+            given()
+                .contentType(ContentType.JSON)
+                .body(eventsJson.toString())
+                .queryParam("parallel", true)
+            .when()
+                .post("/api/v1/evaluate/batch")
+            .then()
+                .statusCode(200)
+                .body("stats.totalEvents", equalTo(eventCount))
+                .body("results", hasSize(eventCount))
+                .body("results[0].eventId", equalTo("parallel-0"))
+                .body("results[299].eventId", equalTo("parallel-299"))
+                .body("results[599].eventId", equalTo("parallel-599"))
+                .body("results[3].matchedRules", hasSize(1))
+                .body("results[4].matchedRules", empty())
+                .body("stats.matchRate", allOf(greaterThan(0.33f), lessThan(0.34f)))
+                .body("stats.totalMatchedRules", equalTo(200));
+        }
+    }
 }
@@ -0,0 +1,128 @@
+package com.helios.ruleengine.service.monitoring;
+
+import com.helios.ruleengine.api.model.MatchResult;
+import com.helios.ruleengine.api.model.RuleDefinition;
+import com.helios.ruleengine.compiler.RuleCompiler;
+import com.helios.ruleengine.runtime.model.EngineModel;
+import io.opentelemetry.api.OpenTelemetry;
+import io.opentelemetry.api.trace.Tracer;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Per-rule counts recorded against dense per-model counters, across hot reloads.
+ */
+class RuleMetricsAggregatorTest {
+
+    private static final Tracer NOOP_TRACER = OpenTelemetry.noop().getTracer("test");
+
+    private RuleMetricsAggregator aggregator;
+
+    @BeforeEach
+    void setUp() {
+        aggregator = new RuleMetricsAggregator();
+    }
+
+    // DUP_A and DUP_B have the same conditions, so they share one combination
+    private static EngineModel compile() throws Exception {
+        List<RuleDefinition> rules = List.of(
+                new RuleDefinition("DUP_A", List.of(new RuleDefinition.Condition("country", "EQUAL_TO", "US")),
+                        1, "A", true, null),
+                new RuleDefinition("DUP_B", List.of(new RuleDefinition.Condition("country", "EQUAL_TO", "US")),
+                        2, "B", true, null),
+                new RuleDefinition("LARGE", List.of(new RuleDefinition.Condition("amount", "GREATER_THAN", 100)),
+                        1, "Large", true, null));
+        return new RuleCompiler(NOOP_TRACER).compile(rules);
+    }
+
+    private static int combinationOf(EngineModel model, String ruleCode) {
+        for (int c = 0; c < model.getNumRules(); c++) {
+            if (model.getCombinationRuleCodes(c).contains(ruleCode)) {
+                return c;
+            }
+        }
+        return -1;
+    }
+
+    private static MatchResult matched(EngineModel model, String... ruleCodes) {
+        List<MatchResult.MatchedRule> rules = new ArrayList<>();
+        for (String code : ruleCodes) {
+            rules.add(new MatchResult.MatchedRule(combinationOf(model, code), code, 1, ""));
+        }
+        return new MatchResult("evt", rules, 0, 0, 0);
+    }
+
+    private Map<String, RuleMetricsAggregator.HotRule> hotRules() {
+        return aggregator.getHotRules(100).stream()
+                .collect(Collectors.toMap(RuleMetricsAggregator.HotRule::ruleCode, Function.identity()));
+    }
+
+    @Test
+    @DisplayName("Matches should be counted per rule, also for rules sharing a combination")
+    void shouldCountMatchesPerRule() throws Exception {
+        EngineModel model = compile();
+        assertThat(combinationOf(model, "DUP_A")).isEqualTo(combinationOf(model, "DUP_B"));
+
+        aggregator.recordModelEvaluation(model, matched(model, "DUP_A", "DUP_B"), 1_000);
+        aggregator.recordModelEvaluation(model, matched(model, "DUP_B"), 1_000);
+        aggregator.recordModelEvaluation(model, matched(model, "LARGE"), 1_000);
+
+        Map<String, RuleMetricsAggregator.HotRule> rules = hotRules();
+        assertThat(rules.get("DUP_A").matchCount()).isEqualTo(1);
+        assertThat(rules.get("DUP_B").matchCount()).isEqualTo(2);
+        assertThat(rules.get("LARGE").matchCount()).isEqualTo(1);
+    }
+
+    @Test
+    @DisplayName("Evaluation counts should equal the events seen by the model, matched or not")
+    void shouldDeriveEvaluationCountsFromEvents() throws Exception {
+        EngineModel model = compile();
+
+        aggregator.recordModelEvaluation(model, matched(model, "DUP_A"), 1_000);
+        aggregator.recordModelEvaluation(model, matched(model), 1_000);
+        aggregator.recordModelEvaluation(model, new MatchResult("evt", null, 0, 0, 0), 1_000);
+        aggregator.recordModelEvaluation(model, matched(model, "DUP_A"), 1_000);
+
+        Map<String, RuleMetricsAggregator.HotRule> rules = hotRules();
+        assertThat(rules.keySet()).containsExactlyInAnyOrder("DUP_A", "DUP_B", "LARGE");
+        assertThat(rules.values()).allSatisfy(rule -> assertThat(rule.evaluationCount()).isEqualTo(4));
+        assertThat(rules.get("DUP_A").matchRate()).isEqualTo(0.5);
+        assertThat(rules.get("LARGE").matchRate()).isZero();
+    }
+
+    @Test
+    @DisplayName("Counts should survive two model switches and late events on a retired model")
+    void shouldFoldAcrossModelSwitches() throws Exception {
+        EngineModel first = compile();
+        EngineModel second = compile();
+        EngineModel third = compile();
+        EngineModel fourth = compile();
+
+        aggregator.recordModelEvaluation(first, matched(first, "DUP_A"), 1_000);
+        aggregator.recordModelEvaluation(first, matched(first, "DUP_A"), 1_000);
+        aggregator.recordModelEvaluation(second, matched(second, "LARGE"), 1_000);
+        // Retires the first model's counters
+        aggregator.recordModelEvaluation(third, matched(third, "DUP_A"), 1_000);
+        // A thread still finishing on the first model
+        aggregator.recordModelEvaluation(first, matched(first, "DUP_A"), 1_000);
+        // Retires the second model's counters
+        aggregator.recordModelEvaluation(fourth, matched(fourth), 1_000);
+        aggregator.recordModelEvaluation(second, matched(second, "LARGE"), 1_000);
+
+        Map<String, RuleMetricsAggregator.HotRule> rules = hotRules();
+        assertThat(rules.get("DUP_A").evaluationCount()).isEqualTo(7);
+        assertThat(rules.get("DUP_A").matchCount()).isEqualTo(4);
+        assertThat(rules.get("LARGE").evaluationCount()).isEqualTo(7);
+        assertThat(rules.get("LARGE").matchCount()).isEqualTo(2);
+        assertThat(rules.get("DUP_B").matchCount()).isZero();
+    }
+}